@@ -0,0 +1,112 @@
+"""Compare benchmark results to a baseline.
+
+Both files are JSON outputs of pytest-benchmark, e.g. obtained with
+`pytest learning/time_learning.py --benchmark-json=results.json`. A
+benchmark is flagged as a regression if its mean time or its peak memory
+exceeds the baseline by more than the given relative tolerance.
+"""
+
+import argparse
+import json
+import sys
+
+parser = argparse.ArgumentParser(description="Compare benchmark results to a baseline")
+parser.add_argument("baseline", type=str, help="JSON file of baseline results.")
+parser.add_argument("results", type=str, help="JSON file of current results.")
+parser.add_argument(
+    "--time-tol",
+    type=float,
+    default=0.2,
+    help="Relative increase of the mean time flagged as a regression.",
+)
+parser.add_argument(
+    "--memory-tol",
+    type=float,
+    default=0.2,
+    help="Relative increase of the peak memory flagged as a regression.",
+)
+
+
+def read_benchmarks(filename):
+    """Read the mean time and peak memory of each benchmark.
+
+    Parameters
+    ----------
+    filename : str
+        JSON file written by pytest-benchmark.
+
+    Returns
+    -------
+    benchmarks : dict
+        Mean time and peak memory, indexed by full benchmark name.
+    """
+    with open(filename) as file:
+        data = json.load(file)
+
+    return {
+        benchmark["fullname"]: {
+            "time": benchmark["stats"]["mean"],
+            "memory": benchmark.get("extra_info", {}).get("peak_memory"),
+        }
+        for benchmark in data["benchmarks"]
+    }
+
+
+def compare(baseline, results, time_tol, memory_tol):
+    """Find the benchmarks that regressed with respect to the baseline.
+
+    Parameters
+    ----------
+    baseline : dict
+        Baseline benchmarks, as returned by `read_benchmarks`.
+    results : dict
+        Current benchmarks, as returned by `read_benchmarks`.
+    time_tol : float
+        Relative increase of the mean time flagged as a regression.
+    memory_tol : float
+        Relative increase of the peak memory flagged as a regression.
+
+    Returns
+    -------
+    regressions : list[str]
+        Description of each regression.
+    """
+    regressions = []
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+
+        for quantity, tol in (("time", time_tol), ("memory", memory_tol)):
+            reference, value = baseline[name][quantity], result[quantity]
+            if reference is None or value is None or reference == 0:
+                continue
+
+            ratio = value / reference
+            if ratio > 1.0 + tol:
+                regressions.append(
+                    f"{name}: {quantity} {reference:.4g} -> {value:.4g} "
+                    f"(x{ratio:.2f})"
+                )
+
+    return regressions
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    baseline = read_benchmarks(args.baseline)
+    results = read_benchmarks(args.results)
+    regressions = compare(baseline, results, args.time_tol, args.memory_tol)
+
+    missing = sorted(set(baseline) - set(results))
+    for name in missing:
+        print(f"{name}: missing from results")
+
+    for regression in regressions:
+        print(regression)
+
+    print(
+        f"{len(regressions)} regressions in {len(set(baseline) & set(results))} "
+        "compared benchmarks."
+    )
+    sys.exit(1 if regressions else 0)
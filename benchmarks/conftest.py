@@ -0,0 +1,74 @@
+"""Configuration of the benchmarks of learning estimators and solvers.
+
+Sizes of the benchmarked problems are multiplied by the scales given with
+`--benchmark-scales`, e.g. `--benchmark-scales=1,4,16`. The peak memory
+allocated by each benchmarked function is stored in the `extra_info` of
+the benchmark, which is saved with `--benchmark-json` and compared to a
+baseline by `compare_baseline.py`.
+"""
+
+import tracemalloc
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Add the scales of the benchmarked problems as option."""
+    parser.addoption(
+        "--benchmark-scales",
+        action="store",
+        default="1",
+        help="Comma-separated factors by which benchmark sizes are multiplied.",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize the benchmarks using `scale` with the requested scales."""
+    if "scale" in metafunc.fixturenames:
+        scales = [
+            int(scale)
+            for scale in metafunc.config.getoption("benchmark_scales").split(",")
+        ]
+        metafunc.parametrize(
+            "scale", scales, ids=[f"scale={scale}" for scale in scales]
+        )
+
+
+def peak_memory(func, *args, **kwargs):
+    """Measure the peak memory allocated by a function call.
+
+    Parameters
+    ----------
+    func : callable
+        Function to call.
+
+    Returns
+    -------
+    peak : int
+        Peak memory allocated by the call, in bytes.
+    """
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start, _ = tracemalloc.get_traced_memory()
+    func(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    if not tracing:
+        tracemalloc.stop()
+    return peak - start
+
+
+@pytest.fixture
+def run_benchmark(benchmark):
+    """Benchmark a function call, tracking its time and peak memory.
+
+    The memory is measured in a separate call, so that tracing does not
+    slow down the timed calls.
+    """
+
+    def _run_benchmark(func, *args, rounds=3, **kwargs):
+        benchmark.extra_info["peak_memory"] = peak_memory(func, *args, **kwargs)
+        return benchmark.pedantic(func, args=args, kwargs=kwargs, rounds=rounds)
+
+    return _run_benchmark
@@ -0,0 +1,148 @@
+"""Benchmark learning estimators."""
+
+import pytest
+
+import geomstats.backend as gs
+from geomstats.datasets.prepare_graph_data import HyperbolicEmbedding
+from geomstats.datasets.utils import load_karate_graph
+from geomstats.geometry.hypersphere import Hypersphere
+from geomstats.geometry.spd_matrices import SPDMatrices
+from geomstats.learning.frechet_mean import FrechetMean, GroupFrechetMean
+from geomstats.learning.geodesic_regression import GeodesicRegression
+from geomstats.learning.kmeans import RiemannianKMeans
+from geomstats.learning.kmedoids import RiemannianKMedoids
+from geomstats.learning.pca import TangentPCA
+from geomstats.test.test_case import autodiff_only
+
+SPACES = {
+    "Hypersphere(4)": lambda: Hypersphere(4),
+    "SPDMatrices(3)": lambda: SPDMatrices(3),
+}
+
+
+@pytest.mark.parametrize("space_name", SPACES)
+@pytest.mark.parametrize("method", ["default", "adaptive"])
+def test_benchmark_frechet_mean(space_name, method, scale, run_benchmark):
+    """Benchmark Frechet mean estimation."""
+    space = SPACES[space_name]()
+    estimator = FrechetMean(space, method=method)
+    X = space.random_point(100 * scale)
+
+    run_benchmark(estimator.fit, X)
+
+
+@pytest.mark.parametrize("space_name", SPACES)
+def test_benchmark_frechet_mean_batch(space_name, scale, run_benchmark):
+    """Benchmark Frechet mean estimation of batches of samples."""
+    space = SPACES[space_name]()
+    estimator = FrechetMean(space, method="batch")
+    X = gs.reshape(space.random_point(50 * 10 * scale), (50, 10 * scale) + space.shape)
+
+    run_benchmark(estimator.fit, X)
+
+
+@pytest.mark.parametrize("space_name", SPACES)
+def test_benchmark_group_frechet_mean(space_name, scale, run_benchmark):
+    """Benchmark Frechet mean estimation of groups of samples."""
+    space = SPACES[space_name]()
+    n_groups = 10
+    estimator = GroupFrechetMean(space, n_groups=n_groups)
+    X = space.random_point(100 * scale)
+    groups = gs.arange(100 * scale) % n_groups
+
+    run_benchmark(estimator.fit, X, groups=groups)
+
+
+@pytest.mark.parametrize("space_name", SPACES)
+def test_benchmark_kmeans(space_name, scale, run_benchmark):
+    """Benchmark Riemannian k-means."""
+    space = SPACES[space_name]()
+    estimator = RiemannianKMeans(space, n_clusters=5, init="kmeans++")
+    X = space.random_point(100 * scale)
+
+    run_benchmark(estimator.fit, X)
+
+
+@pytest.mark.parametrize("space_name", SPACES)
+def test_benchmark_kmedoids(space_name, scale, run_benchmark):
+    """Benchmark Riemannian k-medoids."""
+    space = SPACES[space_name]()
+    estimator = RiemannianKMedoids(space, n_clusters=5)
+    X = space.random_point(100 * scale)
+
+    run_benchmark(estimator.fit, X)
+
+
+@pytest.mark.parametrize("space_name", SPACES)
+def test_benchmark_tangent_pca(space_name, scale, run_benchmark):
+    """Benchmark tangent PCA."""
+    space = SPACES[space_name]()
+    estimator = TangentPCA(space, n_components=2)
+    X = space.random_point(200 * scale)
+
+    run_benchmark(estimator.fit, X)
+
+
+@pytest.mark.parametrize("svd_solver", ["full", "randomized", "arpack", "partial_fit"])
+def test_benchmark_tangent_pca_svd_solver(svd_solver, scale, run_benchmark):
+    """Benchmark tangent PCA of many high-dimensional samples."""
+    space = SPDMatrices(20)
+    X = space.random_point(2000 * scale)
+    base_point = gs.eye(20)
+
+    if svd_solver == "partial_fit":
+        estimator = TangentPCA(space, n_components=5)
+
+        def fit(X, base_point):
+            for chunk in gs.reshape(X, (10, -1) + space.shape):
+                estimator.partial_fit(chunk, base_point=base_point)
+
+        run_benchmark(fit, X, base_point=base_point)
+    else:
+        estimator = TangentPCA(space, n_components=5, svd_solver=svd_solver)
+        run_benchmark(estimator.fit, X, base_point=base_point)
+
+
+@autodiff_only
+@pytest.mark.parametrize("method", ["extrinsic", "riemannian"])
+def test_benchmark_geodesic_regression(method, scale, run_benchmark):
+    """Benchmark geodesic regression on the sphere."""
+    space = Hypersphere(2)
+    n_samples = 50 * scale
+    X = gs.linspace(0.0, 1.0, n_samples)
+    intercept = space.random_point()
+    coef = space.to_tangent(gs.random.normal(size=(3,)), intercept)
+    y = space.metric.exp(gs.einsum("n,i->ni", X, coef), intercept)
+
+    estimator = GeodesicRegression(space, method=method, center_X=False)
+
+    run_benchmark(estimator.fit, X, y, rounds=1)
+
+
+@pytest.mark.parametrize("space_name", SPACES)
+@pytest.mark.parametrize("batch_size", [None, 32])
+def test_benchmark_geodesic_regression_batched(
+    space_name, batch_size, scale, run_benchmark
+):
+    """Benchmark batched geodesic regression with closed-form gradients."""
+    space = SPACES[space_name]()
+    n_models, n_samples = 20, 100 * scale
+    X = gs.random.rand(n_models, n_samples)
+    intercept = space.random_point(n_models)
+    coef = space.to_tangent(
+        0.5 * gs.random.normal(size=(n_models,) + space.shape), intercept
+    )
+    estimator = GeodesicRegression(
+        space, method="batched", initialization="frechet"
+    ).set(batch_size=batch_size)
+    y = estimator._model(X - gs.mean(X, axis=-1)[:, None], coef, intercept)
+
+    run_benchmark(estimator.fit, X, y, rounds=1)
+
+
+def test_benchmark_hyperbolic_embedding(scale, run_benchmark):
+    """Benchmark hyperbolic embedding of the karate graph."""
+    graph = load_karate_graph()
+    embedding = HyperbolicEmbedding(max_epochs=10 * scale)
+
+    run_benchmark(embedding.embed, graph, rounds=1)
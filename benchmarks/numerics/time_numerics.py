@@ -0,0 +1,212 @@
+"""Benchmark numerical solvers."""
+
+import pytest
+
+import geomstats.backend as gs
+from geomstats.geometry.discrete_curves import (
+    DiscreteCurvesStartingAtOrigin,
+    DynamicProgrammingAligner,
+)
+from geomstats.geometry.discrete_surfaces import DiscreteSurfaces
+from geomstats.geometry.hyperboloid import Hyperboloid
+from geomstats.geometry.poincare_ball import PoincareBall
+from geomstats.geometry.stratified.bhv_space import TreeSpace
+from geomstats.geometry.stratified.graph_space import (
+    ExhaustiveAligner,
+    FAQAligner,
+    GraphSpace,
+)
+from geomstats.geometry.stratified.wald_space import WaldSpace
+from geomstats.numerics.geodesic import (
+    CoarseToFinePathStraightening,
+    LogODESolver,
+    LogShootingSolver,
+    PathStraightening,
+    ResolutionLevel,
+)
+from geomstats.numerics.optimizers import ScipyMinimize
+from geomstats.test.test_case import autodiff_only
+
+
+def _log_solver_data(scale):
+    space = Hyperboloid(3)
+    base_point = space.random_point(5 * scale)
+    point = space.random_point(5 * scale)
+    return space, point, base_point
+
+
+@autodiff_only
+@pytest.mark.parametrize("flatten", [True, False])
+def test_benchmark_log_shooting_solver(flatten, scale, run_benchmark):
+    """Benchmark log computed by shooting."""
+    space, point, base_point = _log_solver_data(scale)
+    solver = LogShootingSolver(space, flatten=flatten)
+
+    run_benchmark(solver.log, point, base_point)
+
+
+@autodiff_only
+def test_benchmark_log_ode_solver(scale, run_benchmark):
+    """Benchmark log computed by solving a boundary value problem."""
+    space, point, base_point = _log_solver_data(scale)
+    solver = LogODESolver(space, n_nodes=10, use_jac=False)
+
+    run_benchmark(solver.log, point, base_point)
+
+
+@autodiff_only
+def test_benchmark_path_straightening(scale, run_benchmark):
+    """Benchmark log computed by path-straightening."""
+    space, point, base_point = _log_solver_data(scale)
+    solver = PathStraightening(space, n_nodes=20)
+
+    run_benchmark(solver.log, point, base_point, rounds=1)
+
+
+@pytest.mark.parametrize("flatten", [True, False])
+def test_benchmark_path_straightening_batch(flatten, scale, run_benchmark):
+    """Benchmark path-straightening of batches with closed-form gradients."""
+    space = PoincareBall(3)
+    base_point = space.random_point(20 * scale)
+    point = space.random_point(20 * scale)
+    optimizer = None if flatten else ScipyMinimize()
+    solver = PathStraightening(space, n_nodes=20, optimizer=optimizer, flatten=flatten)
+
+    run_benchmark(solver.log, point, base_point, rounds=1)
+
+
+def test_benchmark_dynamic_programming_aligner(scale, run_benchmark):
+    """Benchmark alignment of discrete curves by dynamic programming."""
+    k_sampling_points = 20 * scale
+    total_space = DiscreteCurvesStartingAtOrigin(k_sampling_points=k_sampling_points)
+    aligner = DynamicProgrammingAligner(total_space, n_space_grid=k_sampling_points)
+
+    sampling_points = gs.linspace(0.0, 1.0, k_sampling_points)
+    freqs = gs.random.uniform(0.5, 2.0, size=(10, 1))
+    curves = total_space.projection(
+        gs.stack(
+            [gs.cos(freqs * sampling_points), gs.sin(freqs * sampling_points**2)],
+            axis=-1,
+        )
+    )
+    point, base_point = curves[:5], curves[5:]
+
+    run_benchmark(aligner.align, point, base_point, rounds=1)
+
+
+def _torus_mesh(n_samples):
+    """Mesh a torus with a grid of n_samples x n_samples vertices."""
+    indices = gs.arange(n_samples)
+    angles = 2 * gs.pi * gs.cast(indices, gs.float64) / n_samples
+    cos_u, sin_u = gs.cos(angles)[:, None], gs.sin(angles)[:, None]
+    cos_v, sin_v = gs.cos(angles)[None, :], gs.sin(angles)[None, :]
+    vertices = gs.stack(
+        [
+            (2.0 + cos_v) * cos_u,
+            (2.0 + cos_v) * sin_u,
+            gs.broadcast_to(sin_v, (n_samples, n_samples)),
+        ],
+        axis=-1,
+    )
+
+    row, col = indices[:, None], indices[None, :]
+    next_row, next_col = (row + 1) % n_samples, (col + 1) % n_samples
+    corners = [
+        gs.reshape(row * n_samples + col, (-1,)),
+        gs.reshape(next_row * n_samples + col, (-1,)),
+        gs.reshape(row * n_samples + next_col, (-1,)),
+        gs.reshape(next_row * n_samples + next_col, (-1,)),
+    ]
+    faces = gs.concatenate(
+        [
+            gs.stack([corners[0], corners[1], corners[3]], axis=-1),
+            gs.stack([corners[0], corners[3], corners[2]], axis=-1),
+        ]
+    )
+    return gs.reshape(vertices, (-1, 3)), faces
+
+
+@autodiff_only
+def test_benchmark_discrete_surfaces_exp_objective(scale, run_benchmark):
+    """Benchmark the objective of the exp of elastic metrics on surfaces."""
+    vertices, faces = _torus_mesh(20 * scale)
+    space = DiscreteSurfaces(faces)
+    tangent_vec = gs.random.rand(*vertices.shape) / 100
+
+    objective = space.metric.exp_solver._objective(vertices, vertices + tangent_vec)
+    next_next_point = gs.flatten(vertices + 2 * tangent_vec)
+
+    run_benchmark(gs.autodiff.value_and_grad(objective), next_next_point)
+
+
+@autodiff_only
+def test_benchmark_coarse_to_fine_path_straightening(scale, run_benchmark):
+    """Benchmark surface geodesics computed from a coarse mesh."""
+    vertices, faces = _torus_mesh(4 * scale)
+    coarse_space = DiscreteSurfaces(faces)
+    space = DiscreteSurfaces(coarse_space.subdivision_faces())
+    levels = [
+        ResolutionLevel(
+            coarse_space,
+            lambda point: point[..., : coarse_space.n_vertices, :],
+            coarse_space.subdivide,
+        )
+    ]
+    solver = CoarseToFinePathStraightening(
+        space, n_nodes=5, coarse_n_nodes=3, levels=levels
+    )
+
+    base_point = coarse_space.subdivide(vertices)
+    point = coarse_space.subdivide(1.5 * vertices)
+
+    run_benchmark(solver.discrete_geodesic_bvp, point, base_point, rounds=1)
+
+
+def test_benchmark_faq_aligner(scale, run_benchmark):
+    """Benchmark alignment of graphs to a common base graph by FAQ."""
+    total_space = GraphSpace(n_nodes=10)
+    total_space.equip_with_group_action()
+    aligner = FAQAligner(total_space)
+
+    point = total_space.random_point(100 * scale)
+    base_point = total_space.random_point()
+
+    run_benchmark(aligner.align, point, base_point)
+
+
+def test_benchmark_exhaustive_aligner(scale, run_benchmark):
+    """Benchmark exact alignment of graphs by branch and bound."""
+    total_space = GraphSpace(n_nodes=8)
+    total_space.equip_with_group_action()
+    aligner = ExhaustiveAligner(total_space)
+
+    point = total_space.random_point(2 * scale)
+    base_point = total_space.random_point(2 * scale)
+
+    run_benchmark(aligner.align, point, base_point, rounds=1)
+
+
+def test_benchmark_gtp_solver(scale, run_benchmark):
+    """Benchmark BHV distances computed by the GTP algorithm."""
+    space = TreeSpace(n_labels=5 + scale)
+    point_a = space.random_point(10 * scale)
+    point_b = space.random_point(10 * scale)
+
+    run_benchmark(space.metric.dist, point_a, point_b)
+
+
+def test_benchmark_bhv_dist_pairwise(scale, run_benchmark):
+    """Benchmark BHV distance matrices."""
+    space = TreeSpace(n_labels=10)
+    points = space.random_point(20 * scale)
+
+    run_benchmark(space.metric.dist_pairwise, points, rounds=1)
+
+
+def test_benchmark_wald_space_projection(scale, run_benchmark):
+    """Benchmark projection of ambient points into a Wald space grove."""
+    space = WaldSpace(n_labels=5)
+    ambient_point = space.lift(space.random_point(5 * scale))
+    topology = space.random_point(p_tree=1.0).topology
+
+    run_benchmark(space.metric.projection, ambient_point, topology, rounds=1)
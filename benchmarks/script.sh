@@ -3,21 +3,34 @@
 manifold="all"
 n_samples=10
 operation="all"
-while getopts m:n:o: flag
+scales="1"
+baseline=""
+while getopts m:n:o:s:b: flag
 do
     case "${flag}" in
         m) manifold=${OPTARG};;
         n) n_samples=${OPTARG};;
         o) operation=${OPTARG};;
+        s) scales=${OPTARG};;
+        b) baseline=${OPTARG};;
     esac
 done
 echo "Manifold: $manifold";
 echo "N Samples: $n_samples";
 echo "Operation: $operation";
+echo "Scales: $scales";
 
 
-python generate_benchmark_params.py
+python generate_benchmark_params.py -m "$manifold" -n "$n_samples"
 pytest exp/time_exp.py  --benchmark-columns='min, max'  --benchmark-sort='fullname'
 pytest log/time_log.py  --benchmark-columns='min, max'  --benchmark-sort='fullname'
 pytest dist/time_dist.py --benchmark-columns='min, max'  --benchmark-sort='fullname'
-pytest inner_produuct/time_inner_product.py --benchmark-columns='min, max'  --benchmark-sort='fullname'
\ No newline at end of file
+pytest inner_product/time_inner_product.py --benchmark-columns='min, max'  --benchmark-sort='fullname'
+
+pytest learning/time_learning.py numerics/time_numerics.py \
+    --benchmark-scales="$scales" \
+    --benchmark-columns='min, max, mean'  --benchmark-sort='fullname' \
+    --benchmark-json=results.json
+if [ -n "$baseline" ]; then
+    python compare_baseline.py "$baseline" results.json
+fi
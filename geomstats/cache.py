@@ -0,0 +1,128 @@
+"""Bounded caches for quantities computed at fixed base points."""
+
+import hashlib
+from collections import OrderedDict, namedtuple
+
+import geomstats.backend as gs
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class BasePointCache:
+    """Least-recently-used cache of quantities derived from base points.
+
+    Base points are identified by a hash of their content, shape and dtype,
+    so that equal arrays share entries even if they are distinct objects.
+    Each base point holds several named quantities, e.g. an
+    eigendecomposition and matrix powers derived from it. When more than
+    `maxsize` base points are stored, the least recently used one is evicted.
+
+    Cached quantities are not tracked by automatic differentiation: the cache
+    is meant for computations that are not differentiated with respect to
+    the base point.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of base points kept in the cache.
+        Optional, default: 32.
+    """
+
+    def __init__(self, maxsize=32):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be a positive integer, got {maxsize}.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        """Give number of base points in the cache."""
+        return len(self._entries)
+
+    @staticmethod
+    def key(base_point):
+        """Compute the key identifying a base point.
+
+        Parameters
+        ----------
+        base_point : array-like
+            Base point.
+
+        Returns
+        -------
+        key : str
+            Hash of the content, shape and dtype of the base point.
+        """
+        array = gs.to_numpy(base_point)
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(str((array.shape, array.dtype.str)).encode())
+        hasher.update(array.tobytes())
+        return hasher.hexdigest()
+
+    def get(self, base_point, name, func, key=None):
+        """Get a quantity at a base point, computing it if needed.
+
+        Parameters
+        ----------
+        base_point : array-like
+            Base point.
+        name : hashable
+            Name of the quantity.
+        func : callable
+            Function computing the quantity from the base point. Only called
+            on a cache miss.
+        key : str
+            Precomputed key of the base point, to avoid hashing it again.
+            Optional, default: None.
+
+        Returns
+        -------
+        value : any
+            Quantity at the base point.
+        """
+        if key is None:
+            key = self.key(base_point)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {}
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+
+        if name in entry:
+            self.hits += 1
+            return entry[name]
+
+        self.misses += 1
+        value = entry[name] = func(base_point)
+        return value
+
+    def invalidate(self, base_point):
+        """Remove all quantities stored for a base point.
+
+        Parameters
+        ----------
+        base_point : array-like
+            Base point.
+        """
+        self._entries.pop(self.key(base_point), None)
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self):
+        """Give statistics of the cache.
+
+        Returns
+        -------
+        info : CacheInfo
+            Named tuple with the number of hits and misses, the maximum size
+            and the current number of base points in the cache.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
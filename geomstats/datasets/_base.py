@@ -3,15 +3,24 @@
 Note: deeply inspired by sklearn.
 """
 
+import json
 import logging
 import os
 from collections import namedtuple
 from urllib.request import urlretrieve
 
+import numpy as np
+
 DEFAULT_DATA_DIR = os.path.expanduser(os.path.join("~", ".geomstats_data"))
+CACHE_DIR = "cache"
+CACHE_MANIFEST = "manifest.json"
+CACHE_FORMAT = 2
 
 
 RemoteFileMetadata = namedtuple("RemoteFileMetadata", ["filename", "url"])
+LocalDatasetMetadata = namedtuple(
+    "LocalDatasetMetadata", ["sources", "parse", "shared"], defaults=[()]
+)
 
 
 def _get_data_home(data_home=None):
@@ -37,3 +46,112 @@ def _fetch_remote(url, filename, dirname=None):
         urlretrieve(url, file_path)
 
     return file_path
+
+
+def _fingerprint(paths):
+    """Describe the state of files by their path, modification time and size.
+
+    Parameters
+    ----------
+    paths : list[str]
+        Paths of the files.
+
+    Returns
+    -------
+    fingerprint : list[list]
+        Absolute path, modification time in nanoseconds and size of each file.
+    """
+    fingerprint = []
+    for path in paths:
+        stat = os.stat(path)
+        fingerprint.append([os.path.abspath(path), stat.st_mtime_ns, stat.st_size])
+    return fingerprint
+
+
+def _read_cache(cache_dir, fingerprint, mmap_mode=None):
+    manifest_path = os.path.join(cache_dir, CACHE_MANIFEST)
+    try:
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest["format"] != CACHE_FORMAT or manifest["sources"] != fingerprint:
+            return None
+
+        return {
+            key: np.load(os.path.join(cache_dir, f"{key}.npy"), mmap_mode=mmap_mode)
+            for key in manifest["arrays"]
+        }
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _write_cache(cache_dir, fingerprint, arrays):
+    os.makedirs(cache_dir, exist_ok=True)
+
+    for key, array in arrays.items():
+        tmp_path = os.path.join(cache_dir, f"{key}.{os.getpid()}.tmp.npy")
+        np.save(tmp_path, array, allow_pickle=False)
+        os.replace(tmp_path, os.path.join(cache_dir, f"{key}.npy"))
+
+    manifest = {
+        "format": CACHE_FORMAT,
+        "sources": fingerprint,
+        "arrays": list(arrays),
+    }
+    tmp_path = os.path.join(cache_dir, f"{CACHE_MANIFEST}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as manifest_file:
+        json.dump(manifest, manifest_file)
+    os.replace(tmp_path, os.path.join(cache_dir, CACHE_MANIFEST))
+
+
+def _fetch_cached(name, sources, parse, data_home=None, mmap_mode=None):
+    """Load a dataset from its binary cache, building the cache if needed.
+
+    The arrays parsed from the source files are stored once as `.npy` files,
+    together with the path, modification time and size of the sources. The
+    cache is rebuilt when any of them changes, so that checking it does not
+    read the sources. If the cache cannot be written, the parsed arrays are
+    returned directly.
+
+    Parameters
+    ----------
+    name : str
+        Name of the dataset.
+    sources : list[str]
+        Paths of the source files of the dataset.
+    parse : callable
+        Function parsing the sources into a dict of numpy arrays, that can be
+        saved without pickling.
+    data_home : str
+        Directory where the cache is stored.
+        Optional, default: None, in which case `~/.geomstats_data` is used.
+    mmap_mode : {None, "r", "r+", "c"}
+        Memory-mapping mode of the cached arrays, see `numpy.load`.
+        Optional, default: None, in which case the arrays are read in memory.
+
+    Returns
+    -------
+    arrays : dict[str, numpy.ndarray]
+        Arrays of the dataset.
+    """
+    fingerprint = _fingerprint(sources)
+    try:
+        cache_dir = os.path.join(_get_data_home(data_home), CACHE_DIR, name)
+    except OSError as error:
+        logging.warning(f"Dataset '{name}' could not be cached: {error}")
+        return parse()
+
+    arrays = _read_cache(cache_dir, fingerprint, mmap_mode=mmap_mode)
+    if arrays is not None:
+        return arrays
+
+    logging.info(f"Building cache of dataset '{name}' in '{cache_dir}'.")
+    arrays = parse()
+    try:
+        _write_cache(cache_dir, fingerprint, arrays)
+    except OSError as error:
+        logging.warning(f"Dataset '{name}' could not be cached: {error}")
+        return arrays
+
+    if mmap_mode is None:
+        return arrays
+    return _read_cache(cache_dir, fingerprint, mmap_mode=mmap_mode)
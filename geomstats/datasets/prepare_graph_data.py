@@ -4,7 +4,8 @@ Lead author: Hadi Zaatiti.
 """
 
 import logging
-import random
+
+import numpy as np
 
 import geomstats.backend as gs
 from geomstats.geometry.poincare_ball import PoincareBall
@@ -56,6 +57,8 @@ class Graph:
         random walks of a specified length.
         Two consecutive nodes in the random walk, are necessarily
         related with an edge. The walks capture the structure of the graph.
+        All the walks are advanced by one step at a time. A walk that reaches
+        a node without edges stays there.
 
         Parameters
         ----------
@@ -69,25 +72,21 @@ class Graph:
         self : array-like, shape=[n_walks_per_node*self.n_edges, walk_length]
             Array containing random walks.
         """
-        paths = [
-            [0] * (walk_length + 1) for i in range(self.n_nodes * n_walks_per_node)
-        ]
-
-        for index in range(len(self.edges)):
-            for i in range(n_walks_per_node):
-                paths[index * n_walks_per_node + i] = self._walk(index, walk_length)
-        return gs.array(paths)
-
-    def _walk(self, index, walk_length):
-        """Generate a single random walk."""
-        count_index = index
-        path = [index]
+        edges = [self.edges[index] or [index] for index in range(self.n_nodes)]
+        degrees = gs.array([len(edges_) for edges_ in edges])
+        neighbors = gs.array([node for edges_ in edges for node in edges_])
+        offsets = gs.cumsum(degrees) - degrees
+
+        node = gs.repeat(gs.arange(self.n_nodes), n_walks_per_node)
+        path = [node]
         for _ in range(walk_length):
-            count_index = self.edges[count_index][
-                random.randint(0, len(self.edges[count_index]) - 1)
-            ]
-            path.append(count_index)
-        return gs.array(path, dtype=gs.int32)
+            step = gs.cast(
+                gs.floor(gs.random.rand(node.shape[0]) * degrees[node]), gs.int64
+            )
+            node = neighbors[offsets[node] + step]
+            path.append(node)
+
+        return gs.cast(gs.stack(path, axis=1), gs.int32)
 
 
 class HyperbolicEmbedding:
@@ -107,14 +106,27 @@ class HyperbolicEmbedding:
     n_negative : int
         Number of nodes to consider when searching for
         a set of nodes that are far from a particular node.
+    batch_size : int
+        Number of (example, context) pairs whose gradients are computed at
+        once. The gradients of the pairs sharing an example are summed before
+        updating its embedding.
     """
 
-    def __init__(self, dim=2, max_epochs=100, lr=0.05, n_context=1, n_negative=2):
+    def __init__(
+        self,
+        dim=2,
+        max_epochs=100,
+        lr=0.05,
+        n_context=1,
+        n_negative=2,
+        batch_size=256,
+    ):
         self.manifold = PoincareBall(dim)
         self.max_epochs = max_epochs
         self.lr = lr
         self.n_context = n_context
         self.n_negative = n_negative
+        self.batch_size = batch_size
 
     @staticmethod
     def log_sigmoid(vector):
@@ -181,7 +193,7 @@ class HyperbolicEmbedding:
             Current data sample embedding.
         context_embedding : array-like, shape=[dim]
             Current context embedding.
-        negative_embedding: array-like, shape=[dim]
+        negative_embedding: array-like, shape=[n_negative, dim]
             Current negative sample embedding.
 
         Returns
@@ -192,51 +204,102 @@ class HyperbolicEmbedding:
             The gradient of the loss function at the embedding
             of the current data sample.
         """
-        n_edges, dim = negative_embedding.shape[0], example_embedding.shape[-1]
-        example_embedding = gs.expand_dims(example_embedding, 0)
-        context_embedding = gs.expand_dims(context_embedding, 0)
+        n_negative, dim = negative_embedding.shape[0], example_embedding.shape[-1]
+        negative_embedding = gs.broadcast_to(negative_embedding, (n_negative, dim))
 
-        positive_distance = self.manifold.metric.squared_dist(
-            example_embedding, context_embedding
-        )
-        positive_loss = self.log_sigmoid(-positive_distance)
-
-        reshaped_example_embedding = gs.repeat(example_embedding, n_edges, axis=0)
-
-        negative_distance = self.manifold.metric.squared_dist(
-            reshaped_example_embedding, negative_embedding
+        return self._batch_loss(
+            gs.expand_dims(example_embedding, 0),
+            gs.expand_dims(context_embedding, 0),
+            gs.expand_dims(negative_embedding, 0),
         )
-        negative_loss = self.log_sigmoid(negative_distance)
 
-        total_loss = -(positive_loss + gs.sum(negative_loss))
+    def _batch_loss(self, example_embedding, context_embedding, negative_embedding):
+        """Compute loss and grad for a batch of examples.
 
-        positive_log_sigmoid_grad = -self.grad_log_sigmoid(-positive_distance)
-
-        positive_distance_grad = self.grad_squared_distance(
-            example_embedding, context_embedding
-        )
+        Parameters
+        ----------
+        example_embedding : array-like, shape=[batch_size, dim]
+            Embeddings of the data samples.
+        context_embedding : array-like, shape=[batch_size, dim]
+            Embeddings of their contexts.
+        negative_embedding: array-like, shape=[batch_size, n_negative, dim]
+            Embeddings of their negative samples.
 
-        positive_grad = (
-            gs.repeat(positive_log_sigmoid_grad, dim, axis=-1) * positive_distance_grad
+        Returns
+        -------
+        total_loss : array-like, shape=[batch_size]
+            Values of the loss function.
+        example_grad : array-like, shape=[batch_size, dim]
+            Gradients of the loss function at the embeddings of the data
+            samples.
+        """
+        metric = self.manifold.metric
+        reshaped_example_embedding = gs.broadcast_to(
+            gs.expand_dims(example_embedding, -2), negative_embedding.shape
         )
 
-        negative_distance_grad = self.grad_squared_distance(
+        positive_distance = metric.squared_dist(example_embedding, context_embedding)
+        negative_distance = metric.squared_dist(
             reshaped_example_embedding, negative_embedding
         )
+        total_loss = -(
+            self.log_sigmoid(-positive_distance)
+            + gs.sum(self.log_sigmoid(negative_distance), axis=-1)
+        )
 
-        negative_distance = gs.to_ndarray(negative_distance, to_ndim=2, axis=-1)
-        negative_log_sigmoid_grad = self.grad_log_sigmoid(negative_distance)
+        positive_grad = gs.expand_dims(
+            -self.grad_log_sigmoid(-positive_distance), -1
+        ) * self.grad_squared_distance(example_embedding, context_embedding)
+        negative_grad = gs.expand_dims(
+            self.grad_log_sigmoid(negative_distance), -1
+        ) * self.grad_squared_distance(reshaped_example_embedding, negative_embedding)
 
-        negative_grad = negative_log_sigmoid_grad * negative_distance_grad
+        example_grad = -(positive_grad + gs.sum(negative_grad, axis=-2))
+        return total_loss, example_grad
 
-        example_grad = -(positive_grad + gs.sum(negative_grad, axis=0))
+    def _context_pairs(self, random_walks):
+        """List the (example, context) pairs of nodes in random walks.
 
-        return total_loss, example_grad
+        The context of a node is made of the nodes at most `n_context`
+        steps before or after it in a walk.
+
+        Parameters
+        ----------
+        random_walks : array-like, shape=[n_walks, walk_length + 1]
+            Random walks.
+
+        Returns
+        -------
+        example_index : array-like, shape=[n_pairs]
+            Example nodes.
+        context_index : array-like, shape=[n_pairs]
+            Context nodes.
+        """
+        path_length = random_walks.shape[1]
+        example_index, context_index = [], []
+        for shift in range(1, min(self.n_context, path_length - 1) + 1):
+            example_index += [
+                random_walks[:, shift:],
+                random_walks[:, :-shift],
+            ]
+            context_index += [
+                random_walks[:, :-shift],
+                random_walks[:, shift:],
+            ]
+
+        example_index = gs.concatenate([gs.flatten(index) for index in example_index])
+        context_index = gs.concatenate([gs.flatten(index) for index in context_index])
+        return gs.cast(example_index, gs.int64), gs.cast(context_index, gs.int64)
 
     def embed(self, graph):
         """Compute embedding.
 
         Optimize a loss function to obtain a representable embedding.
+        At each epoch, all the (example, context) pairs of the random walks
+        are shuffled and processed by mini-batches: the Riemannian gradients
+        of each mini-batch are computed at once, summed over the pairs sharing
+        an example, and the embeddings of the examples are updated with the
+        exponential map.
 
         Parameters
         ----------
@@ -249,7 +312,7 @@ class HyperbolicEmbedding:
             Return the embedding of the data. Each data sample
             is represented as a point belonging to the manifold.
         """
-        nb_vertices_by_edges = [len(e_2) for _, e_2 in graph.edges.items()]
+        nb_vertices_by_edges = [len(graph.edges[i]) for i in range(graph.n_nodes)]
         logging.info("Number of edges: %s", len(graph.edges))
         logging.info(
             "Mean vertices by edges: %s",
@@ -257,71 +320,65 @@ class HyperbolicEmbedding:
         )
 
         negative_table_parameter = 5
-        negative_sampling_table = []
-
-        for i, nb_v in enumerate(nb_vertices_by_edges):
-            negative_sampling_table += (
-                [i] * int((nb_v ** (3.0 / 4.0))) * negative_table_parameter
-            )
+        negative_sampling_table = gs.repeat(
+            gs.arange(graph.n_nodes),
+            gs.array(
+                [
+                    int(nb_v ** (3.0 / 4.0)) * negative_table_parameter
+                    for nb_v in nb_vertices_by_edges
+                ]
+            ),
+        )
 
-        negative_sampling_table = gs.array(negative_sampling_table)
         random_walks = graph.random_walk()
+        example_index, context_index = self._context_pairs(random_walks)
+        n_pairs = example_index.shape[0]
+
         embeddings = gs.random.normal(size=(graph.n_nodes, self.manifold.dim))
         embeddings = embeddings * 0.2
 
         for epoch in range(self.max_epochs):
-            total_loss = []
-            for path in random_walks:
-                for example_index, one_path in enumerate(path):
-                    context_index = path[
-                        max(0, example_index - self.n_context) : min(
-                            example_index + self.n_context, len(path)
-                        )
-                    ]
-                    negative_index = gs.random.randint(
-                        negative_sampling_table.shape[0],
-                        size=(len(context_index), self.n_negative),
-                    )
-
-                    negative_index = gs.expand_dims(gs.flatten(negative_index), axis=-1)
-
-                    negative_index = gs.get_slice(
-                        negative_sampling_table, negative_index
-                    )
-
-                    example_embedding = embeddings[gs.cast(one_path, dtype=gs.int64)]
-
-                    for one_context_i, one_negative_i in zip(
-                        context_index, negative_index
-                    ):
-                        context_embedding = embeddings[one_context_i]
-
-                        negative_embedding = gs.get_slice(
-                            embeddings,
-                            gs.squeeze(gs.cast(one_negative_i, dtype=gs.int64)),
-                        )
-
-                        l, g_ex = self.loss(
-                            example_embedding, context_embedding, negative_embedding
-                        )
-                        total_loss.append(l)
-
-                        example_to_update = embeddings[one_path]
-
-                        valeur = self.manifold.metric.exp(
-                            -self.lr * g_ex, example_to_update
-                        )
-
-                        embeddings = gs.assignment(
-                            embeddings,
-                            valeur,
-                            gs.to_ndarray(one_path, to_ndim=1),
-                            axis=1,
-                        )
+            order = gs.from_numpy(np.argsort(gs.to_numpy(gs.random.rand(n_pairs))))
+            negative_index = negative_sampling_table[
+                gs.random.randint(
+                    negative_sampling_table.shape[0],
+                    size=(n_pairs, self.n_negative),
+                )
+            ]
+
+            total_loss = 0.0
+            for start in range(0, n_pairs, self.batch_size):
+                batch = order[start : start + self.batch_size]
+                batch_example_index = example_index[batch]
+
+                loss, example_grad = self._batch_loss(
+                    embeddings[batch_example_index],
+                    embeddings[context_index[batch]],
+                    embeddings[negative_index[batch]],
+                )
+                total_loss += gs.sum(loss)
+
+                nodes, inverse, counts = np.unique(
+                    gs.to_numpy(batch_example_index),
+                    return_inverse=True,
+                    return_counts=True,
+                )
+                cumulated_grad = gs.cumsum(
+                    example_grad[gs.from_numpy(np.argsort(inverse, kind="stable"))],
+                    axis=0,
+                )[gs.from_numpy(np.cumsum(counts) - 1)]
+                example_grad = cumulated_grad - gs.concatenate(
+                    [gs.zeros_like(cumulated_grad[:1]), cumulated_grad[:-1]]
+                )
+                nodes = gs.from_numpy(nodes)
+
+                embeddings[nodes] = self.manifold.metric.exp(
+                    -self.lr * example_grad, embeddings[nodes]
+                )
 
             logging.info(
                 "iteration %d loss_value %f",
                 epoch,
-                sum(total_loss, 0) / len(total_loss),
+                total_loss / n_pairs,
             )
         return embeddings
@@ -15,8 +15,14 @@ import numpy as np
 import pandas as pd
 
 import geomstats.backend as gs
-from geomstats.datasets._base import RemoteFileMetadata, _fetch_remote
+from geomstats.datasets._base import (
+    LocalDatasetMetadata,
+    RemoteFileMetadata,
+    _fetch_cached,
+    _fetch_remote,
+)
 from geomstats.datasets.prepare_graph_data import Graph
+from geomstats.errors import check_parameter_accepted_values
 from geomstats.geometry.hypersphere import Hypersphere
 from geomstats.geometry.skew_symmetric_matrices import SkewSymmetricMatrices
 from geomstats.geometry.special_orthogonal import SpecialOrthogonal
@@ -57,6 +63,137 @@ CUBE_VERTICES = os.path.join(CUBE_MESH_DIR, "vertices.npy")
 CUBE_FACES = os.path.join(CUBE_MESH_DIR, "faces.npy")
 
 
+def _parse_connectomes():
+    with open(CONNECTOMES_PATH) as csvfile:
+        data_list = list(csv.reader(csvfile))
+    patient_id = np.array([int(row[0]) for row in data_list[1:]])
+    data = np.array([[float(value) for value in row[1:]] for row in data_list[1:]])
+
+    with open(CONNECTOMES_LABELS_PATH) as csvfile:
+        labels = list(csv.reader(csvfile))
+    target = np.array([int(row[1]) for row in labels[1:]])
+    return {"data": data, "patient_id": patient_id, "target": target}
+
+
+def _parse_leaves():
+    data = pd.read_csv(LEAVES_PATH, sep=";")
+    return {
+        "beta_param": data[["nu", "mu"]].to_numpy(),
+        "distrib_type": data["Distribution"].to_numpy().astype(str),
+    }
+
+
+def _parse_optical_nerves():
+    nerves = pd.read_csv(OPTICAL_NERVES_PATH, sep="\t")
+    nerves = nerves.set_index("Filename")
+    nerves = nerves.drop(index=["laljn103.12b", "lalj0103.12b"])
+    nerves = nerves.reset_index(drop=True)
+    return {"data": nerves.to_numpy()}
+
+
+def _parse_hands():
+    return {
+        "data": pd.read_csv(HANDS_PATH, sep=" ").to_numpy(),
+        "labels": pd.read_csv(HANDS_LABELS_PATH).to_numpy().squeeze(),
+    }
+
+
+def _parse_cells():
+    with open(CELLS_PATH) as cells_file:
+        cells = cells_file.read().split("\n\n")
+    curves = [
+        np.array(
+            [[int(coord) for coord in point.split()] for point in cell.split("\n")]
+        )
+        for cell in cells
+    ]
+    ends = np.cumsum([len(curve) for curve in curves])
+    with open(CELL_LINES_PATH) as cell_lines_file:
+        cell_lines = cell_lines_file.read().split("\n")
+    with open(CELL_TREATMENTS_PATH) as treatments_file:
+        treatments = treatments_file.read().split("\n")
+    return {
+        "points": np.concatenate(curves).astype(np.float32),
+        "starts": ends - np.array([len(curve) for curve in curves]),
+        "ends": ends,
+        "cell_lines": np.array(cell_lines),
+        "treatments": np.array(treatments),
+    }
+
+
+DATASETS = {
+    "connectomes": LocalDatasetMetadata(
+        sources=[CONNECTOMES_PATH, CONNECTOMES_LABELS_PATH],
+        parse=_parse_connectomes,
+    ),
+    "leaves": LocalDatasetMetadata(sources=[LEAVES_PATH], parse=_parse_leaves),
+    "optical_nerves": LocalDatasetMetadata(
+        sources=[OPTICAL_NERVES_PATH], parse=_parse_optical_nerves
+    ),
+    "hands": LocalDatasetMetadata(
+        sources=[HANDS_PATH, HANDS_LABELS_PATH], parse=_parse_hands
+    ),
+    "cells": LocalDatasetMetadata(
+        sources=[CELLS_PATH, CELL_LINES_PATH, CELL_TREATMENTS_PATH],
+        parse=_parse_cells,
+        shared=("points",),
+    ),
+}
+
+
+def _iter_chunks(arrays, chunks, shared=()):
+    n_samples = len(next(array for key, array in arrays.items() if key not in shared))
+    for start in range(0, n_samples, chunks):
+        yield {
+            key: array if key in shared else array[start : start + chunks]
+            for key, array in arrays.items()
+        }
+
+
+def load_dataset(name, mmap_mode=None, chunks=None, data_home=None):
+    """Load the arrays of a registered dataset from its binary cache.
+
+    Each dataset of `DATASETS` is parsed from its source files once, and stored
+    as `.npy` files in the data home. The cache is rebuilt when the path,
+    modification time or size of a source file changes.
+
+    Parameters
+    ----------
+    name : str
+        Name of the dataset, among the keys of `DATASETS`.
+    mmap_mode : {None, "r", "r+", "c"}
+        Memory-mapping mode of the arrays, see `numpy.load`. Memory-mapped
+        arrays are read-only with "r": they should not be given directly to a
+        backend that shares memory with numpy arrays, e.g. pytorch.
+        Optional, default: None, in which case the arrays are read in memory.
+    chunks : int
+        If given, an iterator over chunks of `chunks` samples is returned.
+        Arrays shared by all samples, e.g. the points of the cells, are not
+        chunked.
+        Optional, default: None.
+    data_home : str
+        Directory where the cache is stored.
+        Optional, default: None, in which case `~/.geomstats_data` is used.
+
+    Returns
+    -------
+    arrays : dict[str, numpy.ndarray] or iterator
+        Arrays of the dataset, or iterator over chunks of them.
+    """
+    check_parameter_accepted_values(name, "name", list(DATASETS))
+    metadata = DATASETS[name]
+    arrays = _fetch_cached(
+        name,
+        metadata.sources,
+        metadata.parse,
+        data_home=data_home,
+        mmap_mode=mmap_mode,
+    )
+    if chunks is None:
+        return arrays
+    return _iter_chunks(arrays, chunks, shared=metadata.shared)
+
+
 def load_cities():
     """Load data from data/cities/cities.json.
 
@@ -171,14 +308,10 @@ def load_connectomes(as_vectors=False):
         Labels, whether patients belong to the diseased class (1) or control
         (0).
     """
-    with open(CONNECTOMES_PATH) as csvfile:
-        data_list = list(csv.reader(csvfile))
-    patient_id = gs.array([int(row[0]) for row in data_list[1:]])
-    data = gs.array([[float(value) for value in row[1:]] for row in data_list[1:]])
-
-    with open(CONNECTOMES_LABELS_PATH) as csvfile:
-        labels = list(csv.reader(csvfile))
-    target = gs.array([int(row[1]) for row in labels[1:]])
+    arrays = load_dataset("connectomes")
+    data = gs.array(arrays["data"])
+    patient_id = gs.array(arrays["patient_id"])
+    target = gs.array(arrays["target"])
     if as_vectors:
         return data, patient_id, target
     mat = SkewSymmetricMatrices(28).matrix_representation(data)
@@ -199,9 +332,9 @@ def load_leaves():
     distrib_type: array-like, shape=[172, ]
         Leaf orientation angle distribution type for each of the 172 species.
     """
-    data = pd.read_csv(LEAVES_PATH, sep=";")
-    beta_param = gs.array(data[["nu", "mu"]])
-    distrib_type = gs.squeeze(gs.array(data["Distribution"]))
+    arrays = load_dataset("leaves")
+    beta_param = gs.array(arrays["beta_param"])
+    distrib_type = gs.squeeze(gs.array(arrays["distrib_type"].astype(object)))
     return beta_param, distrib_type
 
 
@@ -256,11 +389,7 @@ def load_optical_nerves():
         Indices in 0...10 referencing the index of the monkey to which a given
         optical nerve belongs.
     """
-    nerves = pd.read_csv(OPTICAL_NERVES_PATH, sep="\t")
-    nerves = nerves.set_index("Filename")
-    nerves = nerves.drop(index=["laljn103.12b", "lalj0103.12b"])
-    nerves = nerves.reset_index(drop=True)
-    nerves_gs = gs.array(nerves.values)
+    nerves_gs = gs.array(load_dataset("optical_nerves")["data"])
 
     data = gs.reshape(nerves_gs, (nerves_gs.shape[0], -1, 3))
     labels = gs.tile([0, 1], [nerves_gs.shape[0] // 2])
@@ -301,11 +430,12 @@ def load_hands():
     bone_list : array-like
         List of bones, as a list of connexions between joints.
     """
-    data = gs.array(pd.read_csv(HANDS_PATH, sep=" ").values)
+    arrays = load_dataset("hands")
+    data = gs.array(arrays["data"])
     n_landmarks = 22
     dim = 3
     data = gs.reshape(data, (data.shape[0], n_landmarks, dim))
-    labels = gs.array(pd.read_csv(HANDS_LABELS_PATH).values.squeeze())
+    labels = gs.array(arrays["labels"])
 
     bone_list = gs.array(
         [
@@ -355,19 +485,14 @@ def load_cells():
     treatments : list of 650 strings
         List of the treatments given to each cell (control, cytd or jasp).
     """
-    with open(CELLS_PATH) as cells_file:
-        cells = cells_file.read().split("\n\n")
-    for i, cell in enumerate(cells):
-        cell = cell.split("\n")
-        curve = []
-        for point in cell:
-            coords = [int(coord) for coord in point.split()]
-            curve.append(coords)
-        cells[i] = gs.cast(gs.array(curve), gs.float32)
-    with open(CELL_LINES_PATH) as cell_lines_file:
-        cell_lines = cell_lines_file.read().split("\n")
-    with open(CELL_TREATMENTS_PATH) as treatments_file:
-        treatments = treatments_file.read().split("\n")
+    arrays = load_dataset("cells")
+    points = arrays["points"]
+    cells = [
+        gs.cast(gs.array(points[start:end]), gs.float32)
+        for start, end in zip(arrays["starts"], arrays["ends"])
+    ]
+    cell_lines = arrays["cell_lines"].tolist()
+    treatments = arrays["treatments"].tolist()
     return cells, cell_lines, treatments
 
 
@@ -3,10 +3,13 @@
 Lead author: Alice Le Brigant.
 """
 
-import copy
+import hashlib
 import logging
 import math
+import os
+from fractions import Fraction
 
+import numpy as np
 from scipy.interpolate import CubicSpline, PchipInterpolator
 
 import geomstats.backend as gs
@@ -25,6 +28,7 @@ from geomstats.numerics.finite_differences import (
     forward_difference,
     second_centered_difference,
 )
+from geomstats.numerics.interpolation import UniformUnitIntervalLinearInterpolator
 from geomstats.vectorization import check_is_batch, get_batch_shape
 
 
@@ -213,6 +217,29 @@ class DiscreteCurvesStartingAtOrigin(NFoldManifold):
 
         return interpolating_curve
 
+    def resample(self, point, k_sampling_points):
+        """Resample a discrete curve by linear interpolation.
+
+        This down-samples or up-samples curves, e.g. to pass them between
+        resolutions of a coarse-to-fine solver.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., k_sampling_points - 1, ambient_dim]
+            Discrete curve starting at the origin.
+        k_sampling_points : int
+            Number of sampling points of the resampled curve.
+
+        Returns
+        -------
+        resampled_point : array-like, shape=[..., k_sampling_points - 1, ambient_dim]
+            Discrete curve starting at the origin.
+        """
+        interpolator = UniformUnitIntervalLinearInterpolator(
+            self.insert_origin(point), point_ndim=1
+        )
+        return interpolator(gs.linspace(0.0, 1.0, k_sampling_points))[..., 1:, :]
+
     def length(self, point):
         """Compute the length of a discrete curve.
 
@@ -1249,6 +1276,12 @@ class DynamicProgrammingAligner(AlignerAlgorithm):
     :math:`\left[\frac{i}{n},\frac{i+1}{n}\right]` of :math:`\left[0,1\right]`,
     gamma is linear.
 
+    The integrals of the scalar product over all the linear pieces that gamma
+    can take are computed once per pair of curves. The tableau is then filled
+    one row at a time, the whole row being computed at once for a chunk of
+    pairs of curves, and the optimal pieces are stored as integer
+    backpointers.
+
     Parameters
     ----------
     total_space : Manifold
@@ -1259,6 +1292,14 @@ class DynamicProgrammingAligner(AlignerAlgorithm):
     max_slope : int
         Maximum slope allowed for a reparametrization.
         Optional, default: 6.
+    chunk_size : int
+        Number of pairs of curves aligned together. Memory grows linearly
+        with it.
+        Optional, default: 16.
+    cache_dir : str
+        Directory in which alignments are stored, keyed by the content of
+        the curves. If None, alignments are not stored.
+        Optional, default: None.
 
     References
     ----------
@@ -1267,10 +1308,23 @@ class DynamicProgrammingAligner(AlignerAlgorithm):
     Vision. 73(3):307-324, 2007.
     """
 
-    def __init__(self, total_space, n_space_grid=100, max_slope=6.0):
+    def __init__(
+        self,
+        total_space,
+        n_space_grid=100,
+        max_slope=6.0,
+        chunk_size=16,
+        cache_dir=None,
+    ):
         super().__init__(total_space)
         self.n_space_grid = n_space_grid
         self.max_slope = max_slope
+        self.chunk_size = chunk_size
+        self.cache_dir = cache_dir
+
+        self.srv_transform = SRVTransform(
+            total_space.ambient_manifold, total_space.k_sampling_points
+        )
 
     def _resample_srv_function(self, srv_function, k_sampling_points):
         """Resample SRV function of a discrete curve.
@@ -1294,219 +1348,399 @@ class DynamicProgrammingAligner(AlignerAlgorithm):
         return srv_function[..., indices, :]
 
     @staticmethod
-    def _compute_integral_restricted(srv_1, srv_2, x_min, x_max, y_min, y_max):
-        r"""Compute the value of an integral over a subinterval.
+    def _linear_pieces(x_length, y_length):
+        r"""Decompose a linear piece of gamma along the grid.
+
+        Gamma is linear from :math:`(0, 0)` to :math:`(x_length, y_length)`.
+        Its graph crosses the cells of the grid :math:`[a, a+1]\times[b, b+1]`
+        over intervals of :math:`t` of given lengths.
+
+        Parameters
+        ----------
+        x_length : int
+            Number of subintervals of the piece for the initial curve.
+        y_length : int
+            Number of subintervals of the piece for the end curve.
+
+        Returns
+        -------
+        pieces : list[tuple]
+            Offsets :math:`(a, b)` of the crossed cells and lengths of the
+            crossings.
+        """
+        bounds = sorted(
+            {Fraction(x_bound) for x_bound in range(x_length + 1)}
+            | {
+                Fraction(y_bound * x_length, y_length)
+                for y_bound in range(y_length + 1)
+            }
+        )
+        return [
+            (
+                math.floor(lower_bound),
+                math.floor(lower_bound * y_length / x_length),
+                float(upper_bound - lower_bound),
+            )
+            for lower_bound, upper_bound in zip(bounds[:-1], bounds[1:])
+        ]
+
+    def _segment_patterns(self):
+        """Give the increments of the linear pieces of gamma.
+
+        They are ordered so that, among pieces of equal value, the first one
+        starts at the lowest grid indices.
+        """
+        window = math.ceil(self.max_slope)
+        return [
+            (x_length, y_length)
+            for x_length in range(window, 0, -1)
+            for y_length in range(window, 0, -1)
+        ]
+
+    def _segment_integrals(self, initial_srv, end_srv, patterns):
+        r"""Compute the integrals over all linear pieces of gamma.
 
         Compute n * the value of the integral of
 
         .. math::
         srv_1(t)\cdotsrv_2(\gamma(t))\cdot|\gamma(t)|^\frac{1}{2}
 
-        over :math:`\left[\x_min,x_max\right]` where gamma restricted to
-        :math:`\left[\x_min,x_max\right]` is a linear.
+        over :math:`\left[m, m + x_length\right]` for gamma linear from
+        :math:`(m, k)` to :math:`(m + x_length, k + y_length)`, for all
+        pieces.
 
         Parameters
         ----------
-        srv_1 : array, shape=[n, ambient_dim]
-            SRV function of the initial curve.
-        srv_2 : array, shape=[n, ambient_dim]
-            SRV function of the end curve.
-        x_min : int
-            Beginning of the subinterval.
-        x_max : int
-            End of the subinterval.
-        y_min : int
-            Value of gamma at x_min.
-        y_max : int
-            Value of gamma at x_max.
+        initial_srv : array-like, shape=[n_pairs, n_space_grid, ambient_dim]
+            SRV functions of the initial curves.
+        end_srv : array-like, shape=[n_pairs, n_space_grid, ambient_dim]
+            SRV functions of the end curves.
+        patterns : list[tuple]
+            Increments of the linear pieces.
 
         Returns
         -------
-        value : float
-            Value of the integral described above.
+        integrals : array-like, shape=[n_pairs, n_patterns, n + 1, window + n + 1]
+            Integral over the piece of each pattern starting at
+            :math:`(m, k)`, stored at index :math:`[k, window + m]`.
         """
-        gamma_slope = (y_max - y_min) / (x_max - x_min)
+        n_space_grid = self.n_space_grid
+        window = math.ceil(self.max_slope)
+        scalar_products = gs.einsum("...ki,...mi->...km", end_srv, initial_srv)
+
+        integrals = []
+        for x_length, y_length in patterns:
+            n_x = n_space_grid - x_length + 1
+            n_y = n_space_grid - y_length + 1
+            integral = 0.0
+            for x_offset, y_offset, length in self._linear_pieces(x_length, y_length):
+                integral += (
+                    length
+                    * scalar_products[
+                        :, y_offset : y_offset + n_y, x_offset : x_offset + n_x
+                    ]
+                )
+            integral = math.sqrt(y_length / x_length) * integral
+            integrals.append(
+                gs.pad(
+                    integral,
+                    [
+                        [0, 0],
+                        [0, n_space_grid + 1 - n_y],
+                        [window, n_space_grid + 1 - n_x],
+                    ],
+                )
+            )
 
-        list_l = list(range(x_min, x_max + 1))
-        list_k = [(k - y_min) / gamma_slope + x_min for k in range(y_min, y_max + 1)]
+        return gs.stack(integrals, axis=1)
 
-        lower_bound = x_min
-        i = 1
-        j = 1
+    def _fill_tableau(self, integrals, patterns):
+        """Fill the dynamic programming tableau.
 
-        value = 0.0
-        while i < x_max - x_min + 1 and j < y_max - y_min + 1:
-            upper_bound = min(list_l[i], list_k[j])
-            length = upper_bound - lower_bound
-            value += length * gs.dot(srv_1[x_min + i - 1], srv_2[y_min + j - 1])
+        Parameters
+        ----------
+        integrals : array-like, shape=[n_pairs, n_patterns, n + 1, window + n + 1]
+            Integrals over the linear pieces, see `_segment_integrals`.
+        patterns : list[tuple]
+            Increments of the linear pieces.
 
-            if list_l[i] == list_k[j]:
-                i += 1
-                j += 1
-            elif list_l[i] < list_k[j]:
-                i += 1
-            else:
-                j += 1
-            lower_bound = upper_bound
+        Returns
+        -------
+        tableau : array-like, shape=[n_pairs, n + 1, window + n + 1]
+            Maximum scalar product of the curves restricted to
+            :math:`[0, i]`, with gamma ending at :math:`j`, stored at
+            index :math:`[j, window + i]`.
+        backpointers : array, shape=[n_pairs, n + 1, n + 1]
+            Index of the pattern of the last linear piece of gamma.
+        """
+        n_space_grid = self.n_space_grid
+        max_slope = self.max_slope
+        window = math.ceil(max_slope)
+        n_pairs = integrals.shape[0]
 
-        return math.pow(gamma_slope, 1 / 2) * value
+        x_lengths = np.array([x_length for x_length, _ in patterns])
+        y_lengths = np.array([y_length for _, y_length in patterns])
+        columns = window - x_lengths[:, None] + np.arange(n_space_grid + 1)
+        patterns_indices = gs.from_numpy(np.arange(len(patterns))[:, None])
+        columns_ = gs.from_numpy(columns)
 
-    def _reparametrize(self, curve, gamma):
-        """Reparametrize curve by gamma.
+        tableau = -math.inf * gs.ones(
+            (n_pairs, n_space_grid + 1, window + n_space_grid + 1)
+        )
+        tableau[:, 0, window] = 0.0
+        backpointers = np.zeros(
+            (n_pairs, n_space_grid + 1, n_space_grid + 1), dtype=int
+        )
+
+        grid = np.arange(n_space_grid + 1)
+        for j in range(1, n_space_grid + 1):
+            min_i = int(
+                max(
+                    math.floor(j / max_slope),
+                    n_space_grid - max_slope * (n_space_grid - j),
+                )
+            )
+            max_i = int(
+                min(
+                    j * max_slope,
+                    math.ceil(n_space_grid - (n_space_grid - j) * (1 / max_slope)),
+                )
+            )
+
+            rows = np.maximum(j - y_lengths, 0)
+            rows_ = gs.from_numpy(rows[:, None])
+            candidates = (
+                tableau[:, rows_, columns_]
+                + integrals[:, patterns_indices, rows_, columns_]
+            )
+            candidates = gs.where(
+                gs.from_numpy((j - y_lengths >= 0)[:, None]), candidates, -math.inf
+            )
+
+            best = gs.amax(candidates, axis=1)
+            in_band = gs.from_numpy((grid >= min_i) & (grid <= max_i))
+            tableau[:, j, window:] = gs.where(in_band, best, -math.inf)
+            backpointers[:, j] = gs.to_numpy(gs.argmax(candidates, axis=1))
+
+        return tableau, backpointers
+
+    def _optimal_gamma(self, backpointers, patterns):
+        """Compute the optimal reparametrization from the backpointers.
 
         Parameters
         ----------
-        curve : array, shape=[k_sampling_points, ambient_dim]
-            Discrete curve.
-        gamma : array, shape=[n_subinterval]
-            Parametrization of a curve.
+        backpointers : array, shape=[n_pairs, n + 1, n + 1]
+            Index of the pattern of the last linear piece of gamma.
+        patterns : list[tuple]
+            Increments of the linear pieces.
 
         Returns
         -------
-        new_curve : array , shape=[k_sampling_points, ambient_dim]
-            Curve reparametrized by gamma.
+        gamma_slopes : array, shape=[n_pairs, n + 1]
+            Slope of gamma on each subinterval.
+        gamma_constants : array, shape=[n_pairs, n + 1]
+            Constant of gamma on each subinterval.
         """
         n_space_grid = self.n_space_grid
-        k_sampling_points = curve.shape[-2]
+        n_pairs = backpointers.shape[0]
+        x_lengths = np.array([x_length for x_length, _ in patterns])
+        y_lengths = np.array([y_length for _, y_length in patterns])
+
+        gamma_slopes = np.zeros((n_pairs, n_space_grid + 1))
+        gamma_constants = np.zeros((n_pairs, n_space_grid + 1))
+
+        pairs = np.arange(n_pairs)
+        i_arrive = np.full(n_pairs, n_space_grid)
+        j_arrive = np.full(n_pairs, n_space_grid)
+        while np.any(i_arrive > 0):
+            active = pairs[i_arrive > 0]
+            pattern = backpointers[active, j_arrive[active], i_arrive[active]]
+            i_depart = i_arrive[active] - x_lengths[pattern]
+            j_depart = j_arrive[active] - y_lengths[pattern]
+
+            gamma_slope = y_lengths[pattern] / x_lengths[pattern]
+            gamma_constant = j_depart - i_depart * gamma_slope
+            for offset in range(max(x_lengths)):
+                on_piece = offset < x_lengths[pattern]
+                gamma_slopes[active[on_piece], i_depart[on_piece] + offset] = (
+                    gamma_slope[on_piece]
+                )
+                gamma_constants[active[on_piece], i_depart[on_piece] + offset] = (
+                    gamma_constant[on_piece]
+                )
 
-        new_curve = gs.zeros(curve.shape, dtype=float)
-        n_subinterval = len(gamma)
-        list_gamma_slope = gs.zeros(n_space_grid + 1, dtype=float)
-        list_gamma_constant = gs.zeros(n_space_grid + 1, dtype=float)
+            i_arrive[active], j_arrive[active] = i_depart, j_depart
 
-        new_curve[0] = curve[0]
-        new_curve[-1] = curve[-1]
+        return gamma_slopes, gamma_constants
 
-        for k in range(1, n_subinterval):
-            (i_depart, j_depart) = gamma[k - 1]
-            (i_arrive, j_arrive) = gamma[k]
-            gamma_slope = (j_arrive - j_depart) / (i_arrive - i_depart)
-            gamma_constant = j_depart - i_depart * gamma_slope
+    def _reparametrize(self, curve, gamma_slopes, gamma_constants):
+        """Reparametrize curves by gamma.
 
-            for i in range(i_depart, i_arrive):
-                list_gamma_slope[i] = gamma_slope
-                list_gamma_constant[i] = gamma_constant
+        Parameters
+        ----------
+        curve : array-like, shape=[n_pairs, k_sampling_points, ambient_dim]
+            Discrete curves.
+        gamma_slopes : array, shape=[n_pairs, n + 1]
+            Slope of gamma on each subinterval.
+        gamma_constants : array, shape=[n_pairs, n + 1]
+            Constant of gamma on each subinterval.
+
+        Returns
+        -------
+        new_curve : array-like, shape=[n_pairs, k_sampling_points - 1, ambient_dim]
+            Curves reparametrized by gamma, without their starting point.
+        """
+        n_space_grid = self.n_space_grid
+        k_sampling_points = curve.shape[-2]
 
         ratio_k = (n_space_grid - 1) / k_sampling_points
         ratio_n = (k_sampling_points - 1) / n_space_grid
-        for k in range(1, k_sampling_points):
-            indice_n = int(gs.floor(k * ratio_k))
-            gamma_indice_n = (k * ratio_k) * list_gamma_slope[
-                indice_n
-            ] + list_gamma_constant[indice_n]
-            gamma_indice_k = gamma_indice_n * ratio_n
-            indice_k = int(gs.floor(gamma_indice_k))
-            alpha = gamma_indice_k - indice_k
+        sampling_indices = np.arange(1, k_sampling_points)
+        indices_n = np.floor(sampling_indices * ratio_k).astype(int)
+
+        gamma_indices_n = (sampling_indices * ratio_k) * gamma_slopes[
+            :, indices_n
+        ] + gamma_constants[:, indices_n]
+        gamma_indices_k = gamma_indices_n * ratio_n
+        indices_k = np.floor(gamma_indices_k).astype(int)
+        alpha = gs.cast(
+            gs.from_numpy(gamma_indices_k - indices_k)[..., None], curve.dtype
+        )
 
-            new_curve[k] = curve[indice_k] * (1 - alpha) + curve[indice_k + 1] * alpha
+        pairs = gs.from_numpy(np.arange(curve.shape[0])[:, None])
+        indices_k = gs.from_numpy(indices_k)
+        return (
+            curve[pairs, indices_k] * (1 - alpha) + curve[pairs, indices_k + 1] * alpha
+        )
 
-        return new_curve
+    def _align_chunk(self, point, base_point):
+        r"""Align points to base points, for a chunk of pairs.
 
-    def _compute_squared_dist(self, initial_srv, end_srv, tableau):
-        """Compute squared distance using algorithmic information."""
+        Parameters
+        ----------
+        point : CurveCollection
+            Discrete curves to align, of length n_pairs.
+        base_point : CurveCollection
+            Reference discrete curves, of length n_pairs.
+
+        Returns
+        -------
+        aligned : array, shape=[n_pairs, k_sampling_points - 1, ambient_dim]
+            Curves reparametrized in an optimal way with respect to reference
+            curves.
+        squared_dist : array, shape=[n_pairs,]
+            Quotient distance between points and base points.
+        """
         n_space_grid = self.n_space_grid
+        window = math.ceil(self.max_slope)
+        initial_srv = base_point.resampled_srv
+        end_srv = point.resampled_srv
 
-        norm_squared_initial_srv = (
-            self._compute_integral_restricted(
-                initial_srv, initial_srv, 0, n_space_grid, 0, n_space_grid
-            )
-            / n_space_grid
-        )
-        norm_squared_end_srv = (
-            self._compute_integral_restricted(
-                end_srv, end_srv, 0, n_space_grid, 0, n_space_grid
-            )
-            / n_space_grid
-        )
+        patterns = self._segment_patterns()
+        integrals = self._segment_integrals(initial_srv, end_srv, patterns)
+        tableau, backpointers = self._fill_tableau(integrals, patterns)
+        gamma_slopes, gamma_constants = self._optimal_gamma(backpointers, patterns)
 
-        maximum_scalar_product = tableau[(n_space_grid, n_space_grid)] / n_space_grid
+        point_with_origin = insert_zeros(point.curves, axis=-2)
+        point_reparametrized = self._reparametrize(
+            point_with_origin, gamma_slopes, gamma_constants
+        )
 
-        return (
+        norm_squared_initial_srv = gs.sum(initial_srv**2, axis=(-2, -1))
+        norm_squared_end_srv = gs.sum(end_srv**2, axis=(-2, -1))
+        maximum_scalar_product = tableau[:, n_space_grid, window + n_space_grid]
+        squared_dist = (
             norm_squared_initial_srv + norm_squared_end_srv - 2 * maximum_scalar_product
-        )
+        ) / n_space_grid
+
+        return point_reparametrized, squared_dist
+
+    def _cache_path(self, point, base_point):
+        """Give the file storing the alignment of two collections of curves."""
+        key = hashlib.sha256(
+            "-".join(
+                [
+                    point.content_hash,
+                    base_point.content_hash,
+                    str(self.n_space_grid),
+                    str(self.max_slope),
+                ]
+            ).encode()
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.npz")
 
-    def _align_single(self, point, base_point, return_sdist=False):
-        r"""Align point to base point, non vectorized.
+    def precompute(self, points):
+        """Compute the SRV representations of curves once.
 
         Parameters
         ----------
-        point : array-like, shape=[k_sampling_points - 1, ambient_dim]
-            Discrete curve to align.
-        base_point : array-like, shape=[k_sampling_points - 1, ambient_dim]
-            Reference discrete curve.
-        return_sdist : bool
-            If True, also returns squared distance.
+        points : array-like, shape=[n_samples, k_sampling_points - 1, ambient_dim]
+            Discrete curves.
 
         Returns
         -------
-        aligned : array, shape=[k_sampling_points - 1, ambient_dim]
-            Curve reparametrized in an optimal way with respect to reference curve.
-        squared_dist : float
-            Quotient distance between point and base point.
-            If return_sdist is True.
+        collection : CurveCollection
+            Curves with their SRV representations.
         """
-        n_space_grid = self.n_space_grid
-        max_slope = self.max_slope
+        return CurveCollection(points, self)
 
-        k_sampling_points = self._total_space.k_sampling_points
-        srv_transform = SRVTransform(
-            self._total_space.ambient_manifold,
-            k_sampling_points,
-        )
-        initial_srv = srv_transform.diffeomorphism(base_point)
-        end_srv = srv_transform.diffeomorphism(point)
+    def align_precomputed(self, point, base_point, return_sdist=False):
+        """Align curves to base curves, given their SRV representations.
 
-        initial_srv = self._resample_srv_function(initial_srv, k_sampling_points)
-        end_srv = self._resample_srv_function(end_srv, k_sampling_points)
+        If `cache_dir` is set, the alignments are stored on disk, keyed by the
+        content of both collections of curves, and read from there if they
+        were already computed.
 
-        initial_srv_ = gs.copy(initial_srv)
-        end_srv_ = gs.copy(end_srv)
+        Parameters
+        ----------
+        point : CurveCollection
+            Discrete curves to align, of length n_pairs.
+        base_point : CurveCollection
+            Reference discrete curves, of length n_pairs.
+        return_sdist : bool
+            If True, also returns squared distance.
 
-        tableau = (-1.0) * gs.ones((n_space_grid + 1, n_space_grid + 1))
-        tableau[0, 0] = 0.0
-        gamma = {(0, 0): [(0, 0)]}
-        for j in range(1, n_space_grid + 1):
-            min_i = int(
-                max(
-                    gs.floor(j / max_slope),
-                    n_space_grid - max_slope * (n_space_grid - j),
-                )
+        Returns
+        -------
+        aligned : array-like, shape=[n_pairs, k_sampling_points - 1, ambient_dim]
+            Curves reparametrized in an optimal way with respect to reference
+            curves.
+        squared_dist : array, shape=[n_pairs,]
+            Quotient distance between points and base points.
+            If return_sdist is True.
+        """
+        if len(point) != len(base_point):
+            raise ValueError(
+                "Expected collections of same length, got "
+                f"{len(point)} and {len(base_point)}."
             )
-            max_i = int(
-                min(
-                    j * max_slope,
-                    gs.ceil(n_space_grid - (n_space_grid - j) * (1 / max_slope)),
-                )
+
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = self._cache_path(point, base_point)
+            if os.path.exists(cache_path):
+                with np.load(cache_path) as cached:
+                    aligned = gs.from_numpy(cached["aligned"])
+                    sdists = gs.from_numpy(cached["sdists"])
+                return (aligned, sdists) if return_sdist else aligned
+
+        out = [
+            self._align_chunk(
+                point[start : start + self.chunk_size],
+                base_point[start : start + self.chunk_size],
             )
-            for i in range(min_i, max_i + 1):
-                minimum_column_index = int(max(0, i - max_slope))
-                minimum_line_index = int(max(0, j - max_slope))
-                for m in range(minimum_column_index, i):
-                    for k in range(minimum_line_index, j):
-                        if tableau[k, m] != -1:
-                            new_value = tableau[
-                                k, m
-                            ] + self._compute_integral_restricted(
-                                initial_srv, end_srv, m, i, k, j
-                            )
-
-                            if tableau[j, i] < new_value:
-                                tableau[j, i] = new_value
-                                new_gamma = copy.deepcopy(gamma[(m, k)])
-                                new_gamma.append((i, j))
-                                gamma[(i, j)] = new_gamma
-
-        point_with_origin = insert_zeros(point, axis=-2)
-        point_reparametrized = self._reparametrize(
-            point_with_origin, gamma[(n_space_grid, n_space_grid)]
-        )[1:]
+            for start in range(0, len(point), self.chunk_size)
+        ]
+        aligned = gs.concatenate([out_[0] for out_ in out])
+        sdists = gs.concatenate([out_[1] for out_ in out])
 
-        if not return_sdist:
-            return point_reparametrized
+        if cache_path is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            np.savez(
+                cache_path, aligned=gs.to_numpy(aligned), sdists=gs.to_numpy(sdists)
+            )
 
-        return point_reparametrized, self._compute_squared_dist(
-            initial_srv_, end_srv_, tableau
-        )
+        return (aligned, sdists) if return_sdist else aligned
 
     def align(self, point, base_point, return_sdist=False):
         """Align point to base point.
@@ -1528,27 +1762,81 @@ class DynamicProgrammingAligner(AlignerAlgorithm):
             Quotient distance between point and base point.
             If return_sdist is True.
         """
-        is_batch = check_is_batch(
-            self._total_space.point_ndim,
-            point,
-            base_point,
-        )
-        if not is_batch:
-            return self._align_single(point, base_point, return_sdist=return_sdist)
-
+        point_ndim = self._total_space.point_ndim
         if point.ndim != base_point.ndim:
             point, base_point = gs.broadcast_arrays(point, base_point)
 
-        out = [
-            self._align_single(point_, base_point_, return_sdist=return_sdist)
-            for point_, base_point_ in zip(point, base_point)
-        ]
+        batch_shape = point.shape[:-point_ndim]
+        point_shape = point.shape[-point_ndim:]
+        point = gs.reshape(point, (-1,) + point_shape)
+        base_point = gs.reshape(base_point, (-1,) + point_shape)
+
+        aligned, sdists = self.align_precomputed(
+            self.precompute(point), self.precompute(base_point), return_sdist=True
+        )
+        aligned = gs.reshape(aligned, batch_shape + point_shape)
         if not return_sdist:
-            return gs.stack(out)
+            return aligned
+
+        return aligned, gs.reshape(sdists, batch_shape)
+
 
-        aligned = gs.stack([out_[0] for out_ in out])
-        sdists = gs.stack([out_[1] for out_ in out])
-        return aligned, sdists
+class CurveCollection:
+    """Discrete curves with their SRV representations.
+
+    The SRV representations of the curves, and their resampling on the grid
+    of a `DynamicProgrammingAligner`, are computed once, so that they can be
+    reused to align each curve to many others, e.g. to compute a matrix of
+    quotient distances.
+
+    Parameters
+    ----------
+    curves : array-like, shape=[n_curves, k_sampling_points - 1, ambient_dim]
+        Discrete curves starting at the origin.
+    aligner : DynamicProgrammingAligner
+        Aligner by which the curves are aligned.
+
+    Attributes
+    ----------
+    srv : array-like, shape=[n_curves, k_sampling_points - 1, ambient_dim]
+        SRV representations of the curves.
+    resampled_srv : array-like, shape=[n_curves, n_space_grid, ambient_dim]
+        SRV representations resampled on the grid of the aligner.
+    """
+
+    def __init__(self, curves, aligner, srv=None, resampled_srv=None):
+        self.curves = curves
+        if srv is None:
+            k_sampling_points = aligner._total_space.k_sampling_points
+            srv = aligner.srv_transform.diffeomorphism(curves)
+            resampled_srv = aligner._resample_srv_function(srv, k_sampling_points)
+        self.srv = srv
+        self.resampled_srv = resampled_srv
+        self._aligner = aligner
+        self._content_hash = None
+
+    def __len__(self):
+        """Give the number of curves."""
+        return self.curves.shape[0]
+
+    def __getitem__(self, index):
+        """Select curves, without recomputing their SRV representations."""
+        return CurveCollection(
+            self.curves[index],
+            self._aligner,
+            srv=self.srv[index],
+            resampled_srv=self.resampled_srv[index],
+        )
+
+    @property
+    def content_hash(self):
+        """Hash of the curves, identifying the collection on disk."""
+        if self._content_hash is None:
+            curves = np.ascontiguousarray(gs.to_numpy(self.curves))
+            content = hashlib.sha256(curves.tobytes())
+            content.update(str((curves.shape, curves.dtype)).encode())
+            self._content_hash = content.hexdigest()
+        return self._content_hash
 
 
 class SRVReparametrizationBundle(FiberBundle):
@@ -1583,6 +1871,38 @@ class SRVReparametrizationBundle(FiberBundle):
             aligner=IterativeHorizontalGeodesicAligner(total_space),
         )
 
+    def _align_factors(self, points):
+        """Compute the quantities reused by the aligner, e.g. SRV functions.
+
+        Parameters
+        ----------
+        points : array-like, shape=[n_samples, k_sampling_points - 1, ambient_dim]
+            Discrete curves.
+
+        Returns
+        -------
+        factors : array-like or CurveCollection
+            Output of the `precompute` method of the aligner.
+        """
+        return self.aligner.precompute(points)
+
+    def _align_from_factors(self, factors, base_factors):
+        """Align curves given by the output of `_align_factors`.
+
+        Parameters
+        ----------
+        factors : array-like or CurveCollection
+            Output of `_align_factors` for the curves to align.
+        base_factors : array-like or CurveCollection
+            Output of `_align_factors` for the base curves.
+
+        Returns
+        -------
+        aligned : array-like, shape=[n_samples, k_sampling_points - 1, ambient_dim]
+            Aligned curves.
+        """
+        return self.aligner.align_precomputed(factors, base_factors)
+
     def vertical_projection(self, tangent_vec, base_point, return_norm=False):
         """Compute vertical part of tangent vector at base point.
 
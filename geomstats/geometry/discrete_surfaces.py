@@ -3,7 +3,7 @@
 Lead authors: Emmanuel Hartman, Adele Myers.
 """
 
-import math
+import numpy as np
 
 import geomstats.backend as gs
 from geomstats.geometry.euclidean import Euclidean
@@ -13,7 +13,6 @@ from geomstats.geometry.riemannian_metric import RiemannianMetric
 from geomstats.numerics.geodesic import ExpSolver, PathStraightening
 from geomstats.numerics.optimizers import ScipyMinimize
 from geomstats.numerics.path import UniformlySampledDiscretePath
-from geomstats.vectorization import get_batch_shape
 
 
 class DiscreteSurfaces(Manifold):
@@ -37,6 +36,15 @@ class DiscreteSurfaces(Manifold):
     faces : integer array-like, shape=[n_faces, 3]
         Triangulation of the surface.
         Each face is given by 3 indices that indicate its vertices.
+
+    Notes
+    -----
+    The incidence between vertices and faces only depends on the
+    triangulation. It is stored once as a sparse operator, which gives for
+    each vertex the corners of the faces that contain it, padded to the
+    largest vertex degree. Sums over the faces incident to the vertices,
+    e.g. for the vertex areas and the mesh Laplacian, are then a gather and
+    a sum, which are vectorized and differentiable with every backend.
     """
 
     def __init__(
@@ -50,6 +58,8 @@ class DiscreteSurfaces(Manifold):
         self.n_faces = len(faces)
         self.n_vertices = int(gs.amax(self.faces) + 1)
         self.shape = (self.n_vertices, ambient_dim)
+        self._vertex_corners = self._incident_corners(self.faces, self.n_vertices)
+        self._subdivision = None
         super().__init__(
             dim=self.n_vertices * ambient_dim,
             shape=(self.n_vertices, 3),
@@ -165,6 +175,130 @@ class DiscreteSurfaces(Manifold):
         vertices = gs.reshape(vertices, (n_samples, self.n_vertices, 3))
         return vertices[0] if n_samples == 1 else vertices
 
+    @staticmethod
+    def _incident_corners(faces, n_vertices):
+        """Index the corners of the faces incident to each vertex.
+
+        The corner j of the face f has the flat index 3 * f + j. Vertices
+        have different degrees, so indices are padded with 3 * n_faces,
+        the index of the zero that `_sum_at_vertices` appends to the values.
+
+        Parameters
+        ----------
+        faces : integer array-like, shape=[n_faces, 3]
+            Triangulation of the surface.
+        n_vertices : int
+            Number of vertices.
+
+        Returns
+        -------
+        corners : integer array-like, shape=[n_vertices, max_degree]
+            Flat indices of the corners at each vertex.
+        """
+        corner_vertices = np.reshape(gs.to_numpy(faces), (-1,)).astype(int)
+        n_corners = len(corner_vertices)
+        order = np.argsort(corner_vertices, kind="stable")
+        degrees = np.bincount(corner_vertices, minlength=n_vertices)
+        sorted_vertices = corner_vertices[order]
+        positions = (
+            np.arange(n_corners) - (np.cumsum(degrees) - degrees)[sorted_vertices]
+        )
+
+        corners = np.full((n_vertices, max(degrees.max(), 1)), n_corners)
+        corners[sorted_vertices, positions] = order
+        return gs.from_numpy(corners)
+
+    def _sum_at_vertices(self, corner_values):
+        """Sum values given at the corners of the faces at each vertex.
+
+        Parameters
+        ----------
+        corner_values : array-like, shape=[..., n_faces, 3, dim]
+            Values at each corner of each face.
+
+        Returns
+        -------
+        vertex_values : array-like, shape=[..., n_vertices, dim]
+            Sum of the values at the corners of each vertex.
+        """
+        batch_shape = corner_values.shape[:-3]
+        dim = corner_values.shape[-1]
+        corner_values = gs.concatenate(
+            [
+                gs.reshape(corner_values, batch_shape + (-1, dim)),
+                gs.zeros(batch_shape + (1, dim), dtype=corner_values.dtype),
+            ],
+            axis=-2,
+        )
+        slc = tuple([slice(None)] * len(batch_shape))
+        return gs.sum(corner_values[*slc, self._vertex_corners], axis=-2)
+
+    def _midpoint_subdivision(self):
+        """Compute the edges and faces of the midpoint subdivision.
+
+        Returns
+        -------
+        edges : integer array-like, shape=[n_edges, 2]
+            Vertices of each edge. The midpoint of the edge i is the vertex
+            n_vertices + i of the subdivided surface.
+        faces : integer array-like, shape=[4 * n_faces, 3]
+            Triangulation of the subdivided surface.
+        """
+        if self._subdivision is not None:
+            return self._subdivision
+
+        faces = gs.to_numpy(self.faces).astype(int)
+        face_edges = np.sort(faces[:, [[0, 1], [1, 2], [2, 0]]], axis=-1)
+        edges, edge_indices = np.unique(
+            np.reshape(face_edges, (-1, 2)), axis=0, return_inverse=True
+        )
+        midpoints = self.n_vertices + np.reshape(edge_indices, (-1, 3))
+        mid_01, mid_12, mid_20 = midpoints[:, 0], midpoints[:, 1], midpoints[:, 2]
+        subdivided_faces = np.concatenate(
+            [
+                np.stack([faces[:, 0], mid_01, mid_20], axis=-1),
+                np.stack([faces[:, 1], mid_12, mid_01], axis=-1),
+                np.stack([faces[:, 2], mid_20, mid_12], axis=-1),
+                np.stack([mid_01, mid_12, mid_20], axis=-1),
+            ]
+        )
+        self._subdivision = gs.from_numpy(edges), gs.from_numpy(subdivided_faces)
+        return self._subdivision
+
+    def subdivision_faces(self):
+        """Triangulate the midpoint subdivision of the surfaces.
+
+        Each face is split in 4 faces by the midpoints of its edges. With
+        `subdivide`, this gives finer resolutions of the surfaces, e.g. for
+        coarse-to-fine geodesic solvers. The vertices of the surfaces are
+        the first vertices of the subdivided surfaces, so that restricting
+        subdivided surfaces is slicing their first n_vertices vertices.
+
+        Returns
+        -------
+        faces : integer array-like, shape=[4 * n_faces, 3]
+            Triangulation of the subdivided surfaces.
+        """
+        return self._midpoint_subdivision()[1]
+
+    def subdivide(self, point):
+        """Subdivide surfaces by adding the midpoints of their edges.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., n_vertices, 3]
+            Surface, as the 3D coordinates of the vertices of its triangulation.
+
+        Returns
+        -------
+        subdivided_point : array-like, shape=[..., n_vertices + n_edges, 3]
+            Surface triangulated by `subdivision_faces`.
+        """
+        edges, _ = self._midpoint_subdivision()
+        slc = tuple([slice(None)] * len(point.shape[:-2]))
+        edge_vertices = point[*slc, edges]
+        return gs.concatenate([point, gs.sum(edge_vertices, axis=-2) / 2.0], axis=-2)
+
     def _vertices(self, point):
         """Extract 3D vertices coordinates corresponding to each face.
 
@@ -210,12 +344,14 @@ class DiscreteSurfaces(Manifold):
         len_edge_01 = gs.linalg.norm((vertex_0 - vertex_1), axis=-1)
         half_perimeter = 0.5 * (len_edge_12 + len_edge_02 + len_edge_01)
         return gs.sqrt(
-            (
+            gs.clip(
                 half_perimeter
                 * (half_perimeter - len_edge_12)
                 * (half_perimeter - len_edge_02)
-                * (half_perimeter - len_edge_01)
-            ).clip(min=1e-6)
+                * (half_perimeter - len_edge_01),
+                1e-6,
+                None,
+            )
         )
 
     def vertex_areas(self, point):
@@ -235,27 +371,12 @@ class DiscreteSurfaces(Manifold):
         vertex_areas :  array-like, shape=[..., n_vertices]
             Vertex area for each vertex.
         """
-        batch_shape = point.shape[:-2]
-        n_vertices = point.shape[-2]
-        n_faces = self.faces.shape[0]
-
         area = self._triangle_areas(point)
-
-        id_vertices = gs.broadcast_to(
-            gs.reshape(self.faces, (-1,)), batch_shape + (math.prod(self.faces.shape),)
-        )
-        val = gs.reshape(
-            gs.broadcast_to(gs.expand_dims(area, axis=-2), batch_shape + (3, n_faces)),
-            batch_shape + (-1,),
-        )
-        incident_areas = gs.zeros(batch_shape + (n_vertices,), dtype=val.dtype)
-
-        incident_areas = gs.scatter_add(
-            incident_areas,
-            dim=-1,
-            index=id_vertices,
-            src=val,
+        corner_areas = gs.broadcast_to(
+            gs.expand_dims(gs.expand_dims(area, axis=-1), axis=-1),
+            area.shape + (3, 1),
         )
+        incident_areas = self._sum_at_vertices(corner_areas)[..., 0]
         return 2 * incident_areas / 3.0
 
     def normals(self, point):
@@ -379,38 +500,7 @@ class DiscreteSurfaces(Manifold):
             Function that evaluates the mesh Laplacian operator at a
             tangent vector field to the surface.
         """
-        n_vertices, n_faces = point.shape[-2], self.faces.shape[0]
-        vertex_0, vertex_1, vertex_2 = self._vertices(point)
-        len_edge_12 = gs.linalg.norm((vertex_1 - vertex_2), axis=-1)
-        len_edge_02 = gs.linalg.norm((vertex_0 - vertex_2), axis=-1)
-        len_edge_01 = gs.linalg.norm((vertex_0 - vertex_1), axis=-1)
-
-        half_perimeter = 0.5 * (len_edge_12 + len_edge_02 + len_edge_01)
-        area = gs.sqrt(
-            (
-                half_perimeter
-                * (half_perimeter - len_edge_12)
-                * (half_perimeter - len_edge_02)
-                * (half_perimeter - len_edge_01)
-            ).clip(min=1e-6)
-        )
-        sq_len_edge_12, sq_len_edge_02, sq_len_edge_01 = (
-            len_edge_12 * len_edge_12,
-            len_edge_02 * len_edge_02,
-            len_edge_01 * len_edge_01,
-        )
-        cot_12 = (sq_len_edge_02 + sq_len_edge_01 - sq_len_edge_12) / area
-        cot_02 = (sq_len_edge_12 + sq_len_edge_01 - sq_len_edge_02) / area
-        cot_01 = (sq_len_edge_12 + sq_len_edge_02 - sq_len_edge_01) / area
-        cot = gs.stack([cot_12, cot_02, cot_01], axis=-1)
-        cot /= 2.0
-        id_vertices_120 = self.faces[:, [1, 2, 0]]
-        id_vertices_201 = self.faces[:, [2, 0, 1]]
-        id_vertices = gs.reshape(
-            gs.stack([id_vertices_120, id_vertices_201], axis=0), (2, n_faces * 3)
-        )
-
-        cot_flatten = gs.expand_dims(gs.reshape(cot, point.shape[:-2] + (-1,)), axis=-1)
+        weights = self._cotangent_weights(point)
 
         def _laplacian(tangent_vec):
             """Evaluate the mesh Laplacian operator.
@@ -432,38 +522,75 @@ class DiscreteSurfaces(Manifold):
                 Mesh Laplacian operator of the triangulated surface applied
                 to one its tangent vector tangent_vec.
             """
-            batch_shape = get_batch_shape(2, point, tangent_vec)
-            slc = tuple([slice(None)] * len(batch_shape))
+            return self._apply_laplacian(weights, tangent_vec)
 
-            tangent_vec_diff = (
-                tangent_vec[*slc, id_vertices[0]] - tangent_vec[*slc, id_vertices[1]]
-            )
+        return _laplacian
 
-            values = gs.einsum(
-                "...bd,...bd->...bd",
-                gs.broadcast_to(cot_flatten, batch_shape + (n_faces * 3, 3)),
-                tangent_vec_diff,
-            )
+    def _cotangent_weights(self, point):
+        """Compute the weights of the edges in the mesh Laplacian.
 
-            laplacian_at_tangent_vec = gs.zeros(
-                batch_shape + (n_vertices, 3), dtype=values.dtype
-            )
+        The edge j of a face goes from its corner j + 1 to its corner j + 2,
+        modulo 3, and its weight is twice the cotangent of the angle at the
+        corner j.
 
-            id_vertices_201 = id_vertices[1, :]
-            id_vertices_201 = gs.broadcast_to(
-                id_vertices_201, batch_shape + id_vertices_201.shape
-            )
+        Parameters
+        ----------
+        point : array-like, shape=[..., n_vertices, 3]
+            Surface, as the 3D coordinates of the vertices of its triangulation.
 
-            for i_dim in range(3):
-                laplacian_at_tangent_vec[*slc, :, i_dim] = gs.scatter_add(
-                    input=laplacian_at_tangent_vec[*slc, :, i_dim],
-                    dim=-1,
-                    index=id_vertices_201,
-                    src=values[*slc, :, i_dim],
-                )
-            return laplacian_at_tangent_vec
+        Returns
+        -------
+        weights : array-like, shape=[..., n_faces, 3]
+            Weight of each edge of each face.
+        """
+        vertex_0, vertex_1, vertex_2 = self._vertices(point)
+        sq_len_edge_12 = gs.sum((vertex_1 - vertex_2) ** 2, axis=-1)
+        sq_len_edge_02 = gs.sum((vertex_0 - vertex_2) ** 2, axis=-1)
+        sq_len_edge_01 = gs.sum((vertex_0 - vertex_1) ** 2, axis=-1)
+        area = self._triangle_areas(point)
 
-        return _laplacian
+        cot_12 = sq_len_edge_02 + sq_len_edge_01 - sq_len_edge_12
+        cot_02 = sq_len_edge_12 + sq_len_edge_01 - sq_len_edge_02
+        cot_01 = sq_len_edge_12 + sq_len_edge_02 - sq_len_edge_01
+        return gs.stack([cot_12, cot_02, cot_01], axis=-1) / (
+            2.0 * gs.expand_dims(area, axis=-1)
+        )
+
+    def _apply_laplacian(self, weights, tangent_vec, transpose=False):
+        """Apply the mesh Laplacian operator or its transpose.
+
+        The Laplacian adds to the end vertex of each edge of each face the
+        weighted difference of the tangent vector between the start and
+        the end of the edge.
+
+        Parameters
+        ----------
+        weights : array-like, shape=[..., n_faces, 3]
+            Weights of the edges, see `_cotangent_weights`.
+        tangent_vec : array-like, shape=[..., n_vertices, 3]
+            Tangent vector, i.e. a vector field on the surface.
+        transpose : bool
+            Whether to apply the transpose of the operator.
+            Optional, default: False.
+
+        Returns
+        -------
+        laplacian_at_tangent_vec : array-like, shape=[..., n_vertices, 3]
+            Mesh Laplacian operator, or its transpose, applied to tangent_vec.
+        """
+        slc = tuple([slice(None)] * len(tangent_vec.shape[:-2]))
+        face_vecs = tangent_vec[*slc, self.faces]
+        end_vecs = face_vecs[..., [2, 0, 1], :]
+        weights = gs.expand_dims(weights, axis=-1)
+
+        if transpose:
+            values = weights * end_vecs
+            return self._sum_at_vertices(
+                values[..., [2, 0, 1], :] - values[..., [1, 2, 0], :]
+            )
+
+        values = weights * (face_vecs[..., [1, 2, 0], :] - end_vecs)
+        return self._sum_at_vertices(values[..., [1, 2, 0], :])
 
 
 class ElasticMetric(RiemannianMetric):
@@ -596,7 +723,7 @@ class ElasticMetric(RiemannianMetric):
             arXiv:2204.04238 [cs.CV], 25 Sep 2022.
         """
         return self.a1 * gs.sum(
-            gs.einsum("...bii->...b", gs.matmul(ginvdga, ginvdgb)) * areas_bp,
+            Matrices.trace_product(ginvdga, ginvdgb) * areas_bp,
             axis=-1,
         )
 
@@ -635,8 +762,8 @@ class ElasticMetric(RiemannianMetric):
             arXiv:2204.04238 [cs.CV], 25 Sep 2022.
         """
         return self.b1 * gs.sum(
-            gs.einsum("...bii->...b", ginvdga)
-            * gs.einsum("...bii->...b", ginvdgb)
+            (ginvdga[..., 0, 0] + ginvdga[..., 1, 1])
+            * (ginvdgb[..., 0, 0] + ginvdgb[..., 1, 1])
             * areas_bp,
             axis=-1,
         )
@@ -739,15 +866,9 @@ class ElasticMetric(RiemannianMetric):
         )
 
         return self.d1 * gs.sum(
-            gs.einsum(
-                "...bii->...b",
-                gs.matmul(
-                    xa_0,
-                    gs.matmul(
-                        inv_surface_metrics_bp,
-                        Matrices.transpose(xb_0),
-                    ),
-                ),
+            Matrices.trace_product(
+                xa_0,
+                gs.matmul(inv_surface_metrics_bp, Matrices.transpose(xb_0)),
             )
             * areas_bp,
             axis=-1,
@@ -863,7 +984,7 @@ class ElasticMetric(RiemannianMetric):
                     base_point=base_point,
                     vertex_areas_bp=vertex_areas_bp,
                 )
-        if self.a1 > 0 or self.b1 > 0 or self.c1 > 0 or self.b1 > 0:
+        if self.a1 > 0 or self.b1 > 0 or self.c1 > 0 or self.d1 > 0:
             one_forms_bp = self._space.surface_one_forms(base_point)
             surface_metrics_bp = self._space._surface_metric_matrices_from_one_forms(
                 one_forms_bp
@@ -920,6 +1041,112 @@ class ElasticMetric(RiemannianMetric):
             + inner_prod_d1
         )
 
+    def inner_product_gradient(self, tangent_vec, base_point):
+        r"""Compute the gradient of the inner-product with a tangent vector.
+
+        The gradient is taken with respect to the other tangent vector
+        :math:`k`, at :math:`k = 0`, and is computed in closed form for each
+        of the 6 terms of the inner-product. On the bilinear terms this is
+        the metric applied to the tangent vector :math:`h`. The terms
+        of coefficients a1, b1 and c1 are evaluated on the finite differences
+        of the surface metric and normals between :math:`q + h` and
+        :math:`q`, so that they are only linearized with respect to
+        :math:`k`, as in `inner_product`.
+
+        Parameters
+        ----------
+        tangent_vec : array-like, shape=[..., n_vertices, 3]
+            Tangent vector at base point.
+        base_point : array-like, shape=[n_vertices, 3]
+            Surface, as the 3D coordinates of the vertices of its triangulation.
+
+        Returns
+        -------
+        gradient : array-like, shape=[..., n_vertices, 3]
+            Gradient of the inner-product with tangent_vec.
+        """
+        gradient = gs.zeros_like(tangent_vec)
+
+        if self.a0 > 0 or self.a2 > 0:
+            vertex_areas_bp = gs.expand_dims(
+                self._space.vertex_areas(base_point), axis=-1
+            )
+            if self.a0 > 0:
+                gradient = gradient + self.a0 * vertex_areas_bp * tangent_vec
+            if self.a2 > 0:
+                weights = self._space._cotangent_weights(base_point)
+                laplacian = self._space._apply_laplacian(weights, tangent_vec)
+                gradient = gradient + self.a2 * self._space._apply_laplacian(
+                    weights, laplacian / vertex_areas_bp, transpose=True
+                )
+
+        if self.a1 > 0 or self.b1 > 0 or self.c1 > 0 or self.d1 > 0:
+            one_forms_bp = self._space.surface_one_forms(base_point)
+            one_forms_bp_t = Matrices.transpose(one_forms_bp)
+            surface_metrics_bp = self._space._surface_metric_matrices_from_one_forms(
+                one_forms_bp
+            )
+            areas_bp = gs.sqrt(gs.linalg.det(surface_metrics_bp))
+            ginv_bp = gs.linalg.inv(surface_metrics_bp)
+
+            point_a = base_point + tangent_vec
+            one_forms_a = self._space.surface_one_forms(point_a)
+
+            one_forms_gradient = gs.zeros_like(one_forms_a)
+            if self.c1 > 0:
+                dna = self._space.normals(point_a) - self._space.normals(base_point)
+                one_forms_gradient = one_forms_gradient + self.c1 / 2 * gs.stack(
+                    [
+                        gs.cross(one_forms_bp[..., 1, :], dna),
+                        gs.cross(dna, one_forms_bp[..., 0, :]),
+                    ],
+                    axis=-2,
+                )
+            if self.d1 > 0:
+                xa = one_forms_a - one_forms_bp
+                xa_0 = gs.matmul(
+                    gs.matmul(one_forms_bp_t, ginv_bp),
+                    gs.matmul(xa, one_forms_bp_t)
+                    - gs.matmul(one_forms_bp, Matrices.transpose(xa)),
+                )
+                ginv_xa_0 = gs.matmul(
+                    gs.matmul(ginv_bp, one_forms_bp), gs.matmul(xa_0, ginv_bp)
+                )
+                one_forms_gradient = one_forms_gradient + self.d1 * gs.matmul(
+                    ginv_xa_0 - Matrices.transpose(ginv_xa_0), one_forms_bp
+                )
+            if self.a1 > 0 or self.b1 > 0:
+                dga = (
+                    gs.matmul(one_forms_a, Matrices.transpose(one_forms_a))
+                    - surface_metrics_bp
+                )
+                ginvdga = gs.matmul(ginv_bp, dga)
+                if self.a1 > 0:
+                    one_forms_gradient = one_forms_gradient + 2 * self.a1 * gs.matmul(
+                        gs.matmul(ginvdga, ginv_bp), one_forms_bp
+                    )
+                if self.b1 > 0:
+                    one_forms_gradient = one_forms_gradient + 2 * self.b1 * gs.einsum(
+                        "...f,...fij->...fij",
+                        ginvdga[..., 0, 0] + ginvdga[..., 1, 1],
+                        gs.matmul(ginv_bp, one_forms_bp),
+                    )
+
+            one_forms_gradient = gs.einsum(
+                "...f,...fij->...fij", areas_bp, one_forms_gradient
+            )
+            corner_gradients = gs.stack(
+                [
+                    -gs.sum(one_forms_gradient, axis=-2),
+                    one_forms_gradient[..., 0, :],
+                    one_forms_gradient[..., 1, :],
+                ],
+                axis=-2,
+            )
+            gradient = gradient + self._space._sum_at_vertices(corner_gradients)
+
+        return gradient
+
 
 class DiscreteSurfacesExpSolver(ExpSolver):
     """Class to solve the initial value problem (IVP) for exp.
@@ -955,7 +1182,10 @@ class DiscreteSurfacesExpSolver(ExpSolver):
         energy_objective : callable
             Computes energy wrt next next point.
         """
-        zeros = gs.zeros_like(current_point)
+        current_to_next = next_point - current_point
+        energy_1 = self._space.metric.inner_product_gradient(
+            current_to_next, current_point
+        )
 
         def energy_objective(flat_next_next_point):
             """Compute the energy objective to minimize.
@@ -971,31 +1201,8 @@ class DiscreteSurfacesExpSolver(ExpSolver):
                 Energy objective to minimize.
             """
             next_next_point = gs.reshape(flat_next_next_point, self._space.shape)
-            current_to_next = next_point - current_point
             next_to_next_next = next_next_point - next_point
 
-            def _inner_product_with_current_to_next(tangent_vec):
-                """Compute inner-product with tangent vector `current_to_next`.
-
-                The tangent vector `current_to_next` is the vector going from the
-                current point, i.e. discrete surface, to the next point on the
-                geodesic that is being computed.
-                """
-                return self._space.metric.inner_product(
-                    current_to_next, tangent_vec, current_point
-                )
-
-            def _inner_product_with_next_to_next_next(tangent_vec):
-                """Compute inner-product with tangent vector `next_to_next_next`.
-
-                The tangent vector `next_to_next_next` is the vector going from the
-                next point, i.e. discrete surface, to the next next point on the
-                geodesic that is being computed.
-                """
-                return self._space.metric.inner_product(
-                    next_to_next_next, tangent_vec, next_point
-                )
-
             def _norm(base_point):
                 """Compute norm of `next_to_next_next` at the base_point.
 
@@ -1005,14 +1212,9 @@ class DiscreteSurfacesExpSolver(ExpSolver):
                 """
                 return self._space.metric.squared_norm(next_to_next_next, base_point)
 
-            _, energy_1 = gs.autodiff.value_and_grad(
-                _inner_product_with_current_to_next,
-                point_ndims=2,
-            )(zeros)
-            _, energy_2 = gs.autodiff.value_and_grad(
-                _inner_product_with_next_to_next_next,
-                point_ndims=2,
-            )(zeros)
+            energy_2 = self._space.metric.inner_product_gradient(
+                next_to_next_next, next_point
+            )
             _, energy_3 = gs.autodiff.value_and_grad(_norm, point_ndims=2)(next_point)
 
             energy_tot = 2 * energy_1 - 2 * energy_2 + energy_3
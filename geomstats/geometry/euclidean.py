@@ -72,6 +72,8 @@ class EuclideanMetric(RiemannianMetric):
     - positive definite
     """
 
+    _analytic_derivative_matrix = True
+
     def __init__(self, space, metric_matrix=None, signature=None):
         super().__init__(space, signature=signature)
         self._check_metric_matrix_dim(space, metric_matrix)
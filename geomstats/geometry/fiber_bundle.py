@@ -41,6 +41,38 @@ class AlignerAlgorithm(ABC):
             Aligned point.
         """
 
+    def precompute(self, points):
+        """Compute per-point quantities reused when aligning many pairs.
+
+        Parameters
+        ----------
+        points : array-like, shape=[n_samples, *total_space.shape]
+            Points.
+
+        Returns
+        -------
+        factors : array-like
+            Per-point quantities, indexable along the points dimension.
+        """
+        return points
+
+    def align_precomputed(self, point, base_point):
+        """Align points given by the output of `precompute`.
+
+        Parameters
+        ----------
+        point : array-like
+            Output of `precompute` for the points to align.
+        base_point : array-like
+            Output of `precompute` for the base points.
+
+        Returns
+        -------
+        aligned_point : array-like, shape=[n_samples, *total_space.shape]
+            Aligned points.
+        """
+        return self.align(point, base_point)
+
 
 class DistanceMinimizationBasedAligner(AlignerAlgorithm):
     """Aligment based on minimization of squared distance.
@@ -243,6 +275,41 @@ class FiberBundle(ABC):
             raise NotImplementedError("Alignment is not implemented.")
         return self.aligner.align(point, base_point)
 
+    def _align_factors(self, points):
+        """Compute per-point quantities reused when aligning many pairs.
+
+        Bundles whose aligner can reuse such quantities override this method
+        together with `_align_from_factors`.
+
+        Parameters
+        ----------
+        points : array-like, shape=[n_samples, *total_space.shape]
+            Points.
+
+        Returns
+        -------
+        factors : array-like
+            Per-point quantities, indexable along the points dimension.
+        """
+        return points
+
+    def _align_from_factors(self, factors, base_factors):
+        """Align points given by the output of `_align_factors`.
+
+        Parameters
+        ----------
+        factors : array-like
+            Output of `_align_factors` for the points to align.
+        base_factors : array-like
+            Output of `_align_factors` for the base points.
+
+        Returns
+        -------
+        aligned_point : array-like, shape=[n_samples, *total_space.shape]
+            Aligned points.
+        """
+        return self.align(factors, base_factors)
+
     def horizontal_projection(self, tangent_vec, base_point):
         r"""Project to horizontal subspace.
 
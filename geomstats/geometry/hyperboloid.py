@@ -387,6 +387,43 @@ class HyperboloidMetric(RiemannianMetric):
 
         return gs.arccosh(cosh_angle)
 
+    def _dist_factors(self, points):
+        """Normalize points once before computing tiles of distances.
+
+        Parameters
+        ----------
+        points : array-like, shape=[n_samples, dim + 1]
+            Points in hyperbolic space.
+
+        Returns
+        -------
+        unit_points : array-like, shape=[n_samples, dim + 1]
+            Points divided by the square root of the absolute value
+            of their Minkowski squared norm.
+        """
+        sq_norm = self._space.embedding_space.metric.squared_norm(points)
+        return gs.einsum("...,...j->...j", 1.0 / gs.sqrt(gs.abs(sq_norm)), points)
+
+    def _dist_tile(self, factors_a, factors_b):
+        """Compute a tile of distances from the Minkowski Gram matrix.
+
+        Parameters
+        ----------
+        factors_a : array-like, shape=[n_samples_a, dim + 1]
+            Normalized first set of points.
+        factors_b : array-like, shape=[n_samples_b, dim + 1]
+            Normalized second set of points.
+
+        Returns
+        -------
+        dist : array-like, shape=[n_samples_a, n_samples_b]
+            Geodesic distances between points of both sets.
+        """
+        metric_mat = self._space.embedding_space.metric.metric_matrix()
+        cosh_angle = -gs.einsum("ni,ij,mj->nm", factors_a, metric_mat, factors_b)
+        cosh_angle = gs.clip(cosh_angle, 1.0, 1e24)
+        return gs.arccosh(cosh_angle)
+
     def parallel_transport(
         self, tangent_vec, base_point, direction=None, end_point=None
     ):
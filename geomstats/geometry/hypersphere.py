@@ -818,6 +818,40 @@ class HypersphereMetric(RiemannianMetric):
         """
         return self.dist(point_a, point_b) ** 2
 
+    def _dist_factors(self, points):
+        """Normalize points once before computing tiles of distances.
+
+        Parameters
+        ----------
+        points : array-like, shape=[n_samples, dim + 1]
+            Points on the hypersphere.
+
+        Returns
+        -------
+        unit_points : array-like, shape=[n_samples, dim + 1]
+            Points divided by their norm.
+        """
+        norm = self._space.embedding_space.metric.norm(points)
+        return gs.einsum("...,...j->...j", 1.0 / norm, points)
+
+    def _dist_tile(self, factors_a, factors_b):
+        """Compute a tile of distances from the Gram matrix of unit points.
+
+        Parameters
+        ----------
+        factors_a : array-like, shape=[n_samples_a, dim + 1]
+            Normalized first set of points.
+        factors_b : array-like, shape=[n_samples_b, dim + 1]
+            Normalized second set of points.
+
+        Returns
+        -------
+        dist : array-like, shape=[n_samples_a, n_samples_b]
+            Geodesic distances between points of both sets.
+        """
+        cos_angle = gs.clip(gs.matmul(factors_a, gs.transpose(factors_b)), -1, 1)
+        return gs.arccos(cos_angle)
+
     def parallel_transport(
         self, tangent_vec, base_point, direction=None, end_point=None
     ):
@@ -869,6 +903,55 @@ class HypersphereMetric(RiemannianMetric):
         )
         return transported
 
+    def exp_differential_adjoints(self, end_tangent_vec, tangent_vec, base_point):
+        r"""Compute the adjoints of the differentials of the exponential map.
+
+        Writing :math:`q = Exp_p(v)`, compute the adjoints of the
+        differentials of :math:`Exp` with respect to :math:`p` and :math:`v`,
+        applied to a tangent vector :math:`w` at :math:`q`. They are given
+        in closed form by the Jacobi fields of the sphere: the component of
+        :math:`w` along the geodesic is transported back unchanged, while
+        the orthogonal component is scaled by :math:`\cos(|v|)` and
+        :math:`\sin(|v|) / |v|` respectively.
+
+        Parameters
+        ----------
+        end_tangent_vec : array-like, shape=[..., dim + 1]
+            Tangent vector at :math:`Exp_p(v)`.
+        tangent_vec : array-like, shape=[..., dim + 1]
+            Tangent vector :math:`v` at base point.
+        base_point : array-like, shape=[..., dim + 1]
+            Point on the hypersphere.
+
+        Returns
+        -------
+        base_point_adjoint : array-like, shape=[..., dim + 1]
+            Adjoint of the differential with respect to the base point,
+            tangent vector at base point.
+        tangent_vec_adjoint : array-like, shape=[..., dim + 1]
+            Adjoint of the differential with respect to the tangent vector,
+            tangent vector at base point.
+        """
+        norm = gs.linalg.norm(tangent_vec, axis=-1)
+        safe_norm = gs.where(norm == 0.0, 1.0, norm)
+        unit_vec = gs.einsum("...,...i->...i", 1.0 / safe_norm, tangent_vec)
+        end_unit_vec = gs.einsum(
+            "...,...i->...i", -gs.sin(norm), base_point
+        ) + gs.einsum("...,...i->...i", gs.cos(norm), unit_vec)
+
+        along = gs.sum(end_tangent_vec * end_unit_vec, axis=-1)
+        orthogonal = end_tangent_vec - gs.einsum("...,...i->...i", along, end_unit_vec)
+        along = gs.einsum("...,...i->...i", along, unit_vec)
+
+        squared_norm = norm**2
+        coef_cos = utils.taylor_exp_even_func(squared_norm, utils.cos_close_0, order=4)
+        coef_sinc = utils.taylor_exp_even_func(
+            squared_norm, utils.sinc_close_0, order=4
+        )
+        base_point_adjoint = along + gs.einsum("...,...i->...i", coef_cos, orthogonal)
+        tangent_vec_adjoint = along + gs.einsum("...,...i->...i", coef_sinc, orthogonal)
+        return base_point_adjoint, tangent_vec_adjoint
+
     def christoffels(self, base_point):
         """Compute the Christoffel symbols at a point.
 
@@ -99,6 +99,8 @@ class PoincareBall(_Hyperbolic, VectorSpaceOpenSet):
 class PoincareBallMetric(RiemannianMetric):
     """Class that defines operations using a Poincare ball."""
 
+    _analytic_derivative_matrix = True
+
     def exp(self, tangent_vec, base_point):
         """Compute the Riemannian exponential of a tangent vector.
 
@@ -290,6 +292,37 @@ class PoincareBallMetric(RiemannianMetric):
 
         return gs.einsum("...,jk->...jk", lambda_base, identity)
 
+    def inner_product_derivative_matrix(self, base_point=None):
+        r"""Compute derivative of the inner prod matrix at base point.
+
+        Writing :math:`g_{ij}` the inner-product matrix at base point,
+        this computes :math:`mat_{ijk} = \partial_k g_{ij}`, where the
+        index k of the derivation is put last.
+
+        Parameters
+        ----------
+        base_point : array-like, shape=[..., dim]
+            Base point.
+            Optional, defaults to zeros if None.
+
+        Returns
+        -------
+        metric_derivative : array-like, shape=[..., dim, dim, dim]
+            Derivative of the inner-product matrix, where the index
+            k of the derivation is last: :math:`mat_{ijk} = \partial_k g_{ij}`.
+        """
+        if base_point is None:
+            base_point = gs.zeros((1, self._space.dim))
+
+        lambda_derivative = gs.einsum(
+            "...,...k->...k",
+            16 / (1 - gs.sum(base_point * base_point, axis=-1)) ** 3,
+            base_point,
+        )
+        identity = gs.eye(self._space.dim, self._space.dim)
+
+        return gs.einsum("...k,ij->...ijk", lambda_derivative, identity)
+
     def normalization_factor(self, variances):
         """Return normalization factor of the Gaussian distribution.
 
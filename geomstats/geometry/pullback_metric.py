@@ -384,6 +384,54 @@ class PullbackDiffeoMetric(RiemannianMetric):
         image_point_b = self.diffeo.diffeomorphism(point_b)
         return self.image_space.metric.dist(image_point_a, image_point_b)
 
+    def _image_metric_has_dist_tiles(self):
+        """Check whether the image metric computes tiles of distances itself."""
+        image_metric = self.image_space.metric
+        return hasattr(image_metric, "_dist_factors") and hasattr(
+            image_metric, "_dist_tile"
+        )
+
+    def _dist_factors(self, points):
+        """Map points once to the image space before computing distances.
+
+        If the image metric does not compute tiles of distances, e.g. a
+        `ScalarProductMetric`, the points are kept and tiles are computed
+        with `dist`.
+
+        Parameters
+        ----------
+        points : array-like, shape=[n_samples, *shape]
+            Set of points.
+
+        Returns
+        -------
+        factors : array-like or tuple[array-like]
+            Per-point quantities of the image metric for the image points.
+        """
+        if not self._image_metric_has_dist_tiles():
+            return super()._dist_factors(points)
+        image_points = self.diffeo.diffeomorphism(points)
+        return self.image_space.metric._dist_factors(image_points)
+
+    def _dist_tile(self, factors_a, factors_b):
+        """Compute a tile of distances with the image metric.
+
+        Parameters
+        ----------
+        factors_a : array-like or tuple[array-like]
+            Output of `_dist_factors` for a first set of n_samples_a points.
+        factors_b : array-like or tuple[array-like]
+            Output of `_dist_factors` for a second set of n_samples_b points.
+
+        Returns
+        -------
+        dist : array-like, shape=[n_samples_a, n_samples_b]
+            Distances between points of both sets.
+        """
+        if not self._image_metric_has_dist_tiles():
+            return super()._dist_tile(factors_a, factors_b)
+        return self.image_space.metric._dist_tile(factors_a, factors_b)
+
     def geodesic(self, initial_point, end_point=None, initial_tangent_vec=None):
         """Compute the geodesic via diffeomorphic pullback.
 
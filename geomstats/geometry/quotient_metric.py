@@ -180,6 +180,49 @@ class QuotientMetric(RiemannianMetric):
         aligned = self._fiber_bundle.align(fiber_point_b, fiber_point_a)
         return self._total_space.metric.squared_dist(fiber_point_a, aligned)
 
+    def _dist_factors(self, points):
+        """Lift points and compute the quantities reused to align them.
+
+        Parameters
+        ----------
+        points : array-like, shape=[n_samples, {dim, [n, n]}]
+            Set of points.
+
+        Returns
+        -------
+        factors : tuple[array-like]
+            Lifted points and per-point quantities of the fiber bundle.
+        """
+        fiber_points = self._fiber_bundle.lift(points)
+        return fiber_points, self._fiber_bundle._align_factors(fiber_points)
+
+    def _dist_tile(self, factors_a, factors_b):
+        """Compute a tile of distances, aligning all pairs at once.
+
+        Parameters
+        ----------
+        factors_a : tuple[array-like]
+            Output of `_dist_factors` for a first set of n_samples_a points.
+        factors_b : tuple[array-like]
+            Output of `_dist_factors` for a second set of n_samples_b points.
+
+        Returns
+        -------
+        dist : array-like, shape=[n_samples_a, n_samples_b]
+            Distances between points of both sets.
+        """
+        fiber_points_a, align_factors_a = factors_a
+        fiber_points_b, align_factors_b = factors_b
+        n_samples_a, n_samples_b = fiber_points_a.shape[0], fiber_points_b.shape[0]
+
+        indices_a = gs.repeat(gs.arange(n_samples_a), n_samples_b)
+        indices_b = gs.tile(gs.arange(n_samples_b), (n_samples_a,))
+        aligned = self._fiber_bundle._align_from_factors(
+            align_factors_b[indices_b], align_factors_a[indices_a]
+        )
+        dist = self._total_space.metric.dist(fiber_points_a[indices_a], aligned)
+        return gs.reshape(dist, (n_samples_a, n_samples_b))
+
     def curvature(self, tangent_vec_a, tangent_vec_b, tangent_vec_c, base_point):
         r"""Compute the curvature.
 
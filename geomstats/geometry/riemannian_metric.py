@@ -8,11 +8,26 @@ from abc import ABC
 import joblib
 
 import geomstats.backend as gs
-import geomstats.geometry as geometry
 from geomstats.geometry.connection import Connection
 from geomstats.vectorization import check_is_batch
 
 EPSILON = 1e-4
+TILE_SIZE = 128
+
+
+def _tile_slices(n_samples, tile_size):
+    """Split range(n_samples) into consecutive slices of at most tile_size."""
+    return [
+        slice(start, min(start + tile_size, n_samples))
+        for start in range(0, n_samples, tile_size)
+    ]
+
+
+def _slice_factors(factors, slice_):
+    """Slice per-point quantities along the points dimension."""
+    if isinstance(factors, tuple):
+        return tuple(factor[slice_] for factor in factors)
+    return factors[slice_]
 
 
 class RiemannianMetric(Connection, ABC):
@@ -400,34 +415,163 @@ class RiemannianMetric(Connection, ABC):
         if ndim in (point_a.ndim, point_b.ndim) or (point_a.shape == point_b.shape):
             return self.dist(point_a, point_b)
 
-        n_samples = point_a.shape[0] * point_b.shape[0]
+        return gs.squeeze(self.dist_cross(point_a, point_b))
+
+    def _dist_factors(self, points):
+        """Compute per-point quantities reused by every tile of distances.
+
+        Metrics whose distance has a closed form over a batch of pairs
+        override this method together with `_dist_tile`, so that expensive
+        per-point computations are performed once per point instead of
+        once per pair.
+
+        Parameters
+        ----------
+        points : array-like, shape=[n_samples, *point_shape]
+            Set of points.
+
+        Returns
+        -------
+        factors : array-like or tuple[array-like]
+            Per-point quantities, with leading dimension n_samples.
+        """
+        return points
+
+    def _dist_tile(self, factors_a, factors_b):
+        """Compute a rectangular block of the distance matrix.
+
+        The whole block is computed with a single call to `dist`.
+
+        Parameters
+        ----------
+        factors_a : array-like or tuple[array-like]
+            Output of `_dist_factors` for a first set of n_samples_a points.
+        factors_b : array-like or tuple[array-like]
+            Output of `_dist_factors` for a second set of n_samples_b points.
+
+        Returns
+        -------
+        dist : array-like, shape=[n_samples_a, n_samples_b]
+            Distances between points of both sets.
+        """
+        n_samples = factors_a.shape[0] * factors_b.shape[0]
+        point_shape = self._space.shape
+
         point_a_broadcast, point_b_broadcast = gs.broadcast_arrays(
-            point_a[:, None], point_b[None, ...]
+            factors_a[:, None], factors_b[None, ...]
         )
-
-        point_a_flatten = gs.reshape(
-            point_a_broadcast, (n_samples,) + point_a.shape[-ndim:]
+        dist = self.dist(
+            gs.reshape(point_a_broadcast, (n_samples,) + point_shape),
+            gs.reshape(point_b_broadcast, (n_samples,) + point_shape),
         )
-        point_b_flatten = gs.reshape(
-            point_b_broadcast, (n_samples,) + point_a.shape[-ndim:]
+        return gs.reshape(dist, (factors_a.shape[0], factors_b.shape[0]))
+
+    def _dist_tiles(self, blocks, n_jobs=1, **joblib_kwargs):
+        """Compute distance blocks, optionally in parallel.
+
+        Parameters
+        ----------
+        blocks : list[tuple]
+            Pairs of per-point quantities of two sets of points.
+        n_jobs : int
+            Number of jobs to run in parallel, using joblib.
+            Optional. Default: 1.
+        **joblib_kwargs : dict
+            Keyword arguments to joblib.Parallel
+
+        Returns
+        -------
+        tiles : list[array-like]
+            Distance block of each pair of sets of points.
+        """
+        if n_jobs == 1:
+            return [
+                self._dist_tile(factors_a, factors_b) for factors_a, factors_b in blocks
+            ]
+
+        @joblib.delayed
+        @joblib.wrap_non_picklable_objects
+        def pickable_dist_tile(factors_a, factors_b):
+            """Wrap distance block function to make it pickable."""
+            return self._dist_tile(factors_a, factors_b)
+
+        pool = joblib.Parallel(n_jobs=n_jobs, **joblib_kwargs)
+        return pool(
+            pickable_dist_tile(factors_a, factors_b) for factors_a, factors_b in blocks
         )
 
-        dist = self.dist(point_a_flatten, point_b_flatten)
-        dist = gs.reshape(dist, (point_a.shape[0], point_b.shape[0]))
-        return gs.squeeze(dist)
+    def dist_cross(
+        self, points_a, points_b, tile_size=TILE_SIZE, n_jobs=1, **joblib_kwargs
+    ):
+        """Compute the distance between each point of two sets of points.
+
+        The distance matrix is computed by tiles of at most
+        `tile_size` x `tile_size` pairs of points, each of them with a
+        single batched call to `dist`.
+
+        Parameters
+        ----------
+        points_a : array-like, shape=[n_samples_a, *point_shape]
+            First set of points in the manifold.
+        points_b : array-like, shape=[n_samples_b, *point_shape]
+            Second set of points in the manifold.
+        tile_size : int
+            Maximum number of points of each set per tile. Larger tiles
+            reduce the number of calls to `dist` but increase memory usage.
+            Optional. Default: 128.
+        n_jobs : int
+            Number of jobs to run in parallel over tiles, using joblib.
+            Optional. Default: 1.
+        **joblib_kwargs : dict
+            Keyword arguments to joblib.Parallel
+
+        Returns
+        -------
+        dist : array-like, shape=[n_samples_a, n_samples_b]
+            Distance matrix between the points of the two sets.
 
-    def dist_pairwise(self, points, n_jobs=1, **joblib_kwargs):
+        See Also
+        --------
+        `joblib documentations <https://joblib.readthedocs.io/en/latest/>`_
+        """
+        slices_a = _tile_slices(points_a.shape[0], tile_size)
+        slices_b = _tile_slices(points_b.shape[0], tile_size)
+
+        factors_a = self._dist_factors(points_a)
+        factors_b = self._dist_factors(points_b)
+        blocks = [
+            (_slice_factors(factors_a, slice_a), _slice_factors(factors_b, slice_b))
+            for slice_a in slices_a
+            for slice_b in slices_b
+        ]
+        tiles = self._dist_tiles(blocks, n_jobs=n_jobs, **joblib_kwargs)
+
+        n_tiles_b = len(slices_b)
+        rows = [
+            gs.concatenate(tiles[index : index + n_tiles_b], axis=1)
+            for index in range(0, len(tiles), n_tiles_b)
+        ]
+        return gs.concatenate(rows, axis=0)
+
+    def dist_pairwise(self, points, n_jobs=1, tile_size=TILE_SIZE, **joblib_kwargs):
         """Compute the pairwise distance between points.
 
+        Only the tiles of the upper triangular part of the distance matrix
+        are computed, each of them with a single batched call to `dist`.
+
         Parameters
         ----------
         points : array-like, shape=[n_samples, dim]
             Set of points in the manifold.
         n_jobs : int
-            Number of jobs to run in parallel, using joblib. Note that a
-            higher number of jobs may not be beneficial when one computation
-            of a geodesic distance is cheap.
+            Number of jobs to run in parallel over tiles, using joblib.
+            Note that a higher number of jobs may not be beneficial when
+            one computation of a tile of distances is cheap.
             Optional. Default: 1.
+        tile_size : int
+            Maximum number of points per side of a tile. Larger tiles
+            reduce the number of calls to `dist` but increase memory usage.
+            Optional. Default: 128.
         **joblib_kwargs : dict
             Keyword arguments to joblib.Parallel
 
@@ -440,22 +584,32 @@ class RiemannianMetric(Connection, ABC):
         --------
         `joblib documentations <https://joblib.readthedocs.io/en/latest/>`_
         """
-        n_samples = points.shape[0]
-        rows, cols = gs.triu_indices(n_samples)
-
-        @joblib.delayed
-        @joblib.wrap_non_picklable_objects
-        def pickable_dist(x, y):
-            """Wrap distance function to make it pickable."""
-            return self.dist(x, y)
-
-        pool = joblib.Parallel(n_jobs=n_jobs, **joblib_kwargs)
-        out = pool(pickable_dist(points[i], points[j]) for i, j in zip(rows, cols))
-
-        return geometry.symmetric_matrices.SymmetricMatrices.matrix_representation(
-            gs.array(out)
+        slices = _tile_slices(points.shape[0], tile_size)
+        n_tiles = len(slices)
+
+        all_factors = self._dist_factors(points)
+        factors = [_slice_factors(all_factors, slice_) for slice_ in slices]
+        indices = [(i, j) for i in range(n_tiles) for j in range(i, n_tiles)]
+        blocks = [(factors[i], factors[j]) for i, j in indices]
+        tiles = dict(
+            zip(indices, self._dist_tiles(blocks, n_jobs=n_jobs, **joblib_kwargs))
         )
 
+        rows = []
+        for i in range(n_tiles):
+            row = []
+            for j in range(n_tiles):
+                if i < j:
+                    row.append(tiles[(i, j)])
+                elif i > j:
+                    row.append(gs.transpose(tiles[(j, i)]))
+                else:
+                    upper = gs.triu(tiles[(i, i)])
+                    row.append(upper + gs.transpose(gs.triu(upper, k=1)))
+            rows.append(gs.concatenate(row, axis=1))
+
+        return gs.concatenate(rows, axis=0)
+
     def diameter(self, points):
         """Give the distance between two farthest points.
 
@@ -497,22 +651,12 @@ class RiemannianMetric(Connection, ABC):
         closest_neighbor_index : int
             Index of closest neighbor.
         """
-        n_points = point.shape[0] if gs.ndim(point) == gs.ndim(neighbors) else 1
-        n_neighbors = neighbors.shape[0]
-
-        if n_points > 1 and n_neighbors > 1:
-            neighbors = gs.repeat(neighbors, n_points, axis=0)
-
-            point = gs.concatenate([point for _ in range(n_neighbors)])
-
-        closest_neighbor_index = gs.argmin(
-            gs.transpose(
-                gs.reshape(self.dist(point, neighbors), (n_neighbors, n_points)),
-            ),
-            axis=1,
+        points = (
+            point if gs.ndim(point) == gs.ndim(neighbors) else gs.expand_dims(point, 0)
         )
+        closest_neighbor_index = gs.argmin(self.dist_cross(points, neighbors), axis=1)
 
-        if n_points == 1:
+        if points.shape[0] == 1:
             return closest_neighbor_index[0]
 
         return closest_neighbor_index
@@ -57,7 +57,14 @@ def _wrap_attr(scaling_factor, func):
 class _ScaledMethodsRegistry:
     """Class to hold lists of methods and their scaling functions."""
 
-    _SQRT_LIST = ["norm", "dist", "dist_broadcast", "dist_pairwise", "diameter"]
+    _SQRT_LIST = [
+        "norm",
+        "dist",
+        "dist_broadcast",
+        "dist_cross",
+        "dist_pairwise",
+        "diameter",
+    ]
     _LINEAR_LIST = [
         "metric_matrix",
         "inner_product",
@@ -4,8 +4,11 @@ Lead authors: Yann Thanwerdas and Olivier Bisson.
 """
 
 import math
+from functools import partial
 
+import geomstats.algebra_utils as utils
 import geomstats.backend as gs
+from geomstats.cache import BasePointCache
 from geomstats.geometry.base import VectorSpaceOpenSet
 from geomstats.geometry.complex_matrices import ComplexMatrices
 from geomstats.geometry.diffeo import Diffeo
@@ -557,9 +560,22 @@ class SPDAffineMetric(RiemannianMetric):
 
     Parameters
     ----------
-    power_affine : int
-        Power transformation of the classical SPD metric.
-        Optional, default: 1.
+    space : SPDMatrices
+        Manifold of SPD matrices.
+    cache_size : int
+        If given, eigendecompositions of base points and the matrix powers
+        derived from them are kept in a least-recently-used cache of
+        `cache_size` base points, shared by `exp`, `log`, `inner_product`
+        and `parallel_transport`. The cache is not suited for automatic
+        differentiation with respect to the base point.
+        Optional, default: None.
+
+    Attributes
+    ----------
+    cache : BasePointCache or None
+        Cache of quantities computed at base points. Use
+        `cache.cache_info()` for hit and miss counts, and `cache.clear()`
+        or `cache.invalidate(base_point)` to invalidate entries.
 
     References
     ----------
@@ -568,6 +584,50 @@ class SPDAffineMetric(RiemannianMetric):
         2019. https://arxiv.org/abs/1906.01349
     """
 
+    def __init__(self, space, cache_size=None):
+        super().__init__(space)
+        self.cache = None if cache_size is None else BasePointCache(cache_size)
+
+    def _base_point_powers(self, base_point, powers, cache=None):
+        """Compute matrix powers of a base point.
+
+        If a cache is used, the eigendecomposition of the base point
+        and each of its powers are computed at most once.
+
+        Parameters
+        ----------
+        base_point : array-like, shape=[..., n, n]
+            Base point.
+        powers : list[float]
+            Powers at which base point will be raised.
+        cache : BasePointCache
+            Cache to use instead of the cache of the metric.
+            Optional, default: None.
+
+        Returns
+        -------
+        powers : list[array-like], shape=[..., n, n]
+            Matrix powers of base point.
+        """
+        if cache is None:
+            cache = self.cache
+        if cache is None:
+            return powermh(base_point, powers)
+
+        key = cache.key(base_point)
+        eigvals, eigvecs = cache.get(base_point, "eigh", gs.linalg.eigh, key=key)
+
+        def _power(_, power):
+            return Matrices.mul(
+                eigvecs * gs.power(eigvals, power)[..., None, :],
+                Matrices.transpose(eigvecs),
+            )
+
+        return [
+            cache.get(base_point, power, partial(_power, power=power), key=key)
+            for power in powers
+        ]
+
     def inner_product(self, tangent_vec_a, tangent_vec_b, base_point):
         """Compute the affine-invariant inner-product.
 
@@ -588,13 +648,16 @@ class SPDAffineMetric(RiemannianMetric):
         inner_product : array-like, shape=[..., n, n]
             Inner-product.
         """
-        inv_base_point = GeneralLinear.inverse(base_point)
+        if self.cache is None:
+            inv_base_point = GeneralLinear.inverse(base_point)
+        else:
+            (inv_base_point,) = self._base_point_powers(base_point, [-1.0])
         aux_a = Matrices.mul(inv_base_point, tangent_vec_a)
         aux_b = Matrices.mul(inv_base_point, tangent_vec_b)
 
         return Matrices.trace_product(aux_a, aux_b)
 
-    def exp(self, tangent_vec, base_point):
+    def exp(self, tangent_vec, base_point, cache=None):
         """Compute the affine-invariant exponential map.
 
         Compute the Riemannian exponential at point base_point
@@ -607,13 +670,18 @@ class SPDAffineMetric(RiemannianMetric):
             Tangent vector at base point.
         base_point : array-like, shape=[..., n, n]
             Base point.
+        cache : BasePointCache
+            Cache of base point quantities to use instead of `cache`.
+            Optional, default: None.
 
         Returns
         -------
         exp : array-like, shape=[..., n, n]
             Riemannian exponential.
         """
-        sqrt_base_point, inv_sqrt_base_point = powermh(base_point, [1.0 / 2, -1.0 / 2])
+        sqrt_base_point, inv_sqrt_base_point = self._base_point_powers(
+            base_point, [1.0 / 2, -1.0 / 2], cache=cache
+        )
 
         tangent_vec_at_id = Matrices.mul(
             inv_sqrt_base_point, tangent_vec, inv_sqrt_base_point
@@ -624,7 +692,7 @@ class SPDAffineMetric(RiemannianMetric):
 
         return Matrices.mul(sqrt_base_point, exp_from_id, sqrt_base_point)
 
-    def log(self, point, base_point):
+    def log(self, point, base_point, cache=None):
         """Compute the affine-invariant logarithm map.
 
         Compute the Riemannian logarithm at point base_point,
@@ -637,19 +705,67 @@ class SPDAffineMetric(RiemannianMetric):
             Point.
         base_point : array-like, shape=[..., n, n]
             Base point.
+        cache : BasePointCache
+            Cache of base point quantities to use instead of `cache`.
+            Optional, default: None.
 
         Returns
         -------
         log : array-like, shape=[..., n, n]
             Riemannian logarithm of point at base_point.
         """
-        sqrt_base_point, inv_sqrt_base_point = powermh(base_point, [1.0 / 2, -1.0 / 2])
+        sqrt_base_point, inv_sqrt_base_point = self._base_point_powers(
+            base_point, [1.0 / 2, -1.0 / 2], cache=cache
+        )
         point_near_id = Matrices.mul(inv_sqrt_base_point, point, inv_sqrt_base_point)
         point_near_id = Matrices.to_symmetric(point_near_id)
 
         log_at_id = logmh(point_near_id)
         return Matrices.mul(sqrt_base_point, log_at_id, sqrt_base_point)
 
+    def _dist_factors(self, points):
+        """Compute inverse square roots once before computing distances.
+
+        Parameters
+        ----------
+        points : array-like, shape=[n_samples, n, n]
+            Points on the manifold of SPD matrices.
+
+        Returns
+        -------
+        factors : tuple[array-like]
+            Points and their inverse square roots, each of shape
+            [n_samples, n, n].
+        """
+        return points, powermh(points, -1.0 / 2)
+
+    def _dist_tile(self, factors_a, factors_b):
+        """Compute a tile of distances from generalized eigenvalues.
+
+        Each point :math:`B` of the second set is whitened by the
+        precomputed :math:`A^{-1/2}` of each point :math:`A` of the first
+        set, and the distance is the norm of the log of the eigenvalues
+        of :math:`A^{-1/2} B A^{-1/2}`.
+
+        Parameters
+        ----------
+        factors_a : tuple[array-like]
+            Output of `_dist_factors` for a first set of n_samples_a points.
+        factors_b : tuple[array-like]
+            Output of `_dist_factors` for a second set of n_samples_b points.
+
+        Returns
+        -------
+        dist : array-like, shape=[n_samples_a, n_samples_b]
+            Distances between points of both sets.
+        """
+        inv_sqrt_a = factors_a[1][:, None]
+        whitened = Matrices.to_symmetric(
+            Matrices.mul(inv_sqrt_a, factors_b[0][None], inv_sqrt_a)
+        )
+        eigvals = gs.linalg.eigvalsh(whitened)
+        return gs.sqrt(gs.sum(gs.log(eigvals) ** 2, axis=-1))
+
     def parallel_transport(
         self, tangent_vec, base_point, direction=None, end_point=None
     ):
@@ -688,11 +804,82 @@ class SPDAffineMetric(RiemannianMetric):
         if end_point is None:
             end_point = self.exp(direction, base_point)
         # compute B^1/2(B^-1/2 A B^-1/2)B^-1/2 instead of sqrtm(AB^-1)
-        sqrt_bp, inv_sqrt_bp = powermh(base_point, [1.0 / 2, -1.0 / 2])
+        sqrt_bp, inv_sqrt_bp = self._base_point_powers(base_point, [1.0 / 2, -1.0 / 2])
         pdt = powermh(Matrices.mul(inv_sqrt_bp, end_point, inv_sqrt_bp), 1.0 / 2)
         congruence_mat = Matrices.mul(sqrt_bp, pdt, inv_sqrt_bp)
         return Matrices.congruent(tangent_vec, congruence_mat)
 
+    def exp_differential_adjoints(self, end_tangent_vec, tangent_vec, base_point):
+        r"""Compute the adjoints of the differentials of the exponential map.
+
+        Writing :math:`q = Exp_p(v)`, compute the adjoints of the
+        differentials of :math:`Exp` with respect to :math:`p` and :math:`v`,
+        applied to a tangent vector :math:`w` at :math:`q`. After whitening
+        by :math:`p^{-1/2}`, :math:`w` is transported back to the identity
+        and expressed in the eigenbasis of the whitened :math:`v`, with
+        eigenvalues :math:`\lambda_i`. The Jacobi fields then scale each
+        entry by :math:`\cosh(\mu_{ij})` and :math:`\sinh(\mu_{ij}) /
+        \mu_{ij}` respectively, where :math:`\mu_{ij} = (\lambda_i -
+        \lambda_j) / 2`.
+
+        Parameters
+        ----------
+        end_tangent_vec : array-like, shape=[..., n, n]
+            Tangent vector at :math:`Exp_p(v)`.
+        tangent_vec : array-like, shape=[..., n, n]
+            Tangent vector :math:`v` at base point.
+        base_point : array-like, shape=[..., n, n]
+            Base point.
+
+        Returns
+        -------
+        base_point_adjoint : array-like, shape=[..., n, n]
+            Adjoint of the differential with respect to the base point,
+            tangent vector at base point.
+        tangent_vec_adjoint : array-like, shape=[..., n, n]
+            Adjoint of the differential with respect to the tangent vector,
+            tangent vector at base point.
+        """
+        sqrt_base_point, inv_sqrt_base_point = self._base_point_powers(
+            base_point, [1.0 / 2, -1.0 / 2]
+        )
+        tangent_vec_at_id = Matrices.to_symmetric(
+            Matrices.mul(inv_sqrt_base_point, tangent_vec, inv_sqrt_base_point)
+        )
+        eigvals, eigvecs = gs.linalg.eigh(tangent_vec_at_id)
+
+        end_tangent_vec_at_id = Matrices.mul(
+            Matrices.transpose(eigvecs),
+            inv_sqrt_base_point,
+            end_tangent_vec,
+            inv_sqrt_base_point,
+            eigvecs,
+        )
+        half_exp = gs.exp(-eigvals / 2.0)
+        transported = (
+            half_exp[..., :, None] * end_tangent_vec_at_id * half_exp[..., None, :]
+        )
+
+        squared_diff = ((eigvals[..., :, None] - eigvals[..., None, :]) / 2.0) ** 2
+        coef_cosh = utils.taylor_exp_even_func(
+            squared_diff, utils.cosh_close_0, order=4
+        )
+        coef_sinch = utils.taylor_exp_even_func(
+            squared_diff, utils.sinch_close_0, order=4
+        )
+
+        adjoints = []
+        for coef in (coef_cosh, coef_sinch):
+            adjoint_at_id = Matrices.mul(
+                eigvecs, coef * transported, Matrices.transpose(eigvecs)
+            )
+            adjoints.append(
+                Matrices.to_symmetric(
+                    Matrices.mul(sqrt_base_point, adjoint_at_id, sqrt_base_point)
+                )
+            )
+        return tuple(adjoints)
+
     def injectivity_radius(self, base_point=None):
         """Radius of the largest ball where the exponential is injective.
 
@@ -934,6 +934,8 @@ class SpecialEuclideanMatricesCanonicalLeftMetric(_InvariantMetricMatrix):
     def __init__(self, space):
         self._check_implemented(space)
         super().__init__(space=space)
+        if space.n <= 3:
+            self.exp_differential_adjoints = self._exp_differential_adjoints
 
     def _instantiate_solvers(self):
         pass
@@ -1136,6 +1138,84 @@ class SpecialEuclideanMatricesCanonicalLeftMetric(_InvariantMetricMatrix):
 
         return homogeneous_representation(transported_rot, translation, 0.0)
 
+    def _exp_differential_adjoints(self, end_tangent_vec, tangent_vec, base_point):
+        r"""Compute the adjoints of the differentials of the exponential map.
+
+        Writing :math:`q = Exp_p(v)`, compute the adjoints of the
+        differentials of :math:`Exp` with respect to :math:`p` and :math:`v`,
+        applied to a tangent vector :math:`w` at :math:`q`. Translations are
+        flat, so their part of :math:`w` is returned unchanged. The rotation
+        part of :math:`w` is transported back to :math:`p`. There, with
+        :math:`\Omega` the left-translated rotation part of :math:`v` and
+        :math:`\theta` its angle, the Jacobi fields of the bi-invariant
+        metric scale its component orthogonal to :math:`\Omega` by
+        :math:`\cos(\theta / 2)` and :math:`\sin(\theta / 2) /
+        (\theta / 2)` respectively.
+
+        Only available as `exp_differential_adjoints` for :math:`n \leq 3`,
+        where the Jacobi operator has a single non-zero eigenvalue.
+
+        Parameters
+        ----------
+        end_tangent_vec : array-like, shape=[..., n + 1, n + 1]
+            Tangent vector at :math:`Exp_p(v)`.
+        tangent_vec : array-like, shape=[..., n + 1, n + 1]
+            Tangent vector :math:`v` at base point.
+        base_point : array-like, shape=[..., n + 1, n + 1]
+            Point on the manifold.
+
+        Returns
+        -------
+        base_point_adjoint : array-like, shape=[..., n + 1, n + 1]
+            Adjoint of the differential with respect to the base point,
+            tangent vector at base point.
+        tangent_vec_adjoint : array-like, shape=[..., n + 1, n + 1]
+            Adjoint of the differential with respect to the tangent vector,
+            tangent vector at base point.
+        """
+        n = self._space.n
+        rotation = base_point[..., :n, :n]
+        inf_rotation = Matrices.mul(
+            Matrices.transpose(rotation), tangent_vec[..., :n, :n]
+        )
+        half_exp = GeneralLinear.exp(inf_rotation / 2.0)
+        end_rotation = Matrices.mul(rotation, half_exp, half_exp)
+        transported = Matrices.mul(
+            half_exp,
+            Matrices.transpose(end_rotation),
+            end_tangent_vec[..., :n, :n],
+            Matrices.transpose(half_exp),
+        )
+
+        squared_norm = Matrices.frobenius_product(inf_rotation, inf_rotation)
+        safe_squared_norm = gs.where(squared_norm == 0.0, 1.0, squared_norm)
+        along = gs.einsum(
+            "...,...ij->...ij",
+            Matrices.frobenius_product(transported, inf_rotation) / safe_squared_norm,
+            inf_rotation,
+        )
+        orthogonal = transported - along
+
+        squared_half_angle = squared_norm / 8.0
+        coef_cos = utils.taylor_exp_even_func(
+            squared_half_angle, utils.cos_close_0, order=4
+        )
+        coef_sinc = utils.taylor_exp_even_func(
+            squared_half_angle, utils.sinc_close_0, order=4
+        )
+        translation = end_tangent_vec[..., :n, n]
+
+        return tuple(
+            homogeneous_representation(
+                Matrices.mul(
+                    rotation, along + gs.einsum("...,...ij->...ij", coef, orthogonal)
+                ),
+                translation,
+                0.0,
+            )
+            for coef in (coef_cos, coef_sinc)
+        )
+
     def squared_dist(self, point_a, point_b):
         """Squared geodesic distance between two points.
 
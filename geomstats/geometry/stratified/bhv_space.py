@@ -16,9 +16,9 @@ References
     https://doi.org/10.1109/TCBB.2010.3
 """
 
-import itertools as it
+import functools
 
-import networkx as nx
+import joblib
 import numpy as np
 
 import geomstats.backend as gs
@@ -157,6 +157,20 @@ class Tree(Point):
             ]
         )
 
+    @functools.cached_property
+    def split_lengths(self):
+        """Edge lengths indexed by split.
+
+        Computed once per tree, as it is used by every distance and geodesic
+        computation involving the tree.
+
+        Returns
+        -------
+        split_lengths : dict of Split, float
+            The splits of the tree and their respective lengths.
+        """
+        return dict(zip(self.topology.splits, self.lengths))
+
     def __repr__(self):
         """Return the string representation of the tree.
 
@@ -392,6 +406,35 @@ class BHVMetric(PointSetMetric):
         """
         return self.geodesic_solver.dist(point_a, point_b)
 
+    def dist_pairwise(self, points, n_jobs=1, tile_size=128, **joblib_kwargs):
+        """Compute the pairwise distance between points.
+
+        Parameters
+        ----------
+        points : TreeBatch
+            Points in BHV Space.
+        n_jobs : int
+            Number of jobs to run in parallel over tiles, using joblib.
+            Optional. Default: 1.
+        tile_size : int
+            Maximum number of points per side of a tile.
+            Optional. Default: 128.
+        **joblib_kwargs : dict
+            Keyword arguments to joblib.Parallel
+
+        Returns
+        -------
+        dist : array-like, shape=[n_points, n_points]
+            Pairwise distance matrix between all the points.
+
+        See Also
+        --------
+        `joblib documentations <https://joblib.readthedocs.io/en/latest/>`_
+        """
+        return self.geodesic_solver.dist_pairwise(
+            points, n_jobs=n_jobs, tile_size=tile_size, **joblib_kwargs
+        )
+
     def geodesic(self, initial_point, end_point):
         """Compute the geodesic between two points.
 
@@ -423,11 +466,24 @@ class GTPSolver:
     tol : float
         Tolerance for the algorithm, in particular for the decision problem in the
         GTP algorithm in [OP11] to avoid unambiguity.
+
+    Attributes
+    ----------
+    FLOW_ATOL : float
+        Residual capacity below which an edge is considered saturated when solving
+        the extension problems by maximum flow. Capacities are normalized to sum
+        to one.
     """
 
+    FLOW_ATOL = 1e-12
+
     def __init__(self, n_labels, tol=1e-8):
         self.n_labels = n_labels
         self.tol = tol
+        self._pendants = {
+            Split(part1=[i], part2=[j for j in range(self.n_labels) if j != i])
+            for i in range(self.n_labels)
+        }
 
     def _squared_dist_single(self, point_a, point_b):
         """Compute the squared distance between two points.
@@ -444,14 +500,7 @@ class GTPSolver:
         squared_dist : array-like, shape=[...]
             The squared distance between the two points.
         """
-        sp_a = {
-            split: length
-            for split, length in zip(point_a.topology.splits, point_a.lengths)
-        }
-        sp_b = {
-            split: length
-            for split, length in zip(point_b.topology.splits, point_b.lengths)
-        }
+        sp_a, sp_b = point_a.split_lengths, point_b.split_lengths
         common_a, common_b, supports = self._trees_with_common_support(
             sp_a,
             sp_b,
@@ -515,6 +564,82 @@ class GTPSolver:
         """
         return gs.sqrt(self.squared_dist(point_a, point_b))
 
+    def _squared_dist_tile(self, points_a, points_b, upper=False):
+        """Compute a rectangular block of the squared distance matrix.
+
+        Parameters
+        ----------
+        points_a : list[Tree]
+            A first set of points in BHV Space.
+        points_b : list[Tree]
+            A second set of points in BHV Space.
+        upper : bool
+            If True, the sets are the same and only the strictly upper triangular
+            part of the block is computed, the rest being zero.
+            Optional, default: False.
+
+        Returns
+        -------
+        squared_dist : array-like, shape=[len(points_a), len(points_b)]
+            The squared distances between points of both sets.
+        """
+        squared_dist = np.zeros((len(points_a), len(points_b)))
+        for i, point_a in enumerate(points_a):
+            for j in range(i + 1 if upper else 0, len(points_b)):
+                squared_dist[i, j] = self._squared_dist_single(point_a, points_b[j])
+        return squared_dist
+
+    def dist_pairwise(self, points, n_jobs=1, tile_size=128, **joblib_kwargs):
+        """Compute the pairwise distance between points.
+
+        Only the tiles of the upper triangular part of the distance matrix are
+        computed. The splits of each point are indexed once, before the tiles are
+        dispatched, so that workers share them instead of recomputing them for each
+        pair.
+
+        Parameters
+        ----------
+        points : TreeBatch
+            Points in BHV Space.
+        n_jobs : int
+            Number of jobs to run in parallel over tiles, using joblib.
+            Optional. Default: 1.
+        tile_size : int
+            Maximum number of points per side of a tile.
+            Optional. Default: 128.
+        **joblib_kwargs : dict
+            Keyword arguments to joblib.Parallel
+
+        Returns
+        -------
+        dist : array-like, shape=[n_points, n_points]
+            Pairwise distance matrix between all the points.
+        """
+        points = list(points)
+        for point in points:
+            # index the splits before the points are dispatched to the workers
+            point.split_lengths
+
+        starts = range(0, len(points), tile_size)
+        indices = [(i, j) for i in starts for j in starts if i <= j]
+        blocks = [
+            (points[i : i + tile_size], points[j : j + tile_size], i == j)
+            for i, j in indices
+        ]
+        if n_jobs == 1:
+            tiles = [self._squared_dist_tile(*block) for block in blocks]
+        else:
+            pool = joblib.Parallel(n_jobs=n_jobs, **joblib_kwargs)
+            tiles = pool(
+                joblib.delayed(self._squared_dist_tile)(*block) for block in blocks
+            )
+
+        squared_dist = np.zeros((len(points), len(points)))
+        for (i, j), tile in zip(indices, tiles):
+            squared_dist[i : i + tile.shape[0], j : j + tile.shape[1]] = tile
+        squared_dist = squared_dist + squared_dist.T
+        return gs.sqrt(gs.from_numpy(squared_dist))
+
     def _geodesic_single(self, initial_point, end_point):
         """Compute the geodesic between two points.
 
@@ -531,8 +656,7 @@ class GTPSolver:
             The geodesic between the two points. Takes parameter t, that is the time
             between 0 and 1 at which the corresponding point on the path is returned.
         """
-        sp_a = dict(zip(initial_point.topology.splits, initial_point.lengths))
-        sp_b = dict(zip(end_point.topology.splits, end_point.lengths))
+        sp_a, sp_b = initial_point.split_lengths, end_point.split_lengths
         common_a, common_b, supports = self._trees_with_common_support(
             sp_a,
             sp_b,
@@ -650,16 +774,14 @@ class GTPSolver:
         supports: dict
             Containing for each subtree the respective support.
         """
-        pendants = {
-            Split(part1=[i], part2=[j for j in range(self.n_labels) if j != i])
-            for i in range(self.n_labels)
-        }
+        pendants = self._pendants
         sp_a, sp_b = set(splits_a.keys()), set(splits_b.keys())
         common = sp_a & sp_b
-        only_a = sp_a - common
-        only_b = sp_b - common
-        easy_a = {s for s in only_a if gs.all(list(map(s.is_compatible, only_b)))}
-        easy_b = {s for s in only_b if gs.all(list(map(s.is_compatible, only_a)))}
+        only_a = list(sp_a - common)
+        only_b = list(sp_b - common)
+        compatible = self._compatibility_matrix(only_a, only_b)
+        easy_a = {s for s, row in zip(only_a, compatible) if row.all()}
+        easy_b = {s for s, column in zip(only_b, compatible.T) if column.all()}
         total_a = (sp_a | easy_b) - pendants
         total_b = (sp_b | easy_a) - pendants
 
@@ -756,31 +878,65 @@ class GTPSolver:
         support_b : tuple of tuple
             The support partition of B corresponding to a geodesic.
         """
-        old_support_a = (tuple(splits_a.keys()),)
-        old_support_b = (tuple(splits_b.keys()),)
-        weights_a = {split: splits_a[split] ** 2 for split in splits_a}
-        weights_b = {split: splits_b[split] ** 2 for split in splits_b}
+        splits_a_, splits_b_ = list(splits_a.keys()), list(splits_b.keys())
+        weights_a = np.array([splits_a[split] ** 2 for split in splits_a_])
+        weights_b = np.array([splits_b[split] ** 2 for split in splits_b_])
+        incompatible = ~self._compatibility_matrix(splits_a_, splits_b_)
+
+        old_support_a = (np.arange(len(splits_a_)),)
+        old_support_b = (np.arange(len(splits_b_)),)
         while 1:
             new_support_a, new_support_b = tuple(), tuple()
             for pair_a, pair_b in zip(old_support_a, old_support_b):
-                pair_a_w = {s: weights_a[s] for s in pair_a}
-                pair_b_w = {s: weights_b[s] for s in pair_b}
                 value, c1, c2, d1, d2 = self._solve_extension_problem(
-                    pair_a_w, pair_b_w
+                    weights_a[pair_a],
+                    weights_b[pair_b],
+                    incompatible[np.ix_(pair_a, pair_b)],
                 )
                 if value >= 1 - self.tol:
                     new_support_a += (pair_a,)
                     new_support_b += (pair_b,)
                 else:
-                    new_support_a += (c1, c2)
-                    new_support_b += (d1, d2)
+                    new_support_a += (pair_a[c1], pair_a[c2])
+                    new_support_b += (pair_b[d1], pair_b[d2])
             if len(new_support_a) == len(old_support_a):
-                return new_support_a, new_support_b
-            else:
-                old_support_a, old_support_b = new_support_a, new_support_b
+                break
+            old_support_a, old_support_b = new_support_a, new_support_b
+
+        support_a = tuple(
+            tuple(splits_a_[index] for index in pair_a) for pair_a in new_support_a
+        )
+        support_b = tuple(
+            tuple(splits_b_[index] for index in pair_b) for pair_b in new_support_b
+        )
+        return support_a, support_b
+
+    @staticmethod
+    def _compatibility_matrix(splits_a, splits_b):
+        """Compute the compatibility of each pair of splits.
+
+        Parameters
+        ----------
+        splits_a : list[Split]
+            The splits in A.
+        splits_b : list[Split]
+            The splits in B.
+
+        Returns
+        -------
+        compatible : array-like, shape=[len(splits_a), len(splits_b)]
+            Boolean matrix, whose entry is ``True`` if the splits are compatible.
+        """
+        return np.array(
+            [
+                [split_a.is_compatible(split_b) for split_b in splits_b]
+                for split_a in splits_a
+            ],
+            dtype=bool,
+        ).reshape(len(splits_a), len(splits_b))
 
     @staticmethod
-    def _solve_extension_problem(sq_splits_a, sq_splits_b):
+    def _solve_extension_problem(weights_a, weights_b, incompatible):
         """Solve the extension problem in [1] for sets of splits with squared weights.
 
         Solving the min weight vertex cover with respect to the incompatibility graph in
@@ -801,7 +957,8 @@ class GTPSolver:
         and
         its value, that is the sum of all capacities of edges from V to V_bar, such
         that the
-        source is in V and the sink is in V_bar.
+        source is in V and the sink is in V_bar. V_bar is the set of vertices from
+        which the sink can be reached in the residual graph of a maximum flow.
 
         If the value is larger or equal than one (possibly with respect to some
         tolerance),
@@ -815,37 +972,133 @@ class GTPSolver:
 
         Parameters
         ----------
-        sq_splits_a : dict of Split, float
-            Dictionary of splits in A with squared length associated to each split.
-        sq_splits_b : dict of Split, float
-            Dictionary of splits in B with squared length associated to each split.
+        weights_a : array-like, shape=[n_a]
+            Squared lengths of the splits in A.
+        weights_b : array-like, shape=[n_b]
+            Squared lengths of the splits in B.
+        incompatible : array-like, shape=[n_a, n_b]
+            Boolean matrix, whose entry is ``True`` if the splits are incompatible.
 
         Returns
         -------
         value : float
             The value of the minimum cut.
-        c1 : set of Split
-            First part of A that it is split into.
-        c2 : set of Split
-            Second part of A that it is split into.
-        d1 : set of Split
-            First part of B that it is split into.
-        d2 : set of Split
-            Second part of B that it is split into.
+        c1 : array-like, shape=[n_a]
+            Boolean mask of the first part of A that it is split into.
+        c2 : array-like, shape=[n_a]
+            Boolean mask of the second part of A that it is split into.
+        d1 : array-like, shape=[n_b]
+            Boolean mask of the first part of B that it is split into.
+        d2 : array-like, shape=[n_b]
+            Boolean mask of the second part of B that it is split into.
+        """
+        capacity_a = weights_a / np.sum(weights_a)
+        capacity_b = weights_b / np.sum(weights_b)
+        flow, residual_a, residual_b = GTPSolver._max_flow(
+            capacity_a, capacity_b, incompatible
+        )
+        atol = GTPSolver.FLOW_ATOL
+
+        v_bar_b = residual_b > atol
+        while True:
+            v_bar_a = np.any(incompatible & v_bar_b, axis=1)
+            new_v_bar_b = v_bar_b | np.any((flow > atol) & v_bar_a[:, None], axis=0)
+            if np.all(new_v_bar_b == v_bar_b):
+                break
+            v_bar_b = new_v_bar_b
+
+        value = np.sum(capacity_a) - np.sum(residual_a)
+        return value, v_bar_a, ~v_bar_a, v_bar_b, ~v_bar_b
+
+    @staticmethod
+    def _max_flow(capacity_a, capacity_b, incompatible):
+        """Compute a maximum flow through the bipartite incompatibility graph.
+
+        The flow goes from the source to the splits in A, from the splits in A to the
+        incompatible splits in B with infinite capacity, and from the splits in B to the
+        sink. Shortest augmenting paths are found by breadth-first search over all
+        vertices of a level at once [EK72]_.
+
+        Parameters
+        ----------
+        capacity_a : array-like, shape=[n_a]
+            Capacities of the edges from the source to the splits in A.
+        capacity_b : array-like, shape=[n_b]
+            Capacities of the edges from the splits in B to the sink.
+        incompatible : array-like, shape=[n_a, n_b]
+            Boolean matrix, whose entry is ``True`` if the splits are incompatible.
+
+        Returns
+        -------
+        flow : array-like, shape=[n_a, n_b]
+            The flow from the splits in A to the splits in B.
+        residual_a : array-like, shape=[n_a]
+            Residual capacities of the edges from the source to the splits in A.
+        residual_b : array-like, shape=[n_b]
+            Residual capacities of the edges from the splits in B to the sink.
+
+        References
+        ----------
+        .. [EK72] Edmonds, J., R. M. Karp.
+            "Theoretical Improvements in Algorithmic Efficiency for Network Flow
+            Problems."
+            Journal of the ACM,
+            volume 19, issue 2, pages 248-264, 1972.
+            https://doi.org/10.1145/321694.321699
         """
-        total_a, total_b = sum(sq_splits_a.values()), sum(sq_splits_b.values())
-        graph = nx.DiGraph()
-        for split, weight in sq_splits_a.items():
-            graph.add_edge("source", split, capacity=weight / total_a)
-        for split, weight in sq_splits_b.items():
-            graph.add_edge(split, "sink", capacity=weight / total_b)
-        for split_a, split_b in it.product(sq_splits_a.keys(), sq_splits_b.keys()):
-            if not split_a.is_compatible(split_b):
-                graph.add_edge(split_a, split_b)
-
-        min_value, (v, v_bar) = nx.minimum_cut(graph, "source", "sink")
-        a = set(sq_splits_a.keys())
-        b = set(sq_splits_b.keys())
-        v = set(v)
-        v_bar = set(v_bar)
-        return min_value, tuple(a & v_bar), tuple(a & v), tuple(b & v_bar), tuple(b & v)
+        atol = GTPSolver.FLOW_ATOL
+        flow = np.zeros(incompatible.shape)
+        residual_a, residual_b = capacity_a.copy(), capacity_b.copy()
+        while True:
+            parent_a = np.full(len(capacity_a), -1)
+            parent_b = np.full(len(capacity_b), -1)
+            frontier_a = residual_a > atol
+            visited_a, visited_b = frontier_a.copy(), np.zeros(len(capacity_b), bool)
+
+            end = None
+            while end is None and np.any(frontier_a):
+                index_a = np.nonzero(frontier_a)[0]
+                reached = incompatible[index_a] & ~visited_b
+                frontier_b = np.any(reached, axis=0)
+                if not np.any(frontier_b):
+                    break
+                parent_b[frontier_b] = index_a[
+                    np.argmax(reached[:, frontier_b], axis=0)
+                ]
+                visited_b |= frontier_b
+
+                sinks = frontier_b & (residual_b > atol)
+                if np.any(sinks):
+                    end = np.argmax(sinks)
+                    break
+
+                index_b = np.nonzero(frontier_b)[0]
+                reached = (flow[:, index_b].T > atol) & ~visited_a
+                frontier_a = np.any(reached, axis=0)
+                parent_a[frontier_a] = index_b[
+                    np.argmax(reached[:, frontier_a], axis=0)
+                ]
+                visited_a |= frontier_a
+
+            if end is None:
+                return flow, residual_a, residual_b
+
+            forward, backward = [], []
+            bottleneck = residual_b[end]
+            split_b = end
+            while True:
+                split_a = parent_b[split_b]
+                forward.append((split_a, split_b))
+                split_b = parent_a[split_a]
+                if split_b == -1:
+                    bottleneck = min(bottleneck, residual_a[split_a])
+                    break
+                backward.append((split_a, split_b))
+                bottleneck = min(bottleneck, flow[split_a, split_b])
+
+            residual_a[split_a] -= bottleneck
+            residual_b[end] -= bottleneck
+            for index in forward:
+                flow[index] += bottleneck
+            for index in backward:
+                flow[index] -= bottleneck
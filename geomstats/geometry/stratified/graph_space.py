@@ -10,9 +10,12 @@ References
     https://mox.polimi.it/reports-and-theses/publication-results/?id=855.
 """
 
-import itertools
 from abc import ABC, abstractmethod
 
+import joblib
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
 import geomstats.backend as gs
 from geomstats.errors import check_parameter_accepted_values
 from geomstats.geometry.fiber_bundle import AlignerAlgorithm
@@ -88,6 +91,35 @@ class GraphSpaceAlignerAlgorithm(AlignerAlgorithm, ABC):
 class FAQAligner(GraphSpaceAlignerAlgorithm):
     """Fast Quadratic Assignment for graph matching (or network alignment).
 
+    The Frank-Wolfe iterations of [Vogelstein2015]_ are run for a batch of pairs of
+    graphs at once: gradients and step sizes are computed for all pairs with
+    batched matrix products, and only the linear assignment problems are solved
+    pair by pair. When all graphs are aligned to the same base graph, the base graph
+    is not broadcast. Chunks of pairs can be aligned in parallel.
+
+    Parameters
+    ----------
+    total_space : GraphSpace
+        Set with quotient structure.
+    max_iter : int
+        Maximum number of Frank-Wolfe iterations.
+        Optional, default: 30.
+    tol : float
+        Tolerance on the change of the doubly stochastic matrix between
+        iterations.
+        Optional, default: 0.03.
+    warm_start : bool
+        If True, the iterations start from the permutations found by the previous
+        alignment of a batch of the same size, e.g. the previous iteration of an
+        estimator, instead of the barycenter of doubly stochastic matrices.
+        Optional, default: False.
+    n_jobs : int
+        Number of jobs to run in parallel over chunks of pairs, using joblib.
+        Optional, default: 1.
+    chunk_size : int
+        Number of pairs of graphs per chunk.
+        Optional, default: 256.
+
     References
     ----------
     .. [Vogelstein2015] Vogelstein JT, Conroy JM, Lyzinski V, Podrazik LJ,
@@ -96,6 +128,123 @@ class FAQAligner(GraphSpaceAlignerAlgorithm):
         PLoS One. 2015 Apr 17; doi: 10.1371/journal.pone.0121002.
     """
 
+    def __init__(
+        self,
+        total_space,
+        max_iter=30,
+        tol=0.03,
+        warm_start=False,
+        n_jobs=1,
+        chunk_size=256,
+    ):
+        super().__init__(total_space)
+        self.max_iter = max_iter
+        self.tol = tol
+        self.warm_start = warm_start
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def _linear_assignment(weights):
+        """Solve linear assignment problems maximizing the total weight.
+
+        Parameters
+        ----------
+        weights : array-like, shape=[n_pairs, n_nodes, n_nodes]
+            Weight of assigning each row to each column.
+
+        Returns
+        -------
+        cols : array-like, shape=[n_pairs, n_nodes]
+            Column assigned to each row.
+        """
+        return np.stack(
+            [linear_sum_assignment(weights_, maximize=True)[1] for weights_ in weights]
+        )
+
+    def _faq(self, point, base_point, init_perm=None):
+        """Align batches of graphs by fast approximate quadratic programming.
+
+        Parameters
+        ----------
+        point : array-like, shape=[n_pairs, n_nodes, n_nodes]
+            Graphs to align.
+        base_point : array-like, shape=[n_pairs, n_nodes, n_nodes] or \
+            shape=[n_nodes, n_nodes]
+            Base graphs.
+        init_perm : array-like, shape=[n_pairs, n_nodes]
+            Permutations to start from. They are returned for the pairs where
+            the projection of the last iterate onto permutations is worse.
+            Optional, default: None, in which case the iterations start at the
+            barycenter.
+
+        Returns
+        -------
+        perm : array-like, shape=[n_pairs, n_nodes]
+            Optimal permutations.
+        """
+        n_pairs, n_nodes = point.shape[:2]
+        eye = np.eye(n_nodes)
+        base_point_t = np.swapaxes(base_point, -1, -2)
+        point_t = np.swapaxes(point, -1, -2)
+
+        if init_perm is None:
+            doubly_stochastic = np.ones((n_pairs, n_nodes, n_nodes)) / n_nodes
+        else:
+            doubly_stochastic = eye[init_perm]
+
+        active = np.arange(n_pairs)
+        for _ in range(self.max_iter):
+            base_point_ = base_point if base_point.ndim == 2 else base_point[active]
+            base_point_t_ = (
+                base_point_t if base_point_t.ndim == 2 else base_point_t[active]
+            )
+            point_, point_t_ = point[active], point_t[active]
+            current = doubly_stochastic[active]
+
+            grad = base_point_ @ current @ point_t_ + base_point_t_ @ current @ point_
+            cols = self._linear_assignment(grad)
+            direction = eye[cols]
+
+            diff = current - direction
+            diff_t = np.swapaxes(diff, -1, -2)
+            base_diff = base_point_t_ @ diff
+            point_diff = point_ @ diff_t
+            rows = np.arange(len(active))[:, None]
+            coef_b = np.sum(base_diff * point_t_[rows, cols], axis=(-2, -1)) + np.sum(
+                base_point_ * point_diff[rows, cols], axis=(-2, -1)
+            )
+            coef_a = np.sum(np.swapaxes(base_diff, -1, -2) * point_diff, axis=(-2, -1))
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                critical = -coef_b / (2 * coef_a)
+            step = np.where(
+                (coef_a < 0) & (critical >= 0) & (critical <= 1),
+                critical,
+                (coef_b + coef_a > 0).astype(float),
+            )
+
+            updated = (
+                step[:, None, None] * current + (1 - step[:, None, None]) * direction
+            )
+            doubly_stochastic[active] = updated
+            change = np.linalg.norm(current - updated, axis=(-2, -1)) / np.sqrt(n_nodes)
+            active = active[change >= self.tol]
+            if not len(active):
+                break
+
+        perm = self._linear_assignment(doubly_stochastic)
+        if init_perm is None:
+            return perm
+
+        def _objective(perm):
+            perm_matrix = eye[perm]
+            aligned = perm_matrix @ point @ np.swapaxes(perm_matrix, -1, -2)
+            return np.sum(base_point * aligned, axis=(-2, -1))
+
+        keep = _objective(init_perm) > _objective(perm)
+        return np.where(keep[:, None], init_perm, perm)
+
     def _get_opt_perm_single(self, point, base_point):
         """Get optimal element of the group.
 
@@ -111,32 +260,175 @@ class FAQAligner(GraphSpaceAlignerAlgorithm):
         perm : array-like, shape=[n_nodes]
             Optimal permutation group element.
         """
-        return gs.array(
-            gs.linalg.quadratic_assignment(
-                base_point, point, options={"maximize": True}
+        return self._get_opt_perm(point, base_point)
+
+    def _get_opt_perm(self, point, base_point):
+        """Get optimal element of the group.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., n_nodes, n_nodes]
+            Graph to align.
+        base_point : array-like, shape=[..., n_nodes, n_nodes]
+            Base graph.
+
+        Returns
+        -------
+        perm : array-like, shape=[..., n_nodes]
+            Optimal permutation group element.
+        """
+        n_nodes = self._total_space.n_nodes
+        batch_shape = get_batch_shape(self._total_space.point_ndim, point, base_point)
+        point = np.reshape(gs.to_numpy(point), (-1, n_nodes, n_nodes))
+        base_point = gs.to_numpy(base_point)
+        if base_point.ndim > 2:
+            point, base_point = np.broadcast_arrays(
+                point, np.reshape(base_point, (-1, n_nodes, n_nodes))
+            )
+        n_pairs = point.shape[0]
+
+        init_perm = None
+        if self.warm_start and self.perm_ is not None:
+            previous_perm = np.reshape(gs.to_numpy(self.perm_), (-1, n_nodes))
+            if previous_perm.shape[0] == n_pairs:
+                init_perm = previous_perm
+
+        chunks = [
+            slice(start, start + self.chunk_size)
+            for start in range(0, n_pairs, self.chunk_size)
+        ]
+
+        def _chunk_args(chunk):
+            return (
+                point[chunk],
+                base_point if base_point.ndim == 2 else base_point[chunk],
+                None if init_perm is None else init_perm[chunk],
+            )
+
+        if self.n_jobs == 1:
+            perms = [self._faq(*_chunk_args(chunk)) for chunk in chunks]
+        else:
+            pool = joblib.Parallel(n_jobs=self.n_jobs)
+            perms = pool(
+                joblib.delayed(self._faq)(*_chunk_args(chunk)) for chunk in chunks
             )
-        )
+
+        perm = np.concatenate(perms, axis=0)
+        return gs.from_numpy(np.reshape(perm, batch_shape + (n_nodes,)))
 
 
 class ExhaustiveAligner(GraphSpaceAlignerAlgorithm):
-    """Brute force exact alignment.
+    """Exact alignment by branch and bound.
+
+    Exact Alignment obtained by a depth-first search of the permutation group.
+    Nodes of the point are assigned to the nodes of the base point one at a time,
+    and a partial assignment is discarded as soon as a lower bound on the
+    squared distance of its completions exceeds the best distance found so far.
 
-    Exact Alignment obtained by exploring the whole permutation group.
+    The lower bound is a linear assignment problem over the remaining nodes:
+    the cost of assigning a node is the exact cost of its edges to the nodes
+    already assigned, plus the cost of optimally matching its sorted incoming and
+    outgoing edge weights with those of the base node, as for degree sequences.
+    The solution of this linear assignment problem also completes the partial
+    assignment, which gives the upper bounds.
 
     Parameters
     ----------
     total_space : GraphSpace
         Set with quotient structure.
+    max_n_nodes : int
+        Maximum number of nodes of the graphs.
+        Optional, default: 12.
 
     Notes
     -----
-    Not recommended for large `n_nodes`.
+    The worst case complexity is still factorial in `n_nodes`, but only a
+    branch of the permutation group is stored at a time.
     """
 
-    def __init__(self, total_space):
+    def __init__(self, total_space, max_n_nodes=12):
+        if total_space.n_nodes > max_n_nodes:
+            raise ValueError(
+                f"Exact alignment of graphs with {total_space.n_nodes} nodes is "
+                f"intractable: it is only available up to {max_n_nodes} nodes. "
+                "Use FAQ alignment instead."
+            )
         super().__init__(total_space)
-        n_nodes = total_space.n_nodes
-        self._perms = gs.array(list(itertools.permutations(range(n_nodes), n_nodes)))
+        self.max_n_nodes = max_n_nodes
+
+    @staticmethod
+    def _sorted_match(weights_a, weights_b):
+        """Compute the cost of optimally matching vectors of weights.
+
+        Parameters
+        ----------
+        weights_a : array-like, shape=[n_vectors_a, n_weights]
+            Sorted vectors of weights.
+        weights_b : array-like, shape=[n_vectors_b, n_weights]
+            Sorted vectors of weights.
+
+        Returns
+        -------
+        cost : array-like, shape=[n_vectors_a, n_vectors_b]
+            Squared distance between each pair of vectors.
+        """
+        return (
+            (weights_a**2).sum(axis=-1)[:, None]
+            + (weights_b**2).sum(axis=-1)[None, :]
+            - 2 * weights_a @ weights_b.T
+        )
+
+    def _assignment_costs(self, point, base_point, assigned, free):
+        """Compute the costs of assigning each free node to the next base nodes.
+
+        Parameters
+        ----------
+        point : array-like, shape=[n_nodes, n_nodes]
+            Graph to align.
+        base_point : array-like, shape=[n_nodes, n_nodes]
+            Base graph.
+        assigned : list[int]
+            Nodes of the point assigned to the first base nodes.
+        free : list[int]
+            Nodes of the point not assigned yet.
+
+        Returns
+        -------
+        exact_cost : array-like, shape=[n_free, n_free]
+            Cost of the edges to the assigned nodes and of the self-loop.
+        edge_cost : array-like, shape=[n_free, n_free]
+            Lower bound on the cost of the edges between free nodes.
+        """
+        n_assigned, n_free = len(assigned), len(free)
+        base_free = base_point[n_assigned:, n_assigned:]
+        point_free = point[free][:, free]
+
+        exact_cost = (
+            np.diagonal(base_free)[:, None] - np.diagonal(point_free)[None, :]
+        ) ** 2
+        if n_assigned:
+            out_diff = (
+                base_point[n_assigned:, :n_assigned][:, None, :]
+                - point[free][:, assigned][None, :, :]
+            )
+            in_diff = (
+                base_point[:n_assigned, n_assigned:].T[:, None, :]
+                - point[assigned][:, free].T[None, :, :]
+            )
+            exact_cost = exact_cost + (out_diff**2 + in_diff**2).sum(axis=-1)
+
+        off_diag = ~np.eye(n_free, dtype=bool)
+
+        def _sorted_edges(mat):
+            return np.sort(mat[off_diag].reshape(n_free, n_free - 1), axis=-1)
+
+        edge_cost = 0.5 * (
+            self._sorted_match(_sorted_edges(base_free), _sorted_edges(point_free))
+            + self._sorted_match(
+                _sorted_edges(base_free.T), _sorted_edges(point_free.T)
+            )
+        )
+        return exact_cost, edge_cost
 
     def _get_opt_perm_single(self, point, base_point):
         """Get optimal element of the group.
@@ -153,9 +445,42 @@ class ExhaustiveAligner(GraphSpaceAlignerAlgorithm):
         perm : array-like, shape=[n_nodes]
             Optimal permutation group element.
         """
-        orbit = self._total_space.group_action(self._perms, point)
-        sdists = self._total_space.metric.squared_dist(base_point, orbit)
-        return self._perms[gs.argmin(sdists)]
+        point, base_point = gs.to_numpy(point), gs.to_numpy(base_point)
+        n_nodes = point.shape[-1]
+
+        best_perm = np.arange(n_nodes)
+        best_cost = np.sum((base_point - point) ** 2)
+
+        stack = [(0.0, [], list(range(n_nodes)))]
+        while stack:
+            cost, assigned, free = stack.pop()
+            exact_cost, edge_cost = self._assignment_costs(
+                point, base_point, assigned, free
+            )
+            bound_cost = exact_cost + edge_cost
+            rows, cols = linear_sum_assignment(bound_cost)
+            if cost + bound_cost[rows, cols].sum() >= best_cost:
+                continue
+
+            perm = np.array(assigned + [free[col] for col in cols])
+            perm_cost = ((base_point - point[perm][:, perm]) ** 2).sum()
+            if perm_cost < best_cost:
+                best_perm, best_cost = perm, perm_cost
+
+            if len(free) == 1:
+                continue
+
+            for index in np.argsort(-bound_cost[0]):
+                node = free[index]
+                stack.append(
+                    (
+                        cost + exact_cost[0, index],
+                        assigned + [node],
+                        free[:index] + free[index + 1 :],
+                    )
+                )
+
+        return gs.from_numpy(best_perm)
 
 
 class PointToGeodesicAlignerBase(ABC):
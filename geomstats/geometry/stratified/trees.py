@@ -167,6 +167,14 @@ class Split:
         The second part of the split, an iterable that is a subset of
         :math:`\{0,\dots,n-1\}`. It may be empty, but must have empty intersection with
         ``part1``.
+
+    Attributes
+    ----------
+    bits1 : int
+        The labels of ``part1`` packed into an integer, the bit :math:`i` being set
+        if and only if :math:`i` is in ``part1``.
+    bits2 : int
+        The labels of ``part2`` packed into an integer.
     """
 
     def __init__(self, part1, part2):
@@ -183,6 +191,29 @@ class Split:
             self.part1 = part1 or part2
             self.part2 = set()
 
+        self.bits1 = self._pack(self.part1)
+        self.bits2 = self._pack(self.part2)
+        self._hash = hash((tuple(sorted(self.part1)), tuple(sorted(self.part2))))
+
+    @staticmethod
+    def _pack(part):
+        """Pack a set of labels into an integer.
+
+        Parameters
+        ----------
+        part : set
+            The set of labels.
+
+        Returns
+        -------
+        bits : int
+            The integer whose set bits are the labels.
+        """
+        bits = 0
+        for label in part:
+            bits |= 1 << label
+        return bits
+
     def __bool__(self):
         """Return True if and only if both parts are non-empty.
 
@@ -197,7 +228,7 @@ class Split:
         return bool(self.part1) and bool(self.part2)
 
     def __eq__(self, other):
-        """Check for equal hashes of the two splits.
+        """Check whether the two splits have the same parts.
 
         Parameters
         ----------
@@ -209,19 +240,23 @@ class Split:
         is_equal : bool
             Return ``True`` if the splits are equal, else ``False``.
         """
-        return hash(self) == hash(other)
+        if not isinstance(other, Split):
+            return NotImplemented
+        return self.bits1 == other.bits1 and self.bits2 == other.bits2
 
     def __hash__(self):
         """Compute the hash of a split.
 
-        Note that this hash simply uses the hash function for tuples.
+        Note that this hash simply uses the hash function for tuples of the sorted
+        parts, which are equal if and only if the packed parts are. It is computed
+        once at initialization, as splits are used as dictionary keys and sorted.
 
         Returns
         -------
         hash_of_split : int
             Return the hash of the split.
         """
-        return hash((tuple(self.part1), tuple(self.part2)))
+        return self._hash
 
     def __lt__(self, other):
         """Check if the hash of this split is less than the hash of the other split.
@@ -272,7 +307,7 @@ class Split:
         """Check whether this split is compatible with another split.
 
         Two splits are compatible, if at least one intersection of the respective parts
-        of the splits is empty.
+        of the splits is empty. The intersections are computed on the packed labels.
 
         Parameters
         ----------
@@ -284,9 +319,9 @@ class Split:
         is_compatible_with : bool
             Return ``True`` if the splits are compatible, else ``False``.
         """
-        p1, p2 = self.part1, self.part2
-        o1, o2 = other.part1, other.part2
-        return sum([bool(s) for s in [p1 & o1, p1 & o2, p2 & o1, p2 & o2]]) < 4
+        p1, p2 = self.bits1, self.bits2
+        o1, o2 = other.bits1, other.bits2
+        return not (p1 & o1 and p1 & o2 and p2 & o1 and p2 & o2)
 
     def get_part_away_from(self, other):
         """Return the part of this split that is directed away from other split.
@@ -434,6 +469,9 @@ class ForestTopology:
         For each split, give an :math:`n\times n` dimensional matrix, where the
         uv-th entry is ``True`` if the split separates the labels u and v, else
         ``False``.
+    component : array-like, shape=[n, n]
+        The uv-th entry is ``True`` if the labels u and v are in the same component
+        of the forest, else ``False``.
     """
 
     def __init__(self, partition, split_sets):
@@ -472,6 +510,11 @@ class ForestTopology:
             gs.array([m for m in self._flatten(_support)]),
             (-1, self.n_labels, self.n_labels),
         )
+        _component = gs.zeros((self.n_labels, self.n_labels), dtype=int)
+        for part in self.partition:
+            for u, v in itertools.product(part, repeat=2):
+                _component[u][v] = 1
+        self.component = _component
         self._chart_gradient = None
 
         self.n_splits = gs.sum(
@@ -650,51 +693,73 @@ class ForestTopology:
         comps = [", ".join(str(sp) for sp in splits) for splits in self.split_sets]
         return "(" + "; ".join(comps) + ")"
 
+    def _corr_factors(self, weights):
+        """Compute the factor of each split in the correlation of each pair of labels.
+
+        Parameters
+        ----------
+        weights : array-like, shape=[..., n_splits]
+            Edge weights.
+
+        Returns
+        -------
+        factors : array-like, shape=[..., n_splits, n, n]
+            The uv-th entry of the factor of a split is one minus its weight if the
+            split separates the labels u and v, else one.
+        """
+        return 1.0 - weights[..., :, None, None] * self.support
+
     def corr(self, weights):
         """Compute the correlation matrix of the topology with edge weights ``weights``.
 
+        The correlation of two labels in the same component is the product of one
+        minus the weights of the splits on the path between them. It is computed as
+        a product over all splits, at once for all pairs of labels.
+
         Parameters
         ----------
-        weights : array-like, [n_splits]
+        weights : array-like, shape=[..., n_splits]
             Edge weights.
 
         Returns
         -------
-        corr : array-like, shape=[n, n]
+        corr : array-like, shape=[..., n, n]
             Returns the corresponding correlation matrix.
         """
-        corr = gs.zeros((self.n_labels, self.n_labels))
-        for path_dict in self.paths:
-            for (u, v), path in path_dict.items():
-                corr[u][v] = gs.prod(
-                    gs.array([1 - weights[self.where[split]] for split in path])
-                )
-                corr[v][u] = corr[u][v]
-
-        corr = gs.array(corr)
-        return corr + gs.eye(corr.shape[0])
+        return gs.prod(self._corr_factors(weights), axis=-3) * self.component
 
     def corr_gradient(self, weights):
         """Compute the gradient of the correlation matrix, differentiated by weights.
 
+        The derivative with respect to the weight of a split is minus the product of
+        the factors of all other splits, computed with cumulative products from both
+        ends so that weights equal to one are handled.
+
         Parameters
         ----------
-        weights : array-like, [n_splits]
+        weights : array-like, shape=[..., n_splits]
             The vector weights at which the gradient is computed.
 
         Returns
         -------
-        gradient : array-like, shape=[n_splits, n, n]
+        gradient : array-like, shape=[..., n_splits, n, n]
             The gradient of the correlation matrix, differentiated by weights.
         """
-        x_list = [
-            [y if i != k else 0 for i, y in enumerate(weights)]
-            for k in range(len(weights))
-        ]
-        gradient = gs.array(
-            [-supp * self.corr(x) for supp, x in zip(self.support, x_list)]
+        factors = self._corr_factors(weights)
+        ones = gs.ones_like(factors[..., :1, :, :])
+        before = gs.cumprod(
+            gs.concatenate([ones, factors[..., :-1, :, :]], axis=-3), axis=-3
+        )
+        after = gs.flip(
+            gs.cumprod(
+                gs.flip(
+                    gs.concatenate([factors[..., 1:, :, :], ones], axis=-3), axis=-3
+                ),
+                axis=-3,
+            ),
+            axis=-3,
         )
-        return gradient
+        return -self.support * before * after * self.component
 
     def _unflatten(self, ls):
         """Transform list into list of lists according to separators, ``self.sep``.
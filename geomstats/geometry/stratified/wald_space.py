@@ -732,7 +732,7 @@ class LocalProjectionSolver:
             Initial guess for weights.
         """
         if len(topology.partition) == topology.n_labels:
-            return Wald(topology=topology, weights=gs.ones(self.n_labels))
+            return Wald(topology=topology, weights=gs.ones(topology.n_splits))
 
         value_and_grad = _AMBIENT_METRIC_TO_SQUARED_DIST_GRAD.get(
             self._space.ambient_space.metric.__class__.__name__,
@@ -875,7 +875,8 @@ class BasicWaldGeodesicSolver(ABC):
 class NaiveProjectionGeodesicSolver(BasicWaldGeodesicSolver):
     """Naive geodesic projection solver.
 
-    Implementation of algorithm 1 from [Lueg21]_.
+    Implementation of algorithm 1 from [Lueg21]_. The projection of each node of
+    the ambient geodesic is initialized at the projection of the previous node.
     """
 
     def __init__(self, space, n_grid=10):
@@ -912,9 +913,15 @@ class NaiveProjectionGeodesicSolver(BasicWaldGeodesicSolver):
         time = gs.linspace(0, 1, self.n_grid)[1:-1]
         mid_ambient_point = ambient_geod_func(time)
 
-        mid_points = self._space.metric.projection(mid_ambient_point, topology)
+        points = [initial_point]
+        for ambient_point in mid_ambient_point:
+            points.append(
+                self._space.metric.projection(
+                    ambient_point, topology, initial_weights=points[-1].weights
+                )
+            )
 
-        return WaldBatch([initial_point] + mid_points + [end_point])
+        return WaldBatch(points + [end_point])
 
 
 class SuccessiveProjectionGeodesicSolver(BasicWaldGeodesicSolver):
@@ -986,7 +993,11 @@ class SuccessiveProjectionGeodesicSolver(BasicWaldGeodesicSolver):
             left_corr, end_point=right_corr
         )
 
-        mid_point = self._space.metric.projection(ambient_geod_func(0.5), topology)
+        mid_point = self._space.metric.projection(
+            ambient_geod_func(0.5),
+            topology,
+            initial_weights=(left_points[-1].weights + right_points[0].weights) / 2,
+        )
         return WaldBatch(left_points + mid_point + right_points)
 
 
@@ -58,6 +58,28 @@ class BetaDistributions(DirichletDistributions):
         """
         return self._scp_rv.rvs(point, n_samples)
 
+    def _pdf_at(self, point, x):
+        """Evaluate pdfs at one sample per distribution.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., 2]
+            Points representing beta distributions.
+        x : array-like, shape=[...]
+            Samples, broadcast against the batch shape of point.
+
+        Returns
+        -------
+        pdf_at_x : array-like, shape=[...]
+            Value of each pdf at its sample.
+        """
+        alpha, beta = point[..., 0], point[..., 1]
+        return (
+            x ** (alpha - 1)
+            * (1 - x) ** (beta - 1)
+            / (gs.gamma(alpha) * gs.gamma(beta) / gs.gamma(alpha + beta))
+        )
+
     def point_to_pdf(self, point):
         """Compute pdf associated to point.
 
@@ -75,8 +97,6 @@ class BetaDistributions(DirichletDistributions):
             Probability density function of the beta distribution with
             parameters provided by point.
         """
-        alpha = gs.expand_dims(point[..., 0], axis=-1)
-        beta = gs.expand_dims(point[..., 1], axis=-1)
 
         def pdf(x):
             """Generate parameterized function for normal pdf.
@@ -93,11 +113,7 @@ class BetaDistributions(DirichletDistributions):
                 by point.
             """
             x = gs.reshape(gs.array(x), (-1,))
-            return (
-                x ** (alpha - 1)
-                * (1 - x) ** (beta - 1)
-                / (gs.gamma(alpha) * gs.gamma(beta) / gs.gamma(alpha + beta))
-            )
+            return self._pdf_at(gs.expand_dims(point, axis=-2), x)
 
         return pdf
 
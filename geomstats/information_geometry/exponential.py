@@ -121,6 +121,24 @@ class ExponentialDistributions(InformationManifoldMixin, VectorSpaceOpenSet):
         """
         return self._scp_rv.rvs(point, n_samples)
 
+    def _pdf_at(self, point, x):
+        """Evaluate pdfs at one sample per distribution.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., 1]
+            Points representing exponential distributions.
+        x : array-like, shape=[...]
+            Samples, broadcast against the batch shape of point.
+
+        Returns
+        -------
+        pdf_at_x : array-like, shape=[...]
+            Value of each pdf at its sample.
+        """
+        pdf_at_x = point[..., 0] * gs.exp(-point[..., 0] * x)
+        return gs.where(x >= 0, pdf_at_x, 0.0)
+
     def point_to_pdf(self, point):
         """Compute pdf associated to point.
 
@@ -155,8 +173,7 @@ class ExponentialDistributions(InformationManifoldMixin, VectorSpaceOpenSet):
             pdf_at_x : array-like, shape=[..., n_points]
             """
             x = gs.reshape(gs.array(x), (-1,))
-            pdf_at_x = point * gs.exp(-point * x)
-            return gs.where(x >= 0, pdf_at_x, 0.0)
+            return self._pdf_at(gs.expand_dims(point, axis=-2), x)
 
         return pdf
 
@@ -1,8 +1,13 @@
 """Class to implement simply the Fisher-Rao metric on information manifolds."""
 
+import math
+
+import numpy as np
 from scipy.integrate import quad_vec
 
 import geomstats.backend as gs
+from geomstats.cache import BasePointCache
+from geomstats.errors import check_parameter_accepted_values
 from geomstats.geometry.riemannian_metric import RiemannianMetric
 
 
@@ -24,14 +29,179 @@ class FisherRaoMetric(RiemannianMetric):
     support : list, shape = (2,)
         Left and right bounds for the support of the distribution.
         But this is just to help integration, bounds should be as large as needed.
+    quadrature : str, {"adaptive", "gauss"}
+        Integration method. "adaptive" integrates with `scipy.integrate.quad_vec`,
+        differentiating the pdf at each point where it is evaluated. "gauss" uses a
+        fixed-order Gauss rule chosen from the support: Gauss-Legendre on a bounded
+        support, Gauss-Laguerre on a half-line and Gauss-Hermite on the real line.
+        The pdf and its derivatives are then computed at all the nodes and for
+        all the base points at once. Fixed-order rules converge slowly if the
+        integrand is singular at a bound of the support, e.g. for gamma or beta
+        distributions, in which case more nodes are needed.
+        Optional, default: "adaptive".
+    n_nodes : int
+        Number of nodes of the Gauss rule.
+        Optional, default: 100.
+    cache_size : int
+        If given, metric matrices and their derivatives are kept in a
+        least-recently-used cache of `cache_size` base points.
+        Optional, default: None.
+    cache : BasePointCache or None
+        Cache of metric matrices, if `cache_size` is given.
     """
 
-    def __init__(self, space, support):
+    def __init__(
+        self, space, support, quadrature="adaptive", n_nodes=100, cache_size=None
+    ):
         super().__init__(
             space=space,
             signature=(space.dim, 0),
         )
+        check_parameter_accepted_values(quadrature, "quadrature", ["adaptive", "gauss"])
         self.support = support
+        self.quadrature = quadrature
+        self.n_nodes = n_nodes
+        self.cache = None if cache_size is None else BasePointCache(cache_size)
+
+    @staticmethod
+    def gauss_rule(support, n_nodes):
+        """Compute the nodes and weights of a Gauss rule on a support.
+
+        Parameters
+        ----------
+        support : list, shape = (2,)
+            Left and right bounds of the support, possibly infinite.
+        n_nodes : int
+            Number of nodes.
+
+        Returns
+        -------
+        nodes : array-like, shape=[n_nodes]
+            Nodes of the rule.
+        weights : array-like, shape=[n_nodes]
+            Weights of the rule, such that the integral of f over the support
+            is approximated by the sum of weights * f(nodes).
+        """
+        lower, upper = (float(bound) for bound in support)
+        if math.isfinite(lower) and math.isfinite(upper):
+            nodes, weights = np.polynomial.legendre.leggauss(n_nodes)
+            half_length = (upper - lower) / 2
+            nodes = half_length * nodes + (upper + lower) / 2
+            weights = half_length * weights
+        elif math.isfinite(lower) or math.isfinite(upper):
+            nodes, weights = np.polynomial.laguerre.laggauss(n_nodes)
+            weights = weights * np.exp(nodes)
+            nodes = lower + nodes if math.isfinite(lower) else upper - nodes
+        else:
+            nodes, weights = np.polynomial.hermite.hermgauss(n_nodes)
+            weights = weights * np.exp(nodes**2)
+
+        if not np.all(np.isfinite(weights)):
+            raise ValueError(
+                f"The Gauss rule with {n_nodes} nodes overflows on an unbounded "
+                "support: use fewer nodes or bound the support."
+            )
+        return gs.from_numpy(nodes), gs.from_numpy(weights)
+
+    def _pdf_at_nodes(self, point, nodes):
+        """Evaluate pdfs at quadrature nodes, one node per copy of the point.
+
+        If the space evaluates pdfs at one sample per distribution, with
+        `_pdf_at`, all the copies are evaluated at once. Otherwise, the copies
+        are evaluated node by node, which avoids evaluating every copy at
+        every node.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., n_nodes, dim]
+            Copies of points, one for each node.
+        nodes : array-like, shape=[n_nodes]
+            Nodes.
+
+        Returns
+        -------
+        pdf_at_nodes : array-like, shape=[..., n_nodes]
+            Value at each node of the pdf of the corresponding copy.
+        """
+        if hasattr(self._space, "_pdf_at"):
+            return self._space._pdf_at(point, nodes)
+
+        return gs.stack(
+            [
+                self._space.point_to_pdf(point[..., index, :])(
+                    nodes[index : index + 1]
+                )[..., 0]
+                for index in range(nodes.shape[0])
+            ],
+            axis=-1,
+        )
+
+    def _gauss_derivatives(self, base_point, order=1):
+        """Compute the derivatives of the pdf at the nodes of the Gauss rule.
+
+        The base points are copied for each node, so that the derivatives at
+        all nodes are obtained from a single elementwise gradient. Derivatives
+        are divided by the pdf, and the pdf is multiplied by the weights of the
+        rule, which avoids overflows where the pdf is tiny.
+
+        Parameters
+        ----------
+        base_point : array-like, shape=[..., dim]
+            Base point.
+        order : int, {1, 2}
+            Highest order of the derivatives.
+
+        Returns
+        -------
+        weighted_pdf : array-like, shape=[..., n_nodes]
+            Pdf at the nodes times the weights of the rule.
+        derivatives : list[array-like]
+            Gradients with shape=[..., n_nodes, dim] and, if order is 2,
+            hessians with shape=[..., n_nodes, dim, dim] of the pdf at the
+            nodes, divided by the pdf.
+        """
+        nodes, weights = self.gauss_rule(self.support, self.n_nodes)
+        dim = base_point.shape[-1]
+        point = gs.broadcast_to(
+            gs.expand_dims(base_point, axis=-2),
+            base_point.shape[:-1] + (self.n_nodes, dim),
+        )
+
+        def _pdf(point):
+            return self._pdf_at_nodes(point, nodes)
+
+        value_and_grad = gs.autodiff.value_and_grad(_pdf)
+        pdf, pdf_grad = value_and_grad(point)
+        derivatives = [pdf_grad]
+        if order == 2:
+            derivatives.append(
+                gs.stack(
+                    [
+                        gs.autodiff.value_and_grad(
+                            lambda point, index=index: value_and_grad(point)[1][
+                                ..., index
+                            ]
+                        )(point)[1]
+                        for index in range(dim)
+                    ],
+                    axis=-2,
+                )
+            )
+
+        positive = pdf > 0
+        safe_pdf = gs.where(positive, pdf, 1.0)
+        weighted_pdf = gs.where(positive, weights * pdf, 0.0)
+        derivatives = [
+            derivative
+            / gs.reshape(safe_pdf, safe_pdf.shape + (1,) * (derivative.ndim - pdf.ndim))
+            for derivative in derivatives
+        ]
+        return weighted_pdf, derivatives
+
+    def _cached(self, base_point, name, func):
+        if self.cache is None:
+            return func(base_point)
+        return self.cache.get(base_point, name, func)
 
     def metric_matrix(self, base_point):
         r"""Compute the inner-product matrix.
@@ -72,6 +242,13 @@ class FisherRaoMetric(RiemannianMetric):
         .. [AS1985] Amari, S (1985)
             Differential Geometric Methods in Statistics, Berlin, Springer – Verlag.
         """
+        return self._cached(base_point, "metric_matrix", self._metric_matrix)
+
+    def _metric_matrix(self, base_point):
+        """Compute the inner-product matrix without caching it."""
+        if self.quadrature == "gauss":
+            weighted_pdf, (score,) = self._gauss_derivatives(base_point)
+            return gs.einsum("...n,...ni,...nj->...ij", weighted_pdf, score, score)
 
         def pdf(x):
             """Compute pdf at a fixed point on the support.
@@ -137,6 +314,28 @@ class FisherRaoMetric(RiemannianMetric):
             Derivative of the inner-product matrix, where the index
             k of the derivation is last: math:`mat_{ijk} = \partial_k g_{ij}`.
         """
+        return self._cached(
+            base_point,
+            "inner_product_derivative_matrix",
+            self._inner_product_derivative_matrix,
+        )
+
+    def _inner_product_derivative_matrix(self, base_point):
+        """Compute the derivative of the inner-product matrix without caching it."""
+        if self.quadrature == "gauss":
+            weighted_pdf, (score, hessian) = self._gauss_derivatives(
+                base_point, order=2
+            )
+            hessian_score = gs.einsum(
+                "...n,...nki,...nj->...ijk", weighted_pdf, hessian, score
+            )
+            return (
+                hessian_score
+                + gs.einsum("...ijk->...jik", hessian_score)
+                - gs.einsum(
+                    "...n,...ni,...nj,...nk->...ijk", weighted_pdf, score, score, score
+                )
+            )
 
         def pdf(x):
             """Compute pdf at a fixed point on the support.
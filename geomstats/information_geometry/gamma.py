@@ -204,6 +204,29 @@ class GammaDistributions(InformationManifoldMixin, VectorSpaceOpenSet):
         """
         return self._scp_rv.rvs(point, n_samples)
 
+    def _pdf_at(self, point, x):
+        """Evaluate pdfs at one sample per distribution.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., dim]
+            Points representing Gamma distributions.
+        x : array-like, shape=[...]
+            Samples, broadcast against the batch shape of point.
+
+        Returns
+        -------
+        pdf_at_x : array-like, shape=[...]
+            Value of each pdf at its sample.
+        """
+        kappa, gamma = point[..., 0], point[..., 1]
+        return (
+            kappa**kappa
+            * x ** (kappa - 1)
+            * gs.exp(-kappa * x / gamma)
+            / (gamma**kappa * gs.gamma(kappa))
+        )
+
     def point_to_pdf(self, point):
         """Compute pdf associated to point.
 
@@ -221,8 +244,6 @@ class GammaDistributions(InformationManifoldMixin, VectorSpaceOpenSet):
             Probability density function of the Gamma distribution with
             parameters provided by point.
         """
-        kappa = gs.expand_dims(point[..., 0], axis=-1)
-        gamma = gs.expand_dims(point[..., 1], axis=-1)
 
         def pdf(x):
             """Generate parameterized function for Gamma pdf.
@@ -240,12 +261,7 @@ class GammaDistributions(InformationManifoldMixin, VectorSpaceOpenSet):
                 by point.
             """
             x = gs.reshape(gs.array(x), (-1,))
-            return (
-                kappa**kappa
-                * x ** (kappa - 1)
-                * gs.exp(-kappa * x / gamma)
-                / (gamma**kappa * gs.gamma(kappa))
-            )
+            return self._pdf_at(gs.expand_dims(point, axis=-2), x)
 
         return pdf
 
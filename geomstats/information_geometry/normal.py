@@ -123,6 +123,25 @@ class UnivariateNormalDistributions(InformationManifoldMixin, PoincareHalfSpace)
         """
         return self._scp_rv.rvs(point, n_samples)
 
+    def _pdf_at(self, point, x):
+        """Evaluate pdfs at one sample per distribution.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., 2]
+            Points representing normal distributions (mean and scale).
+        x : array-like, shape=[...]
+            Samples, broadcast against the batch shape of point.
+
+        Returns
+        -------
+        pdf_at_x : array-like, shape=[...]
+            Value of each pdf at its sample.
+        """
+        means, stds = point[..., 0], point[..., 1]
+        pdf_normalization = 1.0 / gs.sqrt(2 * gs.pi * stds**2)
+        return pdf_normalization * gs.exp(-((x - means) ** 2) / (2 * stds**2))
+
     def point_to_pdf(self, point):
         """Compute pdf associated to point.
 
@@ -140,9 +159,6 @@ class UnivariateNormalDistributions(InformationManifoldMixin, PoincareHalfSpace)
             Probability density function of the normal distribution with
             parameters provided by point.
         """
-        means = gs.expand_dims(point[..., 0], axis=-1)
-        stds = gs.expand_dims(point[..., 1], axis=-1)
-        pdf_normalization = 1.0 / gs.sqrt(2 * gs.pi * stds**2)
 
         def pdf(x):
             """Generate parameterized function for normal pdf.
@@ -159,7 +175,7 @@ class UnivariateNormalDistributions(InformationManifoldMixin, PoincareHalfSpace)
                 by point.
             """
             x = gs.reshape(gs.array(x), (-1,))
-            return pdf_normalization * gs.exp(-((x - means) ** 2) / (2 * stds**2))
+            return self._pdf_at(gs.expand_dims(point, axis=-2), x)
 
         return pdf
 
@@ -98,16 +98,7 @@ class AgglomerativeHierarchicalClustering(AgglomerativeClustering):
         distance_threshold=None,
     ):
         def affinity(data):
-            data = gs.from_numpy(data)
-
-            n_samples = data.shape[0]
-            affinity_matrix = gs.zeros([n_samples, n_samples])
-            for i_sample in range(1, n_samples):
-                affinity_matrix[i_sample, :i_sample] = self.space.metric.dist(
-                    data[i_sample, ...], data[:i_sample, ...]
-                ).reshape(i_sample)
-            affinity_matrix = affinity_matrix + affinity_matrix.T
-            return affinity_matrix
+            return self.space.metric.dist_pairwise(gs.from_numpy(data))
 
         self.space = space
 
@@ -6,6 +6,7 @@ Lead authors: Nicolas Guigui and Nina Miolane.
 import abc
 import logging
 import math
+import random
 
 from sklearn.base import BaseEstimator
 
@@ -14,6 +15,7 @@ import geomstats.errors as error
 from geomstats.geometry.discrete_curves import ElasticMetric, SRVMetric
 from geomstats.geometry.euclidean import EuclideanMetric
 from geomstats.geometry.hypersphere import HypersphereMetric
+from geomstats.geometry.stratified.bhv_space import BHVMetric
 
 ELASTIC_METRICS = [SRVMetric, ElasticMetric]
 
@@ -269,6 +271,140 @@ class BatchGradientDescent(BaseGradientDescent):
         return estimates
 
 
+class GroupGradientDescent(BaseGradientDescent):
+    """Gradient descent for the Frechet means of independent groups.
+
+    Each group follows the steps of `GradientDescent`, with its own step size
+    and convergence flag. Groups that have converged are excluded from
+    subsequent calls to `log` and `exp`.
+    """
+
+    def minimize(self, space, points, groups=None, n_groups=None, weights=None):
+        """Perform gradient descent for each group of points.
+
+        Parameters
+        ----------
+        space : Manifold
+            Equipped manifold.
+        points : array-like, shape=[n_samples, *space.shape]
+            Points to be averaged.
+        groups : array-like, shape=[n_samples,]
+            Index of the group of each point.
+            Optional, default: None, in which case all points are in a single
+            group.
+        n_groups : int
+            Number of groups.
+            Optional, default: None, in which case it is inferred from `groups`.
+        weights : array-like, shape=[n_samples,]
+            Weights associated to the points.
+            Optional, default: None.
+
+        Returns
+        -------
+        estimates : array-like, shape=[n_groups, *space.shape]
+            Weighted Frechet mean of each group. Empty groups keep their
+            initial estimate.
+        """
+        n_points = gs.shape(points)[0]
+        if groups is None:
+            groups = gs.zeros((n_points,), dtype=gs.int64)
+        if n_groups is None:
+            n_groups = int(gs.amax(groups)) + 1
+        if weights is None:
+            weights = gs.ones((n_points,))
+
+        membership = gs.cast(gs.one_hot(groups, n_groups), weights.dtype)
+        weighted_membership = gs.einsum("n,ng->ng", weights, membership)
+        sum_weights = gs.sum(weighted_membership, axis=0)
+
+        if self.init_point is None:
+            estimates = points[gs.argmax(membership, axis=0)]
+        else:
+            estimates = self.init_point
+
+        group_indices = gs.arange(n_groups)
+        mask_shape = (n_groups,) + (1,) * space.point_ndim
+        tol = self.epsilon * space.dim
+
+        active = sum_weights > 0.0
+        step_size = self.init_step_size * gs.ones(n_groups)
+        sq_norm_points = gs.sum(gs.reshape(points, (n_points, -1)) ** 2, axis=-1)
+        norm_old = gs.sqrt(gs.einsum("ng,n->g", membership, sq_norm_points))
+        var = gs.zeros(n_groups)
+        sq_dist = gs.zeros(n_groups)
+        iteration = 0
+        while iteration < self.max_iter and gs.any(active):
+            point_mask = active[groups]
+            active_estimates = estimates[active]
+            active_membership = weighted_membership[point_mask][:, active]
+            active_sum_weights = sum_weights[active]
+            base_points = estimates[groups[point_mask]]
+
+            logs = space.metric.log(points[point_mask], base_points)
+            scatter = gs.cast(gs.one_hot(group_indices[active], n_groups), logs.dtype)
+
+            active_var = gs.einsum(
+                "na,n->a",
+                active_membership,
+                space.metric.squared_norm(logs, base_points),
+            )
+            var = gs.einsum("ag,a->g", scatter, active_var / active_sum_weights)
+
+            tangent_mean = gs.einsum("na,n...->a...", active_membership, logs)
+            tangent_mean = _scalarmul(1.0 / active_sum_weights, tangent_mean)
+            norm = gs.linalg.norm(
+                gs.reshape(tangent_mean, (tangent_mean.shape[0], -1)), axis=-1
+            )
+            norm = gs.einsum("ag,a->g", scatter, norm)
+
+            sq_dist = space.metric.squared_norm(tangent_mean, active_estimates)
+            sq_dist = gs.einsum("ag,a->g", scatter, sq_dist)
+
+            converged = gs.logical_or(gs.isclose(var, 0.0), sq_dist <= tol)
+            if iteration == 0:
+                updating = active
+            else:
+                updating = gs.logical_and(active, ~converged)
+
+            active_updating = updating[active]
+            if gs.any(active_updating):
+                next_estimates = space.metric.exp(
+                    _scalarmul(step_size[updating], tangent_mean[active_updating]),
+                    active_estimates[active_updating],
+                )
+                next_estimates = gs.einsum(
+                    "ag,a...->g...", scatter[active_updating], next_estimates
+                )
+                estimates = gs.where(
+                    gs.reshape(updating, mask_shape), next_estimates, estimates
+                )
+            iteration += 1
+
+            decreased = gs.logical_and(updating, norm < norm_old)
+            increased = gs.logical_and(updating, norm > norm_old)
+            norm_old = gs.where(decreased, norm, norm_old)
+            step_size = gs.where(increased, step_size / 2.0, step_size)
+            active = updating
+
+        if gs.any(active):
+            logging.warning(
+                "Maximum number of iterations %d reached for %d groups. "
+                "The means may be inaccurate",
+                self.max_iter,
+                int(gs.sum(gs.cast(active, gs.int32))),
+            )
+
+        if self.verbose:
+            logging.info(
+                "n_iter: %d, final max variance: %e, final max dist: %e",
+                iteration,
+                gs.amax(var),
+                gs.amax(sq_dist),
+            )
+
+        return estimates
+
+
 class AdaptiveGradientDescent(BaseGradientDescent):
     """Adaptive gradient descent."""
 
@@ -601,6 +737,112 @@ class CircleMean(BaseEstimator):
         return self
 
 
+class SturmMean(BaseEstimator):
+    """Inductive Frechet mean in a space of non-positive curvature.
+
+    Sturm's algorithm moves the estimate along the geodesic towards a randomly
+    drawn sample, by a fraction of the geodesic equal to the weight of the sample
+    over the total weight of the samples drawn so far [S03]_. It converges to the
+    Frechet mean in CAT(0) spaces, such as BHV tree space, where geodesics are
+    computed in polynomial time but there is no log map.
+
+    Samples are drawn by passes over random permutations of the data, and the
+    algorithm stops when the estimate moves by less than `epsilon` over a pass.
+
+    Parameters
+    ----------
+    space : PointSet or Manifold
+        Equipped space, whose metric implements `geodesic` and `dist`.
+    max_iter : int
+        Maximum number of geodesic steps.
+        Optional, default: 1000.
+    epsilon : float
+        Tolerance on the distance between the estimates of successive passes.
+        Optional, default: 1e-4.
+    verbose : bool
+        Verbose option.
+        Optional, default: False.
+
+    Attributes
+    ----------
+    estimate_ : Point
+        If fit, Frechet mean.
+    n_iter_ : int
+        If fit, number of geodesic steps.
+
+    References
+    ----------
+    .. [S03] Sturm, K.-T.
+        "Probability Measures on Metric Spaces of Nonpositive Curvature."
+        Heat Kernels and Analysis on Manifolds, Graphs, and Metric Spaces,
+        Contemporary Mathematics, volume 338, pages 357-390, 2003.
+    """
+
+    def __init__(self, space, max_iter=1000, epsilon=1e-4, verbose=False):
+        self.space = space
+        self.max_iter = max_iter
+        self.epsilon = epsilon
+        self.verbose = verbose
+
+        self.estimate_ = None
+        self.n_iter_ = None
+
+    def fit(self, X, y=None, weights=None):
+        """Compute the empirical weighted Frechet mean.
+
+        Parameters
+        ----------
+        X : PointBatch or array-like, shape=[n_samples, *metric.shape]
+            Training input samples.
+        y : None
+            Target values. Ignored.
+        weights : array-like, shape=[n_samples,]
+            Weights associated to the samples.
+            Optional, default: None, in which case it is equally weighted.
+
+        Returns
+        -------
+        self : object
+            Returns self.
+        """
+        metric = self.space.metric
+        n_samples = len(X)
+        if weights is None:
+            weights = gs.ones(n_samples)
+
+        order = random.sample(range(n_samples), n_samples)
+        mean = X[order[0]]
+        total_weight = weights[order[0]]
+        pass_mean = mean
+
+        iteration = 1
+        while iteration < self.max_iter:
+            index = order[iteration % n_samples]
+            total_weight = total_weight + weights[index]
+            step = weights[index] / total_weight
+            mean = metric.geodesic(mean, X[index])(float(step))[0]
+
+            iteration += 1
+            if iteration % n_samples == 0:
+                if metric.dist(pass_mean, mean) < self.epsilon:
+                    break
+                order = random.sample(range(n_samples), n_samples)
+                pass_mean = mean
+
+        if iteration == self.max_iter:
+            logging.warning(
+                "Maximum number of iterations %d reached. The mean may be inaccurate",
+                self.max_iter,
+            )
+
+        if self.verbose:
+            logging.info("n_iter: %d", iteration)
+
+        self.estimate_ = mean
+        self.n_iter_ = iteration
+        return self
+
+
 class FrechetMean(BaseEstimator):
     r"""Empirical Frechet mean.
 
@@ -638,6 +880,9 @@ class FrechetMean(BaseEstimator):
         elif _is_elastic_metric(space.metric):
             return ElasticMean(space, **kwargs)
 
+        elif isinstance(space.metric, BHVMetric):
+            return SturmMean(space, **kwargs)
+
         return super().__new__(cls)
 
     def __init__(self, space, method="default"):
@@ -706,3 +951,136 @@ class FrechetMean(BaseEstimator):
             weights=weights,
         )
         return self
+
+
+class GroupFrechetMean(BaseEstimator):
+    """Empirical Frechet means of independent groups of samples.
+
+    Groups are either given by a group index per sample or by a padding mask
+    over samples stacked by group. The means of all groups are estimated
+    together: closed forms are vectorized over groups, and the gradient
+    descent keeps a step size and a convergence flag per group.
+
+    Parameters
+    ----------
+    space : Manifold
+        Equipped manifold.
+    n_groups : int
+        Number of groups.
+        Optional, default: None, in which case it is inferred from the groups
+        given at fit.
+
+    Attributes
+    ----------
+    estimate_ : array-like, shape=[n_groups, *space.shape]
+        If fit, Frechet mean of each group.
+
+    Notes
+    -----
+    * Required metric methods for general case:
+        * `log`, `exp`, `squared_norm` (for convergence criteria)
+    """
+
+    def __init__(self, space, n_groups=None):
+        self.space = space
+        self.n_groups = n_groups
+        self.optimizer = GroupGradientDescent()
+
+        self.estimate_ = None
+
+    def set(self, **kwargs):
+        """Set optimizer parameters.
+
+        Especially useful for one line instantiations.
+        """
+        for param_name, value in kwargs.items():
+            if not hasattr(self.optimizer, param_name):
+                raise ValueError(f"Unknown parameter {param_name}.")
+
+            setattr(self.optimizer, param_name, value)
+        return self
+
+    def _group_linear_mean(self, points, groups, n_groups, weights):
+        membership = gs.cast(gs.one_hot(groups, n_groups), weights.dtype)
+        weighted_membership = gs.einsum("n,ng->ng", weights, membership)
+        sum_weights = gs.sum(weighted_membership, axis=0)
+        sum_weights = gs.where(sum_weights > 0.0, sum_weights, 1.0)
+        return _scalarmul(
+            1.0 / sum_weights,
+            gs.einsum("ng,n...->g...", weighted_membership, points),
+        )
+
+    def _group_loop_mean(self, points, groups, n_groups):
+        mean_estimator = FrechetMean(self.space)
+        return gs.stack(
+            [
+                mean_estimator.fit(points[groups == group]).estimate_
+                for group in range(n_groups)
+            ]
+        )
+
+    def fit(self, X, y=None, weights=None, groups=None, mask=None):
+        """Compute the empirical weighted Frechet mean of each group.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_samples, *metric.shape] or \
+            shape=[n_groups, max_group_size, *metric.shape]
+            Training input samples. If `mask` is given, samples are stacked
+            by group and padded to the size of the largest group.
+        y : None
+            Target values. Ignored.
+        weights : array-like, shape=[n_samples,] or [n_groups, max_group_size]
+            Weights associated to the samples.
+            Optional, default: None, in which case it is equally weighted.
+        groups : array-like, shape=[n_samples,]
+            Index of the group of each sample. Ignored if `mask` is given.
+            Optional, default: None, in which case all samples are in a
+            single group.
+        mask : array-like, shape=[n_groups, max_group_size]
+            Boolean mask of the samples that are not padding.
+            Optional, default: None.
+
+        Returns
+        -------
+        self : object
+            Returns self.
+        """
+        n_groups = self.n_groups
+        if mask is not None:
+            n_groups = mask.shape[0]
+            groups = gs.broadcast_to(gs.arange(n_groups)[:, None], mask.shape)
+            flat_mask = gs.reshape(mask, (-1,))
+            groups = gs.reshape(groups, (-1,))[flat_mask]
+            X = gs.reshape(X, (-1,) + self.space.shape)[flat_mask]
+            if weights is not None:
+                weights = gs.reshape(weights, (-1,))[flat_mask]
+        elif groups is None:
+            groups = gs.zeros((X.shape[0],), dtype=gs.int64)
+
+        if n_groups is None:
+            n_groups = int(gs.amax(groups)) + 1
+
+        metric = self.space.metric
+        if isinstance(metric, HypersphereMetric) and self.space.dim == 1:
+            if weights is not None:
+                raise NotImplementedError(
+                    "Weighted means are not implemented on the circle."
+                )
+            self.estimate_ = self._group_loop_mean(X, groups, n_groups)
+            return self
+
+        if weights is None:
+            weights = gs.ones(X.shape[0])
+        if _is_linear_metric(metric):
+            self.estimate_ = self._group_linear_mean(X, groups, n_groups, weights)
+        elif _is_elastic_metric(metric):
+            transformed = metric.diffeo.diffeomorphism(X)
+            self.estimate_ = metric.diffeo.inverse_diffeomorphism(
+                self._group_linear_mean(transformed, groups, n_groups, weights)
+            )
+        else:
+            self.estimate_ = self.optimizer.minimize(
+                self.space, X, groups, n_groups=n_groups, weights=weights
+            )
+        return self
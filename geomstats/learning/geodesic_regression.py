@@ -23,6 +23,7 @@ The geodesic regression method:
 import logging
 import math
 
+import numpy as np
 from scipy.optimize import OptimizeResult
 from sklearn.base import BaseEstimator
 
@@ -138,6 +139,238 @@ class RiemannianGradientDescent:
         return OptimizeResult(fun=loss, x=param, nit=current_iter)
 
 
+class BatchedRiemannianGradientDescent(RiemannianGradientDescent):
+    """Riemannian gradient descent on a batch of independent problems.
+
+    Each problem has its own step size, acceptance of steps and stopping
+    criterion, while loss and gradient evaluations are vectorized over the
+    problems still running.
+
+    If `batch_size` is given, each epoch takes steps along the gradients of
+    the loss over random mini-batches of samples, so that an epoch moves as
+    far as one step along the full gradient would. The loss over all
+    samples is then compared to the one of the previous epoch: the step
+    size of a problem is increased if it decreased, otherwise the epoch is
+    undone and the step size halved. A problem stops when the relative
+    decrease of its loss over an epoch is below `tol`, and `max_iter` is a
+    number of epochs.
+
+    Parameters
+    ----------
+    max_iter : int
+        Maximum number of iterations, or of epochs if `batch_size` is given.
+        Optional, default: 100.
+    init_step_size : float
+        Initial step size.
+        Optional, default: 0.1.
+    tol : float
+        Tolerance on the decrease of the loss of each problem, relative to
+        the loss if `batch_size` is given.
+        Optional, default: 1e-5.
+    batch_size : int
+        Number of samples per mini-batch. If None, full gradients are used.
+        Optional, default: None.
+    verbose : bool
+        Verbosity.
+        Optional, default: False.
+    """
+
+    def __init__(
+        self,
+        max_iter=100,
+        init_step_size=0.1,
+        tol=1e-5,
+        batch_size=None,
+        verbose=False,
+    ):
+        super().__init__(
+            max_iter=max_iter,
+            init_step_size=init_step_size,
+            tol=tol,
+            verbose=verbose,
+        )
+        self.batch_size = batch_size
+
+    def _handle_jac(self, fun, point_ndim, fun_jac=None):
+        if fun_jac is not None:
+            return fun_jac
+
+        if self.jac != "autodiff":
+            raise NotImplementedError("For now only working with autodiff.")
+
+        def fun_jac_(param, models, samples):
+            return gs.autodiff.value_and_grad(
+                lambda param_: gs.sum(fun(param_, models, samples)),
+                point_ndims=point_ndim + 2,
+            )(param)[1]
+
+        return fun_jac_
+
+    def _step(self, space, param, grad, step_size):
+        vector_transport = self._get_vector_transport(space)
+        point_ndim = space.point_ndim
+        step_size = gs.reshape(step_size, step_size.shape + (1,) * point_ndim)
+
+        intercept, coef = param[:, 0], param[:, 1]
+        grad_intercept = space.to_tangent(grad[:, 0], intercept)
+        grad_coef = space.to_tangent(grad[:, 1], intercept)
+
+        direction = -step_size * grad_intercept
+        intercept_new = space.metric.exp(direction, intercept)
+        coef_new = vector_transport(
+            coef - step_size * grad_coef, direction, intercept, intercept_new
+        )
+        return gs.stack([intercept_new, coef_new], axis=1)
+
+    def minimize(self, space, fun, x0, fun_jac=None, n_samples=None):
+        """Perform gradient descent on each problem.
+
+        Parameters
+        ----------
+        space : Manifold
+            Equipped manifold.
+        fun : callable
+            Loss of a subset of problems on a subset of samples. Called as
+            `fun(param, models, samples)` with `param` of shape
+            [len(models), 2, *space.shape] and `samples` an array of sample
+            indices, or None for all samples. Returns an array of shape
+            [len(models),].
+        x0 : array-like, shape=[n_models, 2, *space.shape]
+            Initial intercepts and coefficients, stacked along axis 1.
+        fun_jac : callable
+            Riemannian gradients of `fun`, with the same signature and
+            returning an array of the shape of `param`. If None, the
+            projected gradient of `fun` is computed by automatic
+            differentiation.
+            Optional, default: None.
+        n_samples : int
+            Number of samples. Required if `batch_size` is given.
+            Optional, default: None.
+
+        Returns
+        -------
+        res : OptimizeResult
+            Result with per-problem `x`, `fun`, `nit` and `success`.
+        """
+        fun_jac = self._handle_jac(fun, space.point_ndim, fun_jac)
+
+        intercept = space.projection(x0[:, 0])
+        coef = space.to_tangent(x0[:, 1], intercept)
+        param = gs.stack([intercept, coef], axis=1)
+
+        if self.batch_size is None:
+            return self._minimize_full(space, fun, fun_jac, param)
+
+        if n_samples is None:
+            raise ValueError("`n_samples` is required when `batch_size` is given.")
+        return self._minimize_stochastic(space, fun, fun_jac, param, n_samples)
+
+    def _minimize_full(self, space, fun, fun_jac, param):
+        n_models = param.shape[0]
+        models = gs.arange(n_models)
+
+        step_size = gs.ones(n_models) * self.init_step_size
+        loss = fun(param, models, None)
+        grad = fun_jac(param, models, None)
+        n_accepted = gs.zeros(n_models, dtype=gs.int64)
+        success = gs.zeros(n_models, dtype=bool)
+
+        for _ in range(self.max_iter):
+            active = gs.where(~success)[0]
+            if active.shape[0] == 0:
+                break
+
+            candidate = self._step(
+                space, param[active], grad[active], step_size[active]
+            )
+            candidate_loss = fun(candidate, active, None)
+            finite = ~gs.isnan(candidate_loss)
+            accepted = finite & (candidate_loss < loss[active])
+            converged = finite & (gs.abs(candidate_loss - loss[active]) < self.tol)
+
+            grow = accepted & (n_accepted[active] % 5 == 0)
+            step_size[active] = gs.where(
+                grow,
+                2.0 * step_size[active],
+                gs.where(accepted, step_size[active], step_size[active] / 2.0),
+            )
+
+            accepted_idx = gs.where(accepted)[0]
+            if accepted_idx.shape[0] > 0:
+                models_accepted = active[accepted_idx]
+                param[models_accepted] = candidate[accepted_idx]
+                loss[models_accepted] = candidate_loss[accepted_idx]
+                grad[models_accepted] = fun_jac(
+                    candidate[accepted_idx], models_accepted, None
+                )
+                n_accepted[models_accepted] += 1
+
+            success[active] = converged
+
+        if self.verbose:
+            logging.info(
+                f"{int(gs.sum(success))} out of {n_models} problems converged, "
+                f"number of accepted iterations: {n_accepted}"
+            )
+
+        return OptimizeResult(fun=loss, x=param, nit=n_accepted, success=success)
+
+    def _minimize_stochastic(self, space, fun, fun_jac, param, n_samples):
+        n_models = param.shape[0]
+        models = gs.arange(n_models)
+        n_batches = math.ceil(n_samples / self.batch_size)
+
+        step_size = gs.ones(n_models) * self.init_step_size
+        loss = fun(param, models, None)
+        n_epochs = gs.zeros(n_models, dtype=gs.int64)
+        success = gs.zeros(n_models, dtype=bool)
+
+        for _ in range(self.max_iter):
+            active = gs.where(~success)[0]
+            if active.shape[0] == 0:
+                break
+
+            active_param = param[active]
+            epoch_step_size = step_size[active]
+            permutation = np.argsort(gs.to_numpy(gs.random.rand(n_samples)))
+            for samples in np.array_split(permutation, n_batches):
+                samples = gs.from_numpy(samples)
+                grad = fun_jac(active_param, active, samples)
+                candidate = self._step(space, active_param, grad, epoch_step_size)
+                finite = ~gs.any(
+                    gs.isnan(gs.reshape(candidate, (candidate.shape[0], -1))), axis=-1
+                )
+                active_param = gs.where(
+                    gs.reshape(finite, finite.shape + (1,) * (candidate.ndim - 1)),
+                    candidate,
+                    active_param,
+                )
+
+            candidate_loss = fun(active_param, active, None)
+            improved = candidate_loss < loss[active]
+            converged = improved & (
+                loss[active] - candidate_loss < self.tol * loss[active]
+            )
+            step_size[active] = gs.where(
+                improved, 1.2 * step_size[active], step_size[active] / 2.0
+            )
+
+            improved_idx = gs.where(improved)[0]
+            models_improved = active[improved_idx]
+            param[models_improved] = active_param[improved_idx]
+            loss[models_improved] = candidate_loss[improved_idx]
+            n_epochs[models_improved] += 1
+            success[active] = converged
+
+        if self.verbose:
+            logging.info(
+                f"{int(gs.sum(success))} out of {n_models} problems converged, "
+                f"number of epochs: {n_epochs}"
+            )
+
+        return OptimizeResult(fun=loss, x=param, nit=n_epochs, success=success)
+
+
 class GeodesicRegression(BaseEstimator):
     r"""Geodesic Regression.
 
@@ -164,8 +397,13 @@ class GeodesicRegression(BaseEstimator):
         Equipped manifold.
     center_X : bool
         Subtract mean to X as a preprocessing.
-    method : str, {\'extrinsic\', \'riemannian\'}
-        Gradient descent method.
+    method : str, {\'extrinsic\', \'riemannian\', \'batched\'}
+        Gradient descent method. The `batched` method performs a Riemannian
+        gradient descent that fits independent regressions, one per row of
+        `X` and `y`, in a single vectorized optimization. It uses closed-form
+        gradients when the metric implements `exp_differential_adjoints`,
+        and supports mini-batches through the `batch_size` parameter of its
+        optimizer, see `set`.
         Optional, default: extrinsic.
     initialization : str or array-like,
         {'random', 'data', 'frechet', warm_start'}
@@ -184,7 +422,9 @@ class GeodesicRegression(BaseEstimator):
     -----
     * Required metric methods:
         * all: `exp`, `squared_dist`
-        * if `riemannian`: `parallel transport` or `to_tangent`
+        * if `riemannian` or `batched`: `parallel transport` or `to_tangent`
+        * if `batched`, optional: `log` and `exp_differential_adjoints`,
+          to compute gradients without automatic differentiation
     """
 
     def __init__(
@@ -232,7 +472,7 @@ class GeodesicRegression(BaseEstimator):
     def method(self, value):
         """Gradient descent method."""
         error.check_parameter_accepted_values(
-            value, "method", ["extrinsic", "riemannian"]
+            value, "method", ["extrinsic", "riemannian", "batched"]
         )
         if value == self._method:
             return
@@ -248,7 +488,7 @@ class GeodesicRegression(BaseEstimator):
                 tol=tol,
             )
 
-        else:
+        elif value == "riemannian":
             optimizer = RiemannianGradientDescent(
                 max_iter=max_iter,
                 init_step_size=0.1,
@@ -256,26 +496,92 @@ class GeodesicRegression(BaseEstimator):
                 verbose=False,
             )
 
+        else:
+            optimizer = BatchedRiemannianGradientDescent(
+                max_iter=max_iter,
+                init_step_size=0.1,
+                tol=tol,
+                verbose=False,
+            )
+
         self.optimizer = optimizer
 
+    def _tangent_vec_and_base_point(self, X, coef, intercept):
+        """Broadcast the parameters of the model against the inputs.
+
+        Parameters
+        ----------
+        X : array-like, shape=[..., n_samples]
+            Input samples.
+        coef : array-like, shape=[..., {dim, [n,n]}]
+            Coefficient of the geodesic regression.
+        intercept : array-like, shape=[..., {dim, [n,n]}]
+            Intercept of the geodesic regression.
+
+        Returns
+        -------
+        tangent_vec : array-like, shape=[..., n_samples, {dim, [n,n]}]
+            Coefficient scaled by each input.
+        base_point : array-like, shape=[..., n_samples, {dim, [n,n]}]
+            Intercept repeated for each input. It is not repeated if there
+            is a single intercept.
+        """
+        point_ndim = self.space.point_ndim
+        X = gs.reshape(X, X.shape + (1,) * point_ndim)
+        tangent_vec = X * gs.expand_dims(coef, axis=-point_ndim - 1)
+        if intercept.ndim == point_ndim:
+            return tangent_vec, intercept
+
+        base_point = gs.broadcast_to(
+            gs.expand_dims(intercept, axis=-point_ndim - 1), tangent_vec.shape
+        )
+        return tangent_vec, base_point
+
+    def _apply_flat(self, func, *args):
+        """Apply a metric function on points with several batch dimensions.
+
+        Parameters
+        ----------
+        func : callable
+            Function of points or tangent vectors, vectorized along a single
+            batch dimension.
+        args : array-like, shape=[..., {dim, [n,n]}]
+            Arguments of `func`, with the same batch shape.
+
+        Returns
+        -------
+        out : array-like or tuple[array-like]
+            Outputs of `func`, with the batch shape of the arguments.
+        """
+        point_ndim = self.space.point_ndim
+        batch_shape = args[0].shape[: args[0].ndim - point_ndim]
+        if len(batch_shape) < 2:
+            return func(*args)
+
+        out = func(*[gs.reshape(arg, (-1,) + self.space.shape) for arg in args])
+        if isinstance(out, tuple):
+            return tuple(gs.reshape(out_, batch_shape + out_.shape[1:]) for out_ in out)
+        return gs.reshape(out, batch_shape + out.shape[1:])
+
     def _model(self, X, coef, intercept):
         """Compute the generative model of the geodesic regression.
 
         Parameters
         ----------
-        X : array-like, shape=[n_samples,]
+        X : array-like, shape=[..., n_samples]
             Training input samples.
-        coef : array-like, shape=[{dim, [n,n]}]
+        coef : array-like, shape=[..., {dim, [n,n]}]
             Coefficient of the geodesic regression.
-        intercept : array-like, shape=[{dim, [n,n]}]
+        intercept : array-like, shape=[..., {dim, [n,n]}]
             Intercept of the geodesic regression.
 
         Returns
         -------
-        _ : array-like, shape=[..., {dim, [n,n]}]
+        _ : array-like, shape=[..., n_samples, {dim, [n,n]}]
             Value on the manifold output by the generative model.
         """
-        return self.space.metric.exp(gs.einsum("n,...->n...", X, coef), intercept)
+        tangent_vec, base_point = self._tangent_vec_and_base_point(X, coef, intercept)
+        return self._apply_flat(self.space.metric.exp, tangent_vec, base_point)
 
     def _loss(self, X, y, param, weights=None):
         """Compute the loss associated to the geodesic regression.
@@ -372,11 +678,12 @@ class GeodesicRegression(BaseEstimator):
 
         Parameters
         ----------
-        X : array-like, shape=[n_samples,]
-            Training input samples.
-        y : array-like, shape[n_samples, {dim, [n,n]}]
+        X : array-like, shape=[..., n_samples]
+            Training input samples. With the `batched` method, a leading
+            dimension indexes independent regressions.
+        y : array-like, shape[..., n_samples, {dim, [n,n]}]
             Training target values.
-        weights : array-like, shape=[n_samples]
+        weights : array-like, shape=[..., n_samples]
             Weights associated to the points.
             Optional, default: None.
 
@@ -385,25 +692,43 @@ class GeodesicRegression(BaseEstimator):
         self : object
             Returns self.
         """
+        point_ndim = self.space.point_ndim
+        if y.ndim > point_ndim + 1 and self.method != "batched":
+            raise ValueError(
+                "Fitting several regressions at once requires `method='batched'`."
+            )
+
         times = gs.copy(X)
         if self.center_X:
-            self.mean_ = gs.mean(X)
-            times -= self.mean_
+            self.mean_ = gs.mean(X, axis=-1)
+            times = times - gs.expand_dims(self.mean_, axis=-1)
 
         if self.method == "extrinsic":
             res = self._fit_extrinsic(times, y, weights)
         if self.method == "riemannian":
             res = self._fit_riemannian(times, y, weights)
 
-        intercept_hat, coef_hat = gs.split(res.x, 2)
-        intercept_hat = gs.reshape(intercept_hat, self.space.shape)
-        coef_hat = gs.reshape(coef_hat, self.space.shape)
+        if self.method == "batched":
+            res = self._fit_batched(times, y, weights)
+            intercept_hat, coef_hat = res.x
+        else:
+            intercept_hat, coef_hat = gs.split(res.x, 2)
+            intercept_hat = gs.reshape(intercept_hat, self.space.shape)
+            coef_hat = gs.reshape(coef_hat, self.space.shape)
 
         self.intercept_ = self.space.projection(intercept_hat)
         self.coef_ = self.space.to_tangent(coef_hat, self.intercept_)
 
         if self.compute_training_score:
-            variance = gs.sum(self.space.metric.squared_dist(y, self.intercept_))
+            intercept = self.intercept_
+            if intercept.ndim > point_ndim:
+                intercept = gs.broadcast_to(
+                    gs.expand_dims(intercept, axis=-point_ndim - 1), y.shape
+                )
+            variance = gs.sum(
+                self._apply_flat(self.space.metric.squared_dist, y, intercept),
+                axis=-1,
+            )
             self.training_score_ = 1 - 2 * res.fun / variance
 
         return self
@@ -469,17 +794,195 @@ class GeodesicRegression(BaseEstimator):
 
         return self.optimizer.minimize(self.space, objective_with_grad, x0)
 
+    def _initialize_batched_parameters(self, y):
+        """Set initial values for the parameters of each model.
+
+        Parameters
+        ----------
+        y : array-like, shape=[n_models, n_samples, {dim, [n,n]}]
+            The target data of each model.
+
+        Returns
+        -------
+        intercept : array-like, shape=[n_models, {dim, [n,n]}]
+            Initial values for the intercepts.
+        coef : array-like, shape=[n_models, {dim, [n,n]}]
+            Initial values for the coefficients.
+        """
+        init = self.initialization
+        if init == "warm_start" and self.intercept_ is not None:
+            intercept, coef = self.intercept_, self.coef_
+        elif isinstance(init, str):
+            intercept, coef = zip(
+                *[self._initialize_parameters(y_model) for y_model in y]
+            )
+            intercept, coef = gs.stack(intercept), gs.stack(coef)
+        else:
+            intercept, coef = init
+
+        shape = (y.shape[0],) + self.space.shape
+        return gs.broadcast_to(intercept, shape), gs.broadcast_to(coef, shape)
+
+    @staticmethod
+    def _select(array, models, samples):
+        """Select the data of some models on some samples."""
+        if array is None:
+            return None
+        array = array[models]
+        if samples is not None:
+            array = array[:, samples]
+        return array
+
+    def _batched_loss(self, X, y, param, weights, models, samples=None):
+        """Compute the losses of several geodesic regressions.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_models, n_samples]
+            Training input samples.
+        y : array-like, shape=[n_models, n_samples, {dim, [n,n]}]
+            Training target values.
+        param : array-like, shape=[len(models), 2, {dim, [n,n]}]
+            Intercepts and coefficients of the models, stacked along axis 1.
+        weights : array-like, shape=[n_models, n_samples]
+            Weights associated to the points, or None.
+        models : array-like, shape=[len(models),]
+            Indices of the models whose loss is computed.
+        samples : array-like
+            Indices of the samples on which losses are computed.
+            Optional, default: None, i.e. all samples.
+
+        Returns
+        -------
+        _ : array-like, shape=[len(models),]
+            Losses.
+        """
+        X, y, weights = (self._select(arg, models, samples) for arg in (X, y, weights))
+        intercept, coef = param[:, 0], param[:, 1]
+        coef = self.space.to_tangent(coef, intercept)
+
+        distances = self._apply_flat(
+            self.space.metric.squared_dist, self._model(X, coef, intercept), y
+        )
+        if weights is None:
+            weights = 1.0
+        return 1.0 / 2.0 * gs.sum(weights * distances, axis=-1)
+
+    def _batched_loss_grad(self, X, y, param, weights, models, samples=None):
+        r"""Compute the Riemannian gradients of several geodesic regressions.
+
+        Writing :math:`q_i = Exp_{\beta_0}(x_i \beta_1)`, the gradient of
+        :math:`\frac{1}{2} d(q_i, y_i)^2` with respect to :math:`q_i` is
+        :math:`-Log_{q_i}(y_i)`, which is pulled back to the intercept and
+        the coefficient by the adjoints of the differentials of the
+        exponential map.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_models, n_samples]
+            Training input samples.
+        y : array-like, shape=[n_models, n_samples, {dim, [n,n]}]
+            Training target values.
+        param : array-like, shape=[len(models), 2, {dim, [n,n]}]
+            Intercepts and coefficients of the models, stacked along axis 1.
+        weights : array-like, shape=[n_models, n_samples]
+            Weights associated to the points, or None.
+        models : array-like, shape=[len(models),]
+            Indices of the models whose gradient is computed.
+        samples : array-like
+            Indices of the samples on which gradients are computed.
+            Optional, default: None, i.e. all samples.
+
+        Returns
+        -------
+        grad : array-like, shape=[len(models), 2, {dim, [n,n]}]
+            Riemannian gradients with respect to the intercepts and the
+            coefficients, stacked along axis 1.
+        """
+        X, y, weights = (self._select(arg, models, samples) for arg in (X, y, weights))
+        intercept, coef = param[:, 0], param[:, 1]
+        coef = self.space.to_tangent(coef, intercept)
+        tangent_vec, base_point = self._tangent_vec_and_base_point(X, coef, intercept)
+
+        metric = self.space.metric
+        residual = self._apply_flat(
+            metric.log, y, self._apply_flat(metric.exp, tangent_vec, base_point)
+        )
+        adjoint_intercept, adjoint_coef = self._apply_flat(
+            metric.exp_differential_adjoints, residual, tangent_vec, base_point
+        )
+
+        trailing_shape = (1,) * self.space.point_ndim
+        if weights is None:
+            weights = gs.ones(X.shape)
+        weights = gs.reshape(weights, weights.shape + trailing_shape)
+        X = gs.reshape(X, X.shape + trailing_shape)
+
+        grad_intercept = -gs.sum(weights * adjoint_intercept, axis=1)
+        grad_coef = -gs.sum(weights * X * adjoint_coef, axis=1)
+        return gs.stack([grad_intercept, grad_coef], axis=1)
+
+    def _fit_batched(self, X, y, weights=None):
+        """Estimate the parameters of several regressions at once.
+
+        Parameters
+        ----------
+        X : array-like, shape=[..., n_samples]
+            Training input samples.
+        y : array-like, shape=[..., n_samples, {dim, [n,n]}]
+            Training target values.
+        weights : array-like, shape=[..., n_samples]
+            Weights associated to the points.
+            Optional, default: None.
+
+        Returns
+        -------
+        res : OptimizeResult
+            Optimize result, whose `x` stacks intercepts and coefficients
+            along axis 0.
+        """
+        batched = y.ndim > self.space.point_ndim + 1
+        if not batched:
+            X, y = gs.expand_dims(X, axis=0), gs.expand_dims(y, axis=0)
+            if weights is not None:
+                weights = gs.expand_dims(weights, axis=0)
+
+        intercept_init, coef_init = self._initialize_batched_parameters(y)
+        x0 = gs.stack([intercept_init, coef_init], axis=1)
+
+        objective = lambda param, models, samples: self._batched_loss(
+            X, y, param, weights, models, samples
+        )
+        objective_grad = None
+        if hasattr(self.space.metric, "exp_differential_adjoints"):
+            objective_grad = lambda param, models, samples: self._batched_loss_grad(
+                X, y, param, weights, models, samples
+            )
+
+        res = self.optimizer.minimize(
+            self.space,
+            objective,
+            x0,
+            fun_jac=objective_grad,
+            n_samples=X.shape[-1],
+        )
+        res.x = gs.moveaxis(res.x, 1, 0)
+        if not batched:
+            res.x, res.fun = res.x[:, 0], res.fun[0]
+            res.nit, res.success = res.nit[0], res.success[0]
+        return res
+
     def predict(self, X):
         """Predict the manifold value for each input.
 
         Parameters
         ----------
-        X : array-like, shape=[n_samples,]
+        X : array-like, shape=[..., n_samples]
             Input data.
 
         Returns
         -------
-        y : array-like, shape=[n_samples, {dim, [n,n]}]
+        y : array-like, shape=[..., n_samples, {dim, [n,n]}]
             Training target values.
         """
         if self.coef_ is None:
@@ -488,7 +991,7 @@ class GeodesicRegression(BaseEstimator):
         times = gs.copy(X)
 
         if self.center_X:
-            times = times - self.mean_
+            times = times - gs.expand_dims(self.mean_, axis=-1)
 
         return self._model(times, self.coef_, self.intercept_)
 
@@ -499,23 +1002,39 @@ class GeodesicRegression(BaseEstimator):
 
         Parameters
         ----------
-        X : array-like, shape=[n_samples,]
+        X : array-like, shape=[..., n_samples]
             Training input samples.
-        y : array-like, shape=[n_samples, {dim, [n,n]}]
+        y : array-like, shape=[..., n_samples, {dim, [n,n]}]
             Training target values.
-        weights : array-like, shape=[n_samples,]
+        weights : array-like, shape=[..., n_samples]
             Weights associated to the points.
             Optional, default: None.
 
         Returns
         -------
-        score : float
-            Training score.
+        score : float or array-like, shape=[...,]
+            Training score of each regression.
         """
         y_pred = self.predict(X)
         if weights is None:
             weights = 1.0
 
+        point_ndim = self.space.point_ndim
+        if y.ndim > point_ndim + 1:
+            mean = gs.stack(
+                [self.mean_estimator.fit(y_model).estimate_ for y_model in y]
+            )
+            mean = gs.broadcast_to(gs.expand_dims(mean, axis=-point_ndim - 1), y.shape)
+            squared_dist = self.space.metric.squared_dist
+            numerator = gs.sum(
+                weights * self._apply_flat(squared_dist, y, y_pred), axis=-1
+            )
+            denominator = gs.sum(
+                weights * self._apply_flat(squared_dist, y, mean), axis=-1
+            )
+            safe_denominator = gs.where(denominator != 0, denominator, 1.0)
+            return gs.where(denominator != 0, 1 - numerator / safe_denominator, 0.0)
+
         mean = self.mean_estimator.fit(y).estimate_
         numerator = gs.sum(weights * self.space.metric.squared_dist(y, y_pred))
         denominator = gs.sum(weights * self.space.metric.squared_dist(y, mean))
@@ -5,9 +5,12 @@ Lead author: Yann Cabanes.
 
 import math
 
+import numpy as np
 from sklearn.neighbors import RadiusNeighborsClassifier
+from sklearn.utils import check_array
 
 import geomstats.backend as gs
+from geomstats.learning.vantage_point_tree import VantagePointTree
 
 
 def wrap(function):
@@ -78,6 +81,13 @@ class KernelDensityEstimationClassifier(RadiusNeighborsClassifier):
     n_jobs : int or None, optional (default = None)
         The number of parallel jobs to run for neighbors search.
         ``None`` means 1; ``-1`` means using all processors.
+    index : {'vp_tree', None}, optional (default = 'vp_tree')
+        Index used for neighbors search. Possible values:
+
+        - 'vp_tree' : the training data is indexed by a vantage-point tree,
+          see :class:`geomstats.learning.vantage_point_tree.VantagePointTree`.
+          It only prunes the search with a finite radius.
+        - None : brute force search by scikit-learn.
 
     Attributes
     ----------
@@ -95,6 +105,8 @@ class KernelDensityEstimationClassifier(RadiusNeighborsClassifier):
     outputs_2d_ : bool
         False when `y`'s shape is [...,] or [..., 1] during fit,
         otherwise True.
+    index_ : VantagePointTree or None
+        Index of the training data.
 
     References
     ----------
@@ -112,8 +124,10 @@ class KernelDensityEstimationClassifier(RadiusNeighborsClassifier):
         leaf_size=30,
         outlier_label=None,
         n_jobs=None,
+        index="vp_tree",
     ):
         self.space = space
+        self.index = index
 
         self.bandwidth = bandwidth
 
@@ -142,3 +156,80 @@ class KernelDensityEstimationClassifier(RadiusNeighborsClassifier):
             outlier_label=outlier_label,
             n_jobs=n_jobs,
         )
+        self.index_ = None
+
+    def fit(self, X, y):
+        """Fit the kernel density estimation classifier from the training dataset.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_samples, dim]
+            Training data.
+        y : array-like, shape=[n_samples,] or [n_samples, n_outputs]
+            Target values.
+
+        Returns
+        -------
+        self : object
+            Returns self.
+        """
+        super().fit(X, y)
+
+        self.index_ = None
+        if self.index == "vp_tree":
+            self.index_ = VantagePointTree(self.space, leaf_size=self.leaf_size)
+            self.index_.fit(gs.from_numpy(self._fit_X))
+        elif self.index is not None:
+            raise ValueError(f"Unknown index '{self.index}'.")
+
+        return self
+
+    def radius_neighbors(
+        self, X=None, radius=None, return_distance=True, sort_results=False
+    ):
+        """Find the neighbors within a given radius of points.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_queries, dim]
+            Query points.
+            Optional, default: None, in which case the neighbors of each
+            training point are returned, not considering itself.
+        radius : float
+            Distance within which neighbors are returned.
+            Optional, default: None, in which case `radius` is used.
+        return_distance : bool
+            Whether to return the distances to the neighbors.
+            Optional, default: True.
+        sort_results : bool
+            Whether to sort the neighbors by increasing distance.
+            Optional, default: False.
+
+        Returns
+        -------
+        neigh_dist : ndarray, shape=[n_queries,] of arrays
+            Distances to the neighbors of each query point. Only returned if
+            `return_distance` is True.
+        neigh_ind : ndarray, shape=[n_queries,] of arrays
+            Indices of the neighbors of each query point among the training
+            points.
+        """
+        if X is None or self.index_ is None:
+            return super().radius_neighbors(
+                X, radius, return_distance, sort_results=sort_results
+            )
+
+        if radius is None:
+            radius = self.radius
+        dists, indices = self.index_.query_radius(
+            gs.from_numpy(check_array(X)), radius, sort_results=sort_results
+        )
+
+        neigh_dist = np.empty(len(dists), dtype=object)
+        neigh_ind = np.empty(len(indices), dtype=object)
+        for i_query, (dists_, indices_) in enumerate(zip(dists, indices)):
+            neigh_dist[i_query] = gs.to_numpy(dists_)
+            neigh_ind[i_query] = gs.to_numpy(indices_)
+        if return_distance:
+            return neigh_dist, neigh_ind
+        return neigh_ind
@@ -4,14 +4,14 @@ Lead author: Hadi Zaatiti.
 """
 
 import logging
-from random import randint
+from random import randint, sample
 
 from scipy.stats import rv_discrete
 from sklearn.base import BaseEstimator, ClusterMixin
 
 import geomstats.backend as gs
 from geomstats.learning._template import TransformerMixin
-from geomstats.learning.frechet_mean import FrechetMean
+from geomstats.learning.frechet_mean import GroupFrechetMean
 
 
 class RiemannianKMeans(TransformerMixin, ClusterMixin, BaseEstimator):
@@ -46,10 +46,27 @@ class RiemannianKMeans(TransformerMixin, ClusterMixin, BaseEstimator):
     verbose : int
         If verbose > 0, information will be printed during learning.
         Optional, default: 0.
+    batch_size : int
+        Number of samples drawn at each iteration to update the cluster
+        centers. Each center then moves along the geodesic towards the mean of
+        its samples in the batch, with a step given by the fraction of the
+        samples it has been assigned so far that belong to the batch.
+        Optional, default: None, in which case all samples are used at each
+        iteration.
+
+    Attributes
+    ----------
+    counts_ : array-like, shape=[n_clusters,]
+        Number of samples assigned to each cluster center by the updates.
+        With mini-batches, it accumulates over the batches.
+    mean_estimator : GroupFrechetMean
+        Estimator of the means of the clusters, fit on all the clusters at
+        once. If it is replaced by an estimator that is not a
+        `GroupFrechetMean`, it is fit on each cluster in turn.
 
     Notes
     -----
-    * Required metric methods: `dist`.
+    * Required metric methods: `dist_cross`.
 
     Example
     -------
@@ -65,6 +82,7 @@ class RiemannianKMeans(TransformerMixin, ClusterMixin, BaseEstimator):
         tol=1e-2,
         max_iter=100,
         verbose=0,
+        batch_size=None,
     ):
         self.space = space
 
@@ -73,16 +91,17 @@ class RiemannianKMeans(TransformerMixin, ClusterMixin, BaseEstimator):
         self.tol = tol
         self.verbose = verbose
         self.max_iter = max_iter
+        self.batch_size = batch_size
 
         self.init_cluster_centers_ = None
 
-        self.mean_estimator = FrechetMean(space=space)
-        if isinstance(self.mean_estimator, FrechetMean):
-            self.mean_estimator.set(max_iter=100, init_step_size=1.0)
+        self.mean_estimator = GroupFrechetMean(space=space)
+        self.mean_estimator.set(max_iter=100, init_step_size=1.0)
 
         self.cluster_centers_ = None
         self.labels_ = None
         self.inertia_ = None
+        self.counts_ = None
 
     def _pick_init_cluster_centers(self, X):
         n_samples = X.shape[0]
@@ -90,14 +109,14 @@ class RiemannianKMeans(TransformerMixin, ClusterMixin, BaseEstimator):
         if isinstance(self.init, str):
             if self.init == "kmeans++":
                 cluster_centers = [X[randint(0, n_samples - 1)]]
-                for i in range(self.n_clusters - 1):
-                    dists = gs.array(
-                        [
-                            self.space.metric.dist(cluster_centers[j], X)
-                            for j in range(i + 1)
-                        ]
+                dists_to_closest_cluster_center = None
+                for _ in range(self.n_clusters - 1):
+                    dists = self._dists_to_centers(X, cluster_centers[-1][None])[:, 0]
+                    dists_to_closest_cluster_center = (
+                        dists
+                        if dists_to_closest_cluster_center is None
+                        else gs.minimum(dists_to_closest_cluster_center, dists)
                     )
-                    dists_to_closest_cluster_center = gs.amin(dists, axis=0)
                     indices = gs.arange(n_samples)
                     weights = dists_to_closest_cluster_center / gs.sum(
                         dists_to_closest_cluster_center
@@ -133,11 +152,107 @@ class RiemannianKMeans(TransformerMixin, ClusterMixin, BaseEstimator):
 
         return cluster_centers
 
+    def _dists_to_centers(self, X, cluster_centers):
+        """Compute the distances from the samples to the cluster centers.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_samples, *space.shape]
+            Samples.
+        cluster_centers : array-like, shape=[n_clusters, *space.shape]
+            Cluster centers.
+
+        Returns
+        -------
+        dists : array-like, shape=[n_samples, n_clusters]
+            Distances from each sample to each cluster center.
+        """
+        return self.space.metric.dist_cross(X, cluster_centers)
+
+    def _cluster_means(self, X, labels):
+        """Compute the mean of the samples of each cluster.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_samples, *space.shape]
+            Samples.
+        labels : array-like, shape=[n_samples,]
+            Cluster of each sample.
+
+        Returns
+        -------
+        means : array-like, shape=[n_clusters, *space.shape]
+            Mean of each cluster. Means of empty clusters are not meaningful.
+        """
+        if isinstance(self.mean_estimator, GroupFrechetMean):
+            self.mean_estimator.n_groups = self.n_clusters
+            return self.mean_estimator.fit(X, groups=labels).estimate_
+
+        means = []
+        for i in range(self.n_clusters):
+            fold = X[labels == i]
+            means.append(
+                self.mean_estimator.fit(fold).estimate_ if len(fold) > 0 else X[0]
+            )
+        return gs.stack(means)
+
+    def _update_cluster_centers(self, X, labels, cluster_centers, mini_batch=False):
+        """Move the cluster centers to the means of their samples.
+
+        With mini-batches, each center moves along the geodesic towards the
+        mean of its samples, with a step size decreasing with the number of
+        samples it has been assigned so far.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_samples, *space.shape]
+            Samples.
+        labels : array-like, shape=[n_samples,]
+            Cluster of each sample.
+        cluster_centers : array-like, shape=[n_clusters, *space.shape]
+            Current cluster centers.
+        mini_batch : bool
+            Whether `X` is a mini-batch.
+            Optional, default: False.
+
+        Returns
+        -------
+        cluster_centers : array-like, shape=[n_clusters, *space.shape]
+            Updated cluster centers.
+        """
+        counts = gs.sum(gs.cast(gs.one_hot(labels, self.n_clusters), X.dtype), axis=0)
+        means = self._cluster_means(X, labels)
+        mask_shape = (self.n_clusters,) + (1,) * len(self.space.shape)
+
+        if not mini_batch:
+            self.counts_ = counts
+            random_samples = X[
+                gs.array([randint(0, X.shape[0] - 1) for _ in range(self.n_clusters)])
+            ]
+            return gs.where(gs.reshape(counts > 0, mask_shape), means, random_samples)
+
+        self.counts_ = self.counts_ + counts
+        step_sizes = counts / gs.where(self.counts_ > 0, self.counts_, 1.0)
+        means = gs.where(gs.reshape(counts > 0, mask_shape), means, cluster_centers)
+        tangent_vecs = self.space.metric.log(means, cluster_centers)
+        return self.space.metric.exp(
+            gs.einsum("k,k...->k...", step_sizes, tangent_vecs), cluster_centers
+        )
+
+    def _sample_batch(self, X):
+        """Draw a mini-batch of samples, or all of them without batch size."""
+        n_samples = X.shape[0]
+        if self.batch_size is None or self.batch_size >= n_samples:
+            return X
+        return X[gs.array(sample(range(n_samples), self.batch_size))]
+
     def fit(self, X):
         """Provide cluster centers and data labels.
 
         Alternate between computing the mean of each cluster
         and labelling data according to the new positions of the cluster centers.
+        All distances from the samples to the cluster centers are computed at
+        once, and the means of all clusters are estimated together.
 
         Parameters
         ----------
@@ -150,42 +265,27 @@ class RiemannianKMeans(TransformerMixin, ClusterMixin, BaseEstimator):
         self : object
             Returns self.
         """
-        n_samples = X.shape[0]
         if self.verbose > 0:
             logging.info("Initializing...")
 
         cluster_centers = self._pick_init_cluster_centers(X)
         self.init_cluster_centers_ = gs.copy(cluster_centers)
+        self.counts_ = gs.zeros(self.n_clusters, dtype=X.dtype)
 
-        dists = [
-            gs.to_ndarray(self.space.metric.dist(cluster_centers[i], X), 2, 1)
-            for i in range(self.n_clusters)
-        ]
-        dists = gs.hstack(dists)
-        self.labels_ = gs.argmin(dists, 1)
+        batch = self._sample_batch(X)
+        dists = self._dists_to_centers(batch, cluster_centers)
 
         for index in range(self.max_iter):
             if self.verbose > 0:
                 logging.info(f"Iteration {index}...")
 
             old_cluster_centers = gs.copy(cluster_centers)
-            for i in range(self.n_clusters):
-                fold = X[self.labels_ == i]
-
-                if len(fold) > 0:
-                    self.mean_estimator.fit(fold)
-                    cluster_centers[i] = self.mean_estimator.estimate_
-                else:
-                    cluster_centers[i] = X[randint(0, n_samples - 1)]
-
-            dists = [
-                gs.to_ndarray(self.space.metric.dist(cluster_centers[i], X), 2, 1)
-                for i in range(self.n_clusters)
-            ]
-            dists = gs.hstack(dists)
-            self.labels_ = gs.argmin(dists, 1)
-            dists_to_closest_cluster_center = gs.amin(dists, 1)
-            self.inertia_ = gs.sum(dists_to_closest_cluster_center**2)
+            cluster_centers = self._update_cluster_centers(
+                batch, gs.argmin(dists, 1), cluster_centers, mini_batch=batch is not X
+            )
+
+            batch = self._sample_batch(X)
+            dists = self._dists_to_centers(batch, cluster_centers)
             cluster_centers_distances = self.space.metric.dist(
                 old_cluster_centers, cluster_centers
             )
@@ -206,6 +306,10 @@ class RiemannianKMeans(TransformerMixin, ClusterMixin, BaseEstimator):
                 "The mean may be inaccurate."
             )
 
+        if batch is not X:
+            dists = self._dists_to_centers(X, cluster_centers)
+        self.labels_ = gs.argmin(dists, 1)
+        self.inertia_ = gs.sum(gs.amin(dists, 1) ** 2)
         self.cluster_centers_ = cluster_centers
 
         return self
@@ -228,15 +332,138 @@ class RiemannianKMeans(TransformerMixin, ClusterMixin, BaseEstimator):
         """
         if self.cluster_centers_ is None:
             raise RuntimeError("fit needs to be called first.")
-        dists = gs.stack(
-            [
-                self.space.metric.dist(cluster_center, X)
-                for cluster_center in self.cluster_centers_
-            ],
-            axis=1,
+        single_point = gs.ndim(X) == len(self.space.shape)
+        if single_point:
+            X = gs.expand_dims(X, 0)
+
+        labels = gs.argmin(self._dists_to_centers(X, self.cluster_centers_), -1)
+
+        return labels[0] if single_point else labels
+
+
+class MiniBatchRiemannianKMeans(RiemannianKMeans):
+    """Mini-batch k-means clustering on manifolds.
+
+    Cluster centers are updated from successive chunks of data. Each center
+    moves along the geodesic towards the mean of its samples in the chunk,
+    with a step size given by the fraction of all the samples it has been
+    assigned so far that belong to the chunk. Data can be given as a single
+    array, from which mini-batches are drawn, or as an iterable of chunks,
+    e.g. a generator, so that the whole dataset never needs to be in memory.
+
+    Parameters
+    ----------
+    space : Manifold
+        Equipped manifold.
+    n_clusters : int
+        Number of clusters (k value of the k-means).
+        Optional, default: 8.
+    init : str or callable or array-like, shape=[n_clusters, n_features]
+        How to initialize cluster centers, see `RiemannianKMeans`. With an
+        iterable of chunks, the centers are initialized from the first chunk.
+        Optional, default: 'random'.
+    tol : float
+        Convergence factor. Convergence is achieved when the difference of mean
+        distance between two steps is lower than tol.
+        Optional, default: 1e-2.
+    max_iter : int
+        Maximum number of iterations when fitting an array.
+        Optional, default: 100
+    verbose : int
+        If verbose > 0, information will be printed during learning.
+        Optional, default: 0.
+    batch_size : int
+        Number of samples drawn at each iteration when fitting an array.
+        Optional, default: 1024.
+
+    Attributes
+    ----------
+    counts_ : array-like, shape=[n_clusters,]
+        Number of samples assigned to each cluster center so far.
+
+    Notes
+    -----
+    * Required metric methods: `dist_cross`, `exp`, `log`.
+    """
+
+    def __init__(
+        self,
+        space,
+        n_clusters=8,
+        init="random",
+        tol=1e-2,
+        max_iter=100,
+        verbose=0,
+        batch_size=1024,
+    ):
+        super().__init__(
+            space,
+            n_clusters=n_clusters,
+            init=init,
+            tol=tol,
+            max_iter=max_iter,
+            verbose=verbose,
+            batch_size=batch_size,
         )
-        dists = gs.squeeze(dists)
 
-        labels = gs.argmin(dists, -1)
+    def partial_fit(self, X, y=None):
+        """Update the cluster centers with a chunk of data.
 
-        return labels
+        Parameters
+        ----------
+        X : array-like, shape=[n_samples, *space.shape]
+            Chunk of training data.
+        y : None
+            Target values. Ignored.
+
+        Returns
+        -------
+        self : object
+            Returns self.
+        """
+        if self.cluster_centers_ is None:
+            self.cluster_centers_ = self._pick_init_cluster_centers(X)
+            self.init_cluster_centers_ = gs.copy(self.cluster_centers_)
+            self.counts_ = gs.zeros(self.n_clusters, dtype=X.dtype)
+
+        dists = self._dists_to_centers(X, self.cluster_centers_)
+        self.labels_ = gs.argmin(dists, 1)
+        self.inertia_ = gs.sum(gs.amin(dists, 1) ** 2)
+        self.cluster_centers_ = self._update_cluster_centers(
+            X, self.labels_, self.cluster_centers_, mini_batch=True
+        )
+
+        return self
+
+    def fit(self, X, y=None):
+        """Provide cluster centers from an array or an iterable of chunks.
+
+        An array is clustered by iterating over random mini-batches, as in
+        `RiemannianKMeans`. An iterable of chunks is consumed once, with one
+        update of the cluster centers per chunk, so that only one chunk is held
+        in memory at a time. In that case, `labels_` and `inertia_` refer to
+        the last chunk, before its update.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_samples, *space.shape] or iterable
+            Training data, or iterable of chunks of training data.
+        y : None
+            Target values. Ignored.
+
+        Returns
+        -------
+        self : object
+            Returns self.
+        """
+        self.cluster_centers_ = None
+        if gs.is_array(X):
+            return super().fit(X)
+
+        for chunk in X:
+            self.partial_fit(chunk)
+
+        if self.cluster_centers_ is None:
+            raise ValueError("Cannot fit on an empty iterable of chunks.")
+
+        return self
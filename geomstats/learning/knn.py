@@ -4,8 +4,10 @@ Lead author: Yann Cabanes.
 """
 
 from sklearn.neighbors import KNeighborsClassifier
+from sklearn.utils import check_array
 
 import geomstats.backend as gs
+from geomstats.learning.vantage_point_tree import VantagePointTree
 
 
 def wrap(function):
@@ -41,6 +43,14 @@ class KNearestNeighborsClassifier(KNeighborsClassifier):
     n_jobs : int or None, optional (default = None)
         The number of parallel jobs to run for neighbors search.
         ``None`` means 1; ``-1`` means using all processors.
+    index : {'vp_tree', None}, optional (default = 'vp_tree')
+        Index used for neighbors search. Possible values:
+
+        - 'vp_tree' : the training data is indexed by a vantage-point tree,
+          see :class:`geomstats.learning.vantage_point_tree.VantagePointTree`.
+        - None : brute force search by scikit-learn.
+    leaf_size : int, optional (default = 30)
+        Leaf size of the index.
 
     Attributes
     ----------
@@ -58,6 +68,8 @@ class KNearestNeighborsClassifier(KNeighborsClassifier):
     outputs_2d_ : bool
         False when `y`'s shape is (n_samples, ) or (n_samples, 1) during fit
         otherwise True.
+    index_ : VantagePointTree or None
+        Index of the training data.
 
     References
     ----------
@@ -72,14 +84,79 @@ class KNearestNeighborsClassifier(KNeighborsClassifier):
         n_neighbors=5,
         weights="uniform",
         n_jobs=None,
+        index="vp_tree",
+        leaf_size=30,
     ):
         self.space = space
+        self.index = index
 
         distance = wrap(space.metric.dist)
         super().__init__(
             n_neighbors=n_neighbors,
             weights=weights,
             algorithm="brute",
+            leaf_size=leaf_size,
             metric=distance,
             n_jobs=n_jobs,
         )
+        self.index_ = None
+
+    def fit(self, X, y):
+        """Fit the k-nearest neighbors classifier from the training dataset.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_samples, dim]
+            Training data.
+        y : array-like, shape=[n_samples,] or [n_samples, n_outputs]
+            Target values.
+
+        Returns
+        -------
+        self : object
+            Returns self.
+        """
+        super().fit(X, y)
+
+        self.index_ = None
+        if self.index == "vp_tree":
+            self.index_ = VantagePointTree(self.space, leaf_size=self.leaf_size)
+            self.index_.fit(gs.from_numpy(self._fit_X))
+        elif self.index is not None:
+            raise ValueError(f"Unknown index '{self.index}'.")
+
+        return self
+
+    def kneighbors(self, X=None, n_neighbors=None, return_distance=True):
+        """Find the k-neighbors of points.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_queries, dim]
+            Query points.
+            Optional, default: None, in which case the neighbors of each
+            training point are returned, not considering itself.
+        n_neighbors : int
+            Number of neighbors.
+            Optional, default: None, in which case `n_neighbors` is used.
+        return_distance : bool
+            Whether to return the distances to the neighbors.
+            Optional, default: True.
+
+        Returns
+        -------
+        neigh_dist : ndarray, shape=[n_queries, n_neighbors]
+            Distances to the neighbors. Only returned if `return_distance`
+            is True.
+        neigh_ind : ndarray, shape=[n_queries, n_neighbors]
+            Indices of the neighbors among the training points.
+        """
+        if X is None or self.index_ is None:
+            return super().kneighbors(X, n_neighbors, return_distance)
+
+        if n_neighbors is None:
+            n_neighbors = self.n_neighbors
+        dists, indices = self.index_.query(gs.from_numpy(check_array(X)), k=n_neighbors)
+        if return_distance:
+            return gs.to_numpy(dists), gs.to_numpy(indices)
+        return gs.to_numpy(indices)
@@ -8,7 +8,7 @@ from sklearn.base import BaseEstimator, ClassifierMixin
 
 import geomstats.backend as gs
 from geomstats.learning._template import TransformerMixin
-from geomstats.learning.frechet_mean import FrechetMean
+from geomstats.learning.frechet_mean import GroupFrechetMean
 
 
 class RiemannianMinimumDistanceToMean(
@@ -51,7 +51,7 @@ class RiemannianMinimumDistanceToMean(
         self.classes_ = None
         self.mean_estimates_ = None
 
-        self.mean_estimator = FrechetMean(space)
+        self.mean_estimator = GroupFrechetMean(space)
 
     @property
     def n_classes_(self):
@@ -61,6 +61,10 @@ class RiemannianMinimumDistanceToMean(
     def fit(self, X, y, weights=None):
         """Compute Frechet mean of each class.
 
+        With the default `GroupFrechetMean` estimator, the means of all
+        classes are estimated together. Other mean estimators are fitted on
+        each class in turn.
+
         Parameters
         ----------
         X : array-like, shape=[n_samples, *space.shape]
@@ -81,6 +85,13 @@ class RiemannianMinimumDistanceToMean(
             weights = gs.ones(X.shape[0])
         weights /= gs.sum(weights)
 
+        if isinstance(self.mean_estimator, GroupFrechetMean):
+            groups = gs.searchsorted(self.classes_, y)
+            self.mean_estimates_ = self.mean_estimator.fit(
+                X, weights=weights, groups=groups
+            ).estimate_
+            return self
+
         frechet_means = []
         for c in self.classes_:
             X_c = X[gs.where(y == c, True, False)]
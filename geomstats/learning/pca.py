@@ -4,16 +4,22 @@ Lead author: Nina Miolane.
 """
 
 import numbers
+from collections.abc import Iterator
 from math import log
 
+from scipy.sparse.linalg import svds
 from scipy.special import gammaln
 from sklearn.decomposition._base import _BasePCA
-from sklearn.utils.extmath import stable_cumsum, svd_flip
+from sklearn.utils import check_random_state
+from sklearn.utils.extmath import randomized_svd, stable_cumsum, svd_flip
 
 import geomstats.backend as gs
+from geomstats.cache import BasePointCache
+from geomstats.errors import check_parameter_accepted_values
 from geomstats.geometry._hyperbolic import _Hyperbolic
 from geomstats.geometry.hyperbolic import Hyperbolic
 from geomstats.geometry.matrices import Matrices
+from geomstats.geometry.spd_matrices import SPDAffineMetric
 from geomstats.geometry.symmetric_matrices import SymmetricMatrices
 from geomstats.learning.exponential_barycenter import ExponentialBarycenter
 from geomstats.learning.frechet_mean import FrechetMean
@@ -107,6 +113,20 @@ class TangentPCA(_BasePCA):
     n_components : int
         Number of principal components.
         Optional, default: None.
+    svd_solver : str, {"full", "randomized", "arpack"}
+        Solver of the SVD of the tangent vectors. "full" computes all singular
+        values. "randomized" computes the first `n_components` singular values
+        by the randomized method of Halko et al., with `iterated_power` power
+        iterations. "arpack" computes them with `scipy.sparse.linalg.svds`,
+        with tolerance `tol`, and requires `n_components` strictly smaller
+        than the number of samples and of features.
+        Optional, default: "full".
+    iterated_power : int or "auto"
+        Number of power iterations of the "randomized" solver.
+        Optional, default: "auto".
+    random_state : int, RandomState or None
+        Seed of the "randomized" and "arpack" solvers.
+        Optional, default: None.
 
     Notes
     -----
@@ -114,6 +134,11 @@ class TangentPCA(_BasePCA):
     * If `base_point=None`, also requires `FrechetMean` required methods.
     * Lie groups can be used without a metric, but `base_point` or `mean_estimator`
       need to be specified.
+    * Data that does not fit in memory can be fitted by chunks with
+      `partial_fit`, and transformed by passing an iterator of chunks to
+      `transform` and `inverse_transform`. With `SPDAffineMetric`, the
+      quantities computed at `base_point_` by `log` and `exp` are then
+      reused from chunk to chunk, in the cache of the metric if it has one.
     """
 
     def __init__(
@@ -125,7 +150,11 @@ class TangentPCA(_BasePCA):
         tol=0.0,
         iterated_power="auto",
         random_state=None,
+        svd_solver="full",
     ):
+        check_parameter_accepted_values(
+            svd_solver, "svd_solver", ["full", "randomized", "arpack"]
+        )
         self.space = space
         self.n_components = n_components
         self.copy = copy
@@ -133,6 +162,7 @@ class TangentPCA(_BasePCA):
         self.tol = tol
         self.iterated_power = iterated_power
         self.random_state = random_state
+        self.svd_solver = svd_solver
 
         if hasattr(self.space, "metric"):
             self.mean_estimator = FrechetMean(space)
@@ -140,6 +170,7 @@ class TangentPCA(_BasePCA):
             self.mean_estimator = ExponentialBarycenter(space)
 
         self.base_point_ = None
+        self._cache = BasePointCache(maxsize=1)
 
     @property
     def _geometry(self):
@@ -149,6 +180,65 @@ class TangentPCA(_BasePCA):
 
         return self.space
 
+    def _cache_kwargs(self):
+        """Get keyword arguments passing a cache to `exp` and `log`.
+
+        Only `SPDAffineMetric` without a cache of its own is passed a cache,
+        so that `exp` and `log` at `base_point_` reuse the quantities
+        computed for previous chunks.
+        """
+        geometry = self._geometry
+        if isinstance(geometry, SPDAffineMetric) and geometry.cache is None:
+            return {"cache": self._cache}
+        return {}
+
+    def _to_features(self, tangent_vecs):
+        """Represent tangent vectors as vectors of features.
+
+        Parameters
+        ----------
+        tangent_vecs : array-like, shape=[n_samples, *point_shape]
+            Tangent vectors at the base point.
+
+        Returns
+        -------
+        X : array-like, shape=[n_samples, n_features]
+            Features.
+        """
+        if self.space.point_ndim == 1:
+            return tangent_vecs
+
+        if gs.all(Matrices.is_square(tangent_vecs)) and gs.all(
+            Matrices.is_symmetric(tangent_vecs)
+        ):
+            return SymmetricMatrices.basis_representation(tangent_vecs)
+        return gs.reshape(tangent_vecs, (len(tangent_vecs), -1))
+
+    def _from_features(self, X):
+        """Represent vectors of features as tangent vectors.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_samples, n_features]
+            Features.
+
+        Returns
+        -------
+        tangent_vecs : array-like, shape=[n_samples, *point_shape]
+            Tangent vectors at the base point.
+        """
+        if self.space.point_ndim == 1:
+            return X
+
+        if gs.all(Matrices.is_square(self.base_point_)) and gs.all(
+            Matrices.is_symmetric(self.base_point_)
+        ):
+            return SymmetricMatrices(self.base_point_.shape[-1]).matrix_representation(
+                X
+            )
+        dim = self.base_point_.shape[-1]
+        return gs.reshape(X, (len(X), dim, dim))
+
     def fit(self, X, y=None, base_point=None):
         """Fit the model with X.
 
@@ -200,28 +290,25 @@ class TangentPCA(_BasePCA):
 
         Parameters
         ----------
-        X : array-like, shape=[..., n_features]
+        X : array-like, shape=[..., n_features], or iterator
             Data, where n_samples is the number of samples
-            and n_features is the number of features.
+            and n_features is the number of features. Data can also be given
+            as an iterator of chunks, which are then transformed lazily.
         y : Ignored (Compliance with scikit-learn interface)
 
         Returns
         -------
-        X_new : array-like, shape=[..., n_components]
-            Projected data.
+        X_new : array-like, shape=[..., n_components], or generator
+            Projected data, or generator of projected chunks if X is an
+            iterator.
         """
-        tangent_vecs = self._geometry.log(X, base_point=self.base_point_)
-        if self.space.point_ndim == 2:
-            if (
-                gs.all(Matrices.is_square(tangent_vecs))
-                and Matrices.is_symmetric(tangent_vecs).all()
-            ):
-                X = SymmetricMatrices.basis_representation(tangent_vecs)
-            else:
-                X = gs.reshape(tangent_vecs, (len(X), -1))
-        else:
-            X = tangent_vecs
-        X = X - self.mean_
+        if isinstance(X, Iterator):
+            return (self.transform(chunk) for chunk in X)
+
+        tangent_vecs = self._geometry.log(
+            X, base_point=self.base_point_, **self._cache_kwargs()
+        )
+        X = self._to_features(tangent_vecs) - self.mean_
         X_transformed = gs.matmul(X, gs.transpose(self.components_))
         return X_transformed
 
@@ -233,31 +320,167 @@ class TangentPCA(_BasePCA):
 
         Parameters
         ----------
-        X : array-like, shape=[..., n_components]
+        X : array-like, shape=[..., n_components], or iterator
             New data, where n_samples is the number of samples
-            and n_components is the number of components.
+            and n_components is the number of components. Data can also be
+            given as an iterator of chunks, which are then reconstructed
+            lazily.
+
+        Returns
+        -------
+        X_original : array-like, shape=[..., n_features], or generator
+            Original data, or generator of reconstructed chunks if X is an
+            iterator.
+        """
+        if isinstance(X, Iterator):
+            return (self.inverse_transform(chunk) for chunk in X)
+
+        scores = self._from_features(self.mean_ + gs.matmul(X, self.components_))
+        return self._geometry.exp(scores, self.base_point_, **self._cache_kwargs())
+
+    def partial_fit(self, X, y=None, base_point=None):
+        """Incrementally fit the model with a chunk of X.
+
+        The principal components are updated from the singular values and
+        components of the previous chunks and the new chunk, as in
+        `sklearn.decomposition.IncrementalPCA`, so that memory does not grow
+        with the number of samples. The base point is fixed at the first call.
+
+        Parameters
+        ----------
+        X : array-like, shape=[..., n_features]
+            Chunk of training data, where n_samples is the number of samples
+            and n_features is the number of features.
+        y : Ignored (Compliance with scikit-learn interface)
+        base_point : array-like, shape=[..., n_features]
+            Point at which to perform the tangent PCA, only used at the first
+            call. Optional, default to Frechet mean of the first chunk if None.
 
         Returns
         -------
-        X_original : array-like, shape=[..., n_features]
-            Original data.
+        self : object
+            Returns the instance itself.
         """
-        scores = self.mean_ + gs.matmul(X, self.components_)
+        first_call = getattr(self, "n_samples_seen_", 0) == 0
+        if first_call:
+            if base_point is None:
+                base_point = self.mean_estimator.fit(X).estimate_
+            self.base_point_ = base_point
+            self._cache.clear()
+
+        tangent_vecs = self._geometry.log(
+            X, base_point=self.base_point_, **self._cache_kwargs()
+        )
+        X = self._to_features(tangent_vecs)
+        n_samples, n_features = X.shape
 
-        if self.space.point_ndim > 1:
-            if gs.all(Matrices.is_square(self.base_point_)) and gs.all(
-                Matrices.is_symmetric(self.base_point_)
+        if first_call:
+            n_components = self.n_components
+            if n_components is None:
+                n_components = min(n_samples, n_features)
+            if not isinstance(n_components, numbers.Integral) or not (
+                1 <= n_components <= n_features
             ):
-                scores = SymmetricMatrices(
-                    self.base_point_.shape[-1]
-                ).matrix_representation(scores)
-            else:
-                dim = self.base_point_.shape[-1]
-                scores = gs.reshape(scores, (len(scores), dim, dim))
-        return self._geometry.exp(scores, self.base_point_)
+                raise ValueError(
+                    f"n_components={n_components} must be an integer between 1 "
+                    f"and n_features={n_features} with partial_fit"
+                )
+            self.n_components_ = int(n_components)
+            self.n_samples_seen_ = 0
+            self.mean_ = gs.zeros(n_features, dtype=X.dtype)
+            self.var_ = gs.zeros(n_features, dtype=X.dtype)
+        if self.n_components_ > n_samples:
+            raise ValueError(
+                f"n_components={self.n_components_} must be less or equal to "
+                f"the number of samples {n_samples} of each chunk"
+            )
+
+        n_samples_seen = self.n_samples_seen_
+        n_total_samples = n_samples_seen + n_samples
+        batch_mean = gs.mean(X, axis=0)
+        col_mean = (n_samples_seen * self.mean_ + n_samples * batch_mean) / (
+            n_total_samples
+        )
+        col_var = (
+            n_samples_seen * self.var_
+            + gs.sum((X - batch_mean) ** 2, axis=0)
+            + n_samples_seen
+            * n_samples
+            / n_total_samples
+            * (self.mean_ - batch_mean) ** 2
+        ) / n_total_samples
+
+        X = X - batch_mean
+        if n_samples_seen > 0:
+            mean_correction = (n_samples_seen / n_total_samples * n_samples) ** 0.5 * (
+                self.mean_ - batch_mean
+            )
+            X = gs.concatenate(
+                [
+                    self.singular_values_[:, None] * self.components_,
+                    X,
+                    mean_correction[None],
+                ]
+            )
+
+        U, S, V = gs.linalg.svd(X, full_matrices=False)
+        # flip eigenvectors' sign to enforce deterministic output
+        U, V = svd_flip(U, V, u_based_decision=False)
+        explained_variance_ = S**2 / (n_total_samples - 1)
+        explained_variance_ratio_ = S**2 / gs.sum(col_var * n_total_samples)
+
+        n_components = self.n_components_
+        if n_components not in (n_samples, n_features):
+            self.noise_variance_ = gs.mean(explained_variance_[n_components:])
+        else:
+            self.noise_variance_ = 0.0
+
+        self.n_samples_seen_ = n_total_samples
+        self.n_samples_, self.n_features_ = n_total_samples, n_features
+        self.mean_ = col_mean
+        self.var_ = col_var
+        self.components_ = V[:n_components]
+        self.explained_variance_ = explained_variance_[:n_components]
+        self.explained_variance_ratio_ = explained_variance_ratio_[:n_components]
+        self.singular_values_ = S[:n_components]
+        return self
+
+    def _truncated_svd(self, X, n_components):
+        """Compute the first singular values and vectors of X.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_samples, n_features]
+            Centered data.
+        n_components : int
+            Number of singular values.
+
+        Returns
+        -------
+        U, S, V : array-like
+            Matrices of the truncated SVD decomposition.
+        """
+        X = gs.to_numpy(X)
+        random_state = check_random_state(self.random_state)
+        if self.svd_solver == "randomized":
+            U, S, V = randomized_svd(
+                X,
+                n_components=n_components,
+                n_iter=self.iterated_power,
+                flip_sign=True,
+                random_state=random_state,
+            )
+        else:
+            v0 = random_state.uniform(-1, 1, size=min(X.shape))
+            U, S, V = svds(X, k=n_components, tol=self.tol, v0=v0)
+            # svds does not follow the decreasing order of singular values
+            U, S, V = U[:, ::-1], S[::-1], V[::-1]
+            U, V = svd_flip(U, V)
+
+        return gs.from_numpy(U), gs.from_numpy(S), gs.from_numpy(V)
 
     def _fit(self, X, base_point=None):
-        """Fit the model by computing full SVD on X.
+        """Fit the model by computing the SVD of the tangent vectors.
 
         Parameters
         ----------
@@ -277,17 +500,12 @@ class TangentPCA(_BasePCA):
         if base_point is None:
             base_point = self.mean_estimator.fit(X).estimate_
 
-        tangent_vecs = self._geometry.log(X, base_point=base_point)
-
-        if self.space.point_ndim > 1:
-            if gs.all(Matrices.is_square(tangent_vecs)) and gs.all(
-                Matrices.is_symmetric(tangent_vecs)
-            ):
-                X = SymmetricMatrices.basis_representation(tangent_vecs)
-            else:
-                X = gs.reshape(tangent_vecs, (len(X), -1))
-        else:
-            X = tangent_vecs
+        self.base_point_ = base_point
+        self._cache.clear()
+        tangent_vecs = self._geometry.log(
+            X, base_point=base_point, **self._cache_kwargs()
+        )
+        X = self._to_features(tangent_vecs)
 
         if self.n_components is None:
             n_components = min(X.shape)
@@ -296,7 +514,18 @@ class TangentPCA(_BasePCA):
 
         n_samples, n_features = X.shape
 
-        if n_components == "mle":
+        if self.svd_solver != "full":
+            max_components = min(n_samples, n_features)
+            if self.svd_solver == "arpack":
+                max_components -= 1
+            if not isinstance(n_components, numbers.Integral) or not (
+                1 <= n_components <= max_components
+            ):
+                raise ValueError(
+                    f"n_components={n_components} must be an integer between 1 "
+                    f"and {max_components} with svd_solver='{self.svd_solver}'"
+                )
+        elif n_components == "mle":
             if n_samples < n_features:
                 raise ValueError(
                     "n_components='mle' is only supported if n_samples >= n_features"
@@ -317,16 +546,21 @@ class TangentPCA(_BasePCA):
         # Center data - the mean should be 0 if base_point is the Frechet mean
         self.mean_ = gs.mean(X, axis=0)
         X -= self.mean_
+        self.var_ = gs.mean(X**2, axis=0)
 
-        U, S, V = gs.linalg.svd(X, full_matrices=False)
-        # flip eigenvectors' sign to enforce deterministic output
-        U, V = svd_flip(U, V)
+        if self.svd_solver == "full":
+            U, S, V = gs.linalg.svd(X, full_matrices=False)
+            # flip eigenvectors' sign to enforce deterministic output
+            U, V = svd_flip(U, V)
+            total_var = gs.sum(S**2) / (n_samples - 1)
+        else:
+            U, S, V = self._truncated_svd(X, n_components)
+            total_var = gs.sum(self.var_) * n_samples / (n_samples - 1)
 
         components_ = V
 
         # Get variance explained by singular values
         explained_variance_ = (S**2) / (n_samples - 1)
-        total_var = explained_variance_.sum()
         explained_variance_ratio_ = explained_variance_ / total_var
         singular_values_ = gs.copy(S)  # Store the singular values.
 
@@ -341,13 +575,17 @@ class TangentPCA(_BasePCA):
 
         # Compute noise covariance using Probabilistic PCA model
         # The sigma2 maximum likelihood (cf. eq. 12.46)
-        if n_components < min(n_features, n_samples):
+        if n_components >= min(n_features, n_samples):
+            self.noise_variance_ = 0.0
+        elif self.svd_solver == "full":
             self.noise_variance_ = explained_variance_[n_components:].mean()
         else:
-            self.noise_variance_ = 0.0
+            self.noise_variance_ = (total_var - gs.sum(explained_variance_)) / (
+                min(n_features, n_samples) - n_components
+            )
 
-        self.base_point_ = base_point
         self.n_samples_, self.n_features_ = n_samples, n_features
+        self.n_samples_seen_ = n_samples
         self.components_ = components_[:n_components]
         self.n_components_ = int(n_components)
         self.explained_variance_ = explained_variance_[:n_components]
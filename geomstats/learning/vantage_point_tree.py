@@ -0,0 +1,272 @@
+"""Vantage-point tree for nearest neighbor search in metric spaces."""
+
+import random
+
+import numpy as np
+
+import geomstats.backend as gs
+
+
+class _KNeighbors:
+    """Running k nearest neighbors of a batch of queries."""
+
+    def __init__(self, n_queries, n_neighbors):
+        self.dists = np.full((n_queries, n_neighbors), np.inf)
+        self.indices = np.full((n_queries, n_neighbors), -1)
+
+    def bound(self, queries):
+        """Give the distance beyond which candidates are discarded."""
+        return self.dists[queries, -1]
+
+    def add(self, queries, dists, indices):
+        """Merge candidate neighbors of shape [n_queries, n_candidates]."""
+        dists = np.concatenate([self.dists[queries], dists], axis=1)
+        indices = np.concatenate([self.indices[queries], indices], axis=1)
+        order = np.argsort(dists, axis=1, kind="stable")[:, : self.dists.shape[1]]
+        self.dists[queries] = np.take_along_axis(dists, order, axis=1)
+        self.indices[queries] = np.take_along_axis(indices, order, axis=1)
+
+
+class _RadiusNeighbors:
+    """Neighbors of a batch of queries within a fixed radius."""
+
+    def __init__(self, n_queries, radius):
+        self.radius = radius
+        self.dists = [[] for _ in range(n_queries)]
+        self.indices = [[] for _ in range(n_queries)]
+
+    def bound(self, queries):
+        """Give the distance beyond which candidates are discarded."""
+        return np.full(len(queries), self.radius)
+
+    def add(self, queries, dists, indices):
+        """Keep candidate neighbors of shape [n_queries, n_candidates]."""
+        within = dists <= self.radius
+        for query, dists_, indices_, within_ in zip(queries, dists, indices, within):
+            self.dists[query].append(dists_[within_])
+            self.indices[query].append(indices_[within_])
+
+
+class VantagePointTree:
+    """Vantage-point tree for nearest neighbor search.
+
+    The tree recursively splits the points around a vantage point, at the
+    median of their distances to it [Y1993]_. Only distances are needed, so
+    that it can index points of any equipped manifold or metric space, such
+    as a space equipped with a `PointSetMetric`.
+
+    Queries are processed in batch: at each node of the tree, the distances
+    from all the queries that reach it to its vantage point are computed with
+    a single call to `dist`. The triangle inequality then prunes the subtrees
+    that cannot contain neighbors.
+
+    Parameters
+    ----------
+    space : Manifold or PointSet
+        Equipped space.
+    leaf_size : int
+        Maximum number of points in a leaf. Distances to the points of a leaf
+        are computed together.
+        Optional, default: 30.
+
+    Attributes
+    ----------
+    points_ : array-like, shape=[n_samples, *space.shape] or list
+        Indexed points.
+
+    References
+    ----------
+    .. [Y1993] P. N. Yianilos, Data structures and algorithms for nearest
+        neighbor search in general metric spaces. Proceedings of the Fourth
+        Annual ACM-SIAM Symposium on Discrete Algorithms, pp. 311-321, 1993.
+    """
+
+    def __init__(self, space, leaf_size=30):
+        if leaf_size < 1:
+            raise ValueError(f"leaf_size must be a positive integer, got {leaf_size}.")
+        self.space = space
+        self.leaf_size = leaf_size
+
+        self.points_ = None
+        self._root = None
+
+    @staticmethod
+    def _take(points, indices):
+        """Select points by index, in an array or in a list."""
+        if gs.is_array(points):
+            return points[gs.from_numpy(np.asarray(indices))]
+        return [points[index] for index in indices]
+
+    def _dists(self, points_a, points_b):
+        """Compute distances between two batches of points of same length."""
+        dists = self.space.metric.dist(points_a, points_b)
+        return np.reshape(gs.to_numpy(dists), (-1,))
+
+    def _dists_to_point(self, points, indices, index):
+        """Compute distances from points to the indexed point `index`."""
+        if gs.is_array(self.points_):
+            return self._dists(self._take(points, indices), self.points_[index])
+        return self._dists(
+            self._take(points, indices),
+            self._take(self.points_, [index] * len(indices)),
+        )
+
+    def _build(self, indices):
+        if len(indices) <= self.leaf_size:
+            return indices
+
+        position = random.randrange(len(indices))
+        vantage_point = indices[position]
+        indices = np.delete(indices, position)
+
+        dists = self._dists_to_point(self.points_, indices, vantage_point)
+        radius = np.median(dists)
+        inside = dists < radius
+
+        return (
+            vantage_point,
+            radius,
+            self._build(indices[inside]),
+            self._build(indices[~inside]),
+        )
+
+    def fit(self, X, y=None):
+        """Build the tree.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_samples, *space.shape] or list
+            Points to index.
+        y : None
+            Target values. Ignored.
+
+        Returns
+        -------
+        self : object
+            Returns self.
+        """
+        self.points_ = X
+        self._root = self._build(np.arange(len(X)))
+        return self
+
+    def _search(self, node, X, queries, neighbors):
+        if len(queries) == 0:
+            return
+
+        if not isinstance(node, tuple):
+            n_queries, n_leaf = len(queries), len(node)
+            if n_leaf == 0:
+                return
+            dists = self._dists(
+                self._take(X, np.repeat(queries, n_leaf)),
+                self._take(self.points_, np.tile(node, n_queries)),
+            )
+            neighbors.add(
+                queries,
+                np.reshape(dists, (n_queries, n_leaf)),
+                np.broadcast_to(node, (n_queries, n_leaf)),
+            )
+            return
+
+        vantage_point, radius, inside, outside = node
+        dists = self._dists_to_point(X, queries, vantage_point)
+        neighbors.add(
+            queries, dists[:, None], np.full((len(queries), 1), vantage_point)
+        )
+
+        near_inside = dists < radius
+        self._search(inside, X, queries[near_inside], neighbors)
+        self._search(outside, X, queries[~near_inside], neighbors)
+
+        bound = neighbors.bound(queries)
+        self._search(
+            outside, X, queries[near_inside & (dists + bound >= radius)], neighbors
+        )
+        self._search(
+            inside, X, queries[~near_inside & (dists - bound <= radius)], neighbors
+        )
+
+    def _check_is_fitted(self):
+        if self.points_ is None:
+            raise RuntimeError("fit needs to be called first.")
+
+    def query(self, X, k=1, return_distance=True):
+        """Find the k nearest neighbors of each query point.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_queries, *space.shape] or list
+            Query points.
+        k : int
+            Number of neighbors.
+            Optional, default: 1.
+        return_distance : bool
+            Whether to return the distances to the neighbors.
+            Optional, default: True.
+
+        Returns
+        -------
+        dists : array-like, shape=[n_queries, k]
+            Distances to the neighbors, sorted in increasing order. Only
+            returned if `return_distance` is True.
+        indices : array-like, shape=[n_queries, k]
+            Indices of the neighbors among the indexed points.
+        """
+        self._check_is_fitted()
+        if k > len(self.points_):
+            raise ValueError(
+                f"Expected k <= n_samples, got k = {k} and "
+                f"n_samples = {len(self.points_)}."
+            )
+
+        neighbors = _KNeighbors(len(X), k)
+        self._search(self._root, X, np.arange(len(X)), neighbors)
+
+        indices = gs.from_numpy(neighbors.indices)
+        if return_distance:
+            return gs.from_numpy(neighbors.dists), indices
+        return indices
+
+    def query_radius(self, X, radius, return_distance=True, sort_results=False):
+        """Find the neighbors of each query point within a radius.
+
+        Parameters
+        ----------
+        X : array-like, shape=[n_queries, *space.shape] or list
+            Query points.
+        radius : float
+            Distance within which neighbors are returned.
+        return_distance : bool
+            Whether to return the distances to the neighbors.
+            Optional, default: True.
+        sort_results : bool
+            Whether to sort the neighbors by increasing distance.
+            Optional, default: False.
+
+        Returns
+        -------
+        dists : list[array-like]
+            Distances to the neighbors of each query point. Only returned if
+            `return_distance` is True.
+        indices : list[array-like]
+            Indices of the neighbors of each query point among the indexed
+            points.
+        """
+        self._check_is_fitted()
+
+        neighbors = _RadiusNeighbors(len(X), radius)
+        self._search(self._root, X, np.arange(len(X)), neighbors)
+
+        all_dists, all_indices = [], []
+        for dists, indices in zip(neighbors.dists, neighbors.indices):
+            dists = np.concatenate(dists) if dists else np.zeros(0)
+            indices = np.concatenate(indices) if indices else np.zeros(0, dtype=int)
+            if sort_results:
+                order = np.argsort(dists, kind="stable")
+                dists, indices = dists[order], indices[order]
+            all_dists.append(gs.from_numpy(dists))
+            all_indices.append(gs.from_numpy(indices))
+
+        if return_distance:
+            return all_dists, all_indices
+        return all_indices
@@ -1,11 +1,12 @@
 """Geodesic solvers implementation."""
 
 from abc import ABC, abstractmethod
+from collections import namedtuple
 
 import geomstats.backend as gs
 from geomstats.numerics.bvp import ScipySolveBVP
 from geomstats.numerics.ivp import GSIVPIntegrator
-from geomstats.numerics.optimizers import ScipyMinimize
+from geomstats.numerics.optimizers import BatchedLBFGS, ScipyMinimize
 from geomstats.numerics.path import (
     UniformlySampledDiscretePath,
     UniformlySampledPathEnergy,
@@ -229,26 +230,78 @@ class LogSolver(ABC):
         raise NotImplementedError("Can't solve for geodesic at different t.")
 
 
+LogDiagnostics = namedtuple(
+    "LogDiagnostics", ["success", "n_iter", "residual", "message"]
+)
+LogDiagnostics.__doc__ = """Convergence diagnostics of log solvers.
+
+Each field has the batch shape of the solved problems.
+
+Parameters
+----------
+success : array-like, shape=[...]
+    Whether the solver converged.
+n_iter : array-like, shape=[...]
+    Number of iterations.
+residual : array-like, shape=[...]
+    Residual of the solution, e.g. the distance between the shooted point
+    and the target point.
+message : list[str] or str
+    Message of the solver.
+"""
+
+
 class _LogBatchMixins:
-    """Provides method to compute log for multiples point."""
+    """Provides method to compute log for multiples point.
+
+    Each point is solved for independently, either in turn or by mapping
+    over an executor, e.g. a `concurrent.futures.ThreadPoolExecutor`. With
+    a process pool, the solver must be picklable.
+
+    With warm starts, each problem is initialized with the most recent
+    solution available when it is started: the solution of the previous
+    point when solving in turn, or the solution of the last point of the
+    previous call with an executor. They are meant for sequences of nearby
+    problems: from a distant solution, the solver may not converge, which is
+    reported in `diagnostics_`.
+    """
 
     @abstractmethod
-    def _log_single(self, point, base_point):
-        """Logarithm map.
+    def _solve_single(self, point, base_point, initial_guess):
+        """Solve the log problem for a single point.
 
         Parameters
         ----------
-        end_point : array-like, shape=[dim]
+        end_point : array-like, shape=[*space.shape]
             Point on the manifold.
-        base_point : array-like, shape=[dim]
+        base_point : array-like, shape=[*space.shape]
             Point on the manifold.
+        initial_guess : array-like
+            Initial solution of the solver.
 
         Returns
         -------
-        tangent_vec : array-like, shape=[dim]
+        tangent_vec : array-like, shape=[*space.shape]
             Tangent vector at the base point.
+        solution : array-like
+            Solution of the solver, in the format of `initial_guess`.
+        diagnostics : tuple
+            Success, number of iterations, residual and message.
         """
 
+    def _initial_guess(self, point, base_point):
+        if self.warm_start and self.warm_start_solution is not None:
+            return self.warm_start_solution
+        return self.initialization(point, base_point)
+
+    def _log_single(self, point, base_point):
+        tangent_vec, solution, diagnostics = self._solve_single(
+            point, base_point, self._initial_guess(point, base_point)
+        )
+        if self.warm_start:
+            self.warm_start_solution = solution
+        return tangent_vec, diagnostics
+
     def log(self, point, base_point):
         """Logarithm map.
 
@@ -272,14 +325,35 @@ class _LogBatchMixins:
 
         is_batch = point.ndim > self._space.point_ndim
         if not is_batch:
-            return self._log_single(point, base_point)
+            tangent_vec, diagnostics = self._log_single(point, base_point)
+            self.diagnostics_ = LogDiagnostics(*diagnostics)
+            return tangent_vec
 
-        return gs.stack(
-            [
+        if self.executor is None:
+            results = [
                 self._log_single(point_, base_point_)
                 for point_, base_point_ in zip(point, base_point)
             ]
+        else:
+            initial_guesses = [
+                self._initial_guess(point_, base_point_)
+                for point_, base_point_ in zip(point, base_point)
+            ]
+            tangent_vecs, solutions, diagnostics = zip(
+                *self.executor.map(
+                    self._solve_single, point, base_point, initial_guesses
+                )
+            )
+            if self.warm_start:
+                self.warm_start_solution = solutions[-1]
+            results = zip(tangent_vecs, diagnostics)
+
+        tangent_vecs, diagnostics = zip(*results)
+        success, n_iter, residual, message = zip(*diagnostics)
+        self.diagnostics_ = LogDiagnostics(
+            gs.array(success), gs.array(n_iter), gs.array(residual), list(message)
         )
+        return gs.stack(tangent_vecs)
 
 
 class LogShootingSolver:
@@ -296,11 +370,29 @@ class LogShootingSolver:
         Defaults to linear initialization.
     flatten : bool
         If True, the optimization problem is solved together for all the batch points.
+    executor : concurrent.futures.Executor
+        Executor mapping the optimization problems of the batch points.
+        Only used if `flatten` is False.
+        Optional, default: None, in which case they are solved in turn.
+    warm_start : bool
+        If True, the previous solution is used as initialization.
+        Only used if `flatten` is False.
+        Optional, default: False.
     """
 
-    def __new__(cls, space, optimizer=None, initialization=None, flatten=True):
+    def __new__(
+        cls,
+        space,
+        optimizer=None,
+        initialization=None,
+        flatten=True,
+        executor=None,
+        warm_start=False,
+    ):
         """Instantiate a log shooting solver."""
         if flatten:
+            if executor is not None or warm_start:
+                raise ValueError("Executors and warm starts require `flatten=False`.")
             return _LogShootingSolverFlatten(
                 space=space,
                 optimizer=optimizer,
@@ -311,6 +403,8 @@ class LogShootingSolver:
             space=space,
             optimizer=optimizer,
             initialization=initialization,
+            executor=executor,
+            warm_start=warm_start,
         )
 
 
@@ -432,6 +526,17 @@ class _LogShootingSolverUnflatten(_LogBatchMixins, _LogShootingSolver):
     initialization : callable
         Function to provide initial solution. `f(point, base_point)`.
         Defaults to linear initialization.
+    executor : concurrent.futures.Executor
+        Executor mapping the optimization problems of the batch points.
+        Optional, default: None, in which case they are solved in turn.
+    warm_start : bool
+        If True, the previous solution is used as initialization.
+        Optional, default: False.
+
+    Attributes
+    ----------
+    diagnostics_ : LogDiagnostics
+        Convergence diagnostics of the last call to `log`.
 
     Notes
     -----
@@ -439,8 +544,22 @@ class _LogShootingSolverUnflatten(_LogBatchMixins, _LogShootingSolver):
     optimization problem for each combination of point and base point.
     """
 
-    def _log_single(self, point, base_point):
-        """Logarithm map.
+    def __init__(
+        self,
+        space,
+        optimizer=None,
+        initialization=None,
+        executor=None,
+        warm_start=False,
+    ):
+        super().__init__(space, optimizer=optimizer, initialization=initialization)
+        self.executor = executor
+        self.warm_start = warm_start
+        self.warm_start_solution = None
+        self.diagnostics_ = None
+
+    def _solve_single(self, point, base_point, initial_guess):
+        """Solve the log problem for a single point.
 
         Parameters
         ----------
@@ -448,23 +567,26 @@ class _LogShootingSolverUnflatten(_LogBatchMixins, _LogShootingSolver):
             Point on the manifold.
         base_point : array-like, shape=[*space.shape]
             Point on the manifold.
+        initial_guess : array-like, shape=[prod(space.shape)]
+            Initial flattened tangent vector.
 
         Returns
         -------
         tangent_vec : array-like, shape=[*space.shape]
             Tangent vector at the base point.
+        solution : array-like, shape=[prod(space.shape)]
+            Flattened tangent vector.
+        diagnostics : tuple
+            Success, number of iterations, residual and message.
         """
         objective = lambda velocity: self._objective(
             velocity, point, base_point, batch_shape=()
         )
-        init_tangent_vec = self.initialization(point, base_point)
-
-        res = self.optimizer.minimize(objective, init_tangent_vec)
 
-        if self._space.point_ndim > 1:
-            return gs.reshape(res.x, self._space.shape)
+        res = self.optimizer.minimize(objective, initial_guess)
 
-        return res.x
+        diagnostics = (res.success, res.nit, gs.sqrt(res.fun), res.message)
+        return gs.reshape(res.x, self._space.shape), res.x, diagnostics
 
 
 class LogODESolver(_LogBatchMixins, LogSolver):
@@ -480,10 +602,32 @@ class LogODESolver(_LogBatchMixins, LogSolver):
     initialization : callable
         Function to provide initial solution. `f( point, base_point)`.
         Defaults to linear initialization.
+    use_jac : bool
+        If True, the jacobian of the geodesic equation is given to the
+        integrator.
+    executor : concurrent.futures.Executor
+        Executor mapping the boundary value problems of the batch points.
+        Optional, default: None, in which case they are solved in turn.
+    warm_start : bool
+        If True, the previous solution, sampled at the mesh nodes, is used as
+        initialization.
+        Optional, default: False.
+
+    Attributes
+    ----------
+    diagnostics_ : LogDiagnostics
+        Convergence diagnostics of the last call to `log`.
     """
 
     def __init__(
-        self, space, n_nodes=10, integrator=None, initialization=None, use_jac=True
+        self,
+        space,
+        n_nodes=10,
+        integrator=None,
+        initialization=None,
+        use_jac=True,
+        executor=None,
+        warm_start=False,
     ):
         self._space = space
         super().__init__(solves_bvp=True)
@@ -498,6 +642,10 @@ class LogODESolver(_LogBatchMixins, LogSolver):
         self.integrator = integrator
         self.initialization = initialization
         self.use_jac = use_jac
+        self.executor = executor
+        self.warm_start = warm_start
+        self.warm_start_solution = None
+        self.diagnostics_ = None
 
         self.grid = self._create_grid()
 
@@ -582,7 +730,7 @@ class LogODESolver(_LogBatchMixins, LogSolver):
 
         return jac
 
-    def _solve(self, point, base_point):
+    def _solve(self, point, base_point, initial_guess=None):
         bvp = lambda t, state: self._bvp(state)
         bc = lambda state_0, state_1: self._boundary_condition(
             state_0, state_1, gs.flatten(base_point), gs.flatten(point)
@@ -592,13 +740,43 @@ class LogODESolver(_LogBatchMixins, LogSolver):
         if self.use_jac:
             jacobian = lambda t, state: self._jacobian(t, state)
 
-        y = self.initialization(point, base_point)
+        if initial_guess is None:
+            initial_guess = self.initialization(point, base_point)
 
-        return self.integrator.integrate(bvp, bc, self.grid, y, fun_jac=jacobian)
+        return self.integrator.integrate(
+            bvp, bc, self.grid, initial_guess, fun_jac=jacobian
+        )
 
-    def _log_single(self, point, base_point):
-        res = self._solve(point, base_point)
-        return self._simplify_log_result(res)
+    def _solve_single(self, point, base_point, initial_guess):
+        """Solve the log problem for a single point.
+
+        Parameters
+        ----------
+        end_point : array-like, shape=[*space.shape]
+            Point on the manifold.
+        base_point : array-like, shape=[*space.shape]
+            Point on the manifold.
+        initial_guess : array-like, shape=[2*dim, n_nodes]
+            Initial state at the mesh nodes.
+
+        Returns
+        -------
+        tangent_vec : array-like, shape=[*space.shape]
+            Tangent vector at the base point.
+        solution : array-like, shape=[2*dim, n_nodes]
+            State at the mesh nodes.
+        diagnostics : tuple
+            Success, number of iterations, residual and message.
+        """
+        res = self._solve(point, base_point, initial_guess)
+
+        diagnostics = (
+            res.success,
+            res.niter,
+            gs.amax(res.rms_residuals),
+            res.message,
+        )
+        return self._simplify_log_result(res), res.sol(self.grid), diagnostics
 
     def geodesic_bvp(self, point, base_point):
         """Geodesic curve for boundary value problem.
@@ -676,10 +854,25 @@ class PathStraightening(LogSolver):
         Method to compute Riemannian path energy.
     n_nodes : int
         Number of midpoints.
-    optimizer : ScipyMinimize
+    optimizer : ScipyMinimize or BatchedLBFGS
         An optimizer to solve path energy minimization problem.
+        `BatchedLBFGS` requires `flatten`.
+        Optional, default: BatchedLBFGS if `flatten`, else ScipyMinimize.
     initialization : callable
         A method to get initial guess for optimization.
+    flatten : bool
+        If True, the midpoints of all the paths of a batch are optimized
+        together, the objective being the sum of the path energies. With
+        `BatchedLBFGS`, each path still stops on its own convergence criterion.
+        Optional, default: False.
+
+    Notes
+    -----
+    If the `closed_form_gradient` attribute of the path energy is True, its
+    `energy_gradient` method is used as gradient of the objective, e.g. for
+    `UniformlySampledPathEnergy` with Euclidean or Poincare ball metrics, and
+    the default optimizers do not require automatic differentiation. Otherwise,
+    the gradient is computed by automatic differentiation.
 
     References
     ----------
@@ -689,20 +882,36 @@ class PathStraightening(LogSolver):
     """
 
     def __init__(
-        self, space, path_energy=None, n_nodes=100, optimizer=None, initialization=None
+        self,
+        space,
+        path_energy=None,
+        n_nodes=100,
+        optimizer=None,
+        initialization=None,
+        flatten=False,
     ):
         self._space = space
         super().__init__(solves_bvp=True)
-        if optimizer is None:
-            optimizer = ScipyMinimize(
-                method="L-BFGS-B",
-                jac="autodiff",
-                options={"disp": False},
-            )
-
         if path_energy is None:
             path_energy = UniformlySampledPathEnergy(space)
 
+        if optimizer is None:
+            optimizer = (
+                BatchedLBFGS()
+                if flatten
+                else ScipyMinimize(
+                    method="L-BFGS-B",
+                    jac=(
+                        None
+                        if getattr(path_energy, "closed_form_gradient", False)
+                        else "autodiff"
+                    ),
+                    options={"disp": False},
+                )
+            )
+        elif isinstance(optimizer, BatchedLBFGS) and not flatten:
+            raise ValueError("`BatchedLBFGS` requires `flatten=True`.")
+
         if initialization is None:
             initialization = self._default_initialization
 
@@ -710,6 +919,7 @@ class PathStraightening(LogSolver):
         self.optimizer = optimizer
         self.path_energy = path_energy
         self.initialization = initialization
+        self.flatten = flatten
 
     def _default_initialization(self, point, base_point):
         """Linear initialization.
@@ -768,8 +978,22 @@ class PathStraightening(LogSolver):
             )
             return self.path_energy(path)
 
+        def objective_jac(midpoints):
+            """Compute the gradient of the path energy with respect to midpoints."""
+            midpoints = gs.reshape(midpoints, (self.n_nodes - 2,) + self._space.shape)
+            path = gs.concatenate([base_point, midpoints, point])
+            return gs.flatten(self.path_energy.energy_gradient(path)[1:-1])
+
         init_midpoints = gs.reshape(init_midpoints, (-1,))
-        sol = self.optimizer.minimize(objective, init_midpoints)
+        sol = self.optimizer.minimize(
+            objective,
+            init_midpoints,
+            fun_jac=(
+                objective_jac
+                if getattr(self.path_energy, "closed_form_gradient", False)
+                else None
+            ),
+        )
 
         solution_midpoints = gs.reshape(
             gs.array(sol.x), (self.n_nodes - 2,) + self._space.shape
@@ -784,6 +1008,84 @@ class PathStraightening(LogSolver):
             axis=0,
         )
 
+    def _discrete_geodesic_bvp_flatten(self, point, base_point):
+        """Solve boundary value problems (BVP) together.
+
+        Parameters
+        ----------
+        point : array-like, shape=[n_paths, *point_shape]
+        base_point : array-like, shape=[n_paths, *point_shape]
+
+        Returns
+        -------
+        discr_geod_path : array-like, shape=[n_paths, n_times, *point_shape]
+            Discrete geodesics.
+        """
+        n_paths = point.shape[0]
+        midpoints_shape = (self.n_nodes - 2,) + self._space.shape
+        init_midpoints = gs.stack(
+            [
+                self.initialization(point_, base_point_)[1:-1]
+                for point_, base_point_ in zip(point, base_point)
+            ]
+        )
+
+        base_point = gs.expand_dims(base_point, axis=1)
+        point = gs.expand_dims(point, axis=1)
+
+        def _path(midpoints, indices):
+            midpoints = gs.reshape(midpoints, (-1,) + midpoints_shape)
+            return gs.concatenate(
+                [base_point[indices], midpoints, point[indices]], axis=1
+            )
+
+        def objective(midpoints, indices):
+            """Compute path energies of paths going through midpoints.
+
+            Parameters
+            ----------
+            midpoints : array-like, shape=[n, (n_nodes - 2) * prod(point_shape)]
+                Midpoints of the paths.
+            indices : array-like, shape=[n]
+                Indices of the paths.
+
+            Returns
+            -------
+            _ : array-like, shape=[n]
+                Energies of the paths going through these midpoints.
+            """
+            return self.path_energy(_path(midpoints, indices))
+
+        def objective_jac(midpoints, indices):
+            """Compute the gradients of the path energies with respect to midpoints."""
+            gradient = self.path_energy.energy_gradient(_path(midpoints, indices))
+            return gs.reshape(gradient[:, 1:-1], (len(indices), -1))
+
+        has_gradient = getattr(self.path_energy, "closed_form_gradient", False)
+        all_indices = gs.arange(n_paths)
+        init_midpoints = gs.reshape(init_midpoints, (n_paths, -1))
+        if isinstance(self.optimizer, BatchedLBFGS):
+            sol = self.optimizer.minimize(
+                objective,
+                init_midpoints,
+                fun_jac=objective_jac if has_gradient else None,
+            )
+        else:
+
+            def summed_objective(midpoints):
+                return gs.sum(objective(midpoints, all_indices))
+
+            def summed_objective_jac(midpoints):
+                return gs.flatten(objective_jac(midpoints, all_indices))
+
+            sol = self.optimizer.minimize(
+                summed_objective,
+                gs.flatten(init_midpoints),
+                fun_jac=summed_objective_jac if has_gradient else None,
+            )
+
+        return _path(gs.array(sol.x), all_indices)
+
     def discrete_geodesic_bvp(self, point, base_point):
         """Solve boundary value problem (BVP).
 
@@ -804,6 +1106,13 @@ class PathStraightening(LogSolver):
             point, base_point = gs.broadcast_arrays(point, base_point)
 
         is_batch = point.ndim > self._space.point_ndim
+        if self.flatten:
+            if not is_batch:
+                return self._discrete_geodesic_bvp_flatten(
+                    gs.expand_dims(point, axis=0), gs.expand_dims(base_point, axis=0)
+                )[0]
+            return self._discrete_geodesic_bvp_flatten(point, base_point)
+
         if not is_batch:
             return self._discrete_geodesic_bvp_single(point, base_point)
 
@@ -855,3 +1164,150 @@ class PathStraightening(LogSolver):
         return UniformlySampledDiscretePath(
             discr_geod_path, point_ndim=self._space.point_ndim
         )
+
+
+ResolutionLevel = namedtuple(
+    "ResolutionLevel", ["space", "restriction", "prolongation"]
+)
+ResolutionLevel.__doc__ = """Coarse resolution of a space for coarse-to-fine solvers.
+
+Parameters
+----------
+space : Manifold
+    Equipped manifold at this resolution, e.g. discrete curves with fewer
+    sampling points or discrete surfaces on a decimated mesh.
+restriction : callable
+    Map from points at the next finer resolution to points of `space`.
+prolongation : callable
+    Map from points of `space` to points at the next finer resolution.
+"""
+
+
+class CoarseToFinePathStraightening(PathStraightening):
+    """Path-straightening solved from coarse to fine resolutions.
+
+    The path energy is first minimized with `coarse_n_nodes` time nodes and,
+    if `levels` are given, on the coarsest resolution of the space. The
+    solution is then prolongated, in space by the prolongation of the level
+    and in time by linear interpolation, and used as initial path at the
+    next resolution. The number of time nodes roughly doubles from one
+    resolution to the next, and then on the finest space until it
+    reaches `n_nodes`. Most of the iterations are thus made on the coarse,
+    cheap, problems.
+
+    Parameters
+    ----------
+    space : Manifold
+        Equipped manifold.
+    path_energy : callable
+        Method to compute Riemannian path energy on `space`. Coarse
+        resolutions use `UniformlySampledPathEnergy`.
+    n_nodes : int
+        Number of time nodes of the solution.
+    optimizer : ScipyMinimize
+        An optimizer to solve path energy minimization problems.
+    coarse_n_nodes : int
+        Number of time nodes at the coarsest resolution.
+        Optional, default: 5.
+    levels : list[ResolutionLevel]
+        Coarse resolutions of the space, from the coarsest to the finest.
+        Optional, default: no coarse resolution, i.e. only the time is
+        refined.
+    """
+
+    def __init__(
+        self,
+        space,
+        path_energy=None,
+        n_nodes=100,
+        optimizer=None,
+        coarse_n_nodes=5,
+        levels=(),
+    ):
+        super().__init__(
+            space, path_energy=path_energy, n_nodes=n_nodes, optimizer=optimizer
+        )
+        self.coarse_n_nodes = coarse_n_nodes
+        self.levels = list(levels)
+
+    def _solve_level(self, space, point, base_point, n_nodes, path=None):
+        """Solve boundary value problem at a given resolution.
+
+        Parameters
+        ----------
+        space : Manifold
+            Equipped manifold at this resolution.
+        point : array-like, shape=[*point_shape]
+        base_point : array-like, shape=[*point_shape]
+        n_nodes : int
+            Number of time nodes.
+        path : array-like, shape=[n_times, *point_shape]
+            Initial path, resampled to n_nodes time nodes.
+            Optional, default: linear initialization.
+
+        Returns
+        -------
+        discr_geod_path : array-like, shape=[n_nodes, *point_shape]
+            Discrete geodesic.
+        """
+        initialization = None
+        if path is not None:
+            times = gs.linspace(0.0, 1.0, n_nodes)
+            initial_path = UniformlySampledDiscretePath(
+                path, point_ndim=space.point_ndim
+            )(times)
+
+            def _resampled_path(point, base_point):
+                return initial_path
+
+            initialization = _resampled_path
+
+        path_energy = (
+            self.path_energy
+            if space is self._space
+            else UniformlySampledPathEnergy(space)
+        )
+        solver = PathStraightening(
+            space,
+            path_energy=path_energy,
+            n_nodes=n_nodes,
+            optimizer=self.optimizer,
+            initialization=initialization,
+        )
+        return solver._discrete_geodesic_bvp_single(point, base_point)
+
+    def _discrete_geodesic_bvp_single(self, point, base_point):
+        """Solve boundary value problem (BVP) from coarse to fine resolutions.
+
+        Parameters
+        ----------
+        point : array-like, shape=[*point_shape]
+        base_point : array-like, shape=[*point_shape]
+
+        Returns
+        -------
+        discr_geod_path : array-like, shape=[n_nodes, *point_shape]
+            Discrete geodesic.
+        """
+        endpoints = [(point, base_point)]
+        for level in reversed(self.levels):
+            point, base_point = endpoints[0]
+            endpoints.insert(
+                0, (level.restriction(point), level.restriction(base_point))
+            )
+        spaces = [level.space for level in self.levels] + [self._space]
+
+        n_nodes = min(self.coarse_n_nodes, self.n_nodes)
+        path = None
+        for index, (space, (point, base_point)) in enumerate(zip(spaces, endpoints)):
+            if path is not None:
+                path = self.levels[index - 1].prolongation(path)
+            path = self._solve_level(space, point, base_point, n_nodes, path)
+
+            is_finest = index == len(spaces) - 1
+            while is_finest and n_nodes < self.n_nodes:
+                n_nodes = min(2 * n_nodes - 1, self.n_nodes)
+                path = self._solve_level(space, point, base_point, n_nodes, path)
+            n_nodes = min(2 * n_nodes - 1, self.n_nodes)
+
+        return path
@@ -1,7 +1,9 @@
 """Initial value problem solvers implementation."""
 
+import logging
 from abc import ABC, abstractmethod
 
+import numpy as np
 import scipy
 
 import geomstats.backend as gs
@@ -187,6 +189,345 @@ class GSIVPIntegrator(ODEIVPIntegrator):
         return result
 
 
+class DormandPrinceIntegrator(ODEIVPIntegrator):
+    """Dormand-Prince 5(4) integrator with per-element step size control.
+
+    Embedded Runge-Kutta method of order 5 with an error estimate of order 4
+    [DP1980]_, run on the backend. Each element of a batch of initial states
+    has its own step size, chosen from its own error estimate. Elements that
+    reach the end time are removed from the batch, so that the force is only
+    evaluated on the remaining ones. The solution at chosen times is given
+    by the continuous extension of the method.
+
+    The force receives a flattened batch of states, of shape
+    `[n_elements, n_vars, *point_shape]`, and their times, of shape
+    `[n_elements,]`. As the batch shrinks along the integration, the force
+    must act on each element independently.
+
+    Parameters
+    ----------
+    rtol : float
+        Relative tolerance.
+        Optional, default: 1e-6.
+    atol : float
+        Absolute tolerance.
+        Optional, default: 1e-9.
+    max_steps : int
+        Maximum number of steps, accepted or rejected.
+        Optional, default: 1000.
+    point_ndim : int
+        Dimension of array representing a point in the space.
+        Optional, default: 1.
+    save_result : bool
+        If True, result is stored after calling `integrate` or `integrate_t`.
+
+    References
+    ----------
+    .. [DP1980] J. R. Dormand and P. J. Prince, A family of embedded
+        Runge-Kutta formulae. Journal of Computational and Applied
+        Mathematics, vol. 6, no. 1, pp. 19-26, 1980.
+    """
+
+    C = [0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0]
+    A = [
+        [],
+        [1 / 5],
+        [3 / 40, 9 / 40],
+        [44 / 45, -56 / 15, 32 / 9],
+        [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+        [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    ]
+    B = [35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84]
+    E = [
+        -71 / 57600,
+        0.0,
+        71 / 16695,
+        -71 / 1920,
+        17253 / 339200,
+        -22 / 525,
+        1 / 40,
+    ]
+    P = [
+        [
+            1.0,
+            -8048581381 / 2820520608,
+            8663915743 / 2820520608,
+            -12715105075 / 11282082432,
+        ],
+        [0.0, 0.0, 0.0, 0.0],
+        [
+            0.0,
+            131558114200 / 32700410799,
+            -68118460800 / 10900136933,
+            87487479700 / 32700410799,
+        ],
+        [
+            0.0,
+            -1754552775 / 470086768,
+            14199869525 / 1410260304,
+            -10690763975 / 1880347072,
+        ],
+        [
+            0.0,
+            127303824393 / 49829197408,
+            -318862633887 / 49829197408,
+            701980252875 / 199316789632,
+        ],
+        [
+            0.0,
+            -282668133 / 205662961,
+            2019193451 / 616988883,
+            -1453857185 / 822651844,
+        ],
+        [
+            0.0,
+            40617522 / 29380423,
+            -110615467 / 29380423,
+            69997945 / 29380423,
+        ],
+    ]
+
+    SAFETY = 0.9
+    MIN_FACTOR = 0.2
+    MAX_FACTOR = 10.0
+
+    def __init__(
+        self, rtol=1e-6, atol=1e-9, max_steps=1000, point_ndim=1, save_result=False
+    ):
+        super().__init__(save_result=save_result, tchosen=True)
+        self.rtol = rtol
+        self.atol = atol
+        self.max_steps = max_steps
+        self.point_ndim = point_ndim
+
+    @staticmethod
+    def _combine(coefs, stages):
+        """Compute the linear combination of stages with scalar coefficients."""
+        return sum(coef * stage for coef, stage in zip(coefs, stages) if coef != 0.0)
+
+    @staticmethod
+    def _scale_by_element(scalars, array):
+        return gs.einsum("n,n...->n...", scalars, array)
+
+    def _rms_norm(self, array, scale):
+        axes = tuple(range(1, array.ndim))
+        return gs.sqrt(gs.mean((array / scale) ** 2, axis=axes))
+
+    def _initial_step(self, force, state, derivative, end_time):
+        """Choose the initial step size of each element."""
+        scale = self.atol + self.rtol * gs.abs(state)
+        norm_state = self._rms_norm(state, scale)
+        norm_derivative = self._rms_norm(derivative, scale)
+        small = (norm_state < 1e-5) | (norm_derivative < 1e-5)
+        step = gs.where(
+            small, 1e-6, 0.01 * norm_state / gs.where(small, 1.0, norm_derivative)
+        )
+
+        next_derivative = force(
+            state + self._scale_by_element(step, derivative),
+            step,
+        )
+        norm_second_derivative = (
+            self._rms_norm(next_derivative - derivative, scale) / step
+        )
+        max_norm = gs.maximum(norm_derivative, norm_second_derivative)
+        tiny = max_norm <= 1e-15
+        other_step = gs.where(
+            tiny,
+            gs.maximum(1e-6, step * 1e-3),
+            (0.01 / gs.where(tiny, 1.0, max_norm)) ** (1 / 5),
+        )
+        return gs.minimum(gs.minimum(100 * step, other_step), end_time)
+
+    def _dense_output(self, state, stages, step, theta):
+        """Evaluate the continuous extension within a step.
+
+        Parameters
+        ----------
+        state : array-like, shape=[n_elements, *state_shape]
+            State at the beginning of the step.
+        stages : list[array-like]
+            Seven stages of the step, of same shape as state.
+        step : array-like, shape=[n_elements,]
+            Step size.
+        theta : array-like, shape=[n_elements, n_times]
+            Fraction of the step at which to evaluate.
+
+        Returns
+        -------
+        states : array-like, shape=[n_elements, n_times, *state_shape]
+        """
+        powers = gs.stack([theta**power for power in range(1, 5)], axis=-1)
+        coefs = gs.einsum("ntp,kp->knt", powers, gs.array(self.P))
+        increment = sum(
+            gs.einsum("nt,n...->nt...", coefs[k], stage)
+            for k, stage in enumerate(stages)
+        )
+        return gs.expand_dims(state, axis=1) + gs.einsum(
+            "n,nt...->nt...", step, increment
+        )
+
+    def _integrate(self, force, initial_state, end_time, t_eval=None):
+        batch_shape = initial_state.shape[: -(self.point_ndim + 1)]
+        state_shape = initial_state.shape[len(batch_shape) :]
+        n_elements = int(np.prod(batch_shape))
+
+        state = gs.reshape(initial_state, (n_elements,) + state_shape)
+        time = gs.zeros(n_elements)
+        element_indices = np.arange(n_elements)
+        eval_states = None
+        if t_eval is not None:
+            at_start = gs.cast(t_eval <= 0.0, state.dtype)
+            eval_states = gs.einsum(
+                "t,n...->nt...", at_start, gs.ones_like(state)
+            ) * gs.expand_dims(state, axis=1)
+
+        derivative = force(state, time)
+        step = self._initial_step(force, state, derivative, end_time)
+
+        finished_indices, finished_states, finished_eval_states = [], [], []
+        n_steps = 0
+        nfev = 2
+        while n_steps < self.max_steps and len(element_indices) > 0:
+            step = gs.minimum(step, end_time - time)
+
+            stages = [derivative]
+            for c_coef, a_coefs in zip(self.C[1:], self.A[1:]):
+                stage_state = state + self._scale_by_element(
+                    step, self._combine(a_coefs, stages)
+                )
+                stages.append(force(stage_state, time + c_coef * step))
+            new_state = state + self._scale_by_element(
+                step, self._combine(self.B, stages)
+            )
+            new_derivative = force(new_state, time + step)
+            stages.append(new_derivative)
+            nfev += 6
+
+            scale = self.atol + self.rtol * gs.maximum(gs.abs(state), gs.abs(new_state))
+            error = self._rms_norm(
+                self._scale_by_element(step, self._combine(self.E, stages)), scale
+            )
+            accepted = error <= 1.0
+
+            factor = self.SAFETY * gs.where(error > 0.0, error, 1.0) ** (-1 / 5)
+            factor = gs.where(error > 0.0, factor, self.MAX_FACTOR)
+            factor = gs.where(
+                accepted,
+                gs.clip(factor, self.MIN_FACTOR, self.MAX_FACTOR),
+                gs.clip(factor, self.MIN_FACTOR, 1.0),
+            )
+
+            mask_shape = (-1,) + (1,) * len(state_shape)
+            accepted_mask = gs.reshape(accepted, mask_shape)
+            if eval_states is not None:
+                new_time = time + step
+                in_step = (
+                    accepted[:, None]
+                    & (t_eval[None] > time[:, None])
+                    & (t_eval[None] <= new_time[:, None])
+                )
+                theta = (t_eval[None] - time[:, None]) / step[:, None]
+                eval_states = gs.where(
+                    gs.reshape(in_step, in_step.shape + (1,) * len(state_shape)),
+                    self._dense_output(
+                        state, stages, step, gs.where(in_step, theta, 0.0)
+                    ),
+                    eval_states,
+                )
+
+            time = gs.where(accepted, time + step, time)
+            state = gs.where(accepted_mask, new_state, state)
+            derivative = gs.where(accepted_mask, new_derivative, derivative)
+            step = step * factor
+            n_steps += 1
+
+            finished = gs.to_numpy(time >= end_time * (1.0 - 1e-12))
+            if np.any(finished):
+                finished_indices.append(element_indices[finished])
+                finished_states.append(state[finished])
+                if eval_states is not None:
+                    finished_eval_states.append(eval_states[finished])
+
+                ongoing = ~finished
+                element_indices = element_indices[ongoing]
+                state, derivative = state[ongoing], derivative[ongoing]
+                time, step = time[ongoing], step[ongoing]
+                if eval_states is not None:
+                    eval_states = eval_states[ongoing]
+
+        success = len(element_indices) == 0
+        if not success:
+            logging.warning(
+                f"Maximum number of steps {self.max_steps} reached before the end "
+                f"time for {len(element_indices)} elements."
+            )
+            finished_indices.append(element_indices)
+            finished_states.append(state)
+            if eval_states is not None:
+                finished_eval_states.append(eval_states)
+
+        order = np.argsort(np.concatenate(finished_indices))
+        result = OdeResult(nfev=nfev, njev=0, n_steps=n_steps, success=success)
+        if t_eval is None:
+            final_state = gs.reshape(
+                gs.concatenate(finished_states)[order], initial_state.shape
+            )
+            result.t = gs.array([0.0, end_time])
+            result.y = gs.stack([initial_state, final_state])
+        else:
+            eval_states = gs.concatenate(finished_eval_states)[order]
+            result.t = t_eval
+            result.y = gs.reshape(
+                eval_states, batch_shape + (t_eval.shape[0],) + state_shape
+            )
+
+        if self.save_result:
+            self.result_ = result
+
+        return result
+
+    def integrate(self, force, initial_state, end_time=1.0):
+        """Integrate force.
+
+        Only the initial and final states are returned.
+
+        Parameters
+        ----------
+        force : callable
+            Function to integrate: `f(state, t)`.
+        initial_state : array-like, shape=[..., n_vars, *point_shape]
+            Initial state.
+        end_time : float
+            Integration end time.
+            Optional, default: 1.
+
+        Returns
+        -------
+        result : OdeResult
+        """
+        return self._integrate(force, initial_state, end_time)
+
+    def integrate_t(self, force, initial_state, t_eval):
+        """Integrate force at `t_eval` points.
+
+        Parameters
+        ----------
+        force : callable
+            Function to integrate: `f(state, t)`.
+        initial_state : array-like, shape=[..., n_vars, *point_shape]
+            Initial state.
+        t_eval : array-like, shape=[n_times,]
+            Nonnegative increasing times at which to store the computed
+            solution.
+
+        Returns
+        -------
+        result : OdeResult
+        """
+        return self._integrate(force, initial_state, t_eval[-1], t_eval=t_eval)
+
+
 class ScipySolveIVP(ODEIVPIntegrator):
     """Wrapper for scipy.integrate.solve_ivp.
 
@@ -2,6 +2,7 @@
 
 import logging
 
+import numpy as np
 import scipy
 
 import geomstats.backend as gs
@@ -113,3 +114,232 @@ class ScipyMinimize:
             self.result_ = result
 
         return result
+
+
+class BatchedLBFGS:
+    """Limited-memory BFGS minimizing a batch of independent problems.
+
+    The variables of each problem form a row of a 2d array, and the objective
+    returns one value per row. Search directions are computed by the
+    two-loop recursion on the last `n_corrections` steps of each problem,
+    and step sizes by backtracking until sufficient decrease. Each problem
+    stops as soon as it converges, and the objective is then only evaluated
+    on the remaining rows.
+
+    Parameters
+    ----------
+    max_iter : int
+        Maximum number of iterations for each problem.
+        Optional, default: 1000.
+    n_corrections : int
+        Number of steps kept to approximate the inverse hessian.
+        Optional, default: 10.
+    gtol : float
+        A problem converges when the largest absolute component of its
+        gradient is below `gtol`.
+        Optional, default: 1e-5.
+    ftol : float
+        A problem converges when the relative decrease of its objective
+        in one iteration is below `ftol`.
+        Optional, default: 2.2e-9, as in scipy's L-BFGS-B.
+    max_linesearch : int
+        Maximum number of step halvings in the line search.
+        Optional, default: 20.
+    save_result : bool
+        If True, the result is kept in `result_`.
+        Optional, default: False.
+    """
+
+    def __init__(
+        self,
+        max_iter=1000,
+        n_corrections=10,
+        gtol=1e-5,
+        ftol=2.2e-9,
+        max_linesearch=20,
+        save_result=False,
+    ):
+        self.max_iter = max_iter
+        self.n_corrections = n_corrections
+        self.gtol = gtol
+        self.ftol = ftol
+        self.max_linesearch = max_linesearch
+
+        self.save_result = save_result
+        self.result_ = None
+
+    @staticmethod
+    def _handle_jac(fun, fun_jac):
+        if fun_jac is not None:
+            return fun_jac
+
+        def fun_jac_(x, indices):
+            def _summed_fun(x):
+                return gs.sum(fun(x, indices))
+
+            return gs.autodiff.value_and_grad(_summed_fun)(x)[1]
+
+        return fun_jac_
+
+    def _two_loop(self, grad, steps, grad_steps, rhos):
+        """Multiply gradients by the approximate inverse hessians."""
+        alphas = []
+        direction = grad
+        for index in reversed(range(self.n_corrections)):
+            alpha = rhos[:, index] * np.sum(steps[:, index] * direction, axis=-1)
+            direction = direction - alpha[:, None] * grad_steps[:, index]
+            alphas.append(alpha)
+
+        step_grad = np.sum(steps[:, -1] * grad_steps[:, -1], axis=-1)
+        grad_norm = np.sum(grad_steps[:, -1] ** 2, axis=-1)
+        has_history = rhos[:, -1] > 0
+        scale = np.where(
+            has_history, step_grad / np.where(has_history, grad_norm, 1.0), 1.0
+        )
+        direction = scale[:, None] * direction
+
+        for index, alpha in zip(range(self.n_corrections), reversed(alphas)):
+            beta = rhos[:, index] * np.sum(grad_steps[:, index] * direction, axis=-1)
+            direction = direction + (alpha - beta)[:, None] * steps[:, index]
+        return -direction
+
+    def minimize(self, fun, x0, fun_jac=None):
+        """Minimize a batch of objective functions.
+
+        Parameters
+        ----------
+        fun : callable
+            Objective function `f(x, indices)`, where `x` has
+            shape=[n, n_vars] and `indices` are the positions in the batch of
+            its n rows. Returns the values of the n objectives, shape=[n].
+        x0 : array-like, shape=[n_problems, n_vars]
+            Initial guess.
+        fun_jac : callable
+            Gradient `f(x, indices)` of the objectives with respect to `x`,
+            shape=[n, n_vars]. If None, automatic differentiation is used.
+
+        Returns
+        -------
+        result : OptimizeResult
+            With `x`, `fun`, `jac`, `nit`, `success` and `message`, for each
+            problem of the batch.
+        """
+        fun_jac = self._handle_jac(fun, fun_jac)
+
+        def _fun(x, indices):
+            return gs.to_numpy(fun(gs.from_numpy(x), indices))
+
+        def _fun_jac(x, indices):
+            return gs.to_numpy(fun_jac(gs.from_numpy(x), indices))
+
+        x = np.array(gs.to_numpy(x0), dtype=float)
+        n_problems, n_vars = x.shape
+        indices = np.arange(n_problems)
+        value = _fun(x, indices)
+        grad = _fun_jac(x, indices)
+
+        steps = np.zeros((n_problems, self.n_corrections, n_vars))
+        grad_steps = np.zeros_like(steps)
+        rhos = np.zeros((n_problems, self.n_corrections))
+
+        result = scipy.optimize.OptimizeResult(
+            x=np.empty_like(x),
+            fun=np.empty(n_problems),
+            jac=np.empty_like(x),
+            nit=np.zeros(n_problems, dtype=int),
+            success=np.zeros(n_problems, dtype=bool),
+            message=[""] * n_problems,
+        )
+
+        def _finish(mask, success, message):
+            for row, index in zip(np.flatnonzero(mask), indices[mask]):
+                result.x[index] = x[row]
+                result.fun[index] = value[row]
+                result.jac[index] = grad[row]
+                result.success[index] = success
+                result.message[index] = message
+
+        converged = np.amax(np.abs(grad), axis=-1) <= self.gtol
+        _finish(converged, True, "Converged: gradient below gtol.")
+        active = ~converged
+
+        for _ in range(self.max_iter):
+            x, value, grad = x[active], value[active], grad[active]
+            steps, grad_steps, rhos = steps[active], grad_steps[active], rhos[active]
+            indices = indices[active]
+            if indices.size == 0:
+                break
+            result.nit[indices] += 1
+
+            direction = self._two_loop(grad, steps, grad_steps, rhos)
+            slope = np.sum(grad * direction, axis=-1)
+            reset = ~(slope < 0)
+            direction[reset] = -grad[reset]
+            slope[reset] = -np.sum(grad[reset] ** 2, axis=-1)
+            rhos[reset] = 0.0
+
+            has_history = rhos[:, -1] > 0
+            step_size = np.where(has_history, 1.0, np.minimum(1.0, 1 / np.sqrt(-slope)))
+            new_x, new_value = x.copy(), value.copy()
+            decreased = np.zeros(len(indices), dtype=bool)
+            for _ in range(self.max_linesearch):
+                rows = np.flatnonzero(~decreased)
+                if rows.size == 0:
+                    break
+                trial_x = x[rows] + step_size[rows, None] * direction[rows]
+                trial_value = _fun(trial_x, indices[rows])
+                accepted = trial_value <= value[rows] + 1e-4 * step_size[rows] * (
+                    slope[rows]
+                )
+                new_x[rows[accepted]] = trial_x[accepted]
+                new_value[rows[accepted]] = trial_value[accepted]
+                decreased[rows[accepted]] = True
+                step_size[rows[~accepted]] /= 2
+
+            _finish(~decreased, False, "Line search failed.")
+
+            new_grad = grad.copy()
+            new_grad[decreased] = _fun_jac(new_x[decreased], indices[decreased])
+            step = new_x - x
+            grad_step = new_grad - grad
+            step_grad = np.sum(step * grad_step, axis=-1)
+            update = decreased & (
+                step_grad > np.finfo(float).eps * np.sum(grad_step**2, axis=-1)
+            )
+            steps[update] = np.concatenate(
+                [steps[update, 1:], step[update, None]], axis=1
+            )
+            grad_steps[update] = np.concatenate(
+                [grad_steps[update, 1:], grad_step[update, None]], axis=1
+            )
+            rhos[update] = np.concatenate(
+                [rhos[update, 1:], 1 / step_grad[update, None]], axis=1
+            )
+
+            small_decrease = value - new_value <= self.ftol * np.maximum(
+                np.maximum(np.abs(value), np.abs(new_value)), 1.0
+            )
+            x, value, grad = new_x, new_value, new_grad
+            small_grad = np.amax(np.abs(grad), axis=-1) <= self.gtol
+            _finish(decreased & small_grad, True, "Converged: gradient below gtol.")
+            _finish(
+                decreased & small_decrease & ~small_grad,
+                True,
+                "Converged: relative decrease below ftol.",
+            )
+            active = decreased & ~small_grad & ~small_decrease
+        else:
+            _finish(active, False, "Maximum number of iterations reached.")
+
+        n_failed = np.sum(~result.success)
+        if n_failed:
+            logging.warning(
+                f"{n_failed} of {n_problems} problems did not converge: "
+                f"{set(np.array(result.message)[~result.success])}"
+            )
+
+        result = result_to_backend_type(result)
+        if self.save_result:
+            self.result_ = result
+
+        return result
@@ -70,6 +70,74 @@ class UniformlySampledPathEnergy:
         """
         return gs.sum(self.energy_per_time(path), axis=-1)
 
+    @property
+    def closed_form_gradient(self):
+        """Whether `energy_gradient` is computed in closed form.
+
+        Only metrics flagging their metric matrix and its derivative as
+        analytic qualify, as e.g. pullback or Fisher-Rao metrics compute them
+        by automatic differentiation or quadrature.
+        """
+        return self._space.point_ndim == 1 and getattr(
+            self._space.metric, "_analytic_derivative_matrix", False
+        )
+
+    def energy_gradient(self, path):
+        r"""Compute the gradient of the Riemannian path energy.
+
+        If the metric implements its metric matrix :math:`g` and its
+        derivative analytically, the gradient at each node :math:`x_s` of the path is
+        computed in closed form:
+
+        .. math::
+            \frac{\delta}{2} \partial g_{x_s}(v_s, v_s)
+            - g_{x_s} v_s + g_{x_{s-1}} v_{s-1}
+
+        where :math:`v_s = (x_{s+1} - x_s) / \delta` and :math:`\delta` is the
+        time step, the terms involving :math:`v_{-1}` or :math:`v_{n-1}` being
+        zero. Otherwise, the energy is differentiated automatically.
+
+        Parameters
+        ----------
+        path : array-like, shape=[..., n_times, *point_shape]
+            Piecewise linear path.
+
+        Returns
+        -------
+        energy_gradient : array-like, shape=[..., n_times, *point_shape]
+            Gradient of the energy with respect to each node of the path.
+        """
+        if not self.closed_form_gradient:
+            return gs.autodiff.value_and_grad(lambda path: gs.sum(self.energy(path)))(
+                path
+            )[1]
+
+        metric = self._space.metric
+        dim = path.shape[-1]
+        delta = 1 / (path.shape[-2] - 1)
+        tangent_vecs = gs.reshape(forward_difference(path, axis=-2), (-1, dim))
+        base_points = gs.reshape(path[..., :-1, :], (-1, dim))
+
+        metric_vecs = gs.einsum(
+            "...ij,...j->...i", metric.metric_matrix(base_points), tangent_vecs
+        )
+        derivative_terms = (
+            delta
+            / 2
+            * gs.einsum(
+                "...ijk,...i,...j->...k",
+                metric.inner_product_derivative_matrix(base_points),
+                tangent_vecs,
+                tangent_vecs,
+            )
+        )
+        metric_vecs = gs.reshape(metric_vecs, path[..., :-1, :].shape)
+        derivative_terms = gs.reshape(derivative_terms, metric_vecs.shape)
+        zeros = gs.zeros_like(metric_vecs[..., :1, :])
+        return gs.concatenate(
+            [derivative_terms - metric_vecs, zeros], axis=-2
+        ) + gs.concatenate([zeros, metric_vecs], axis=-2)
+
 
 class UniformlySampledDiscretePath:
     """A uniformly-sampled discrete path.
@@ -20,7 +20,51 @@ class HyperbolicEmbeddingTestCase(TestCase):
         self.assertAllClose(loss_value, expected_loss, atol=atol)
         self.assertAllClose(loss_grad, expected_grad, atol=atol)
 
+    def test_batch_loss(self, n_points, n_negative, atol):
+        manifold = self.embedding.manifold
+        point = manifold.random_point(n_points)
+        point_context = manifold.random_point(n_points)
+        point_negative = gs.reshape(
+            manifold.random_point(n_points * n_negative),
+            (n_points, n_negative, manifold.dim),
+        )
+
+        loss_value, loss_grad = self.embedding._batch_loss(
+            point, point_context, point_negative
+        )
+
+        expected = [
+            self.embedding.loss(point_, point_context_, point_negative_)
+            for point_, point_context_, point_negative_ in zip(
+                point, point_context, point_negative
+            )
+        ]
+        self.assertAllClose(
+            loss_value, gs.concatenate([value for value, _ in expected]), atol=atol
+        )
+        self.assertAllClose(
+            loss_grad, gs.concatenate([grad for _, grad in expected]), atol=atol
+        )
+
     def test_embed(self, graph, atol):
         embeddings = self.embedding.embed(graph)
         res = self.embedding.manifold.belongs(embeddings, atol)
         self.assertAllEqual(res, gs.ones_like(res))
+
+
+class GraphTestCase(TestCase):
+    def test_random_walk_follows_edges(self, graph, walk_length, n_walks_per_node):
+        walks = graph.random_walk(
+            walk_length=walk_length, n_walks_per_node=n_walks_per_node
+        )
+        self.assertAllEqual(
+            walks.shape, (graph.n_nodes * n_walks_per_node, walk_length + 1)
+        )
+        self.assertAllEqual(
+            walks[:, 0], gs.repeat(gs.arange(graph.n_nodes), n_walks_per_node)
+        )
+
+        for walk in gs.to_numpy(walks):
+            for node, next_node in zip(walk[:-1], walk[1:]):
+                expected = graph.edges[int(node)] or [int(node)]
+                self.assertTrue(int(next_node) in expected)
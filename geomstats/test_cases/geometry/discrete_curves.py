@@ -51,6 +51,20 @@ class DiscreteCurvesStartingAtOriginTestCase(NFoldManifoldTestCase):
             normalize_lengths, gs.ones_like(normalize_lengths), atol=atol
         )
 
+    @pytest.mark.random
+    def test_resample_after_upsampling(self, n_points, atol):
+        """Check that down-sampling an up-sampled curve gives back the curve.
+
+        Up-sampling to 2 * k_sampling_points - 1 points keeps the sampling
+        points of the curve, which are then recovered by linear interpolation.
+        """
+        point = self.data_generator.random_point(n_points)
+        k_sampling_points = self.space.k_sampling_points
+
+        upsampled_point = self.space.resample(point, 2 * k_sampling_points - 1)
+        res = self.space.resample(upsampled_point, k_sampling_points)
+        self.assertAllClose(res, point, atol=atol)
+
 
 class SRVReparametrizationBundleTestCase(FiberBundleTestCase):
     @pytest.mark.random
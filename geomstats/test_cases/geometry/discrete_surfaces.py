@@ -1,6 +1,10 @@
+import pytest
+
 import geomstats.backend as gs
+from geomstats.geometry.discrete_surfaces import DiscreteSurfaces
 from geomstats.test.random import RandomDataGenerator
 from geomstats.test_cases.geometry.manifold import ManifoldTestCase
+from geomstats.test_cases.geometry.riemannian_metric import RiemannianMetricTestCase
 from geomstats.vectorization import get_n_points
 
 
@@ -19,7 +23,7 @@ class SurfacesLocalRandomDataGenerator(RandomDataGenerator):
             gs.concatenate(
                 [
                     gs.zeros(batch_shape + (1, dim)),
-                    gs.random.rand(batch_shape + (dof, dim)),
+                    gs.random.rand(*batch_shape, dof, dim),
                 ],
                 axis=-2,
             )
@@ -45,6 +49,52 @@ class DiscreteSurfacesTestCase(ManifoldTestCase):
         res = self.space.vertex_areas(point)
         self.assertAllClose(res, expected, atol=atol)
 
+    @pytest.mark.random
+    def test_vertex_areas_from_face_areas(self, n_points, atol):
+        """Check vertex areas against the areas of the incident faces.
+
+        Face areas are twice the triangle areas, so that each vertex area
+        is a third of the sum of the areas of its incident faces.
+        """
+        point = self.data_generator.random_point(n_points)
+        incidence = gs.array(
+            [
+                [float(vertex in face) for face in gs.to_numpy(self.space.faces)]
+                for vertex in range(self.space.n_vertices)
+            ]
+        )
+
+        res = self.space.vertex_areas(point)
+        expected = (
+            gs.einsum("vf,...f->...v", incidence, self.space.face_areas(point)) / 3
+        )
+        self.assertAllClose(res, expected, atol=atol)
+
+    @pytest.mark.random
+    def test_laplacian_of_constant_vanishes(self, n_points, atol):
+        """Check that the mesh Laplacian of a constant vector field is zero."""
+        point = self.data_generator.random_point(n_points)
+        constant = gs.ones_like(point) * gs.array([1.0, -2.0, 3.0])
+
+        res = self.space.laplacian(point)(constant)
+        self.assertAllClose(res, gs.zeros_like(point), atol=atol)
+
+    @pytest.mark.random
+    def test_subdivide(self, n_points, atol):
+        """Check that subdivided surfaces keep their vertices and area."""
+        point = self.data_generator.random_point(n_points)
+        subdivided_space = DiscreteSurfaces(self.space.subdivision_faces(), equip=False)
+
+        subdivided_point = self.space.subdivide(point)
+        self.assertAllClose(
+            subdivided_point[..., : self.space.n_vertices, :], point, atol=atol
+        )
+        self.assertAllClose(
+            gs.sum(subdivided_space.face_areas(subdivided_point), axis=-1),
+            gs.sum(self.space.face_areas(point), axis=-1),
+            atol=atol,
+        )
+
     def test_normals(self, point, expected, atol):
         """Test normals.
 
@@ -101,3 +151,23 @@ class DiscreteSurfacesTestCase(ManifoldTestCase):
         """Test faces area."""
         res = self.space.face_areas(point=point)
         self.assertAllClose(res, expected, atol=atol)
+
+
+class ElasticMetricTestCase(RiemannianMetricTestCase):
+    @pytest.mark.random
+    def test_inner_product_gradient(self, n_points, atol):
+        """Check the closed-form gradient of the inner-product against autodiff."""
+        base_point = self.data_generator.random_point()
+        tangent_vec = self.data_generator.random_tangent_vec(
+            self.data_generator.random_point(n_points)
+        )
+
+        res = self.space.metric.inner_product_gradient(tangent_vec, base_point)
+
+        _, expected = gs.autodiff.value_and_grad(
+            lambda other_tangent_vec: self.space.metric.inner_product(
+                tangent_vec, other_tangent_vec, base_point
+            ),
+            point_ndims=2,
+        )(gs.zeros_like(tangent_vec))
+        self.assertAllClose(res, expected, atol=atol)
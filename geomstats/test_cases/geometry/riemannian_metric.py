@@ -177,6 +177,26 @@ class RiemannianMetricTestCase(DistTestCaseMixins, ConnectionTestCase):
         dist_ = self.space.metric.dist(point_a, point_b)
         self.assertAllClose(dist_, log_norm, atol=atol)
 
+    @pytest.mark.random
+    def test_dist_cross_against_dist(self, n_points, atol, tile_size=2):
+        points_a = self.data_generator.random_point(n_points + 1)
+        points_b = self.data_generator.random_point(n_points + 2)
+
+        res = self.space.metric.dist_cross(points_a, points_b, tile_size=tile_size)
+        expected = gs.stack(
+            [self.space.metric.dist(point_a, points_b) for point_a in points_a]
+        )
+        self.assertAllClose(res, expected, atol=atol)
+
+    @pytest.mark.random
+    def test_dist_pairwise_against_dist_cross(self, n_points, atol, tile_size=2):
+        points = self.data_generator.random_point(n_points + 2)
+
+        res = self.space.metric.dist_pairwise(points, tile_size=tile_size)
+        expected = self.space.metric.dist_cross(points, points, tile_size=tile_size)
+        self.assertAllClose(res, expected, atol=atol)
+        self.assertAllClose(res, gs.transpose(res))
+
     def test_diameter(self, points, expected, atol):
         res = self.space.metric.diameter(points)
         self.assertAllClose(res, expected, atol=atol)
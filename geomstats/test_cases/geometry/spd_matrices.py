@@ -1,5 +1,10 @@
+import pytest
+
+from geomstats.cache import BasePointCache
+from geomstats.geometry.spd_matrices import SPDAffineMetric, SPDMatrices
 from geomstats.test_cases.geometry.base import VectorSpaceOpenSetTestCase
 from geomstats.test_cases.geometry.matrices import MatricesMetricTestCase
+from geomstats.test_cases.geometry.riemannian_metric import RiemannianMetricTestCase
 
 
 class SPDMatricesTestCase(VectorSpaceOpenSetTestCase):
@@ -10,3 +15,92 @@ class SPDEuclideanMetricTestCase(MatricesMetricTestCase):
     def test_exp_domain(self, tangent_vec, base_point, expected, atol):
         res = self.space.metric.exp_domain(tangent_vec, base_point)
         self.assertAllClose(res, expected, atol=atol)
+
+
+class SPDAffineMetricTestCase(RiemannianMetricTestCase):
+    def _cached_metric(self, cache_size):
+        space = SPDMatrices(self.space.n, equip=False)
+        space.equip_with_metric(SPDAffineMetric, cache_size=cache_size)
+        return space.metric
+
+    @pytest.mark.random
+    def test_cache_against_no_cache(self, n_points, atol):
+        base_point = self.data_generator.random_point(n_points)
+        point = self.data_generator.random_point(n_points)
+        metric = self.space.metric
+        cached_metric = self._cached_metric(cache_size=4)
+
+        log = metric.log(point, base_point)
+        self.assertAllClose(cached_metric.log(point, base_point), log, atol=atol)
+        self.assertAllClose(
+            cached_metric.exp(log, base_point), metric.exp(log, base_point), atol=atol
+        )
+        self.assertAllClose(
+            cached_metric.inner_product(log, log, base_point),
+            metric.inner_product(log, log, base_point),
+            atol=atol,
+        )
+        self.assertAllClose(
+            cached_metric.parallel_transport(log, base_point, end_point=point),
+            metric.parallel_transport(log, base_point, end_point=point),
+            atol=atol,
+        )
+
+        info = cached_metric.cache.cache_info()
+        self.assertEqual(info.currsize, 1)
+        self.assertTrue(info.hits > 0)
+
+    @pytest.mark.random
+    def test_cache_argument(self, n_points, atol):
+        base_point = self.data_generator.random_point()
+        point = self.data_generator.random_point(n_points)
+        metric = self.space.metric
+        cache = BasePointCache(maxsize=1)
+
+        log = metric.log(point, base_point, cache=cache)
+        self.assertAllClose(log, metric.log(point, base_point), atol=atol)
+        self.assertAllClose(
+            metric.exp(log, base_point, cache=cache),
+            metric.exp(log, base_point),
+            atol=atol,
+        )
+
+        self.assertTrue(metric.cache is None)
+        self.assertEqual(cache.cache_info().currsize, 1)
+        self.assertTrue(cache.cache_info().hits > 0)
+
+    @pytest.mark.random
+    def test_cache_eviction(self, cache_size):
+        base_points = self.data_generator.random_point(cache_size + 1)
+        metric = self.space.metric
+        cached_metric = self._cached_metric(cache_size)
+        for base_point in base_points:
+            cached_metric.inner_product(base_point, base_point, base_point)
+
+        self.assertEqual(len(cached_metric.cache), cache_size)
+        cached_metric.inner_product(base_points[0], base_points[0], base_points[0])
+        self.assertEqual(cached_metric.cache.hits, 0)
+
+        base_point = base_points[-1]
+        self.assertAllClose(
+            cached_metric.inner_product(base_point, base_point, base_point),
+            metric.inner_product(base_point, base_point, base_point),
+        )
+        self.assertTrue(cached_metric.cache.hits > 0)
+
+    @pytest.mark.random
+    def test_cache_invalidate_and_clear(self, cache_size):
+        base_point = self.data_generator.random_point()
+        cached_metric = self._cached_metric(cache_size)
+
+        cached_metric.inner_product(base_point, base_point, base_point)
+        cached_metric.cache.invalidate(base_point)
+        self.assertEqual(len(cached_metric.cache), 0)
+
+        cached_metric.inner_product(base_point, base_point, base_point)
+        cached_metric.cache.clear()
+        self.assertEqual(cached_metric.cache.cache_info(), (0, 0, cache_size, 0))
+
+    def test_cache_size_is_positive(self, cache_size):
+        with pytest.raises(ValueError):
+            self._cached_metric(cache_size)
@@ -0,0 +1,15 @@
+import pytest
+
+import geomstats.backend as gs
+from geomstats.test_cases.geometry.stratified.point_set import PointSetMetricTestCase
+
+
+class BHVMetricTestCase(PointSetMetricTestCase):
+    @pytest.mark.random
+    def test_dist_pairwise_against_dist(self, n_points, atol):
+        points = self.data_generator.random_point(n_points)
+
+        res = self.space.metric.dist_pairwise(points, tile_size=2)
+
+        expected = gs.stack([self.space.metric.dist(point, points) for point in points])
+        self.assertAllClose(res, gs.reshape(expected, res.shape), atol=atol)
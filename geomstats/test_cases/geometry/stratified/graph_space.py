@@ -1,4 +1,7 @@
+import itertools
+
 import pytest
+from scipy.optimize import quadratic_assignment
 
 import geomstats.backend as gs
 from geomstats.test.test_case import TestCase
@@ -93,3 +96,91 @@ class PointToGeodesicAlignerTestCase(TestCase):
         self.test_dist_with_endpoints(
             initial_point, end_point, points, gs.zeros(batch_shape), atol
         )
+
+
+class FAQAlignerTestCase(TestCase):
+    @pytest.mark.random
+    def test_align_against_scipy(self, n_points, shared_base_point, atol):
+        point = self.total_space.random_point(n_points)
+        base_point = self.total_space.random_point(1 if shared_base_point else n_points)
+
+        self.aligner.align(point, base_point)
+
+        base_points = gs.broadcast_to(base_point, point.shape)
+        expected = gs.stack(
+            [
+                gs.array(
+                    quadratic_assignment(
+                        base_point_, point_, options={"maximize": True}
+                    ).col_ind
+                )
+                for point_, base_point_ in zip(point, base_points)
+            ]
+        )
+        self.assertAllEqual(self.aligner.perm_, expected)
+
+    @pytest.mark.random
+    def test_align_in_parallel(self, n_points, atol):
+        point = self.total_space.random_point(n_points)
+        base_point = self.total_space.random_point(n_points)
+
+        expected = self.aligner.align(point, base_point)
+
+        aligner = type(self.aligner)(self.total_space, n_jobs=2, chunk_size=2)
+        res = aligner.align(point, base_point)
+        self.assertAllClose(res, expected, atol=atol)
+
+    @pytest.mark.random
+    def test_align_warm_start_does_not_increase_dist(self, n_points, atol):
+        point = self.total_space.random_point(n_points)
+        base_point = self.total_space.random_point(n_points)
+
+        aligner = type(self.aligner)(self.total_space, warm_start=True)
+        aligned = aligner.align(point, base_point)
+        expected = self.total_space.metric.squared_dist(base_point, aligned)
+
+        res = self.total_space.metric.squared_dist(
+            base_point, aligner.align(point, base_point)
+        )
+        self.assertTrue(gs.all(res <= expected + atol))
+
+    @pytest.mark.random
+    def test_align_warm_start_other_batch_size(self, n_points, atol):
+        point = self.total_space.random_point(n_points + 1)
+        base_point = self.total_space.random_point(n_points + 1)
+
+        aligner = type(self.aligner)(self.total_space, warm_start=True)
+        aligner.align(point[:n_points], base_point[:n_points])
+        res = aligner.align(point, base_point)
+
+        expected = type(self.aligner)(self.total_space).align(point, base_point)
+        self.assertAllClose(res, expected, atol=atol)
+
+
+class ExhaustiveAlignerTestCase(TestCase):
+    @pytest.mark.random
+    def test_align_against_brute_force(self, n_points, atol):
+        point = self.total_space.random_point(n_points)
+        base_point = self.total_space.random_point(n_points)
+
+        res = self.total_space.metric.squared_dist(
+            base_point, self.aligner.align(point, base_point)
+        )
+
+        n_nodes = self.total_space.n_nodes
+        perms = gs.array(list(itertools.permutations(range(n_nodes))))
+        expected = gs.stack(
+            [
+                gs.amin(
+                    self.total_space.metric.squared_dist(
+                        base_point_, self.total_space.group_action(perms, point_)
+                    )
+                )
+                for point_, base_point_ in zip(point, base_point)
+            ]
+        )
+        self.assertAllClose(res, expected, atol=atol)
+
+    def test_max_n_nodes(self, max_n_nodes):
+        with pytest.raises(ValueError):
+            type(self.aligner)(self.total_space, max_n_nodes=max_n_nodes)
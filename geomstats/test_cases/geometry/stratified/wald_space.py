@@ -42,3 +42,30 @@ class WaldGeodesicSolverTestCase(TestCase):
             self.assertTrue(
                 gs.all(geod_points_.equal(geod_points_reversed_, atol=atol))
             )
+
+    @pytest.mark.random
+    def test_discrete_geodesic_against_cold_starts(self, n_points, atol):
+        """Check that warm starting the projections keeps the geodesic."""
+        initial_point = self.data_generator.random_point(n_points)
+        end_point = self.data_generator.random_point(n_points)
+
+        geod_points = self.geodesic_solver.discrete_geodesic(initial_point, end_point)
+
+        metric = self.geodesic_solver._space.metric
+        projection = metric.projection
+        metric.projection = lambda ambient_point, topology, initial_weights=None: (
+            projection(ambient_point, topology)
+        )
+        try:
+            geod_points_cold = self.geodesic_solver.discrete_geodesic(
+                initial_point, end_point
+            )
+        finally:
+            del metric.projection
+
+        if n_points == 1:
+            geod_points = [geod_points]
+            geod_points_cold = [geod_points_cold]
+
+        for geod_points_, geod_points_cold_ in zip(geod_points, geod_points_cold):
+            self.assertTrue(gs.all(geod_points_.equal(geod_points_cold_, atol=atol)))
@@ -0,0 +1,16 @@
+import geomstats.backend as gs
+from geomstats.test.test_case import TestCase
+
+
+class FisherRaoMetricCacheTestCase(TestCase):
+    def test_metric_matrix_cache(self, base_point, atol):
+        expected = self.space.metric.metric_matrix(base_point)
+
+        metric = self.cached_space.metric
+        metric.cache.clear()
+        res = metric.metric_matrix(base_point)
+        res_ = metric.metric_matrix(gs.copy(base_point))
+
+        self.assertAllClose(res, expected, atol=atol)
+        self.assertAllClose(res_, expected, atol=atol)
+        self.assertEqual(metric.cache.cache_info()[:2], (1, 1))
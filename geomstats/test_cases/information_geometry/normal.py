@@ -33,6 +33,14 @@ class UnivariateNormalMetricTestCase(PullbackDiffeoMetricTestCase):
         expected = univariate_fisher_rao_dist(point_a, point_b)
         self.assertAllClose(res, expected, atol=atol)
 
+    @pytest.mark.random
+    def test_dist_pairwise_against_closed_form(self, n_points, atol):
+        points = self.data_generator.random_point(n_points + 2)
+
+        res = self.space.metric.dist_pairwise(points, tile_size=2)
+        expected = univariate_fisher_rao_dist(points[:, None], points[None, :])
+        self.assertAllClose(res, expected, atol=atol)
+
     @pytest.mark.random
     def test_sectional_curvature_value(self, n_points, atol):
         base_point = self.data_generator.random_point(n_points)
@@ -2,7 +2,7 @@ import pytest
 
 import geomstats.backend as gs
 from geomstats.geometry.discrete_curves import SRVMetric
-from geomstats.learning.frechet_mean import GradientDescent, variance
+from geomstats.learning.frechet_mean import FrechetMean, GradientDescent, variance
 from geomstats.test.random import RandomDataGenerator
 from geomstats.test.test_case import TestCase
 from geomstats.test_cases.learning._base import (
@@ -107,3 +107,61 @@ class BatchGradientDescentTestCase(TestCase):
         res = self.batch_optimizer.minimize(self.space, rep_points)
 
         self.assertAllClose(res, repeat_point(res_single, n_reps), atol)
+
+
+class SturmMeanTestCase(TestCase):
+    @pytest.mark.random
+    def test_weighted_mean_two_points(self, atol):
+        space = self.estimator.space
+        X = space.random_point(2)
+        weights = gs.random.rand(2)
+
+        mean = self.estimator.fit(X, weights=weights).estimate_
+
+        expected = space.metric.geodesic(X[0], X[1])(
+            float(weights[1] / gs.sum(weights))
+        )[0]
+        self.assertTrue(mean.equal(expected, atol=atol))
+
+
+class GroupFrechetMeanTestCase(TestCase):
+    def setup_method(self):
+        if not hasattr(self, "data_generator"):
+            self.data_generator = RandomDataGenerator(self.estimator.space)
+
+    @pytest.mark.random
+    def test_against_frechet_mean(self, n_points, n_groups, atol):
+        X = self.data_generator.random_point(n_points * n_groups)
+        groups = gs.arange(n_points * n_groups) % n_groups
+
+        res = self.estimator.fit(X, groups=groups).estimate_
+
+        mean_estimator = FrechetMean(self.estimator.space)
+        expected = gs.stack(
+            [
+                mean_estimator.fit(X[groups == group]).estimate_
+                for group in range(n_groups)
+            ]
+        )
+        self.assertAllClose(res, expected, atol=atol)
+
+    @pytest.mark.random
+    def test_fit_without_groups_against_frechet_mean(self, n_points, atol):
+        X = self.data_generator.random_point(n_points)
+
+        res = self.estimator.fit(X).estimate_
+
+        expected = FrechetMean(self.estimator.space).fit(X).estimate_
+        self.assertAllClose(res, gs.expand_dims(expected, axis=0), atol=atol)
+
+    @pytest.mark.random
+    def test_mask_against_groups(self, n_points, n_groups, atol):
+        X = self.data_generator.random_point(n_points * n_groups)
+        groups = gs.arange(n_points * n_groups) % n_groups
+        X_padded = gs.reshape(X, (n_points, n_groups) + self.estimator.space.shape)
+        X_padded = gs.moveaxis(X_padded, 0, 1)
+        mask = gs.ones((n_groups, n_points), dtype=bool)
+
+        res = self.estimator.fit(X_padded, mask=mask).estimate_
+        expected = self.estimator.fit(X, groups=groups).estimate_
+        self.assertAllClose(res, expected, atol=atol)
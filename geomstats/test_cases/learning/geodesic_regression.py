@@ -85,3 +85,64 @@ class GeodesicRegressionTestCase(BaseEstimatorTestCase):
 
         score = self.estimator.score(X, y)
         self.assertTrue(gs.isclose(score, 1.0, atol=atol), msg=f"score: {score}")
+
+
+class BatchedGeodesicRegressionTestCase(GeodesicRegressionTestCase):
+    def _random_datasets(self, n_models, n_samples):
+        X, y = zip(
+            *[self.data_generator.random_dataset(n_samples) for _ in range(n_models)]
+        )
+        return gs.stack(X), gs.stack(y)
+
+    @pytest.mark.random
+    def test_loss_grad_against_finite_differences(self, n_models, n_samples, atol):
+        """Test the Riemannian gradient against a directional derivative.
+
+        The intercept moves along a geodesic, while the coefficient is
+        parallel transported along it.
+        """
+        metric = self.estimator.space.metric
+        X, y = self._random_datasets(n_models, n_samples)
+        models = gs.arange(n_models)
+
+        intercept = self.data_generator.random_point(n_models)
+        coef = self.data_generator.random_tangent_vec(intercept)
+        direction_intercept = self.data_generator.random_tangent_vec(intercept)
+        direction_coef = self.data_generator.random_tangent_vec(intercept)
+
+        def loss_along(time):
+            intercept_ = metric.exp(time * direction_intercept, intercept)
+            coef_ = metric.parallel_transport(
+                coef + time * direction_coef, intercept, time * direction_intercept
+            )
+            param = gs.stack([intercept_, coef_], axis=1)
+            return self.estimator._batched_loss(X, y, param, None, models)
+
+        step = 1e-6
+        expected = (loss_along(step) - loss_along(-step)) / (2 * step)
+
+        param = gs.stack([intercept, coef], axis=1)
+        grad = self.estimator._batched_loss_grad(X, y, param, None, models)
+        res = metric.inner_product(
+            grad[:, 0], direction_intercept, intercept
+        ) + metric.inner_product(grad[:, 1], direction_coef, intercept)
+        self.assertAllClose(res, expected, atol=atol)
+
+    @pytest.mark.random
+    def test_batched_predict_and_score(self, n_models, n_samples, atol):
+        X, y = self._random_datasets(n_models, n_samples)
+
+        self.estimator.fit(X, y)
+
+        space = self.estimator.space
+        self.assertTrue(gs.all(space.belongs(self.estimator.intercept_, atol=atol)))
+        self.assertTrue(
+            gs.all(
+                space.is_tangent(
+                    self.estimator.coef_, self.estimator.intercept_, atol=atol
+                )
+            )
+        )
+
+        score = self.estimator.score(X, y)
+        self.assertAllClose(score, gs.ones(n_models), atol=atol)
@@ -1,6 +1,8 @@
 import pytest
+from sklearn.base import clone
 
 import geomstats.backend as gs
+from geomstats.learning.frechet_mean import FrechetMean
 from geomstats.test_cases.learning._base import BaseEstimatorTestCase
 
 
@@ -23,3 +25,107 @@ class AgainstFrechetMeanTestCase(BaseEstimatorTestCase):
         res = self.estimator.fit(X).cluster_centers_[0]
         res_ = self.other_estimator.fit(X).estimate_
         self.assertAllClose(res, res_, atol=atol)
+
+
+class RiemannianKMeansMiniBatchTestCase(BaseEstimatorTestCase):
+    @pytest.mark.random
+    def test_mini_batch_update_count_weighted_step(self, n_samples, atol):
+        space = self.estimator.space
+        n_clusters = self.estimator.n_clusters
+        X = self.data_generator.random_point(n_samples)
+        cluster_centers = self.data_generator.random_point(n_clusters)
+        labels = gs.argmin(space.metric.dist_cross(X, cluster_centers), 1)
+
+        estimator = clone(self.estimator)
+        previous_counts = gs.cast(gs.random.randint(1, 10, (n_clusters,)), X.dtype)
+        estimator.counts_ = gs.copy(previous_counts)
+        res = estimator._update_cluster_centers(
+            X, labels, cluster_centers, mini_batch=True
+        )
+
+        for index in range(n_clusters):
+            fold = X[labels == index]
+            if fold.shape[0] == 0:
+                self.assertAllClose(res[index], cluster_centers[index], atol=atol)
+                continue
+
+            mean = FrechetMean(space).fit(fold).estimate_
+            step_size = fold.shape[0] / (previous_counts[index] + fold.shape[0])
+            dist = space.metric.dist(cluster_centers[index], mean)
+            self.assertAllClose(
+                space.metric.dist(cluster_centers[index], res[index]),
+                step_size * dist,
+                atol=atol,
+            )
+            self.assertAllClose(
+                space.metric.dist(res[index], mean), (1 - step_size) * dist, atol=atol
+            )
+
+        self.assertAllClose(
+            gs.sum(estimator.counts_), gs.sum(previous_counts) + n_samples
+        )
+
+    @pytest.mark.random
+    def test_fit_without_batch_size_against_full_batch_step(self, n_samples, atol):
+        space = self.estimator.space
+        n_clusters = self.estimator.n_clusters
+        X = self.data_generator.random_point(n_samples)
+        init = X[:n_clusters]
+
+        estimator = clone(self.estimator).set_params(
+            init=init, batch_size=None, max_iter=1
+        )
+        estimator.fit(X)
+
+        labels = gs.argmin(space.metric.dist_cross(X, init), 1)
+        expected = gs.stack(
+            [
+                FrechetMean(space).fit(X[labels == index]).estimate_
+                for index in range(n_clusters)
+            ]
+        )
+        self.assertAllClose(estimator.cluster_centers_, expected, atol=atol)
+        self.assertAllClose(
+            estimator.counts_,
+            gs.sum(gs.cast(gs.one_hot(labels, n_clusters), X.dtype), axis=0),
+        )
+
+
+class MiniBatchRiemannianKMeansTestCase(BaseEstimatorTestCase):
+    def _update_against_cluster_means(self, chunk, cluster_centers, counts):
+        dists = self.estimator.space.metric.dist_cross(chunk, cluster_centers)
+        labels = gs.argmin(dists, 1)
+
+        new_cluster_centers = []
+        new_counts = []
+        for index, cluster_center in enumerate(cluster_centers):
+            fold = chunk[labels == index]
+            count = counts[index] + fold.shape[0]
+            if fold.shape[0] > 0:
+                mean = FrechetMean(self.estimator.space).fit(fold).estimate_
+                step_size = fold.shape[0] / count
+                cluster_center = self.estimator.space.metric.geodesic(
+                    initial_point=cluster_center, end_point=mean
+                )(step_size)[0]
+            new_cluster_centers.append(cluster_center)
+            new_counts.append(count)
+
+        return gs.stack(new_cluster_centers), new_counts
+
+    @pytest.mark.random
+    def test_fit_chunks_against_cluster_means(self, n_samples, n_chunks, atol):
+        chunks = [self.data_generator.random_point(n_samples) for _ in range(n_chunks)]
+        init = self.data_generator.random_point(self.estimator.n_clusters)
+
+        estimator = clone(self.estimator).set_params(init=init)
+        res = estimator.fit(chunk for chunk in chunks)
+
+        cluster_centers = init
+        counts = [0] * self.estimator.n_clusters
+        for chunk in chunks:
+            cluster_centers, counts = self._update_against_cluster_means(
+                chunk, cluster_centers, counts
+            )
+
+        self.assertAllClose(res.cluster_centers_, cluster_centers, atol=atol)
+        self.assertAllClose(res.counts_, gs.array(counts, dtype=res.counts_.dtype))
@@ -1,3 +1,4 @@
+from geomstats.learning.frechet_mean import FrechetMean
 from geomstats.test_cases.learning._base import BaseEstimatorTestCase
 
 
@@ -6,6 +7,13 @@ class RiemannianMinimumDistanceToMeanTestCase(BaseEstimatorTestCase):
         mean_estimates = self.estimator.fit(X_train, y_train).mean_estimates_
         self.assertAllClose(mean_estimates, expected, atol=atol)
 
+    def test_fit_with_frechet_mean(self, X_train, y_train, expected, atol):
+        estimator = type(self.estimator)(self.estimator.space)
+        estimator.mean_estimator = FrechetMean(self.estimator.space)
+
+        mean_estimates = estimator.fit(X_train, y_train).mean_estimates_
+        self.assertAllClose(mean_estimates, expected, atol=atol)
+
     def test_predict(self, X_train, y_train, X_test, y_test, atol):
         self.estimator.fit(X_train, y_train)
 
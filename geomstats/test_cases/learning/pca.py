@@ -1,6 +1,7 @@
 import pytest
 
 import geomstats.backend as gs
+from geomstats.geometry.spd_matrices import SPDAffineMetric
 from geomstats.test_cases.learning._base import BaseEstimatorTestCase
 
 
@@ -66,3 +67,86 @@ class TangentPCATestCase(BaseEstimatorTestCase):
         self.assertEqual(self.estimator.n_features_, gs.shape(X)[1])
 
         self.estimator.n_components = n_components_0
+
+    @pytest.mark.random
+    def test_svd_solvers(self, n_samples, atol):
+        """Check the truncated SVD solvers against the full SVD."""
+        X = self.data_generator.random_point(n_samples)
+        space = self.estimator.space
+
+        estimator = type(self.estimator)(space, n_components=2).fit(X)
+        for svd_solver in ("randomized", "arpack"):
+            estimator_ = type(self.estimator)(
+                space, n_components=2, svd_solver=svd_solver, random_state=0
+            ).fit(X, base_point=estimator.base_point_)
+
+            self.assertAllClose(
+                estimator_.explained_variance_,
+                estimator.explained_variance_,
+                atol=atol,
+            )
+            self.assertAllClose(
+                gs.abs(estimator_.components_),
+                gs.abs(estimator.components_),
+                atol=atol,
+            )
+
+    @pytest.mark.random
+    def test_partial_fit(self, n_samples, n_chunks, atol):
+        """Check fitting by chunks against fitting all the data at once."""
+        X = self.data_generator.random_point(n_samples)
+        space = self.estimator.space
+
+        estimator = type(self.estimator)(space, n_components=2).fit(X)
+        estimator_ = type(self.estimator)(space)
+        chunk_size = n_samples // n_chunks
+        for start in range(0, n_samples, chunk_size):
+            estimator_.partial_fit(
+                X[start : start + chunk_size], base_point=estimator.base_point_
+            )
+
+        self.assertEqual(estimator_.n_samples_seen_, n_samples)
+        self.assertAllClose(estimator_.mean_, estimator.mean_, atol=atol)
+        self.assertAllClose(
+            estimator_.explained_variance_[:2],
+            estimator.explained_variance_,
+            atol=atol,
+        )
+        self.assertAllClose(
+            gs.abs(estimator_.components_[:2]),
+            gs.abs(estimator.components_),
+            atol=atol,
+        )
+
+    @pytest.mark.random
+    def test_transform_chunks(self, n_samples, atol):
+        """Check transforms of iterators of chunks against whole data."""
+        X = self.data_generator.random_point(n_samples)
+        chunks = [X[: n_samples // 2], X[n_samples // 2 :]]
+
+        X_new = self.estimator.fit(X).transform(X)
+        res = self.estimator.transform(iter(chunks))
+        self.assertAllClose(gs.concatenate(list(res)), X_new, atol=atol)
+
+        X_original = self.estimator.inverse_transform(X_new)
+        res = self.estimator.inverse_transform(
+            iter([X_new[: n_samples // 2], X_new[n_samples // 2 :]])
+        )
+        self.assertAllClose(gs.concatenate(list(res)), X_original, atol=atol)
+
+    @pytest.mark.random
+    def test_transform_chunks_base_point_cache(self, n_samples):
+        """Check that only SPD affine metrics are passed the cache of the PCA."""
+        X = self.data_generator.random_point(n_samples)
+        geometry = self.estimator._geometry
+        cache = getattr(geometry, "cache", None)
+
+        self.estimator.fit(X)
+        list(self.estimator.transform(iter([X[: n_samples // 2], X[n_samples // 2 :]])))
+
+        self.assertTrue(getattr(geometry, "cache", None) is cache)
+        hits = self.estimator._cache.cache_info().hits
+        if isinstance(geometry, SPDAffineMetric) and cache is None:
+            self.assertTrue(hits > 0)
+        else:
+            self.assertEqual(hits, 0)
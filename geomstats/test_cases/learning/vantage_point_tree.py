@@ -0,0 +1,44 @@
+import pytest
+
+import geomstats.backend as gs
+from geomstats.test.random import RandomDataGenerator
+from geomstats.test.test_case import TestCase
+
+
+class VantagePointTreeTestCase(TestCase):
+    def setup_method(self):
+        if not hasattr(self, "data_generator"):
+            self.data_generator = RandomDataGenerator(self.space)
+
+    def _brute_force_dists(self, n_points, n_queries):
+        X = self.data_generator.random_point(n_points)
+        queries = self.data_generator.random_point(n_queries)
+        return X, queries, self.space.metric.dist_cross(queries, X)
+
+    @pytest.mark.random
+    def test_query_against_brute_force(self, n_points, n_queries, k, atol):
+        X, queries, dists = self._brute_force_dists(n_points, n_queries)
+
+        res_dists, res_indices = self.index.fit(X).query(queries, k=k)
+
+        expected_dists = gs.sort(dists, axis=1)[:, :k]
+        self.assertAllClose(res_dists, expected_dists, atol=atol)
+        self.assertAllClose(
+            gs.stack([dists_[indices] for dists_, indices in zip(dists, res_indices)]),
+            expected_dists,
+            atol=atol,
+        )
+
+    @pytest.mark.random
+    def test_query_radius_against_brute_force(self, n_points, n_queries, atol):
+        X, queries, dists = self._brute_force_dists(n_points, n_queries)
+        radius = gs.mean(dists)
+
+        res_dists, res_indices = self.index.fit(X).query_radius(
+            queries, radius, sort_results=True
+        )
+
+        for dists_, res_dists_, res_indices_ in zip(dists, res_dists, res_indices):
+            expected_indices = gs.where(dists_ <= radius)[0]
+            self.assertAllEqual(gs.sort(res_indices_), expected_indices)
+            self.assertAllClose(res_dists_, gs.sort(dists_[expected_indices]), atol)
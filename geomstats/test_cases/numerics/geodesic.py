@@ -147,6 +147,25 @@ class LogSolverAgainstMetricTestCase(_SolverTestCase):
         self.assertAllClose(res, res_, atol=atol)
 
 
+class LogSolverWarmStartTestCase(_SolverTestCase):
+    """Log solver with warm starts against equipped space test case."""
+
+    @pytest.mark.random
+    def test_log_nearby_points(self, n_points, atol):
+        base_point = self.data_generator.random_point()
+        end_point = self.data_generator.random_point()
+        time = gs.linspace(0.5, 1.0, n_points)
+        end_points = self.space.metric.geodesic(base_point, end_point=end_point)(time)
+
+        res_ = self.log_solver.log(end_points, base_point)
+        res = self.space.metric.log(end_points, base_point)
+        self.assertAllClose(res, res_, atol=atol)
+
+        success = self.log_solver.diagnostics_.success
+        self.assertAllEqual(gs.shape(success), (n_points,))
+        self.assertTrue(gs.all(success))
+
+
 class LogSolverComparisonTestCase(_SolverTestCase):
     """Log solver against log solver test case."""
 
@@ -1,4 +1,19 @@
+import pytest
+
+import geomstats.datasets._base
 from geomstats.test.conf import (
     pytest_collection_modifyitems,
     pytest_make_parametrize_id,
 )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def data_home(tmp_path_factory):
+    """Build the caches of datasets in a temporary data home."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            geomstats.datasets._base,
+            "DEFAULT_DATA_DIR",
+            str(tmp_path_factory.mktemp("geomstats_data")),
+        )
+        yield
@@ -1,5 +1,5 @@
 import geomstats.backend as gs
-from geomstats.datasets.utils import load_karate_graph
+from geomstats.datasets.utils import load_karate_graph, load_random_graph
 from geomstats.test.data import TestData
 
 
@@ -30,6 +30,10 @@ class HyperbolicEmbeddingTestData(TestData):
         ]
         return self.generate_tests(data)
 
+    def batch_loss_test_data(self):
+        data = [dict(n_points=5, n_negative=3)]
+        return self.generate_tests(data)
+
     def embed_test_data(self):
         data = [
             dict(
@@ -37,3 +41,25 @@ class HyperbolicEmbeddingTestData(TestData):
             )
         ]
         return self.generate_tests(data)
+
+
+def _isolate_node(graph, node):
+    graph.edges = {
+        index: [] if index == node else [k for k in edges if k != node]
+        for index, edges in graph.edges.items()
+    }
+    return graph
+
+
+class GraphTestData(TestData):
+    def random_walk_follows_edges_test_data(self):
+        data = [
+            dict(graph=load_karate_graph(), walk_length=5, n_walks_per_node=3),
+            dict(graph=load_random_graph(), walk_length=3, n_walks_per_node=2),
+            dict(
+                graph=_isolate_node(load_karate_graph(), 33),
+                walk_length=10,
+                n_walks_per_node=2,
+            ),
+        ]
+        return self.generate_tests(data)
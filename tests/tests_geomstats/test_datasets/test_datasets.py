@@ -1,5 +1,10 @@
+import os
+
+import numpy as np
+
 import geomstats.backend as gs
 import geomstats.datasets.utils as data_utils
+from geomstats.datasets._base import _fetch_cached
 from geomstats.geometry.euclidean import Euclidean
 from geomstats.geometry.hypersphere import Hypersphere
 from geomstats.geometry.landmarks import Landmarks
@@ -197,3 +202,44 @@ class TestDatasets(TestCase):
         vertices, faces = data_utils.load_cube()
         assert vertices.shape == (8, 3)
         assert faces.shape == (12, 3)
+
+    def test_load_dataset_chunks(self, tmp_path):
+        """Test that chunks of cells cover the dataset."""
+        arrays = data_utils.load_dataset("cells", data_home=tmp_path)
+        self.assertFalse(isinstance(arrays["points"], np.memmap))
+        self.assertTrue(arrays["points"].flags.writeable)
+
+        arrays = data_utils.load_dataset("cells", mmap_mode="r", data_home=tmp_path)
+        self.assertTrue(isinstance(arrays["points"], np.memmap))
+
+        chunks = list(data_utils.load_dataset("cells", chunks=300, data_home=tmp_path))
+        self.assertAllClose([len(chunk["starts"]) for chunk in chunks], [300, 300, 50])
+        self.assertAllClose(
+            np.concatenate([chunk["ends"] for chunk in chunks]), arrays["ends"]
+        )
+
+    def test_fetch_cached_invalidation(self, tmp_path):
+        """Test that the cache is rebuilt when the source changes."""
+        source = tmp_path / "source.txt"
+        source.write_text("1 2 3")
+        n_parses = []
+
+        def parse():
+            n_parses.append(1)
+            return {"data": np.loadtxt(source)}
+
+        for _ in range(2):
+            arrays = _fetch_cached("test", [source], parse, data_home=tmp_path)
+        self.assertEqual(len(n_parses), 1)
+
+        source.write_text("1 2 4 5")
+        arrays = _fetch_cached("test", [source], parse, data_home=tmp_path)
+        self.assertEqual(len(n_parses), 2)
+        self.assertAllClose(arrays["data"], np.array([1.0, 2.0, 4.0, 5.0]))
+
+        source.write_text("1 2 4 6")
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        arrays = _fetch_cached("test", [source], parse, data_home=tmp_path)
+        self.assertEqual(len(n_parses), 3)
+        self.assertAllClose(arrays["data"], np.array([1.0, 2.0, 4.0, 6.0]))
@@ -1,8 +1,15 @@
 from geomstats.datasets.prepare_graph_data import HyperbolicEmbedding
 from geomstats.test.parametrizers import DataBasedParametrizer
-from geomstats.test_cases.datasets.prepare_graph_data import HyperbolicEmbeddingTestCase
+from geomstats.test_cases.datasets.prepare_graph_data import (
+    GraphTestCase,
+    HyperbolicEmbeddingTestCase,
+)
 
-from .data.prepare_graph_data import HyperbolicEmbeddingTestData
+from .data.prepare_graph_data import GraphTestData, HyperbolicEmbeddingTestData
+
+
+class TestGraph(GraphTestCase, metaclass=DataBasedParametrizer):
+    testing_data = GraphTestData()
 
 
 class TestHyperbolicEmbedding(
@@ -24,6 +24,9 @@ class DiscreteCurvesStartingAtOriginTestData(NFoldManifoldTestData):
     def normalize_is_unit_length_test_data(self):
         return self.generate_random_data()
 
+    def resample_after_upsampling_test_data(self):
+        return self.generate_random_data()
+
 
 class L2CurvesMetricTestData(RiemannianMetricTestData):
     fail_for_not_implemented_errors = False
@@ -92,6 +95,20 @@ class AlignerCmpTestData(TestData):
         return self.generate_tests(data)
 
 
+class DynamicProgrammingAlignerTestData(TestData):
+    N_RANDOM_POINTS = [2, 5]
+    trials = 1
+
+    def align_precomputed_against_align_test_data(self):
+        return self.generate_random_data()
+
+    def align_precomputed_cache_test_data(self):
+        return self.generate_random_data()
+
+    def quotient_dist_pairwise_against_dist_test_data(self):
+        return self.generate_random_data()
+
+
 class SRVRotationBundleTestData(TestData):
     def align_test_data(self):
         return self.generate_random_data()
@@ -14,6 +14,15 @@ class DiscreteSurfacesTestData(ManifoldTestData):
         "to_tangent_vec",
     )
 
+    def vertex_areas_from_face_areas_test_data(self):
+        return self.generate_random_data()
+
+    def laplacian_of_constant_vanishes_test_data(self):
+        return self.generate_random_data()
+
+    def subdivide_test_data(self):
+        return self.generate_random_data()
+
 
 class DiscreteSurfacesSmokeTestData(TestData):
     vertices, _ = data_utils.load_cube()
@@ -105,3 +114,6 @@ class ElasticMetricTestData(TestData):
 
     def inner_product_is_symmetric_test_data(self):
         return self.generate_random_data()
+
+    def inner_product_gradient_test_data(self):
+        return self.generate_random_data()
@@ -41,3 +41,9 @@ class HyperboloidMetricTestData(RiemannianMetricTestData):
 
     def inner_product_is_minkowski_inner_product_test_data(self):
         return self.generate_random_data()
+
+    def dist_cross_against_dist_test_data(self):
+        return self.generate_random_data()
+
+    def dist_pairwise_against_dist_cross_test_data(self):
+        return self.generate_random_data()
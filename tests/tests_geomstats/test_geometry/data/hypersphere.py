@@ -162,6 +162,12 @@ class HypersphereExtrinsicMetricTestData(RiemannianMetricTestData):
     def sectional_curvature_is_one_test_data(self):
         return self.generate_random_data()
 
+    def dist_cross_against_dist_test_data(self):
+        return self.generate_random_data()
+
+    def dist_pairwise_against_dist_cross_test_data(self):
+        return self.generate_random_data()
+
 
 class Hypersphere2IntrinsicMetricTestData(TestData):
     fail_for_autodiff_exceptions = False
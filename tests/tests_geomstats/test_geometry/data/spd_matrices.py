@@ -270,6 +270,27 @@ class SPDAffineMetricTestData(RiemannianMetricTestData):
     fail_for_autodiff_exceptions = False
     fail_for_not_implemented_errors = False
 
+    def dist_cross_against_dist_test_data(self):
+        return self.generate_random_data()
+
+    def dist_pairwise_against_dist_cross_test_data(self):
+        return self.generate_random_data()
+
+    def cache_against_no_cache_test_data(self):
+        return self.generate_random_data()
+
+    def cache_argument_test_data(self):
+        return self.generate_random_data()
+
+    def cache_eviction_test_data(self):
+        return self.generate_tests([dict(cache_size=2)])
+
+    def cache_invalidate_and_clear_test_data(self):
+        return self.generate_tests([dict(cache_size=2)])
+
+    def cache_size_is_positive_test_data(self):
+        return self.generate_tests([dict(cache_size=0)])
+
 
 class SPD2AffineMetricTestData(TestData):
     def exp_test_data(self):
@@ -448,6 +469,12 @@ class SPDLogEuclideanMetricTestData(PullbackDiffeoMetricTestData):
     fail_for_autodiff_exceptions = False
     fail_for_not_implemented_errors = False
 
+    def dist_cross_against_dist_test_data(self):
+        return self.generate_random_data()
+
+    def dist_pairwise_against_dist_cross_test_data(self):
+        return self.generate_random_data()
+
 
 class SPD2LogEuclideanMetricTestData(TestData):
     def exp_test_data(self):
@@ -1,4 +1,6 @@
+import os
 import random
+import tempfile
 
 import pytest
 
@@ -42,6 +44,7 @@ from .data.diffeo import (
 from .data.discrete_curves import (
     AlignerCmpTestData,
     DiscreteCurvesStartingAtOriginTestData,
+    DynamicProgrammingAlignerTestData,
     ElasticMetricTestData,
     L2CurvesMetricTestData,
     SRVMetricTestData,
@@ -221,6 +224,82 @@ class TestAlignerCmp(TestCase, metaclass=DataBasedParametrizer):
         self.assertAllClose(aligned, other_aligned, atol=atol)
 
 
+class TestDynamicProgrammingAligner(TestCase, metaclass=DataBasedParametrizer):
+    _k_sampling_points = random.randint(5, 10)
+
+    total_space = DiscreteCurvesStartingAtOrigin(k_sampling_points=_k_sampling_points)
+    total_space.equip_with_group_action("reparametrizations")
+    total_space.equip_with_quotient_structure()
+    aligner = total_space.fiber_bundle.aligner = DynamicProgrammingAligner(
+        total_space, n_space_grid=_k_sampling_points, chunk_size=3
+    )
+
+    testing_data = DynamicProgrammingAlignerTestData()
+
+    def _random_curves(self, n_points):
+        sampling_points = gs.linspace(0.0, 1.0, self._k_sampling_points)
+        freqs = gs.random.uniform(0.5, 2.0, size=(n_points, 1))
+        return self.total_space.projection(
+            gs.stack(
+                [gs.cos(freqs * sampling_points), gs.sin(freqs * sampling_points**2)],
+                axis=-1,
+            )
+        )
+
+    def test_align_precomputed_against_align(self, n_points, atol):
+        point = self._random_curves(n_points)
+        base_point = self._random_curves(n_points)
+
+        aligned, sdists = self.aligner.align_precomputed(
+            self.aligner.precompute(point),
+            self.aligner.precompute(base_point),
+            return_sdist=True,
+        )
+        expected = [
+            self.aligner.align(point_, base_point_, return_sdist=True)
+            for point_, base_point_ in zip(point, base_point)
+        ]
+
+        self.assertAllClose(aligned, gs.stack([out[0] for out in expected]), atol=atol)
+        self.assertAllClose(sdists, gs.stack([out[1] for out in expected]), atol=atol)
+
+    def test_align_precomputed_cache(self, n_points, atol):
+        point = self.aligner.precompute(self._random_curves(n_points))
+        base_point = self.aligner.precompute(self._random_curves(n_points))
+        expected = self.aligner.align_precomputed(point, base_point)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            aligner = DynamicProgrammingAligner(
+                self.total_space,
+                n_space_grid=self._k_sampling_points,
+                cache_dir=cache_dir,
+            )
+            aligner.align_precomputed(point, base_point)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            aligned = aligner.align_precomputed(point, base_point)
+
+        self.assertAllClose(aligned, expected, atol=atol)
+
+    def test_quotient_dist_pairwise_against_dist(self, n_points, atol):
+        points = self._random_curves(n_points)
+        metric = self.total_space.quotient.metric
+
+        dist = metric.dist_pairwise(points, tile_size=2)
+        expected = gs.stack(
+            [
+                gs.stack(
+                    [
+                        metric.dist(points[min(i, j)], points[max(i, j)])
+                        for j in range(n_points)
+                    ]
+                )
+                for i in range(n_points)
+            ]
+        )
+
+        self.assertAllClose(dist, expected, atol=atol)
+
+
 class TestSRVRotationBundle(TestCase, metaclass=DataBasedParametrizer):
     _ambient_dim = random.randint(2, 3)
     _k_sampling_points = random.randint(5, 10)
@@ -4,12 +4,12 @@ import geomstats.backend as gs
 import geomstats.datasets.utils as data_utils
 from geomstats.geometry.discrete_surfaces import DiscreteSurfaces
 from geomstats.test.parametrizers import DataBasedParametrizer
-from geomstats.test.test_case import pytorch_backend, torch_only
+from geomstats.test.test_case import autodiff_backend, autodiff_only
 from geomstats.test_cases.geometry.discrete_surfaces import (
     DiscreteSurfacesTestCase,
+    ElasticMetricTestCase,
     SurfacesLocalRandomDataGenerator,
 )
-from geomstats.test_cases.geometry.riemannian_metric import RiemannianMetricTestCase
 
 from .data.discrete_surfaces import (
     DiscreteSurfacesSmokeTestData,
@@ -18,7 +18,6 @@ from .data.discrete_surfaces import (
 )
 
 
-@torch_only
 class TestDiscreteSurfaces(DiscreteSurfacesTestCase, metaclass=DataBasedParametrizer):
     vertices, faces = data_utils.load_cube()
     vertices = gs.array(vertices, dtype=gs.float64)
@@ -28,7 +27,6 @@ class TestDiscreteSurfaces(DiscreteSurfacesTestCase, metaclass=DataBasedParametr
     testing_data = DiscreteSurfacesTestData()
 
 
-@torch_only
 @pytest.mark.smoke
 class TestDiscreteSurfacesSmoke(
     DiscreteSurfacesTestCase, metaclass=DataBasedParametrizer
@@ -53,13 +51,13 @@ class TestDiscreteSurfacesSmoke(
     testing_data = DiscreteSurfacesSmokeTestData()
 
 
-@torch_only
-class TestElasticMetric(RiemannianMetricTestCase, metaclass=DataBasedParametrizer):
+@autodiff_only
+class TestElasticMetric(ElasticMetricTestCase, metaclass=DataBasedParametrizer):
     _vertices, _faces = data_utils.load_cube()
     _vertices = gs.array(_vertices, dtype=gs.float64)
     _faces = gs.array(_faces)
 
-    if pytorch_backend():
+    if autodiff_backend():
         space = DiscreteSurfaces(_faces)
 
         space.metric.log_solver.n_nodes = 100
@@ -26,6 +26,7 @@ from geomstats.test_cases.geometry.diffeo import DiffeoTestCase
 from geomstats.test_cases.geometry.pullback_metric import PullbackDiffeoMetricTestCase
 from geomstats.test_cases.geometry.riemannian_metric import RiemannianMetricTestCase
 from geomstats.test_cases.geometry.spd_matrices import (
+    SPDAffineMetricTestCase,
     SPDEuclideanMetricTestCase,
     SPDMatricesTestCase,
 )
@@ -135,7 +136,7 @@ def spd_with_affine_metric(request):
 
 
 @pytest.mark.usefixtures("spd_with_affine_metric")
-class TestSPDAffineMetric(RiemannianMetricTestCase, metaclass=DataBasedParametrizer):
+class TestSPDAffineMetric(SPDAffineMetricTestCase, metaclass=DataBasedParametrizer):
     testing_data = SPDAffineMetricTestData()
 
 
@@ -1,6 +1,15 @@
+import random
+
 from geomstats.geometry.stratified.bhv_space import Split, Tree
 from geomstats.test.data import TestData
 
+from .point_set import PointMetricTestData
+
+
+class BHVMetricTestData(PointMetricTestData):
+    def dist_pairwise_against_dist_test_data(self):
+        return self.generate_tests([dict(n_points=random.randint(2, 5))])
+
 
 class BHVMetric5TestData(TestData):
     def _get_owen_trees(self):
@@ -21,3 +21,30 @@ class PointToGeodesicAlignerTestData(TestData):
 
     def dist_along_geodesic_is_zero_test_data(self):
         return self.generate_random_data()
+
+
+class FAQAlignerTestData(TestData):
+    def align_against_scipy_test_data(self):
+        data = [
+            dict(n_points=n_points, shared_base_point=shared_base_point)
+            for n_points in [2, 5]
+            for shared_base_point in [True, False]
+        ]
+        return self.generate_tests(data)
+
+    def align_in_parallel_test_data(self):
+        return self.generate_tests([dict(n_points=5)])
+
+    def align_warm_start_does_not_increase_dist_test_data(self):
+        return self.generate_tests([dict(n_points=5)])
+
+    def align_warm_start_other_batch_size_test_data(self):
+        return self.generate_tests([dict(n_points=3)])
+
+
+class ExhaustiveAlignerTestData(TestData):
+    def align_against_brute_force_test_data(self):
+        return self.generate_tests([dict(n_points=3)])
+
+    def max_n_nodes_test_data(self):
+        return self.generate_tests([dict(max_n_nodes=2)])
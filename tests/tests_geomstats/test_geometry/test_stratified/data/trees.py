@@ -1,3 +1,5 @@
+import random
+
 from geomstats.geometry.stratified.trees import ForestTopology, Split
 from geomstats.test.data import TestData
 
@@ -83,14 +85,27 @@ class SplitTestData(TestData):
         return self.generate_tests(smoke_data)
 
     def is_compatible_test_data(self):
-        # TODO: add a non compatible example
-
         smoke_data = [
             dict(
                 split_a=Split(part1=[0, 4], part2=[1, 2, 3]),
                 split_b=Split(part1=[2, 3], part2=[0, 1, 4]),
                 expected=True,
             ),
+            dict(
+                split_a=Split(part1=[0, 1], part2=[2, 3]),
+                split_b=Split(part1=[0, 2], part2=[1, 3]),
+                expected=False,
+            ),
+            dict(
+                split_a=Split(part1=[0, 70], part2=[1, 65, 100]),
+                split_b=Split(part1=[0, 65], part2=[1, 70, 100]),
+                expected=False,
+            ),
+            dict(
+                split_a=Split(part1=[0, 70], part2=[1, 65, 100]),
+                split_b=Split(part1=[0, 1, 70], part2=[65, 100]),
+                expected=True,
+            ),
         ]
 
         return self.generate_tests(smoke_data)
@@ -240,3 +255,21 @@ class BaseTopologyTestData(TestData):
         )
 
         return self.generate_tests(smoke_data)
+
+
+class ForestTopologyTestData(TestData):
+    tolerances = {"corr_gradient_against_finite_differences": {"atol": 1e-6}}
+
+    def corr_against_paths_test_data(self):
+        data = [
+            dict(n_labels=random.randint(4, 8), n_components=n_components, n_points=3)
+            for n_components in [1, 2, 3]
+        ]
+        return self.generate_tests(data)
+
+    def corr_gradient_against_finite_differences_test_data(self):
+        data = [
+            dict(n_labels=random.randint(4, 8), n_components=n_components)
+            for n_components in [1, 2, 3]
+        ]
+        return self.generate_tests(data)
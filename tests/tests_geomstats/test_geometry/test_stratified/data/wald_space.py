@@ -80,7 +80,11 @@ class WaldGeodesicSolverTestData(TestData):
 
     tolerances = {
         "discrete_geodesic_reverse": {"atol": 1e-4},
+        "discrete_geodesic_against_cold_starts": {"atol": 1e-4},
     }
 
     def discrete_geodesic_reverse_test_data(self):
         return self.generate_random_data()
+
+    def discrete_geodesic_against_cold_starts_test_data(self):
+        return self.generate_random_data()
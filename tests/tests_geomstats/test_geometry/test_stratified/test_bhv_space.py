@@ -5,14 +5,15 @@ import pytest
 from geomstats.geometry.stratified.bhv_space import TreeSpace
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test.test_case import np_only
+from geomstats.test_cases.geometry.stratified.bhv_space import BHVMetricTestCase
 from geomstats.test_cases.geometry.stratified.point_set import (
     PointSetMetricTestCase,
     PointSetTestCase,
     PointTestCase,
 )
 
-from .data.bhv_space import BHVMetric5TestData
-from .data.point_set import PointMetricTestData, PointSetTestData, PointTestData
+from .data.bhv_space import BHVMetric5TestData, BHVMetricTestData
+from .data.point_set import PointSetTestData, PointTestData
 
 
 class TestTree(PointTestCase, metaclass=DataBasedParametrizer):
@@ -30,11 +31,11 @@ class TestTreeSpace(PointSetTestCase, metaclass=DataBasedParametrizer):
 
 
 @np_only
-class TestBHVMetric(PointSetMetricTestCase, metaclass=DataBasedParametrizer):
+class TestBHVMetric(BHVMetricTestCase, metaclass=DataBasedParametrizer):
     _n_labels = random.randint(4, 5)
     space = TreeSpace(n_labels=_n_labels, equip=True)
 
-    testing_data = PointMetricTestData()
+    testing_data = BHVMetricTestData()
 
 
 @pytest.mark.smoke
@@ -13,8 +13,11 @@ from geomstats.geometry.stratified.graph_space import (
 )
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test.random import RandomDataGenerator
+from geomstats.test.test_case import np_only
 from geomstats.test_cases.geometry.matrices import MatricesTestCase
 from geomstats.test_cases.geometry.stratified.graph_space import (
+    ExhaustiveAlignerTestCase,
+    FAQAlignerTestCase,
     PointToGeodesicAlignerTestCase,
 )
 from geomstats.test_cases.geometry.stratified.quotient import (
@@ -24,7 +27,12 @@ from geomstats.test_cases.geometry.stratified.quotient import (
 )
 
 from ..data.matrices import MatricesTestData
-from .data.graph_space import GraphAlignerCmpTestData, PointToGeodesicAlignerTestData
+from .data.graph_space import (
+    ExhaustiveAlignerTestData,
+    FAQAlignerTestData,
+    GraphAlignerCmpTestData,
+    PointToGeodesicAlignerTestData,
+)
 from .data.quotient import AlignerAlgorithmTestData, QuotientMetricWithArrayTestData
 
 
@@ -66,6 +74,27 @@ class TestGraphAlignerAlgorithmCmp(
     testing_data = GraphAlignerCmpTestData()
 
 
+class TestExhaustiveAligner(ExhaustiveAlignerTestCase, metaclass=DataBasedParametrizer):
+    _n = random.randint(3, 6)
+    total_space = GraphSpace(_n)
+    total_space.equip_with_group_action()
+
+    aligner = ExhaustiveAligner(total_space)
+
+    testing_data = ExhaustiveAlignerTestData()
+
+
+@np_only
+class TestFAQAligner(FAQAlignerTestCase, metaclass=DataBasedParametrizer):
+    _n = random.randint(3, 6)
+    total_space = GraphSpace(_n)
+    total_space.equip_with_group_action()
+
+    aligner = FAQAligner(total_space)
+
+    testing_data = FAQAlignerTestData()
+
+
 @pytest.fixture(
     scope="class",
     params=[
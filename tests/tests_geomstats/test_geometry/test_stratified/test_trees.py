@@ -1,7 +1,17 @@
+import random
+
+import pytest
+
+import geomstats.backend as gs
+from geomstats.geometry.stratified.trees import (
+    ForestTopology,
+    delete_splits,
+    generate_splits,
+)
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test.test_case import TestCase
 
-from .data.trees import BaseTopologyTestData, SplitTestData
+from .data.trees import BaseTopologyTestData, ForestTopologyTestData, SplitTestData
 
 
 class TestSplit(TestCase, metaclass=DataBasedParametrizer):
@@ -57,3 +67,58 @@ class TestBaseTopology(TestCase, metaclass=DataBasedParametrizer):
             st_a != st_b,
         ]
         self.assertEqual(result, expected)
+
+
+class TestForestTopology(TestCase, metaclass=DataBasedParametrizer):
+    testing_data = ForestTopologyTestData()
+
+    @staticmethod
+    def _random_topology(n_labels, n_components):
+        labels = random.sample(range(n_labels), n_labels)
+        partition = [labels[i::n_components] for i in range(n_components)]
+        split_sets = [
+            delete_splits(generate_splits(part), part, p_keep=0.7) for part in partition
+        ]
+        return ForestTopology(partition=partition, split_sets=split_sets)
+
+    @staticmethod
+    def _corr_from_paths(topology, weights):
+        corr = [
+            [float(u == v) for v in range(topology.n_labels)]
+            for u in range(topology.n_labels)
+        ]
+        for path_dict in topology.paths:
+            for (u, v), path in path_dict.items():
+                value = 1.0
+                for split in path:
+                    value *= 1.0 - float(weights[topology.where[split]])
+                corr[u][v] = corr[v][u] = value
+        return gs.array(corr)
+
+    @pytest.mark.random
+    def test_corr_against_paths(self, n_labels, n_components, n_points, atol):
+        topology = self._random_topology(n_labels, n_components)
+        weights = gs.random.uniform(size=(n_points, topology.n_splits))
+
+        result = topology.corr(weights)
+        expected = gs.stack(
+            [self._corr_from_paths(topology, weights_) for weights_ in weights]
+        )
+        self.assertAllClose(result, expected, atol=atol)
+
+    @pytest.mark.random
+    def test_corr_gradient_against_finite_differences(
+        self, n_labels, n_components, atol
+    ):
+        topology = self._random_topology(n_labels, n_components)
+        weights = gs.random.uniform(size=(topology.n_splits,))
+        weights = gs.where(gs.arange(topology.n_splits) % 3 == 0, 1.0, weights)
+
+        step = 1e-6
+        directions = step * gs.eye(topology.n_splits)
+        expected = (
+            topology.corr(weights + directions) - topology.corr(weights - directions)
+        ) / (2 * step)
+
+        result = topology.corr_gradient(weights)
+        self.assertAllClose(result, expected, atol=atol)
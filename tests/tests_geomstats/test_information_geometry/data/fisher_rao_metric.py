@@ -140,3 +140,14 @@ class FisherRaoMetricCmpBetaTestData(TestData):
             ),
         ]
         return self.generate_tests(smoke_data)
+
+
+class FisherRaoMetricCacheTestData(TestData):
+    fail_for_autodiff_exceptions = False
+
+    def metric_matrix_cache_test_data(self):
+        smoke_data = [
+            dict(base_point=gs.array([0.1, 0.8])),
+            dict(base_point=gs.array([[0.1, 0.8], [1.0, 2.0]])),
+        ]
+        return self.generate_tests(smoke_data)
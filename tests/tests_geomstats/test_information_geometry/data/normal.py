@@ -28,6 +28,15 @@ class UnivariateNormalMetricTestData(PullbackDiffeoMetricTestData):
     def dist_against_closed_form_test_data(self):
         return self.generate_random_data()
 
+    def dist_pairwise_against_closed_form_test_data(self):
+        return self.generate_random_data()
+
+    def dist_cross_against_dist_test_data(self):
+        return self.generate_random_data()
+
+    def dist_pairwise_against_dist_cross_test_data(self):
+        return self.generate_random_data()
+
     def sectional_curvature_value_test_data(self):
         return self.generate_random_data()
 
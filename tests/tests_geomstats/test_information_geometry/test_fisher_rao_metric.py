@@ -9,8 +9,12 @@ from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test_cases.geometry.riemannian_metric import (
     RiemannianMetricComparisonTestCase,
 )
+from geomstats.test_cases.information_geometry.fisher_rao_metric import (
+    FisherRaoMetricCacheTestCase,
+)
 
 from .data.fisher_rao_metric import (
+    FisherRaoMetricCacheTestData,
     FisherRaoMetricCmpBetaTestData,
     FisherRaoMetricCmpExponentialTestData,
     FisherRaoMetricCmpGammaTestData,
@@ -68,3 +72,43 @@ class TestFisherRaoCmpBeta(
     other_space = BetaDistributions()
 
     testing_data = FisherRaoMetricCmpBetaTestData()
+
+
+@pytest.mark.smoke
+class TestFisherRaoGaussCmpUnivariateNormal(
+    RiemannianMetricComparisonTestCase, metaclass=DataBasedParametrizer
+):
+    support = (-20, 20)
+    space = UnivariateNormalDistributions(equip=False)
+    space.equip_with_metric(FisherRaoMetric, support=support, quadrature="gauss")
+
+    other_space = UnivariateNormalDistributions()
+
+    testing_data = FisherRaoMetricCmpUnivariateNormalTestData()
+
+
+@pytest.mark.smoke
+class TestFisherRaoGaussCmpExponential(
+    RiemannianMetricComparisonTestCase, metaclass=DataBasedParametrizer
+):
+    support = (0, float("inf"))
+    space = ExponentialDistributions(equip=False)
+    space.equip_with_metric(FisherRaoMetric, support=support, quadrature="gauss")
+
+    other_space = ExponentialDistributions()
+
+    testing_data = FisherRaoMetricCmpExponentialTestData()
+
+
+@pytest.mark.smoke
+class TestFisherRaoCache(FisherRaoMetricCacheTestCase, metaclass=DataBasedParametrizer):
+    support = (-20, 20)
+    space = UnivariateNormalDistributions(equip=False)
+    space.equip_with_metric(FisherRaoMetric, support=support, quadrature="gauss")
+
+    cached_space = UnivariateNormalDistributions(equip=False)
+    cached_space.equip_with_metric(
+        FisherRaoMetric, support=support, quadrature="gauss", cache_size=2
+    )
+
+    testing_data = FisherRaoMetricCacheTestData()
@@ -65,3 +65,23 @@ class BatchGradientDescentTestData(TestData):
         return self.generate_tests(
             [dict(n_points=random.randint(2, 10), n_reps=random.randint(2, 5))]
         )
+
+
+class SturmMeanTestData(TestData):
+    def weighted_mean_two_points_test_data(self):
+        return self.generate_tests([{}])
+
+
+class GroupFrechetMeanTestData(TestData):
+    def against_frechet_mean_test_data(self):
+        return self.generate_tests(
+            [dict(n_points=random.randint(2, 5), n_groups=random.randint(2, 4))]
+        )
+
+    def fit_without_groups_against_frechet_mean_test_data(self):
+        return self.generate_tests([dict(n_points=random.randint(2, 5))])
+
+    def mask_against_groups_test_data(self):
+        return self.generate_tests(
+            [dict(n_points=random.randint(2, 5), n_groups=random.randint(2, 4))]
+        )
@@ -1,3 +1,5 @@
+import random
+
 from ._base import BaseEstimatorTestData
 
 
@@ -15,3 +17,25 @@ class GeodesicRegressionTestData(BaseEstimatorTestData):
 
     def predict_and_score_test_data(self):
         return self.generate_random_data()
+
+
+class BatchedGeodesicRegressionTestData(GeodesicRegressionTestData):
+    tolerances = {
+        "predict_and_score": {"atol": 0.1},
+        "loss_grad_against_finite_differences": {"atol": 1e-4},
+        "batched_predict_and_score": {"atol": 1e-3},
+    }
+
+    def loss_grad_against_finite_differences_test_data(self):
+        return self.generate_tests(
+            [dict(n_models=random.randint(2, 4), n_samples=random.randint(5, 10))]
+        )
+
+    def batched_predict_and_score_test_data(self):
+        return self.generate_tests(
+            [dict(n_models=random.randint(2, 4), n_samples=random.randint(20, 30))]
+        )
+
+
+class BatchedGeodesicRegressionAutodiffTestData(BatchedGeodesicRegressionTestData):
+    skips = ("loss_grad_against_finite_differences",)
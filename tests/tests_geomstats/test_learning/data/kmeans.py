@@ -1,3 +1,5 @@
+import random
+
 from ._base import BaseEstimatorTestData, ClusterMixinsTestData
 
 
@@ -16,6 +18,29 @@ class RiemannianKMeansTestData(ClusterMixinsTestData, BaseEstimatorTestData):
     tolerances = {"n_repeated_clusters": {"atol": 1e-6}}
 
 
+class RiemannianKMeansMiniBatchTestData(RiemannianKMeansTestData):
+    skips = ("n_repeated_clusters",)
+    tolerances = {
+        "mini_batch_update_count_weighted_step": {"atol": 1e-4},
+        "fit_without_batch_size_against_full_batch_step": {"atol": 1e-4},
+    }
+
+    def mini_batch_update_count_weighted_step_test_data(self):
+        return self.generate_random_data()
+
+    def fit_without_batch_size_against_full_batch_step_test_data(self):
+        return self.generate_random_data()
+
+
+class MiniBatchChunksTestData(BaseEstimatorTestData):
+    tolerances = {"fit_chunks_against_cluster_means": {"atol": 1e-4}}
+
+    def fit_chunks_against_cluster_means_test_data(self):
+        return self.generate_tests(
+            [dict(n_samples=random.randint(5, 10), n_chunks=random.randint(2, 5))]
+        )
+
+
 class AgainstFrechetMeanTestData(BaseEstimatorTestData):
     tolerances = {"against_frechet_mean": {"atol": 1e-1}}
 
@@ -35,6 +35,9 @@ class RiemannianMinimumDistanceToMeanSPDTestData(TestData):
         ]
         return self.generate_tests(data)
 
+    def fit_with_frechet_mean_test_data(self):
+        return self.fit_test_data()
+
     def predict_test_data(self):
         data = [
             dict(
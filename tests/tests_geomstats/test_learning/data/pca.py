@@ -19,3 +19,15 @@ class TangentPCATestData(BaseEstimatorTestData):
 
     def n_components_mle_test_data(self):
         return self.generate_random_data()
+
+    def svd_solvers_test_data(self):
+        return self.generate_random_data()
+
+    def partial_fit_test_data(self):
+        return self.generate_tests([dict(n_samples=20, n_chunks=2)])
+
+    def transform_chunks_test_data(self):
+        return self.generate_random_data()
+
+    def transform_chunks_base_point_cache_test_data(self):
+        return self.generate_random_data()
@@ -0,0 +1,21 @@
+import random
+
+from geomstats.test.data import TestData
+
+
+class VantagePointTreeTestData(TestData):
+    def query_against_brute_force_test_data(self):
+        return self.generate_tests(
+            [
+                dict(
+                    n_points=random.randint(20, 50),
+                    n_queries=random.randint(2, 10),
+                    k=random.randint(1, 5),
+                )
+            ]
+        )
+
+    def query_radius_against_brute_force_test_data(self):
+        return self.generate_tests(
+            [dict(n_points=random.randint(20, 50), n_queries=random.randint(2, 10))]
+        )
@@ -13,18 +13,23 @@ from geomstats.geometry.matrices import Matrices
 from geomstats.geometry.minkowski import Minkowski
 from geomstats.geometry.spd_matrices import SPDMatrices
 from geomstats.geometry.special_orthogonal import SpecialOrthogonal
+from geomstats.geometry.stratified.bhv_space import TreeSpace
 from geomstats.learning.frechet_mean import (
     BatchGradientDescent,
     FrechetMean,
     GradientDescent,
+    GroupFrechetMean,
 )
 from geomstats.test.parametrizers import DataBasedParametrizer
+from geomstats.test.test_case import np_only
 from geomstats.test_cases.learning._base import BaseEstimatorTestCase
 from geomstats.test_cases.learning.frechet_mean import (
     BatchGradientDescentTestCase,
     CircularMeanTestCase,
     ElasticMeanTestCase,
     FrechetMeanTestCase,
+    GroupFrechetMeanTestCase,
+    SturmMeanTestCase,
     VarianceTestCase,
 )
 
@@ -33,7 +38,9 @@ from .data.frechet_mean import (
     CircularMeanTestData,
     FrechetMeanSOCoincideTestData,
     FrechetMeanTestData,
+    GroupFrechetMeanTestData,
     LinearMeanEuclideaTestData,
+    SturmMeanTestData,
     VarianceEuclideanTestData,
     VarianceTestData,
 )
@@ -173,3 +180,29 @@ class TestBatchGradientDescent(
     BatchGradientDescentTestCase, metaclass=DataBasedParametrizer
 ):
     testing_data = BatchGradientDescentTestData()
+
+
+@pytest.fixture(
+    scope="class",
+    params=[
+        Hypersphere(dim=random.randint(2, 3)),
+        SPDMatrices(3),
+        Hyperboloid(dim=3),
+        Euclidean(dim=3),
+        DiscreteCurvesStartingAtOrigin(ambient_dim=2, k_sampling_points=5),
+    ],
+)
+def group_frechet_mean_estimators(request):
+    request.cls.estimator = GroupFrechetMean(request.param)
+
+
+@pytest.mark.usefixtures("group_frechet_mean_estimators")
+class TestGroupFrechetMean(GroupFrechetMeanTestCase, metaclass=DataBasedParametrizer):
+    testing_data = GroupFrechetMeanTestData()
+
+
+@np_only
+class TestSturmMean(SturmMeanTestCase, metaclass=DataBasedParametrizer):
+    estimator = FrechetMean(TreeSpace(n_labels=random.randint(4, 6)))
+
+    testing_data = SturmMeanTestData()
@@ -5,13 +5,21 @@ import pytest
 from geomstats.geometry.discrete_curves import DiscreteCurvesStartingAtOrigin
 from geomstats.geometry.euclidean import Euclidean
 from geomstats.geometry.hypersphere import Hypersphere
+from geomstats.geometry.spd_matrices import SPDMatrices
 from geomstats.geometry.special_euclidean import SpecialEuclidean
 from geomstats.learning.geodesic_regression import GeodesicRegression
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test.test_case import autograd_only
-from geomstats.test_cases.learning.geodesic_regression import GeodesicRegressionTestCase
+from geomstats.test_cases.learning.geodesic_regression import (
+    BatchedGeodesicRegressionTestCase,
+    GeodesicRegressionTestCase,
+)
 
-from .data.geodesic_regression import GeodesicRegressionTestData
+from .data.geodesic_regression import (
+    BatchedGeodesicRegressionAutodiffTestData,
+    BatchedGeodesicRegressionTestData,
+    GeodesicRegressionTestData,
+)
 
 # TODO: test loss decreases for `RiemannianGradientDescent`? bring callback
 # TODO: add tests for initialization (keep it simple)
@@ -65,3 +73,49 @@ class TestGeodesicRegressionOnlyAutograd(
     GeodesicRegressionTestCase, metaclass=DataBasedParametrizer
 ):
     testing_data = GeodesicRegressionTestData()
+
+
+@pytest.fixture(
+    scope="class",
+    params=[
+        (Hypersphere(random.randint(3, 5)), None),
+        (Hypersphere(random.randint(3, 5)), 8),
+        (SPDMatrices(3), None),
+        (SpecialEuclidean(n=3), None),
+    ],
+)
+def batched_estimators(request):
+    space, batch_size = request.param
+    request.cls.estimator = GeodesicRegression(
+        space, method="batched", initialization="frechet"
+    ).set(batch_size=batch_size)
+
+
+@pytest.mark.slow
+@pytest.mark.usefixtures("batched_estimators")
+class TestBatchedGeodesicRegression(
+    BatchedGeodesicRegressionTestCase, metaclass=DataBasedParametrizer
+):
+    testing_data = BatchedGeodesicRegressionTestData()
+
+
+@pytest.fixture(
+    scope="class",
+    params=[
+        SpecialEuclidean(n=4),
+    ],
+)
+def batched_autodiff_estimators(request):
+    space = request.param
+    request.cls.estimator = GeodesicRegression(
+        space, method="batched", initialization="frechet"
+    )
+
+
+@autograd_only
+@pytest.mark.slow
+@pytest.mark.usefixtures("batched_autodiff_estimators")
+class TestBatchedGeodesicRegressionAutodiff(
+    BatchedGeodesicRegressionTestCase, metaclass=DataBasedParametrizer
+):
+    testing_data = BatchedGeodesicRegressionAutodiffTestData()
@@ -6,7 +6,7 @@ from geomstats.geometry.euclidean import Euclidean
 from geomstats.geometry.hypersphere import Hypersphere
 from geomstats.geometry.spd_matrices import SPDMatrices
 from geomstats.learning.frechet_mean import FrechetMean
-from geomstats.learning.kmeans import RiemannianKMeans
+from geomstats.learning.kmeans import MiniBatchRiemannianKMeans, RiemannianKMeans
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test_cases.learning._base import (
     BaseEstimatorTestCase,
@@ -15,11 +15,15 @@ from geomstats.test_cases.learning._base import (
 from geomstats.test_cases.learning.kmeans import (
     AgainstFrechetMeanTestCase,
     ClusterInitializationTestCase,
+    MiniBatchRiemannianKMeansTestCase,
+    RiemannianKMeansMiniBatchTestCase,
 )
 
 from .data.kmeans import (
     AgainstFrechetMeanTestData,
     ClusterInitializationTestData,
+    MiniBatchChunksTestData,
+    RiemannianKMeansMiniBatchTestData,
     RiemannianKMeansTestData,
 )
 
@@ -88,6 +92,47 @@ class TestRiemannianKMeans(
     testing_data = RiemannianKMeansTestData()
 
 
+@pytest.fixture(
+    scope="class",
+    params=[
+        (Hypersphere(dim=random.randint(3, 4)), random.randint(2, 4)),
+        (SPDMatrices(n=random.randint(2, 4)), random.randint(2, 4)),
+    ],
+)
+def mini_batch_estimators(request):
+    space, n_clusters = request.param
+    request.cls.estimator = RiemannianKMeans(space, n_clusters=n_clusters, batch_size=4)
+
+
+@pytest.mark.usefixtures("mini_batch_estimators")
+class TestRiemannianKMeansMiniBatch(
+    RiemannianKMeansMiniBatchTestCase,
+    ClusterMixinsTestCase,
+    metaclass=DataBasedParametrizer,
+):
+    testing_data = RiemannianKMeansMiniBatchTestData()
+
+
+@pytest.fixture(
+    scope="class",
+    params=[
+        (Euclidean(dim=random.randint(3, 4)), random.randint(2, 4)),
+        (Hypersphere(dim=random.randint(3, 4)), random.randint(2, 4)),
+        (SPDMatrices(n=random.randint(2, 4)), random.randint(2, 4)),
+    ],
+)
+def mini_batch_chunks_estimators(request):
+    space, n_clusters = request.param
+    request.cls.estimator = MiniBatchRiemannianKMeans(space, n_clusters=n_clusters)
+
+
+@pytest.mark.usefixtures("mini_batch_chunks_estimators")
+class TestMiniBatchRiemannianKMeansChunks(
+    MiniBatchRiemannianKMeansTestCase, metaclass=DataBasedParametrizer
+):
+    testing_data = MiniBatchChunksTestData()
+
+
 @pytest.fixture(
     scope="class",
     params=(
@@ -0,0 +1,30 @@
+import random
+
+import pytest
+
+from geomstats.geometry.euclidean import Euclidean
+from geomstats.geometry.hypersphere import Hypersphere
+from geomstats.geometry.spd_matrices import SPDMatrices
+from geomstats.learning.vantage_point_tree import VantagePointTree
+from geomstats.test.parametrizers import DataBasedParametrizer
+from geomstats.test_cases.learning.vantage_point_tree import VantagePointTreeTestCase
+
+from .data.vantage_point_tree import VantagePointTreeTestData
+
+
+@pytest.fixture(
+    scope="class",
+    params=[
+        Euclidean(dim=random.randint(2, 4)),
+        Hypersphere(dim=random.randint(2, 4)),
+        SPDMatrices(n=random.randint(2, 3)),
+    ],
+)
+def indices(request):
+    request.cls.space = request.param
+    request.cls.index = VantagePointTree(request.param, leaf_size=4)
+
+
+@pytest.mark.usefixtures("indices")
+class TestVantagePointTree(VantagePointTreeTestCase, metaclass=DataBasedParametrizer):
+    testing_data = VantagePointTreeTestData()
@@ -1,4 +1,12 @@
-from .geodesic import LogSolverAgainstMetricTestData, LogSolverTestData
+import random
+
+from geomstats.test.data import TestData
+
+from .geodesic import (
+    LogSolverAgainstMetricTestData,
+    LogSolverComparisonTestData,
+    LogSolverTestData,
+)
 
 
 class LogSolverAgainstClosedFormTestData(LogSolverAgainstMetricTestData):
@@ -17,6 +25,14 @@ class PathStraighteningAgainstClosedFormTestData(LogSolverAgainstMetricTestData)
     }
 
 
+class CoarseToFinePathStraighteningSurfacesTestData(LogSolverComparisonTestData):
+    N_RANDOM_POINTS = [1]
+    tolerances = {
+        "log": {"atol": 1e-2},
+        "geodesic_bvp": {"atol": 1e-3},
+    }
+
+
 class LogODESolverMatrixTestData(LogSolverTestData):
     skip_vec = True
 
@@ -24,3 +40,10 @@ class LogODESolverMatrixTestData(LogSolverTestData):
         "geodesic_bvp_known_geod": {"atol": 1e-3},
         "log_known_tangent_vec": {"atol": 5e-4},
     }
+
+
+class LogSolverWarmStartTestData(TestData):
+    tolerances = {"log_nearby_points": {"atol": 1e-3}}
+
+    def log_nearby_points_test_data(self):
+        return self.generate_tests([dict(n_points=random.randint(2, 5))])
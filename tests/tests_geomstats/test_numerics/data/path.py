@@ -1,4 +1,9 @@
+from geomstats.geometry.euclidean import Euclidean
+from geomstats.geometry.matrices import Matrices
+from geomstats.geometry.poincare_ball import PoincareBall
+from geomstats.information_geometry.normal import UnivariateNormalDistributions
 from geomstats.test.data import TestData
+from geomstats.test_cases.geometry.pullback_metric import CircleIntrinsic
 
 
 class UniformlySampledPathEnergyTestData(TestData):
@@ -6,5 +11,18 @@ class UniformlySampledPathEnergyTestData(TestData):
 
     tolerances = {"dist_from_path_energy_per_time": {"atol": 1e-2}}
 
+    def closed_form_gradient_test_data(self):
+        data = [
+            dict(space=Euclidean(2), expected=True),
+            dict(space=PoincareBall(2), expected=True),
+            dict(space=Matrices(2, 2), expected=False),
+            dict(space=CircleIntrinsic(), expected=False),
+            dict(space=UnivariateNormalDistributions(), expected=False),
+        ]
+        return self.generate_tests(data)
+
     def dist_from_path_energy_per_time_test_data(self):
         return self.generate_random_data_with_time()
+
+    def energy_gradient_test_data(self):
+        return self.generate_random_data_with_time()
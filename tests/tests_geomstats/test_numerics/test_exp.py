@@ -9,7 +9,11 @@ from geomstats.geometry.invariant_metric import (
 from geomstats.geometry.poincare_ball import PoincareBall
 from geomstats.geometry.special_orthogonal import SpecialOrthogonal
 from geomstats.numerics.geodesic import ExpODESolver
-from geomstats.numerics.ivp import GSIVPIntegrator, ScipySolveIVP
+from geomstats.numerics.ivp import (
+    DormandPrinceIntegrator,
+    GSIVPIntegrator,
+    ScipySolveIVP,
+)
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test_cases.numerics.geodesic import (
     ExpSolverAgainstMetricTestCase,
@@ -31,6 +35,7 @@ def _create_params():
         for integrator in (
             GSIVPIntegrator(n_steps=20, step_type="rk4"),
             ScipySolveIVP(rtol=1e-8),
+            DormandPrinceIntegrator(rtol=1e-8),
         ):
             solver = ExpODESolver(space, integrator=integrator)
             params.append((space, solver))
@@ -106,3 +111,24 @@ class TestExpODESolverMatrix(ExpSolverTestCase, metaclass=DataBasedParametrizer)
     )
 
     testing_data = ExpSolverTestData()
+
+
+class TestExpODESolverMatrixDormandPrinceComparison(
+    ExpSolverComparisonTestCase, metaclass=DataBasedParametrizer
+):
+    """Test ExpODESolver with DormandPrinceIntegrator for matrix points."""
+
+    space = SpecialOrthogonal(random.randint(2, 3), equip=False).equip_with_metric(
+        InvariantMetric, left=True
+    )
+    space.metric.log_solver = None
+    space.metric.exp_solver = None
+
+    exp_solver = InvariantMetricMatrixExpODESolver(
+        space, integrator=DormandPrinceIntegrator(rtol=1e-8, point_ndim=2)
+    )
+    cmp_exp_solver = InvariantMetricMatrixExpODESolver(
+        space, integrator=ScipySolveIVP(rtol=1e-8, point_ndim=2)
+    )
+
+    testing_data = ExpSolverComparisonTestData()
@@ -1,7 +1,11 @@
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
+import geomstats.backend as gs
+import geomstats.datasets.utils as data_utils
+from geomstats.geometry.discrete_surfaces import DiscreteSurfaces
 from geomstats.geometry.invariant_metric import (
     InvariantMetric,
     InvariantMetricMatrixLogODESolver,
@@ -10,20 +14,30 @@ from geomstats.geometry.poincare_ball import PoincareBall
 from geomstats.geometry.spd_matrices import SPDMatrices
 from geomstats.geometry.special_orthogonal import SpecialOrthogonal
 from geomstats.numerics.geodesic import (
+    CoarseToFinePathStraightening,
     LogODESolver,
     LogShootingSolver,
     PathStraightening,
+    ResolutionLevel,
 )
+from geomstats.numerics.optimizers import ScipyMinimize
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test.test_case import autodiff_backend, autodiff_only
+from geomstats.test_cases.geometry.discrete_surfaces import (
+    SurfacesLocalRandomDataGenerator,
+)
 from geomstats.test_cases.numerics.geodesic import (
     LogSolverAgainstMetricTestCase,
+    LogSolverComparisonTestCase,
     LogSolverTestCase,
+    LogSolverWarmStartTestCase,
 )
 
 from .data.log import (
+    CoarseToFinePathStraighteningSurfacesTestData,
     LogODESolverMatrixTestData,
     LogSolverAgainstClosedFormTestData,
+    LogSolverWarmStartTestData,
     PathStraighteningAgainstClosedFormTestData,
 )
 
@@ -38,27 +52,55 @@ def _create_params_autodiff():
     spaces_1d = [PoincareBall(random.randint(2, 3))]
 
     for space in spaces_1d:
-        for solver in (LogODESolver(space, n_nodes=10, use_jac=False),):
-            params.append((space, solver))
+        for with_executor in (False, True):
+            params.append(
+                (space, LogODESolver(space, n_nodes=10, use_jac=False), with_executor)
+            )
 
     spaces_2d = [SPDMatrices(random.randint(2, 3))]
 
     for space in spaces_1d + spaces_2d:
-        for solver in (
-            LogShootingSolver(space, flatten=True),
-            LogShootingSolver(space, flatten=False),
-        ):
-            params.append((space, solver))
+        params.append((space, LogShootingSolver(space, flatten=True), False))
+        for with_executor in (False, True):
+            params.append(
+                (space, LogShootingSolver(space, flatten=False), with_executor)
+            )
+
+    return params
+
+
+def _create_params_warm_start():
+    params = []
+    if not ALLOWS_AUTODIFF:
+        return params
+
+    space = PoincareBall(random.randint(2, 3))
+    params.append(
+        (space, LogODESolver(space, n_nodes=10, use_jac=False, warm_start=True))
+    )
+
+    space = SPDMatrices(random.randint(2, 3))
+    params.append((space, LogShootingSolver(space, flatten=False, warm_start=True)))
 
     return params
 
 
+@pytest.fixture(scope="module")
+def executor():
+    executor = ThreadPoolExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
 @pytest.fixture(
     scope="class",
     params=_create_params_autodiff(),
 )
-def spaces(request):
-    request.cls.space, request.cls.log_solver = request.param
+def spaces(request, executor):
+    space, log_solver, with_executor = request.param
+    if with_executor:
+        log_solver.executor = executor
+    request.cls.space, request.cls.log_solver = space, log_solver
 
 
 @pytest.mark.usefixtures("spaces")
@@ -68,23 +110,110 @@ class TestLogSolverAgainstClosedForm(
     testing_data = LogSolverAgainstClosedFormTestData()
 
 
-@autodiff_only
+@pytest.fixture(
+    scope="class",
+    params=_create_params_warm_start(),
+)
+def warm_start_solvers(request):
+    request.cls.space, request.cls.log_solver = request.param
+
+
+@pytest.mark.usefixtures("warm_start_solvers")
+class TestLogSolverWarmStart(
+    LogSolverWarmStartTestCase, metaclass=DataBasedParametrizer
+):
+    testing_data = LogSolverWarmStartTestData()
+
+
 class TestPathStraighteningAgainstClosedForm(
     LogSolverAgainstMetricTestCase, metaclass=DataBasedParametrizer
 ):
     """Test path-straightening against closed form.
 
-    Not in above test for fine-grained control of tolerances.
+    Not in above test for fine-grained control of tolerances. The default
+    optimizer relies on the closed-form gradient, so this runs on all backends.
     """
 
+    _dim = random.randint(2, 3)
+    space = PoincareBall(_dim)
+    log_solver = PathStraightening(space)
+
+    testing_data = PathStraighteningAgainstClosedFormTestData()
+
+
+def _create_params_flatten():
+    space = PoincareBall(random.randint(2, 3))
+    return [
+        (space, PathStraightening(space, flatten=True)),
+        (space, PathStraightening(space, flatten=True, optimizer=ScipyMinimize())),
+    ]
+
+
+@pytest.fixture(
+    scope="class",
+    params=_create_params_flatten(),
+)
+def flatten_solvers(request):
+    request.cls.space, request.cls.log_solver = request.param
+
+
+@pytest.mark.usefixtures("flatten_solvers")
+class TestPathStraighteningFlattenAgainstClosedForm(
+    LogSolverAgainstMetricTestCase, metaclass=DataBasedParametrizer
+):
+    """Test path-straightening of batches with closed-form gradients."""
+
+    testing_data = PathStraighteningAgainstClosedFormTestData()
+
+
+@autodiff_only
+class TestCoarseToFinePathStraighteningAgainstClosedForm(
+    LogSolverAgainstMetricTestCase, metaclass=DataBasedParametrizer
+):
     _dim = random.randint(2, 3)
     space = PoincareBall(_dim)
     if ALLOWS_AUTODIFF:
-        log_solver = PathStraightening(space)
+        log_solver = CoarseToFinePathStraightening(space)
 
     testing_data = PathStraighteningAgainstClosedFormTestData()
 
 
+@autodiff_only
+class TestCoarseToFinePathStraighteningSurfaces(
+    LogSolverComparisonTestCase, metaclass=DataBasedParametrizer
+):
+    """Test path-straightening from a coarse mesh against path-straightening."""
+
+    _vertices, _faces = data_utils.load_cube()
+    _coarse_space = DiscreteSurfaces(gs.array(_faces), equip=False)
+    space = DiscreteSurfaces(_coarse_space.subdivision_faces(), equip=False)
+    _vertices = _coarse_space.subdivide(gs.array(_vertices, dtype=gs.float64))
+
+    if ALLOWS_AUTODIFF:
+        _coarse_space.equip_with_metric()
+        space.equip_with_metric()
+
+        _optimizer = ScipyMinimize(
+            method="L-BFGS-B", jac="autodiff", options={"ftol": 1e-6}
+        )
+        _levels = [
+            ResolutionLevel(
+                _coarse_space,
+                lambda point, n_vertices=_coarse_space.n_vertices: point[
+                    ..., :n_vertices, :
+                ],
+                _coarse_space.subdivide,
+            )
+        ]
+        log_solver = CoarseToFinePathStraightening(
+            space, n_nodes=5, optimizer=_optimizer, coarse_n_nodes=3, levels=_levels
+        )
+        cmp_log_solver = PathStraightening(space, n_nodes=5, optimizer=_optimizer)
+
+    data_generator = SurfacesLocalRandomDataGenerator(space, _vertices, amplitude=10.0)
+    testing_data = CoarseToFinePathStraighteningSurfacesTestData()
+
+
 class TestLogODESolverMatrix(LogSolverTestCase, metaclass=DataBasedParametrizer):
     """Test log solvers for matrix spaces."""
 
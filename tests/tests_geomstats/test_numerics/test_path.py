@@ -7,7 +7,7 @@ from geomstats.geometry.poincare_ball import PoincareBall
 from geomstats.numerics.path import UniformlySampledPathEnergy
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test.random import RandomDataGenerator
-from geomstats.test.test_case import TestCase
+from geomstats.test.test_case import TestCase, autodiff_only
 
 from .data.path import UniformlySampledPathEnergyTestData
 
@@ -20,6 +20,10 @@ class TestUniformlySampledPathEnergy(TestCase, metaclass=DataBasedParametrizer):
     data_generator = RandomDataGenerator(space)
     testing_data = UniformlySampledPathEnergyTestData()
 
+    def test_closed_form_gradient(self, space, expected):
+        res = UniformlySampledPathEnergy(space).closed_form_gradient
+        self.assertEqual(res, expected)
+
     def test_energy(self, path, expected, atol):
         res = self.path_energy.energy(path)
         self.assertAllClose(res, expected, atol=atol)
@@ -47,3 +51,19 @@ class TestUniformlySampledPathEnergy(TestCase, metaclass=DataBasedParametrizer):
 
         dist = self.space.metric.dist(point, base_point)
         self.assertAllClose(dist_from_energy_per_time, dist, atol=atol)
+
+    @autodiff_only
+    @pytest.mark.random
+    def test_energy_gradient(self, n_points, n_times, atol):
+        """Check the closed-form gradient of the energy against autodiff."""
+        path = gs.reshape(
+            self.data_generator.random_point(n_points * n_times),
+            (n_points, n_times, self._dim),
+        )
+
+        res = self.path_energy.energy_gradient(path)
+
+        _, expected = gs.autodiff.value_and_grad(
+            lambda path: gs.sum(self.path_energy.energy(path))
+        )(path)
+        self.assertAllClose(res, expected, atol=atol)